@@ -0,0 +1 @@
+"""Benchmarks do pacote, executados com python -m benchmarks.<nome>."""
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark do tempo de importação do pacote.
+
+Cada medição roda em um processo Python novo, como os workers de vida
+curta. Compara o import preguiçoso do pacote com a carga de todos os
+scrapers (o custo do import antes do carregamento sob demanda).
+
+Uso:
+    python benchmarks/bench_import.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+STATEMENTS = {
+    "import anbima_scraper": "import anbima_scraper",
+    "anbima_scraper list": (
+        "from anbima_scraper.core.anbima_scraper import ANBIMAScraper; "
+        "ANBIMAScraper().get_available_scrapers()"
+    ),
+    "todos os scrapers (eager)": (
+        "import anbima_scraper as m; [getattr(m, n) for n in m.__all__]"
+    ),
+}
+
+TIMER = (
+    "import time; t = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def measure(statement: str, runs: int) -> list:
+    """Time a statement in ``runs`` fresh interpreters, in seconds."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'Cenário':<28} {'mediana (ms)':>14} {'mín (ms)':>10}")
+    for label, statement in STATEMENTS.items():
+        timings = measure(statement, args.runs)
+        print(
+            f"{label:<28} {statistics.median(timings) * 1000:>14.1f} "
+            f"{min(timings) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks dos caminhos críticos, sobre dados sintéticos.
+
+Mede parse (IDKA, indicadores), limpeza, gravação incremental na base,
+leitura da última data, operações do calendário e um run_all completo
+contra o servidor local (anbima_scraper.testing.server), em tamanhos
+crescentes. Cada execução é gravada em benchmarks/results/ e comparada
+com a anterior, marcando regressões acima do limite.
+
+Uso (na raiz do repositório, com o pacote instalado via pip install -e .):
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --quick --only calendar
+    python -m benchmarks.bench_suite --compare benchmarks/results/anterior.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+import anbima_scraper
+from anbima_scraper.config.settings import (
+    CHANGE_FEED_SETTINGS,
+    FILE_PATHS,
+    REQUEST_SETTINGS,
+)
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.scrapers.idka import IDKAScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.scrapers.indicators import IndicatorsScraper
+from anbima_scraper.testing.fixtures import SyntheticANBIMA
+from anbima_scraper.testing.server import StandInServer
+from anbima_scraper.utils.calendar import get_calendar
+from anbima_scraper.utils.data_processor import DataProcessor
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+START = date(2000, 1, 3)
+
+
+class Case(NamedTuple):
+    """A benchmarked operation and the input sizes it runs at."""
+
+    name: str
+    unit: str
+    sizes: List[int]
+    quick_sizes: List[int]
+    # Builds, for a size, the callable to time (setup is not timed)
+    setup: Callable[[int, Path], Callable[[], object]]
+
+
+@lru_cache(maxsize=None)
+def _generator(indices: int = 12) -> SyntheticANBIMA:
+    """Shared fixture generator."""
+    return SyntheticANBIMA(idka_indices=indices, ima_indices=indices)
+
+
+@lru_cache(maxsize=None)
+def _quadro_resumo(dates: int) -> pd.DataFrame:
+    """Parsed quadro resumo of ``dates`` business days."""
+    days = _generator().business_days(START, date(2100, 1, 1))[:dates]
+    content = _generator().quadro_resumo_csv(days)
+    return IMAQuadroResumoScraper()._process_quadro_resumo(content)
+
+
+def _quadro_resumo_base(dates: int, tmp: Path) -> Path:
+    """Write a quadro resumo base of ``dates`` business days."""
+    path = tmp / f"ima_quadro_resumo_{dates}.csv"
+    if not path.exists():
+        DataProcessor.save_csv_safe(_quadro_resumo(dates), path)
+    return path
+
+
+def setup_idka_parse(indices: int, tmp: Path):
+    """IDKAScraper._process_idka_file over a file of ``indices`` rows."""
+    path = tmp / f"idka_{indices}.csv"
+    path.write_bytes(_generator(indices).idka_csv(date(2017, 5, 16)))
+    scraper = IDKAScraper()
+    return lambda: scraper._process_idka_file(path)
+
+
+def setup_indicators_process(rows: int, tmp: Path):
+    """IndicatorsScraper._process_indicators_data over ``rows`` indicator rows."""
+    names = [
+        "Taxa SELIC do BC2", "DI-CETIP3", "Dolar Comercial Compra", "Euro Venda",
+        "TR2", "TBF2", "FDS4",
+    ]
+    raw = pd.DataFrame(
+        [["Data e Hora da Última Atualização: 16/05/2017 - 18:30"] * 3]
+        + [[names[i % len(names)], "16/05/2017", 1.0 + i] for i in range(rows)]
+    )
+    scraper = IndicatorsScraper()
+    return lambda: scraper._process_indicators_data(raw.copy())
+
+
+def setup_clean_dataframe(dates: int, tmp: Path):
+    """DataProcessor.clean_dataframe over a quadro resumo of ``dates`` days."""
+    df = _quadro_resumo(dates)
+    df = df.assign(no_indice=df['no_indice'].astype(object))
+    return lambda: DataProcessor.clean_dataframe(df)
+
+
+def setup_append_data(dates: int, tmp: Path):
+    """BaseScraper.append_data of one new date into a base of ``dates`` days."""
+    base = _quadro_resumo_base(dates, tmp)
+    path = tmp / "append_target.csv"
+    path.write_bytes(base.read_bytes())
+
+    scraper = IMAQuadroResumoScraper()
+    scraper.output_file = path
+    new_date = _generator().business_days(START, date(2100, 1, 1))[dates]
+    new_rows = IMAQuadroResumoScraper()._process_quadro_resumo(
+        _generator().quadro_resumo_csv([new_date])
+    )
+    return lambda: scraper.append_data(new_rows)
+
+
+def setup_last_date(dates: int, tmp: Path):
+    """DataProcessor.get_last_date_from_csv over a base of ``dates`` days."""
+    base = _quadro_resumo_base(dates, tmp)
+    return lambda: DataProcessor.get_last_date_from_csv(base)
+
+
+def setup_calendar_range(years: int, tmp: Path):
+    """ANBIMACalendar.get_business_days_range over ``years`` years."""
+    calendar = get_calendar()
+    end = date(2001 + years - 1, 12, 31)
+    return lambda: calendar.get_business_days_range(date(2001, 1, 1), end)
+
+
+def setup_calendar_count(pairs: int, tmp: Path):
+    """ANBIMACalendar.count_business_days over ``pairs`` date pairs."""
+    calendar = get_calendar()
+    rng = np.random.default_rng(0)
+    starts = np.datetime64('2001-01-01') + rng.integers(0, 9000, pairs)
+    ends = starts + rng.integers(1, 9000, pairs)
+    return lambda: calendar.count_business_days(starts, ends)
+
+
+def setup_calendar_is_business_day(calls: int, tmp: Path):
+    """``calls`` ANBIMACalendar.is_business_day lookups."""
+    calendar = get_calendar()
+    days = [date.fromordinal(date(2001, 1, 1).toordinal() + i) for i in range(calls)]
+    return lambda: [calendar.is_business_day(dt) for dt in days]
+
+
+def setup_run_all(debentures: int, tmp: Path):
+    """ANBIMAScraper.run_all against the local server, ``debentures`` per file."""
+    run_dir = Path(tempfile.mkdtemp(dir=tmp))
+    for name, path in FILE_PATHS.items():
+        FILE_PATHS[name] = run_dir / Path(path).name
+
+    server = StandInServer(
+        SyntheticANBIMA(debentures=debentures, titulos=debentures // 4)
+    ).start()
+    REQUEST_SETTINGS["base_url"] = server.base_url
+
+    scraper = ANBIMAScraper()
+    scraper.scrapers["idka"].download_dir = run_dir / "idka"
+
+    def run():
+        try:
+            return scraper.run_all()
+        finally:
+            server.stop()
+
+    return run
+
+
+CASES = [
+    Case("idka_parse", "índices", [12, 120, 1200], [12, 120], setup_idka_parse),
+    Case("indicators_process", "linhas", [16, 160, 1600], [16, 160],
+         setup_indicators_process),
+    Case("clean_dataframe", "dias", [250, 2500, 25000], [250, 2500],
+         setup_clean_dataframe),
+    Case("append_data", "dias na base", [250, 2500, 10000], [250, 2500],
+         setup_append_data),
+    Case("get_last_date_from_csv", "dias na base", [250, 2500, 10000], [250, 2500],
+         setup_last_date),
+    Case("calendar_range", "anos", [1, 10, 50], [1, 10], setup_calendar_range),
+    Case("calendar_count", "pares", [1000, 100_000, 1_000_000], [1000, 100_000],
+         setup_calendar_count),
+    Case("calendar_is_business_day", "chamadas", [1000, 10_000], [1000],
+         setup_calendar_is_business_day),
+    Case("run_all_stand_in", "debêntures/arquivo", [100, 1000], [100],
+         setup_run_all),
+]
+
+
+def measure(case: Case, size: int, repeat: int, tmp: Path) -> Dict[str, float]:
+    """Time a case at one size, with a fresh setup per repetition.
+
+    Args:
+        case: Benchmark case
+        size: Input size
+        repeat: Number of timed runs
+        tmp: Scratch directory
+
+    Returns:
+        Median and minimum seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        func = case.setup(size, tmp)
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {"median": statistics.median(timings), "min": min(timings),
+            "repeat": repeat}
+
+
+def _git_commit() -> Optional[str]:
+    """Current commit, if running from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(current: Dict, previous: Dict, threshold: float,
+            min_delta: float = 0.001) -> List[str]:
+    """List cases slower than in a previous run by more than ``threshold``.
+
+    Args:
+        current: Results of this run
+        previous: Results of a previous run
+        threshold: Accepted ratio of medians (e.g. 1.2 for 20%)
+        min_delta: Smallest slowdown in seconds worth reporting, so timer
+            noise on sub-millisecond cases is not flagged
+
+    Returns:
+        Regression descriptions
+    """
+    regressions = []
+    for name, sizes in current["results"].items():
+        for size, result in sizes.items():
+            before = previous["results"].get(name, {}).get(size)
+            if before is None:
+                continue
+            ratio = result["median"] / before["median"]
+            if ratio > threshold and result["median"] - before["median"] > min_delta:
+                regressions.append(
+                    f"{name} [{size}]: {before['median'] * 1000:.2f} ms -> "
+                    f"{result['median'] * 1000:.2f} ms ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main() -> int:
+    """Run the suite, store its results and compare with the previous run."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--quick", action="store_true",
+                        help="Apenas os tamanhos menores")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", default=[],
+                        help="Casos cujo nome contém um destes textos")
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR)
+    parser.add_argument("--compare", type=Path,
+                        help="Resultado anterior (padrão: o mais recente)")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="Razão de medianas considerada regressão")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Piora mínima, em ms, considerada regressão")
+    parser.add_argument("--no-save", action="store_true",
+                        help="Não gravar os resultados")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter("ignore", FutureWarning)
+
+    cases = [
+        case for case in CASES
+        if not args.only or any(text in case.name for text in args.only)
+    ]
+    previous_files = sorted(args.results_dir.glob("*.json"))
+    previous_path = args.compare or (previous_files[-1] if previous_files else None)
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    print(f"{'Caso':<28} {'Tamanho':>22} {'mediana (ms)':>14} {'mín (ms)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Change batches of benchmarked writes stay in the scratch directory
+        CHANGE_FEED_SETTINGS["directory"] = Path(tmp) / "changes"
+        for case in cases:
+            sizes = case.quick_sizes if args.quick else case.sizes
+            repeat = 1 if case.name.startswith("run_all") else args.repeat
+            for size in sizes:
+                result = measure(case, size, repeat, Path(tmp))
+                results.setdefault(case.name, {})[str(size)] = result
+                print(f"{case.name:<28} {f'{size} {case.unit}':>22} "
+                      f"{result['median'] * 1000:>14.2f} {result['min'] * 1000:>10.2f}")
+
+    run = {
+        "version": anbima_scraper.__version__,
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    if not args.no_save:
+        args.results_dir.mkdir(parents=True, exist_ok=True)
+        path = args.results_dir / (
+            f"{run['version']}_{datetime.now():%Y%m%d-%H%M%S}.json"
+        )
+        path.write_text(json.dumps(run, indent=2), encoding="utf-8")
+        print(f"\nResultados gravados em {path}")
+
+    if previous_path is None:
+        return 0
+
+    previous = json.loads(Path(previous_path).read_text(encoding="utf-8"))
+    regressions = compare(
+        run, previous, args.threshold, args.min_delta_ms / 1000
+    )
+    print(f"\nComparação com {previous_path.name} "
+          f"({previous.get('version')}, {previous.get('commit')}):")
+    if not regressions:
+        print(f"Nenhuma regressão acima de {args.threshold:.2f}x")
+        return 0
+    for line in regressions:
+        print(f"REGRESSÃO {line}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark de ingestão dos arquivos ms{yymmdd}.txt (títulos públicos).
+
+Gera arquivos sintéticos no layout da ANBIMA e mede parse e gravação no
+armazenamento particionado por data.
+
+Uso (na raiz do repositório, com o pacote instalado via pip install -e .):
+    python -m benchmarks.bench_titulos_publicos --dates 2500
+"""
+
+import argparse
+import logging
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from anbima_scraper.scrapers.titulos_publicos import TitulosPublicosScraper
+from anbima_scraper.utils.columnar_store import ColumnarStore
+
+HEADER = (
+    "Titulo@Data Referencia@Codigo SELIC@Data Base/Emissao@Data Vencimento@"
+    "Tx. Compra@Tx. Venda@Tx. Indicativas@PU@Desvio padrao@"
+    "Interv. Ind. Inf. (D0)@Interv. Ind. Sup. (D0)@Interv. Ind. Inf. (D+1)@"
+    "Interv. Ind. Sup. (D+1)@Criterio"
+)
+
+
+def make_ms_file(dt: date, n_bonds: int = 60) -> bytes:
+    """Build a synthetic ms{yymmdd}.txt file."""
+    lines = ["ANBIMA - Associação Brasileira das Entidades", "", HEADER]
+    for i in range(n_bonds):
+        rate = f"{random.uniform(5, 14):.4f}".replace(".", ",")
+        pu = f"{random.uniform(300, 4000):.6f}".replace(".", ",")
+        maturity = dt + timedelta(days=180 * (i + 1))
+        lines.append(
+            f"LTN@{dt:%Y%m%d}@{100000 + i}@20100101@{maturity:%Y%m%d}@"
+            f"{rate}@{rate}@{rate}@{pu}@0,0100@{rate}@{rate}@{rate}@{rate}@Calculado"
+        )
+    return "\r\n".join(lines).encode("latin1")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dates", type=int, default=2500)
+    parser.add_argument("--bonds", type=int, default=60)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    scraper = TitulosPublicosScraper()
+
+    dates = [date(2010, 1, 1) + timedelta(days=i) for i in range(args.dates)]
+    contents = [make_ms_file(dt, args.bonds) for dt in dates]
+
+    start = time.perf_counter()
+    df = scraper._process_titulos_files(contents)
+    parse_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ColumnarStore(Path(tmp), "dt_referencia", scraper.key_columns)
+        start = time.perf_counter()
+        for dt, partition in df.groupby(df["dt_referencia"].dt.date):
+            store.write_partition(dt, partition)
+        store_seconds = time.perf_counter() - start
+
+    print(f"Arquivos: {len(contents)}  Linhas: {len(df)}")
+    print(f"Parse:    {parse_seconds:.3f}s  "
+          f"({len(contents) / parse_seconds / 1000:.2f} arquivos/ms)")
+    print(f"Gravação: {store_seconds:.3f}s  "
+          f"({len(contents) / store_seconds / 1000:.2f} arquivos/ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,10 +13,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from anbima_scraper import ANBIMAScraper
-from anbima_scraper.config.settings import LOGGING_CONFIG
+from anbima_scraper.config.settings import configure_logging
 
 # Configure logging
-logging.config.dictConfig(LOGGING_CONFIG)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
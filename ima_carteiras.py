@@ -65,12 +65,7 @@ def generate_csv_base(df, path_file_base):
 
 
 def generate_xlsx_base(df, path_saida):
-    # Create a Pandas Excel writer using XlsxWriter as the engine.
-    writer = pd.ExcelWriter(path_saida, engine='xlsxwriter')
-    # Convert the dataframe to an XlsxWriter Excel object.
-    df.to_excel(writer, sheet_name='Sheet1')
-    # Close the Pandas Excel writer and output the Excel file.
-    writer.save()
+    utils.generate_xlsx_base(df, path_saida)
 
 
 def xrange(x):
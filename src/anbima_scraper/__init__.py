@@ -3,24 +3,53 @@ ANBIMA Scraper - Web scraper para captura de dados financeiros da ANBIMA.
 
 Este pacote fornece ferramentas para capturar dados financeiros do site da ANBIMA,
 incluindo índices, indicadores, curvas de juros e outros dados de mercado.
+
+Os nomes públicos são carregados sob demanda (PEP 562): ``import anbima_scraper``
+não importa pandas, requests nem bizdays até que um scraper seja usado.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "2.0.0"
 __author__ = "Original Author"
 __email__ = "royopa@gmail.com"
 
-from .core.scraper import ANBIMAScraper
-from .scrapers.idka import IDKAScraper
-from .scrapers.indicators import IndicatorsScraper
-from .scrapers.ima import IMAScraper
-from .scrapers.curves import CurvesScraper
-from .scrapers.debentures import DebenturesScraper
-
-__all__ = [
-    "ANBIMAScraper",
-    "IDKAScraper", 
-    "IndicatorsScraper",
-    "IMAScraper",
-    "CurvesScraper",
-    "DebenturesScraper",
-] 
\ No newline at end of file
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    "ANBIMAScraper": ".core.anbima_scraper",
+    "load": ".core.anbima_scraper",
+    "IDKAScraper": ".scrapers.idka",
+    "IndicatorsScraper": ".scrapers.indicators",
+    "IMAScraper": ".scrapers.ima",
+    "CurvesScraper": ".scrapers.curves",
+    "DebenturesScraper": ".scrapers.debentures",
+    "TitulosPublicosScraper": ".scrapers.titulos_publicos",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .core.anbima_scraper import ANBIMAScraper, load
+    from .scrapers.curves import CurvesScraper
+    from .scrapers.debentures import DebenturesScraper
+    from .scrapers.idka import IDKAScraper
+    from .scrapers.ima import IMAScraper
+    from .scrapers.indicators import IndicatorsScraper
+    from .scrapers.titulos_publicos import TitulosPublicosScraper
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including the lazy public names."""
+    return sorted(set(globals()) | set(__all__))
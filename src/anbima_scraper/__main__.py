@@ -0,0 +1,7 @@
+"""Allow running the package with ``python -m anbima_scraper``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
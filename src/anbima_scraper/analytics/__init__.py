@@ -0,0 +1 @@
+"""Analytics over stored ANBIMA data (curve interpolation, pricing)."""
@@ -0,0 +1,258 @@
+"""Vectorized yield-curve interpolation over stored ANBIMA closing curves.
+
+All functions work on whole (dates x maturities) arrays. Maturities are
+business-day counts (DU) and rates are in % a.a. on the 252 business-day
+basis, the same units as the vertices published by ANBIMA.
+"""
+
+import logging
+from datetime import date
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.calendar import ANBIMACalendar, get_calendar
+from ..utils.curve_store import SVENSSON_CURVES, ClosingCurves
+
+logger = logging.getLogger(__name__)
+
+BUSINESS_DAYS_PER_YEAR = 252
+
+# Vertex series and the Svensson curve fitted to the same market
+SERIES_TO_SVENSSON = {
+    'ettj_pref': 'prefixados',
+    'ettj_ipca': 'ipca',
+}
+
+
+def svensson(parameters: np.ndarray, maturities: np.ndarray) -> np.ndarray:
+    """Evaluate Svensson curves.
+
+    Args:
+        parameters: Parameters (beta1, beta2, beta3, beta4, lambda1, lambda2)
+            of shape (n_dates, 6)
+        maturities: Maturities in business days, a scalar or of shape
+            (n_maturities,) or (n_dates, n_maturities)
+
+    Returns:
+        Rates in % a.a., shape (n_dates, n_maturities)
+    """
+    parameters = np.asarray(parameters, dtype=float)
+    t = np.atleast_2d(np.asarray(maturities, dtype=float)) / BUSINESS_DAYS_PER_YEAR
+    # Avoid 0/0 at t = 0, where the loadings tend to 1 and 0
+    t = np.where(t > 0, t, 1e-10)
+
+    beta1, beta2, beta3, beta4, lambda1, lambda2 = (
+        parameters[:, i:i + 1] for i in range(6)
+    )
+    decay1 = np.exp(-lambda1 * t)
+    decay2 = np.exp(-lambda2 * t)
+    loading1 = (1 - decay1) / (lambda1 * t)
+    loading2 = (1 - decay2) / (lambda2 * t)
+
+    rates = (
+        beta1
+        + beta2 * loading1
+        + beta3 * (loading1 - decay1)
+        + beta4 * (loading2 - decay2)
+    )
+    return rates * 100
+
+
+def discount_factors(rates: np.ndarray, maturities: np.ndarray) -> np.ndarray:
+    """Compute discount factors on the DU/252 exponential convention.
+
+    Args:
+        rates: Rates in % a.a.
+        maturities: Maturities in business days (broadcast against rates)
+
+    Returns:
+        Discount factors ``(1 + r) ** (-du / 252)``
+    """
+    rates = np.asarray(rates, dtype=float) / 100
+    return (1 + rates) ** (-np.asarray(maturities, dtype=float)
+                           / BUSINESS_DAYS_PER_YEAR)
+
+
+def flat_forward_252(
+    vertices: np.ndarray,
+    rates: np.ndarray,
+    maturities: np.ndarray
+) -> np.ndarray:
+    """Interpolate rates with flat forwards between vertices (DU/252).
+
+    The log discount factor is linear in business days between vertices.
+    Before the first vertex the first rate is kept flat; after the last one
+    the last forward rate is extended. Missing vertices (NaN) are skipped
+    for the date they are missing on.
+
+    Args:
+        vertices: Vertices in business days, shape (n_vertices,)
+        rates: Vertex rates in % a.a., shape (n_dates, n_vertices)
+        maturities: Maturities in business days, shape (n_maturities,) or
+            (n_dates, n_maturities)
+
+    Returns:
+        Rates in % a.a., shape (n_dates, n_maturities)
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    rates = np.atleast_2d(np.asarray(rates, dtype=float))
+    n_dates = rates.shape[0]
+    maturities = np.atleast_1d(np.asarray(maturities, dtype=float))
+    t = np.broadcast_to(
+        np.atleast_2d(maturities), (n_dates, maturities.shape[-1])
+    )
+
+    if len(vertices) == 1:
+        flat: np.ndarray = np.broadcast_to(rates[:, :1], t.shape).copy()
+        return flat
+
+    log_df = _fill_missing_log_df(vertices, rates)
+
+    position = np.searchsorted(vertices, t, side='right') - 1
+    position = np.clip(position, 0, len(vertices) - 2)
+    t1 = vertices[position]
+    t2 = vertices[position + 1]
+    log_df1 = np.take_along_axis(log_df, position, axis=1)
+    log_df2 = np.take_along_axis(log_df, position + 1, axis=1)
+
+    weight = (t - t1) / (t2 - t1)
+    log_df_t = log_df1 + weight * (log_df2 - log_df1)
+
+    # Flat rate before the first vertex
+    before = t < vertices[0]
+    log_df_t = np.where(before, log_df[:, :1] * t / vertices[0], log_df_t)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.expm1(-log_df_t * BUSINESS_DAYS_PER_YEAR / t) * 100
+
+    # A zero maturity takes the rate of the first vertex
+    first_rate = np.expm1(
+        -log_df[:, :1] * BUSINESS_DAYS_PER_YEAR / vertices[0]
+    ) * 100
+    interpolated: np.ndarray = np.where(t > 0, result, first_rate)
+    return interpolated
+
+
+def _fill_missing_log_df(vertices: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    """Convert vertex rates to log discount factors, filling NaN cells.
+
+    Interior gaps are filled linearly in the log discount factor (flat
+    forward); leading and trailing gaps keep the nearest rate flat.
+    """
+    log_df = -vertices / BUSINESS_DAYS_PER_YEAR * np.log1p(rates / 100)
+
+    if not np.isnan(log_df).any():
+        return log_df
+
+    frame = pd.DataFrame(log_df.T, index=vertices)
+    frame = frame.interpolate(method='index', limit_area='inside')
+
+    edge_rates = np.expm1(
+        -frame.to_numpy().T * BUSINESS_DAYS_PER_YEAR / vertices
+    )
+    edge_rates = pd.DataFrame(edge_rates).ffill(axis=1).bfill(axis=1).to_numpy()
+    filled: np.ndarray = -vertices / BUSINESS_DAYS_PER_YEAR * np.log1p(edge_rates)
+    return filled
+
+
+class CurveInterpolator:
+    """Rates at arbitrary maturities from stored ANBIMA closing curves."""
+
+    def __init__(self, curves: ClosingCurves,
+                 calendar: Optional[ANBIMACalendar] = None):
+        """Initialize the interpolator.
+
+        Args:
+            curves: Stored curves (see ``CurveStore.load``)
+            calendar: Business day calendar used to count DU
+        """
+        self.curves = curves
+        self.calendar = calendar or get_calendar()
+
+    def rows(self, reference_dates: Sequence[date]) -> np.ndarray:
+        """Get the store rows of reference dates.
+
+        Args:
+            reference_dates: Reference dates
+
+        Returns:
+            Row indices
+
+        Raises:
+            KeyError: If a date has no stored curve
+        """
+        keys = np.asarray(reference_dates, dtype='datetime64[D]')
+        dates = self.curves.dates
+        rows = np.searchsorted(dates, keys)
+
+        found = rows < len(dates)
+        found[found] = dates[rows[found]] == keys[found]
+        if not found.all():
+            raise KeyError(f"No curve stored for {keys[~found].tolist()}")
+        return rows
+
+    def rates(
+        self,
+        reference_dates: Sequence[date],
+        maturities: np.ndarray,
+        series: str = 'ettj_pref',
+        method: str = 'flat_forward'
+    ) -> np.ndarray:
+        """Rates for maturities given in business days.
+
+        Args:
+            reference_dates: Curve dates, shape (n_dates,)
+            maturities: Business days, shape (n_maturities,) or
+                (n_dates, n_maturities)
+            series: Vertex series (``ettj_pref``, ``ettj_ipca`` or
+                ``inflacao_implicita``)
+            method: ``flat_forward`` (between vertices) or ``svensson``
+                (from the fitted parameters)
+
+        Returns:
+            Rates in % a.a., shape (n_dates, n_maturities)
+        """
+        rows = self.rows(reference_dates)
+
+        if method == 'svensson':
+            if series not in SERIES_TO_SVENSSON:
+                raise ValueError(f"No Svensson curve for series: {series}")
+            curve = SVENSSON_CURVES.index(SERIES_TO_SVENSSON[series])
+            return svensson(self.curves.parameters[rows, curve, :], maturities)
+
+        if method == 'flat_forward':
+            return flat_forward_252(
+                self.curves.vertices,
+                self.curves.series(series)[rows],
+                maturities,
+            )
+
+        raise ValueError(f"Unknown interpolation method: {method}")
+
+    def rates_for_dates(
+        self,
+        reference_dates: Sequence[date],
+        cash_flow_dates: Union[Sequence[date], np.ndarray],
+        series: str = 'ettj_pref',
+        method: str = 'flat_forward'
+    ) -> np.ndarray:
+        """Rates for cash flows given as calendar dates.
+
+        Business days between each reference date and each cash flow are
+        counted with ``ANBIMACalendar.count_business_days``.
+
+        Args:
+            reference_dates: Curve dates, shape (n_dates,)
+            cash_flow_dates: Cash flow dates, shape (n_maturities,) or
+                (n_dates, n_maturities)
+            series: Vertex series
+            method: ``flat_forward`` or ``svensson``
+
+        Returns:
+            Rates in % a.a., shape (n_dates, n_maturities)
+        """
+        starts = np.asarray(reference_dates, dtype='datetime64[D]')[:, np.newaxis]
+        maturities = self.calendar.count_business_days(starts, cash_flow_dates)
+        return self.rates(reference_dates, maturities, series, method)
@@ -0,0 +1,220 @@
+"""Vectorized pricing of Brazilian government bonds from secondary-market rates.
+
+Prices, durations and convexities are computed for whole (date x bond)
+tables at once, on the DU/252 convention with business days counted by
+``ANBIMACalendar``. Cash flows of coupon bonds are laid out as a padded
+(bonds x flows) array, so no Python loop runs per bond or per date.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..utils.calendar import ANBIMACalendar, get_calendar
+from .curves import BUSINESS_DAYS_PER_YEAR
+
+logger = logging.getLogger(__name__)
+
+# Face value of LTN and NTN-F
+FACE_VALUE = 1000.0
+
+# Semi-annual coupons: NTN-F pays 10% a.a. on the face value, NTN-B 6% a.a.
+# on the VNA; both are rounded by the Tesouro as below
+NTNF_COUPON = round(FACE_VALUE * (1.10 ** 0.5 - 1), 5)
+NTNB_COUPON = round(100 * (1.06 ** 0.5 - 1), 6)
+
+# Day of month coupons are paid on
+COUPON_DAY = {'NTN-F': 1, 'NTN-B': 15}
+
+PRICED_TITLES = ('LTN', 'NTN-F', 'NTN-B', 'LFT')
+
+
+def _truncate(values: np.ndarray, decimals: int) -> np.ndarray:
+    """Truncate values to a number of decimals, as ANBIMA does for PUs."""
+    factor = 10.0 ** decimals
+    return np.trunc(np.asarray(values, dtype=float) * factor + 1e-9) / factor
+
+
+def coupon_schedule(
+    reference_dates: np.ndarray,
+    maturities: np.ndarray,
+    coupon_day: int
+) -> np.ndarray:
+    """Lay out semi-annual coupon dates after each reference date.
+
+    Coupons fall every six months back from the maturity, on
+    ``coupon_day``. Flows on or before the reference date are NaT.
+
+    Args:
+        reference_dates: ``datetime64[D]`` of shape (n_bonds,)
+        maturities: ``datetime64[D]`` of shape (n_bonds,)
+        coupon_day: Day of month of the payments
+
+    Returns:
+        ``datetime64[D]`` array of shape (n_bonds, n_flows), the first
+        column being the maturity
+    """
+    reference_dates = np.asarray(reference_dates, dtype='datetime64[D]')
+    maturities = np.asarray(maturities, dtype='datetime64[D]')
+    if len(maturities) == 0:
+        return np.empty((0, 0), dtype='datetime64[D]')
+
+    months = (
+        maturities.astype('datetime64[M]') - reference_dates.astype('datetime64[M]')
+    ).astype(int)
+    n_flows = max(int(months.max()) // 6 + 1, 1)
+
+    steps = np.arange(n_flows) * 6
+    flow_months = maturities.astype('datetime64[M]')[:, np.newaxis] - steps
+    flow_dates = flow_months.astype('datetime64[D]') + (coupon_day - 1)
+
+    return np.where(
+        flow_dates > reference_dates[:, np.newaxis],
+        flow_dates,
+        np.datetime64('NaT')
+    )
+
+
+def _discounted_flows(
+    rates: np.ndarray,
+    business_days: np.ndarray,
+    amounts: np.ndarray
+) -> pd.DataFrame:
+    """Present value, duration and convexity of padded cash flows.
+
+    Args:
+        rates: Yields in % a.a., shape (n_bonds,)
+        business_days: DU to each flow, shape (n_bonds, n_flows)
+        amounts: Flow amounts (0 for padding), shape (n_bonds, n_flows)
+
+    Returns:
+        DataFrame with pv, duration (years), duration_modificada and
+        convexidade
+    """
+    y = np.asarray(rates, dtype=float)[:, np.newaxis] / 100
+    t = business_days / BUSINESS_DAYS_PER_YEAR
+    present_values = amounts * (1 + y) ** (-t)
+
+    pv = present_values.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        duration = (present_values * t).sum(axis=1) / pv
+        convexity = (
+            (present_values * t * (t + 1)).sum(axis=1) / pv / (1 + y[:, 0]) ** 2
+        )
+
+    return pd.DataFrame({
+        'pv': pv,
+        'duration': duration,
+        'duration_modificada': duration / (1 + y[:, 0]),
+        'convexidade': convexity,
+    })
+
+
+def price_bonds(
+    df: pd.DataFrame,
+    calendar: Optional[ANBIMACalendar] = None,
+    rate_column: str = 'taxa_indicativa'
+) -> pd.DataFrame:
+    """Price LTN, NTN-F, NTN-B and LFT rows from their yields.
+
+    ``df`` follows the títulos públicos store layout (``dt_referencia``,
+    ``titulo``, ``dt_vencimento`` and the rate column). NTN-B and LFT
+    prices need the VNA of the date in a ``vna`` column; without it only
+    their quotation (``cotacao``, % of VNA) and risk measures are filled.
+
+    Args:
+        df: Bonds to price, one row per (date, bond)
+        calendar: Business day calendar
+        rate_column: Yield column in % a.a.
+
+    Returns:
+        Copy of ``df`` with ``pu_calculado``, ``cotacao``, ``duration``
+        (years), ``duration_modificada`` and ``convexidade``
+    """
+    calendar = calendar or get_calendar()
+    result = df.copy()
+    for col in ('pu_calculado', 'cotacao', 'duration',
+                'duration_modificada', 'convexidade'):
+        result[col] = np.nan
+
+    if result.empty:
+        return result
+
+    titles = result['titulo'].astype(str).str.strip().to_numpy()
+    references = pd.to_datetime(result['dt_referencia']).to_numpy('datetime64[D]')
+    maturities = pd.to_datetime(result['dt_vencimento']).to_numpy('datetime64[D]')
+    rates = result[rate_column].to_numpy(dtype=float)
+    vna = (
+        result['vna'].to_numpy(dtype=float) if 'vna' in result.columns
+        else np.full(len(result), np.nan)
+    )
+
+    for title in PRICED_TITLES:
+        rows = np.flatnonzero(titles == title)
+        if len(rows) == 0:
+            continue
+
+        if title in COUPON_DAY:
+            flow_dates = coupon_schedule(
+                references[rows], maturities[rows], COUPON_DAY[title]
+            )
+            valid = ~np.isnat(flow_dates)
+            coupon = NTNF_COUPON if title == 'NTN-F' else NTNB_COUPON
+            principal = FACE_VALUE if title == 'NTN-F' else 100.0
+            amounts = np.where(valid, coupon, 0.0)
+            amounts[:, 0] += np.where(valid[:, 0], principal, 0.0)
+            # Padding counts zero business days and carries no amount
+            flow_dates = np.where(
+                valid, flow_dates, references[rows][:, np.newaxis]
+            )
+        else:
+            flow_dates = maturities[rows][:, np.newaxis]
+            principal = FACE_VALUE if title == 'LTN' else 100.0
+            amounts = np.full((len(rows), 1), principal)
+
+        business_days = calendar.count_business_days(
+            references[rows][:, np.newaxis], flow_dates
+        )
+        measures = _discounted_flows(rates[rows], business_days, amounts)
+
+        if title in ('LTN', 'NTN-F'):
+            pu = _truncate(measures['pv'].to_numpy(), 6)
+            cotacao = pu / FACE_VALUE * 100
+        else:
+            cotacao = _truncate(measures['pv'].to_numpy(), 4)
+            pu = _truncate(vna[rows] * cotacao / 100, 6)
+
+        index = result.index[rows]
+        result.loc[index, 'pu_calculado'] = pu
+        result.loc[index, 'cotacao'] = cotacao
+        for col in ('duration', 'duration_modificada', 'convexidade'):
+            result.loc[index, col] = measures[col].to_numpy()
+
+    return result
+
+
+def verify_published_prices(
+    priced: pd.DataFrame,
+    tolerance: float = 0.01
+) -> pd.DataFrame:
+    """Compare computed PUs with the PUs published by ANBIMA.
+
+    Args:
+        priced: Output of ``price_bonds`` with the published ``pu`` column
+        tolerance: Largest accepted absolute difference
+
+    Returns:
+        Rows whose computed PU differs from the published one by more than
+        ``tolerance``, with a ``diferenca_pu`` column
+    """
+    checked = priced[priced['pu_calculado'].notna() & priced['pu'].notna()].copy()
+    checked['diferenca_pu'] = checked['pu_calculado'] - checked['pu']
+    mismatches = checked[checked['diferenca_pu'].abs() > tolerance]
+
+    logger.info(
+        f"Verified {len(checked)} PUs against ANBIMA: "
+        f"{len(mismatches)} above tolerance {tolerance}"
+    )
+    return mismatches
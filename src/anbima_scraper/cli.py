@@ -1,21 +1,34 @@
 """Command line interface for ANBIMA scraper."""
 
 import argparse
+import json
 import logging
+import signal
 import sys
-from typing import List
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
 
 from .core.anbima_scraper import ANBIMAScraper
-from .config.settings import LOGGING_CONFIG
+from .config.settings import (
+    METRICS_SETTINGS,
+    PROFILE_SETTINGS,
+    REQUEST_SETTINGS,
+    configure_logging,
+)
 
-# Configure logging
-logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger(__name__)
 
+# Keys of utils.export.EXPORT_WRITERS, kept here so parsing the command
+# line does not import pandas
+EXPORT_FORMATS = ("feather", "xlsx")
+
 
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(
+        prog="anbima_scraper",
         description="ANBIMA Scraper - Captura dados financeiros da ANBIMA",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -32,14 +45,47 @@ Exemplos de uso:
   # Forçar atualização
   python -m anbima_scraper run-all --force
 
-  # Verificar status
-  python -m anbima_scraper status
+  # Resumo JSON por etapa (HTTP, leitura, gravação) e textfile do Prometheus
+  python -m anbima_scraper run idka --summary \\
+      --metrics-file /var/lib/node_exporter/anbima.prom
+
+  # Perfil cProfile por scraper e memória por etapa (tracemalloc)
+  python -m anbima_scraper run ima_carteiras --profile profiles --trace-memory
+
+  # Carga histórica retomável (4 blocos em paralelo)
+  python -m anbima_scraper backfill titulos_publicos --from 2010-01-01
+
+  # Manter os dados atualizados continuamente (modo daemon)
+  python -m anbima_scraper daemon
+
+  # Listar as requisições de uma execução, sem acessar a rede
+  python -m anbima_scraper plan idka --verbose
+
+  # Usar o servidor local de testes em vez de www.anbima.com.br
+  python -m anbima_scraper --base-url http://127.0.0.1:8080 run-all
+
+  # Histórico de execuções, com alertas de lentidão ou bytes por linha
+  python -m anbima_scraper history idka --limit 20
+
+  # Exportar a base do IMA para Excel, em memória constante
+  python -m anbima_scraper export ima_carteiras --format xlsx --from 2020-01-01
+
+  # Linhas gravadas desde a sequência 41 (feed de alterações)
+  python -m anbima_scraper changes debentures --since 41
+
+  # Verificar status (linhas, lacunas e atraso de cada dataset)
+  python -m anbima_scraper status --json
 
   # Listar scrapers disponíveis
   python -m anbima_scraper list
         """
     )
     
+    parser.add_argument(
+        '--base-url',
+        help='Servidor usado no lugar de www.anbima.com.br (ex.: servidor local)'
+    )
+    
     subparsers = parser.add_subparsers(dest='command', help='Comandos disponíveis')
     
     # Run all command
@@ -52,6 +98,8 @@ Exemplos de uso:
         action='store_true',
         help='Forçar atualização mesmo se dados existirem'
     )
+    _add_metrics_arguments(run_all_parser)
+    _add_profiling_arguments(run_all_parser)
     
     # Run specific command
     run_parser = subparsers.add_parser(
@@ -68,12 +116,180 @@ Exemplos de uso:
         action='store_true',
         help='Forçar atualização mesmo se dados existirem'
     )
+    _add_metrics_arguments(run_parser)
+    _add_profiling_arguments(run_parser)
+    
+    # Backfill command
+    backfill_parser = subparsers.add_parser(
+        'backfill',
+        help='Carregar o histórico de um scraper (retomável)'
+    )
+    backfill_parser.add_argument(
+        'dataset',
+        help='Nome do scraper'
+    )
+    backfill_parser.add_argument(
+        '--from',
+        dest='start_date',
+        type=_parse_date,
+        required=True,
+        help='Data inicial (AAAA-MM-DD)'
+    )
+    backfill_parser.add_argument(
+        '--to',
+        dest='end_date',
+        type=_parse_date,
+        help='Data final (AAAA-MM-DD, padrão: último dia útil)'
+    )
+    backfill_parser.add_argument(
+        '--workers',
+        type=int,
+        help='Blocos executados em paralelo'
+    )
+    backfill_parser.add_argument(
+        '--chunk-days',
+        type=int,
+        help='Dias úteis por bloco'
+    )
+    backfill_parser.add_argument(
+        '--restart',
+        action='store_true',
+        help='Ignorar o checkpoint e recomeçar do início'
+    )
+    
+    # Daemon command
+    daemon_parser = subparsers.add_parser(
+        'daemon',
+        help='Manter os dados atualizados conforme as janelas de publicação'
+    )
+    daemon_parser.add_argument(
+        'scrapers',
+        nargs='*',
+        help='Nomes dos scrapers (padrão: todos)'
+    )
+    
+    # Plan command
+    plan_parser = subparsers.add_parser(
+        'plan',
+        help='Listar as requisições de uma execução sem acessar a rede'
+    )
+    plan_parser.add_argument(
+        'scrapers',
+        nargs='*',
+        help='Nomes dos scrapers (padrão: todos)'
+    )
+    plan_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Planejar uma execução forçada'
+    )
+    plan_parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Listar cada requisição (dataset, data, URL)'
+    )
+    
+    # History command
+    history_parser = subparsers.add_parser(
+        'history',
+        help='Mostrar o histórico de execuções e desvios em relação à linha de base'
+    )
+    history_parser.add_argument(
+        'scrapers',
+        nargs='*',
+        help='Nomes dos scrapers (padrão: todos com histórico)'
+    )
+    history_parser.add_argument(
+        '--limit',
+        type=int,
+        help='Execuções mostradas por scraper'
+    )
+    
+    # Export command
+    export_parser = subparsers.add_parser(
+        'export',
+        help='Exportar a base de um scraper (leitura em blocos)'
+    )
+    export_parser.add_argument(
+        'dataset',
+        help='Nome do scraper'
+    )
+    export_parser.add_argument(
+        '--format',
+        dest='export_format',
+        choices=EXPORT_FORMATS,
+        default='xlsx',
+        help='Formato do arquivo (padrão: xlsx)'
+    )
+    export_parser.add_argument(
+        '--output',
+        type=Path,
+        help='Arquivo de saída (padrão: data/exports/<scraper>.<formato>)'
+    )
+    export_parser.add_argument(
+        '--from',
+        dest='start_date',
+        type=_parse_date,
+        help='Data inicial (AAAA-MM-DD)'
+    )
+    export_parser.add_argument(
+        '--to',
+        dest='end_date',
+        type=_parse_date,
+        help='Data final (AAAA-MM-DD)'
+    )
+    
+    # Changes command
+    changes_parser = subparsers.add_parser(
+        'changes',
+        help='Imprimir em JSONL as linhas gravadas após uma sequência'
+    )
+    changes_parser.add_argument(
+        'dataset',
+        help='Nome do scraper'
+    )
+    changes_parser.add_argument(
+        '--since',
+        type=int,
+        default=0,
+        help='Última sequência já processada (padrão: 0, todas as retidas)'
+    )
+    changes_parser.add_argument(
+        '--last',
+        action='store_true',
+        help='Imprimir apenas a última sequência gravada'
+    )
+    
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Servir as bases por HTTP com consultas por período e cache'
+    )
+    serve_parser.add_argument(
+        'scrapers',
+        nargs='*',
+        help='Nomes dos scrapers (padrão: todos)'
+    )
+    serve_parser.add_argument(
+        '--host',
+        help='Interface de escuta (padrão: SERVE_SETTINGS, 127.0.0.1)'
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        help='Porta de escuta (padrão: SERVE_SETTINGS, 8000)'
+    )
     
     # Status command
-    subparsers.add_parser(
+    status_parser = subparsers.add_parser(
         'status', 
         help='Verificar status dos scrapers'
     )
+    status_parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Imprimir o status em JSON'
+    )
     
     # List command
     subparsers.add_parser(
@@ -83,6 +299,14 @@ Exemplos de uso:
     
     args = parser.parse_args()
     
+    configure_logging()
+    
+    if args.base_url:
+        REQUEST_SETTINGS["base_url"] = args.base_url
+    
+    if getattr(args, 'profile', None):
+        PROFILE_SETTINGS["profile_dir"] = args.profile
+    
     if not args.command:
         parser.print_help()
         return 1
@@ -91,11 +315,37 @@ Exemplos de uso:
         scraper = ANBIMAScraper()
         
         if args.command == 'run-all':
-            return _run_all(scraper, args.force)
+            names = scraper.get_available_scrapers()
+            with _memory_tracing(args.trace_memory, scraper, names):
+                code = _run_all(scraper, args.force)
+            _export_metrics(scraper, names, args.summary, args.metrics_file)
+            if args.trace_memory:
+                _show_memory(scraper, names)
+            return code
         elif args.command == 'run':
-            return _run_specific(scraper, args.scrapers, args.force)
+            with _memory_tracing(args.trace_memory, scraper, args.scrapers):
+                code = _run_specific(scraper, args.scrapers, args.force)
+            _export_metrics(scraper, args.scrapers,
+                            args.summary, args.metrics_file)
+            if args.trace_memory:
+                _show_memory(scraper, args.scrapers)
+            return code
+        elif args.command == 'backfill':
+            return _run_backfill(scraper, args)
+        elif args.command == 'daemon':
+            return _run_daemon(scraper, args.scrapers)
+        elif args.command == 'plan':
+            return _show_plan(scraper, args.scrapers, args.force, args.verbose)
+        elif args.command == 'history':
+            return _show_history(scraper, args.scrapers, args.limit)
+        elif args.command == 'export':
+            return _run_export(scraper, args)
+        elif args.command == 'changes':
+            return _show_changes(scraper, args.dataset, args.since, args.last)
+        elif args.command == 'serve':
+            return _run_serve(scraper, args.scrapers, args.host, args.port)
         elif args.command == 'status':
-            return _show_status(scraper)
+            return _show_status(scraper, args.json)
         elif args.command == 'list':
             return _list_scrapers(scraper)
         else:
@@ -110,6 +360,108 @@ Exemplos de uso:
         return 1
 
 
+def _add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the run metrics options to a run command."""
+    parser.add_argument(
+        '--summary',
+        action='store_true',
+        help='Imprimir o resumo JSON da execução por etapa (HTTP, leitura, gravação)'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        help='Textfile do Prometheus com as métricas da execução '
+             '(padrão: METRICS_SETTINGS["textfile"])'
+    )
+
+
+def _add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the profiling options to a run command."""
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='profiles',
+        metavar='DIR',
+        help='Gravar um perfil cProfile (.pstats e .txt) por scraper em DIR '
+             '(padrão: profiles)'
+    )
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Medir pico de memória e principais alocações por etapa '
+             '(download, leitura, limpeza, gravação) com tracemalloc'
+    )
+
+
+@contextmanager
+def _memory_tracing(enabled: bool, scraper: ANBIMAScraper,
+                    scraper_names: List[str]) -> Iterator[None]:
+    """Trace memory allocations with tracemalloc while running scrapers.
+
+    Scrapers are built (and their modules imported) before tracing starts,
+    so import-time allocations do not slow down per-stage snapshots.
+    """
+    if not enabled:
+        yield
+        return
+
+    from .utils.profiling import start_memory_tracing, stop_memory_tracing
+
+    for name in scraper_names:
+        if name in scraper.scrapers:
+            scraper.scrapers[name].calendar
+    start_memory_tracing()
+    try:
+        yield
+    finally:
+        peak = stop_memory_tracing()
+        if peak is not None:
+            print(f"\nPico de memória rastreada: {peak / 1e6:.2f} MB")
+
+
+def _show_memory(scraper: ANBIMAScraper, scraper_names: List[str]) -> None:
+    """Show the peak memory and top allocation sites per stage of a run.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        scraper_names: Scrapers that ran
+    """
+    summaries = scraper.get_run_metrics(scraper_names)
+
+    print("\nMemória por Etapa:")
+    print("-" * 80)
+    for name, summary in summaries.items():
+        for stage, result in summary.get("memory", {}).items():
+            print(f"{name:<25} {stage:<10} pico {result['peak_bytes'] / 1e6:>8.2f} MB")
+            for site in result["top_sites"]:
+                print(f"    {site['bytes'] / 1e3:>10.1f} KB  {site['site']}")
+    print("-" * 80)
+
+
+def _export_metrics(scraper: ANBIMAScraper, scraper_names: List[str],
+                    summary: bool, metrics_file: Optional[str]) -> None:
+    """Print and export the per-stage metrics of a run.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        scraper_names: Scrapers that ran
+        summary: Print the JSON run summary
+        metrics_file: Prometheus textfile (defaults to METRICS_SETTINGS)
+    """
+    from .utils.metrics import write_prometheus_textfile
+
+    summaries = scraper.get_run_metrics(scraper_names)
+
+    if summary:
+        print(json.dumps(summaries, indent=2, ensure_ascii=False))
+
+    metrics_file = metrics_file or METRICS_SETTINGS["textfile"]
+    if metrics_file:
+        try:
+            write_prometheus_textfile(summaries, metrics_file)
+        except OSError as e:
+            logger.error(f"Erro ao gravar métricas em {metrics_file}: {e}")
+
+
 def _run_all(scraper: ANBIMAScraper, force: bool) -> int:
     """Run all scrapers.
 
@@ -175,34 +527,333 @@ def _run_specific(scraper: ANBIMAScraper,
     return 0 if successful == len(results) else 1
 
 
-def _show_status(scraper: ANBIMAScraper) -> int:
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD command line date."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Data inválida: {value}")
+
+
+def _run_backfill(scraper: ANBIMAScraper, args: argparse.Namespace) -> int:
+    """Backfill the history of one scraper.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        args: Parsed backfill arguments
+
+    Returns:
+        Exit code
+    """
+    logger.info(f"Carga histórica de {args.dataset} desde {args.start_date}")
+
+    report = scraper.backfill(
+        args.dataset,
+        args.start_date,
+        args.end_date,
+        chunk_business_days=args.chunk_days,
+        max_workers=args.workers,
+        restart=args.restart,
+    )
+    if report is None:
+        return 1
+
+    print("\nCarga Histórica:")
+    print("-" * 50)
+    print(f"Dataset:          {report.dataset}")
+    print(f"Dias úteis:       {report.total_dates}")
+    print(f"Já concluídos:    {report.already_completed}")
+    print(f"Concluídos agora: {report.completed}")
+    print(f"Falhas:           {report.failed}")
+    print(f"Tempo:            {report.elapsed_seconds:.1f}s "
+          f"({report.dates_per_second:.2f} dias/s)")
+    print("-" * 50)
+
+    return 0 if report.success else 1
+
+
+def _run_export(scraper: ANBIMAScraper, args: argparse.Namespace) -> int:
+    """Export the base of one scraper.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        args: Parsed export arguments
+
+    Returns:
+        Exit code
+    """
+    logger.info(f"Exportando {args.dataset} em {args.export_format}")
+
+    rows = scraper.export(
+        args.dataset,
+        args.output,
+        args.export_format,
+        args.start_date,
+        args.end_date,
+    )
+    if rows is None:
+        return 1
+
+    print(f"{rows} linhas de {args.dataset} exportadas")
+    return 0
+
+
+def _show_changes(scraper: ANBIMAScraper, dataset: str, since: int,
+                  last_only: bool) -> int:
+    """Print the change batches of a dataset as JSON lines.
+
+    Each line is a written row with its batch in ``_sequence``.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        dataset: Scraper whose changes are printed
+        since: Last sequence number already processed
+        last_only: Print only the last sequence number
+
+    Returns:
+        Exit code
+    """
+    from .utils.change_feed import ChangesExpiredError
+
+    if dataset not in scraper.get_available_scrapers():
+        logger.error(f"Scraper desconhecido: {dataset}")
+        return 1
+
+    if last_only:
+        print(scraper.scrapers[dataset].change_feed.last_sequence())
+        return 0
+
+    try:
+        for batch in scraper.changes(dataset, since):
+            if batch.rows.empty:
+                continue
+            rows = batch.rows.copy()
+            rows.insert(0, '_sequence', batch.sequence)
+            sys.stdout.write(rows.to_json(
+                orient='records', lines=True, date_format='iso',
+                force_ascii=False
+            ).rstrip('\n') + '\n')
+    except ChangesExpiredError as e:
+        logger.error(f"Alterações expiradas, recarregue a base completa: {e}")
+        return 1
+
+    return 0
+
+
+def _run_daemon(scraper: ANBIMAScraper, scraper_names: List[str]) -> int:
+    """Run the daemon until interrupted.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        scraper_names: Scrapers to keep updated (all if empty)
+
+    Returns:
+        Exit code
+    """
+    from .core.daemon import ScraperDaemon
+
+    try:
+        daemon = ScraperDaemon(scraper, scraper_names or None)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+    
+    return 0
+
+
+def _run_serve(scraper: ANBIMAScraper, scraper_names: List[str],
+               host: Optional[str], port: Optional[int]) -> int:
+    """Serve the read API until interrupted.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        scraper_names: Scrapers to serve (all if empty)
+        host: Interface to bind (SERVE_SETTINGS if None)
+        port: Port to bind (SERVE_SETTINGS if None)
+
+    Returns:
+        Exit code
+    """
+    from .core.read_api import ReadAPIServer
+
+    try:
+        server = ReadAPIServer(scraper, scraper_names or None, host, port)
+    except (ValueError, OSError) as e:
+        logger.error(str(e))
+        return 1
+
+    print(f"Servindo em {server.base_url} (consulte {server.base_url}/)")
+    # SIGTERM ends serving like Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    
+    return 0
+
+
+def _show_plan(scraper: ANBIMAScraper, scraper_names: List[str],
+               force: bool, verbose: bool) -> int:
+    """Show the requests a run would make and their estimated cost.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        scraper_names: Scrapers to plan (all if empty)
+        force: Force update flag
+        verbose: List every planned request
+
+    Returns:
+        Exit code
+    """
+    plans = scraper.plan(scraper_names or None, force_update=force)
+
+    if verbose:
+        print("\nRequisições Planejadas:")
+        print("-" * 80)
+        for plan in plans:
+            for request in plan.requests:
+                if request.start_date is None:
+                    dates = "-"
+                elif request.start_date == request.end_date:
+                    dates = request.start_date.isoformat()
+                else:
+                    dates = f"{request.start_date}..{request.end_date}"
+                print(f"{request.dataset:<25} {dates:<22} {request.url}")
+
+    print("\nPlano de Execução:")
+    print("-" * 70)
+    print(f"{'Scraper':<25} {'Requisições':>12} {'MB':>10} {'Tempo (s)':>12}")
+    print("-" * 70)
+
+    for plan in plans:
+        marker = "" if plan.from_history else " *"
+        print(f"{plan.dataset:<25} {plan.request_count:>12} "
+              f"{plan.estimated_bytes / 1e6:>10.2f} "
+              f"{plan.estimated_seconds:>12.1f}{marker}")
+
+    print("-" * 70)
+    total_requests = sum(plan.request_count for plan in plans)
+    total_bytes = sum(plan.estimated_bytes for plan in plans)
+    total_seconds = sum(plan.estimated_seconds for plan in plans)
+    print(f"{'Total':<25} {total_requests:>12} {total_bytes / 1e6:>10.2f} "
+          f"{total_seconds:>12.1f}")
+    if any(not plan.from_history for plan in plans):
+        print("* estimativa padrão (sem histórico de execuções)")
+
+    return 0 if len(plans) == len(scraper_names or plans) else 1
+
+
+def _show_history(scraper: ANBIMAScraper, scraper_names: List[str],
+                  limit: Optional[int]) -> int:
+    """Show recorded runs and flag those deviating from their baseline.
+
+    Args:
+        scraper: ANBIMA scraper instance
+        scraper_names: Scrapers to show (all recorded if empty)
+        limit: Runs per scraper
+
+    Returns:
+        Exit code, 1 if the latest run of a scraper was flagged
+    """
+    history = scraper.history(scraper_names or None, limit)
+
+    print("\nHistórico de Execuções:")
+    print("-" * 110)
+    print(f"{'Scraper':<20} {'Início':<20} {'Tempo (s)':>10} {'Req.':>6} "
+          f"{'MB':>8} {'Linhas':>9} {'Bytes/linha':>12} {'Cache':>6} "
+          f"{'Erros':>6}  Alertas")
+    print("-" * 110)
+
+    latest_flagged = False
+    for name, trends in history.items():
+        for trend in trends:
+            run = trend.run
+            bytes_per_row = (
+                f"{run.bytes_per_row:.0f}" if run.bytes_per_row is not None else "-"
+            )
+            alerts = []
+            baseline_duration = trend.baseline_duration
+            if "duration" in trend.flags and baseline_duration:
+                ratio = run.duration_seconds / baseline_duration
+                alerts.append(f"tempo {ratio:.1f}x")
+            baseline_bytes = trend.baseline_bytes_per_row
+            if ("bytes_per_row" in trend.flags and baseline_bytes
+                    and run.bytes_per_row is not None):
+                ratio = run.bytes_per_row / baseline_bytes
+                alerts.append(f"bytes/linha {ratio:.1f}x")
+            if not run.success:
+                alerts.append("falhou")
+            print(f"{name:<20} {run.started_at:%Y-%m-%d %H:%M:%S} "
+                  f"{run.duration_seconds:>10.1f} {run.requests:>6} "
+                  f"{run.bytes / 1e6:>8.2f} {run.rows:>9} {bytes_per_row:>12} "
+                  f"{run.cache_hits:>6} {run.errors:>6}  {', '.join(alerts)}")
+        if trends and trends[-1].flags:
+            latest_flagged = True
+
+    print("-" * 110)
+    if not any(history.values()):
+        print("Nenhuma execução registrada")
+
+    return 1 if latest_flagged else 0
+
+
+def _show_status(scraper: ANBIMAScraper, as_json: bool = False) -> int:
     """Show scraper status.
 
     Args:
         scraper: ANBIMA scraper instance
+        as_json: Print the status as JSON instead of a table
 
     Returns:
         Exit code
     """
     logger.info("Verificando status dos scrapers...")
     
-    status = scraper.get_scraper_status()
+    status = scraper.get_dataset_status()
+    
+    if as_json:
+        print(json.dumps({
+            name: dataset.to_dict() if dataset else None
+            for name, dataset in status.items()
+        }, indent=2))
+        return 0
     
     print("\nStatus dos Scrapers:")
-    print("-" * 60)
-    print(f"{'Scraper':<25} {'Última Data':<20} {'Status'}")
-    print("-" * 60)
+    print("-" * 120)
+    print(f"{'Scraper':<25} {'Última Data':<12} {'Linhas':>10} {'Datas':>7} "
+          f"{'Lacunas':>8} {'Atraso (d.u.)':>14} {'Última execução (s)':>20}  "
+          f"{'Status'}")
+    print("-" * 120)
     
-    for name, last_date in status.items():
-        if last_date is None:
-            status_text = "Sem dados"
+    for name, dataset in status.items():
+        if dataset is None or dataset.last_date is None:
+            print(f"{name:<25} {'N/A':<12} {'':>10} {'':>7} {'':>8} {'':>14} "
+                  f"{'':>20}  Sem dados")
+            continue
+        
+        if dataset.lag_business_days:
+            status_text = f"Defasado ({dataset.lag_business_days} d.u.)"
         else:
             status_text = "Atualizado"
         
-        date_str = last_date.strftime("%Y-%m-%d") if last_date else "N/A"
-        print(f"{name:<25} {date_str:<20} {status_text}")
+        run_str = (
+            f"{dataset.last_run_seconds:.1f}"
+            if dataset.last_run_seconds is not None else "N/A"
+        )
+        print(f"{name:<25} {dataset.last_date.strftime('%Y-%m-%d'):<12} "
+              f"{dataset.rows:>10} {dataset.dates:>7} {dataset.gaps:>8} "
+              f"{dataset.lag_business_days:>14} {run_str:>20}  {status_text}")
     
-    print("-" * 60)
+    print("-" * 120)
     
     return 0
 
@@ -1,6 +1,8 @@
 """Configuration settings for ANBIMA scraper."""
 
+import os
 from pathlib import Path
+from typing import Any, Dict
 
 # Base directory
 BASE_DIR = Path(__file__).parent.parent.parent.parent
@@ -11,9 +13,8 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 LOGS_DIR = BASE_DIR / "logs"
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Directories are created by the code writing into them (see
+# configure_logging and the stores), so importing settings touches no disk
 
 # ANBIMA URLs
 ANBIMA_URLS = {
@@ -31,18 +32,51 @@ ANBIMA_URLS = {
     "debentures": (
         "https://www.anbima.com.br/pt_br/informar/debentures-mercado-secundario.htm"
     ),
+    "titulos_publicos": (
+        "https://www.anbima.com.br/pt_br/informar/taxas-de-titulos-publicos.htm"
+    ),
+}
+
+# ANBIMA download endpoints (raw CSV/TXT outputs behind the pages above)
+ANBIMA_DOWNLOAD_URLS = {
+    "ima_quadro_resumo": (
+        "http://www.anbima.com.br/informacoes/ima/IMA-geral-down.asp"
+    ),
+    "curva_juros_fechamento": (
+        "https://www.anbima.com.br/informacoes/est-termo/CZ-down.asp"
+    ),
+    # Daily files are served as {url}{yymmdd}.txt
+    "debentures": (
+        "https://www.anbima.com.br/informacoes/merc-sec-debentures/arqs/db"
+    ),
+    "titulos_publicos": "http://www.anbima.com.br/informacoes/merc-sec/arqs/ms",
+    "ima_carteiras": (
+        "http://www.anbima.com.br/informacoes/ima/ima-carteira-down.asp"
+    ),
+}
+
+# Largest DataIni/DataFim span (in business days) accepted per request.
+# ima_carteiras is absent: compositions are one snapshot per Dt_Ref.
+RANGE_REQUEST_SETTINGS: Dict[str, Dict[str, int]] = {
+    "ima_quadro_resumo": {"max_business_days": 20},
 }
 
 # File paths
 FILE_PATHS = {
     "indicators": PROCESSED_DATA_DIR / "indicators_anbima.csv",
     "idka": PROCESSED_DATA_DIR / "idka_base.csv",
-    "ima_carteiras": PROCESSED_DATA_DIR / "ima_carteiras_base.csv",
-    "curva_juros_fechamento": PROCESSED_DATA_DIR / "curva_juros_fechamento.csv",
+    # Directory of memory-mappable arrays (see utils.curve_store)
+    "curva_juros_fechamento": PROCESSED_DATA_DIR / "curva_juros_fechamento",
     "ima_quadro_resumo": PROCESSED_DATA_DIR / "ima_quadro_resumo_base.csv",
-    "debentures": PROCESSED_DATA_DIR / "debentures_base.csv",
+    # Date-partitioned columnar store (see utils.columnar_store)
+    "debentures": PROCESSED_DATA_DIR / "debentures",
+    "ima_carteiras": PROCESSED_DATA_DIR / "ima_carteiras",
+    "titulos_publicos": PROCESSED_DATA_DIR / "titulos_publicos",
 }
 
+# Request statistics of past runs (see utils.run_stats)
+RUN_STATS_FILE = DATA_DIR / "run_stats.json"
+
 # User agents file
 USER_AGENTS_FILE = BASE_DIR / "user-agents.txt"
 
@@ -50,10 +84,18 @@ USER_AGENTS_FILE = BASE_DIR / "user-agents.txt"
 HOLIDAYS_FILE = BASE_DIR / "ANBIMA.txt"
 
 # Request settings
-REQUEST_SETTINGS = {
+REQUEST_SETTINGS: Dict[str, Any] = {
     "timeout": 30,
     "max_retries": 3,
     "retry_delay": 1,
+    # Parallel downloads per scraper and pooled connections per host
+    "max_workers": 4,
+    "pool_maxsize": 10,
+    # Simultaneous requests to one host across all scrapers
+    "max_connections_per_host": 4,
+    # Scheme and host replacing www.anbima.com.br in every request (e.g.
+    # the local stand-in server of anbima_scraper.testing.server)
+    "base_url": os.environ.get("ANBIMA_BASE_URL"),
     "headers": {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -106,16 +148,18 @@ LOGGING_CONFIG = {
 }
 
 # Data processing settings
-DATA_SETTINGS = {
+DATA_SETTINGS: Dict[str, Any] = {
     "encoding": "utf-8",
     "csv_separator": ";",
     "date_format": "%Y-%m-%d",
     "datetime_format": "%Y-%m-%d %H:%M:%S",
     "anbima_date_format": "%d/%m/%Y",
+    # fsync written files before replacing or reporting them as stored
+    "fsync": False,
 }
 
 # Business days settings
-BUSINESS_DAYS_SETTINGS = {
+BUSINESS_DAYS_SETTINGS: Dict[str, Any] = {
     "calendar_name": "ANBIMA",
     "weekdays": ["Sunday", "Saturday"],
     "holidays_file": HOLIDAYS_FILE,
@@ -137,4 +181,139 @@ INDICATOR_MAPPINGS = {
     "TR2": "tr",
     "TBF2": "tbf",
     "FDS4": "fds",
-} 
\ No newline at end of file
+}
+
+# Historical backfill settings
+BACKFILL_SETTINGS: Dict[str, Any] = {
+    # Business days handed to one scrape() call
+    "chunk_business_days": 20,
+    # Chunks running at the same time
+    "max_workers": 4,
+    # SQLite database of completed (dataset, date) units
+    "state_file": DATA_DIR / "backfill_state.sqlite3",
+}
+
+# Scheduler settings for run_all / run_multiple
+SCHEDULER_SETTINGS: Dict[str, Any] = {
+    # Scrapers running at the same time
+    "max_workers": 4,
+    # Scrapers running at the same time against the same host
+    "max_per_host": 3,
+    # Seconds before a scraper run is abandoned (None waits forever)
+    "timeout": 1800,
+    # Per-scraper overrides of the timeout
+    "timeouts": {
+        "indicators": 120,
+    },
+}
+
+
+# Run metrics export (see utils.metrics)
+METRICS_SETTINGS: Dict[str, Any] = {
+    # Prometheus textfile rewritten after run and run-all, e.g. inside the
+    # node_exporter textfile collector directory (None disables it)
+    "textfile": os.environ.get("ANBIMA_METRICS_TEXTFILE"),
+}
+
+
+# Opt-in profiling of scraper runs (see utils.profiling)
+PROFILE_SETTINGS: Dict[str, Any] = {
+    # Directory receiving one cProfile dump per scraper run (None disables)
+    "profile_dir": None,
+    # Functions listed in the text report of a profile
+    "top_functions": 40,
+    # Allocation sites reported per stage when tracing memory
+    "top_allocations": 10,
+    # Frames kept per traced allocation
+    "trace_frames": 1,
+}
+
+# Exports of processed bases (see utils.export)
+EXPORT_SETTINGS: Dict[str, Any] = {
+    # Default directory of exported files
+    "directory": DATA_DIR / "exports",
+    # Rows read from a base at a time, which bounds export memory
+    "chunk_rows": 50_000,
+    # Excel number format of date cells
+    "xlsx_date_format": "yyyy-mm-dd",
+    # Arrow IPC snapshots memory-mapped by load() (see utils.arrow_snapshot)
+    "arrow_directory": DATA_DIR / "arrow",
+}
+
+
+# Change-data feed of rows written to each dataset (see utils.change_feed)
+CHANGE_FEED_SETTINGS: Dict[str, Any] = {
+    # Record one delta batch per successful write
+    "enabled": True,
+    # One subdirectory of batches per dataset
+    "directory": DATA_DIR / "changes",
+    # Format of new batches: "jsonl" or "parquet" (requires pyarrow)
+    "format": "jsonl",
+    # Batches older than this are deleted (None keeps them)
+    "retention_days": 30,
+    # Latest batches kept per dataset (None keeps them)
+    "retention_batches": None,
+}
+
+
+# Local read API of the serve command (see core.read_api)
+SERVE_SETTINGS: Dict[str, Any] = {
+    "host": "127.0.0.1",
+    "port": 8000,
+    # Cache-Control max-age of query responses, in seconds
+    "max_age": 60,
+}
+
+
+# Ledger of past runs used by the history command (see utils.run_history)
+RUN_HISTORY_SETTINGS: Dict[str, Any] = {
+    "path": DATA_DIR / "run_history.sqlite3",
+    # Runs listed per scraper
+    "show_runs": 10,
+    # Previous successful runs whose median is the baseline of a run
+    "baseline_runs": 20,
+    # Ratio to the baseline above which duration or bytes per row is flagged
+    "threshold": 1.5,
+}
+
+
+# Run planning estimates for datasets without run statistics yet
+PLAN_SETTINGS: Dict[str, Any] = {
+    "default_bytes_per_request": 100_000,
+    "default_seconds_per_request": 1.5,
+}
+
+# Daemon settings: each dataset is polled around the window in which ANBIMA
+# usually publishes the data of a business day (HH:MM, in "timezone")
+DAEMON_SETTINGS: Dict[str, Any] = {
+    "timezone": "America/Sao_Paulo",
+    "publication_windows": {
+        "indicators": ("17:00", "19:30"),
+        "idka": ("18:00", "20:30"),
+        "ima_carteiras": ("18:00", "20:30"),
+        "ima_quadro_resumo": ("18:00", "20:30"),
+        "curva_juros_fechamento": ("17:30", "19:30"),
+        "debentures": ("18:00", "20:30"),
+        "titulos_publicos": ("17:30", "19:30"),
+    },
+    # Window of datasets without an entry above (e.g. plugins)
+    "default_window": ("18:00", "21:00"),
+    # Seconds between polls inside the publication window
+    "window_interval": 30,
+    # Start polling this many seconds before the window opens
+    "window_lead": 300,
+    # Backoff once the window has closed without new data
+    "late_interval": 300,
+    "max_backoff": 3600,
+}
+
+
+def configure_logging() -> None:
+    """Apply LOGGING_CONFIG, creating the logs directory first.
+
+    Logging is configured by entry points (CLI, scripts), never on import.
+    """
+    import logging.config
+
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    logging.config.dictConfig(LOGGING_CONFIG)
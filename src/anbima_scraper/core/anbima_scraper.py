@@ -2,13 +2,28 @@
 
 import logging
 from datetime import date
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Union
 
-from ..scrapers.debentures import DebenturesScraper
-from ..scrapers.idka import IDKAScraper
-from ..scrapers.ima import IMAQuadroResumoScraper, IMACarteirasScraper
-from ..scrapers.curves import CurvaJurosFechamentoScraper
-from ..scrapers.indicators import IndicatorsScraper
+from ..config.settings import (
+    BACKFILL_SETTINGS,
+    EXPORT_SETTINGS,
+    RUN_HISTORY_SETTINGS,
+    SCHEDULER_SETTINGS,
+)
+from ..utils.profiling import diagnostics_enabled
+from .registry import ScraperRegistry
+from .scheduler import Job, Scheduler
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+    from ..utils.change_feed import ChangeBatch
+    from ..utils.dataset_metadata import DatasetStatus
+    from ..utils.run_history import RunTrend
+    from .backfill import BackfillReport
+    from .run_plan import DatasetPlan
 
 logger = logging.getLogger(__name__)
 
@@ -16,20 +31,22 @@ logger = logging.getLogger(__name__)
 class ANBIMAScraper:
     """Main class to coordinate all ANBIMA scrapers."""
 
-    def __init__(self):
-        """Initialize the ANBIMA scraper."""
-        self.scrapers = {
-            "indicators": IndicatorsScraper(),
-            "idka": IDKAScraper(),
-            "ima_carteiras": IMACarteirasScraper(),
-            "ima_quadro_resumo": IMAQuadroResumoScraper(),
-            "curva_juros_fechamento": CurvaJurosFechamentoScraper(),
-            "debentures": DebenturesScraper(),
-        }
+    def __init__(self, registry: Optional[ScraperRegistry] = None):
+        """Initialize the ANBIMA scraper.
+
+        Scrapers are built on first use, so listing them or running a
+        single one does not pay for the others.
+
+        Args:
+            registry: Scraper registry (defaults to built-ins and plugins)
+        """
+        self.scrapers = registry if registry is not None else ScraperRegistry()
 
     def run_all(self, force_update: bool = False) -> Dict[str, bool]:
         """Run all scrapers.
 
+        Independent scrapers run concurrently (see ``run_multiple``).
+
         Args:
             force_update: Force update even if data exists
 
@@ -37,24 +54,9 @@ class ANBIMAScraper:
             Dictionary with scraper results
         """
         logger.info("Starting ANBIMA scraper for all data sources")
-        
-        results = {}
-        
-        for name, scraper in self.scrapers.items():
-            logger.info(f"Running {name} scraper")
-            try:
-                success = scraper.run(force_update=force_update)
-                results[name] = success
-                
-                if success:
-                    logger.info(f"{name} scraper completed successfully")
-                else:
-                    logger.error(f"{name} scraper failed")
-                    
-            except Exception as e:
-                logger.error(f"Error running {name} scraper: {e}")
-                results[name] = False
-        
+
+        results = self.run_multiple(list(self.scrapers), force_update)
+
         # Log summary
         successful = sum(1 for success in results.values() if success)
         total = len(results)
@@ -99,6 +101,12 @@ class ANBIMAScraper:
                     force_update: bool = False) -> Dict[str, bool]:
         """Run multiple specific scrapers.
 
+        Scrapers run concurrently under the global and per-host limits of
+        SCHEDULER_SETTINGS, each after the scrapers it depends on, and are
+        reported as failed if they exceed their timeout. While profiling or
+        tracing memory they run one at a time, so each gets its own
+        profile and stage peaks.
+
         Args:
             scraper_names: List of scraper names to run
             force_update: Force update even if data exists
@@ -109,6 +117,7 @@ class ANBIMAScraper:
         logger.info(f"Running scrapers: {', '.join(scraper_names)}")
         
         results = {}
+        jobs = {}
         
         for name in scraper_names:
             if name not in self.scrapers:
@@ -116,9 +125,233 @@ class ANBIMAScraper:
                 results[name] = False
                 continue
             
-            results[name] = self.run_scraper(name, force_update)
-        
-        return results
+            jobs[name] = self._build_job(name, force_update)
+
+        if diagnostics_enabled():
+            logger.info("Profiling or tracing memory: running scrapers one at a time")
+            scheduler = Scheduler(max_workers=1)
+        else:
+            scheduler = Scheduler()
+        results.update(scheduler.run(jobs))
+
+        return {name: results[name] for name in scraper_names}
+
+    def _build_job(self, scraper_name: str, force_update: bool) -> Job:
+        """Describe a scraper run for the scheduler.
+
+        Args:
+            scraper_name: Name of the scraper
+            force_update: Force update even if data exists
+
+        Returns:
+            Scheduler job
+        """
+        scraper = self.scrapers[scraper_name]
+        timeout = SCHEDULER_SETTINGS["timeouts"].get(
+            scraper_name, SCHEDULER_SETTINGS["timeout"]
+        )
+        return Job(
+            func=lambda: scraper.run(force_update=force_update),
+            host=scraper.host,
+            depends_on=scraper.depends_on,
+            timeout=timeout,
+        )
+
+    def backfill(self, scraper_name: str, start_date: date,
+                 end_date: Optional[date] = None,
+                 chunk_business_days: Optional[int] = None,
+                 max_workers: Optional[int] = None,
+                 restart: bool = False) -> Optional["BackfillReport"]:
+        """Backfill the history of a scraper, resuming from its checkpoint.
+
+        Args:
+            scraper_name: Name of the scraper to backfill
+            start_date: First date of the history
+            end_date: Last date (defaults to the previous business day)
+            chunk_business_days: Business days per chunk
+            max_workers: Chunks running at the same time
+            restart: Forget previously completed dates first
+
+        Returns:
+            Backfill report or None if the scraper cannot be backfilled
+        """
+        if scraper_name not in self.scrapers:
+            logger.error(f"Unknown scraper: {scraper_name}")
+            return None
+
+        from ..utils.backfill_state import BackfillState
+        from .backfill import BackfillRunner
+
+        # The runner turns off skipping of stored dates and closes the
+        # session when done; a separate instance keeps both away from runs
+        # using the shared one. Writes to the base still share its lock.
+        scraper = self.scrapers.create(scraper_name)
+        if not scraper.supports_backfill:
+            logger.error(f"Scraper {scraper_name} does not support backfill")
+            return None
+
+        with BackfillState(BACKFILL_SETTINGS["state_file"]) as state:
+            if restart:
+                state.reset(scraper_name)
+            runner = BackfillRunner(
+                scraper, state, chunk_business_days, max_workers
+            )
+            return runner.run(start_date, end_date)
+
+    def plan(self, scraper_names: Optional[List[str]] = None,
+             force_update: bool = False) -> List["DatasetPlan"]:
+        """Compute the requests a run would make, without network access.
+
+        Args:
+            scraper_names: Scrapers to plan (defaults to all)
+            force_update: Plan a forced run
+
+        Returns:
+            One plan per scraper able to plan its requests
+        """
+        from .run_plan import RunPlanner
+
+        scrapers = []
+        for name in scraper_names or list(self.scrapers):
+            if name not in self.scrapers:
+                logger.error(f"Unknown scraper: {name}")
+                continue
+            scrapers.append(self.scrapers[name])
+
+        return RunPlanner().plan_all(scrapers, force_update)
+
+    def export(self, scraper_name: str, path: Optional[Path] = None,
+               export_format: str = "xlsx",
+               start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> Optional[int]:
+        """Export the stored base of a scraper, streaming it in chunks.
+
+        Args:
+            scraper_name: Scraper whose base is exported
+            path: Output file (defaults to EXPORT_SETTINGS["directory"])
+            export_format: Output format (see utils.export.EXPORT_WRITERS)
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+
+        Returns:
+            Rows exported, None if the export failed
+        """
+        if scraper_name not in self.scrapers:
+            logger.error(f"Unknown scraper: {scraper_name}")
+            return None
+
+        from ..utils.export import EXPORT_WRITERS
+
+        if export_format not in EXPORT_WRITERS:
+            logger.error(f"Unknown export format: {export_format}")
+            return None
+
+        if path is None:
+            path = EXPORT_SETTINGS["directory"] / f"{scraper_name}.{export_format}"
+
+        scraper = self.scrapers[scraper_name]
+        try:
+            return EXPORT_WRITERS[export_format](
+                scraper.iter_chunks(start_date, end_date), Path(path), scraper_name
+            )
+        except Exception as e:
+            logger.error(f"Error exporting {scraper_name}: {e}")
+            return None
+
+    def load(self, scraper_name: str, start_date: Optional[date] = None,
+             end_date: Optional[date] = None,
+             columns: Optional[Sequence[str]] = None,
+             as_frame: bool = False
+             ) -> Union["pyarrow.Table", "pandas.DataFrame"]:
+        """Load the stored rows of a scraper from its Arrow snapshot.
+
+        The snapshot is memory-mapped and date ranges and columns are
+        sliced out of it, so years of data open without parsing or
+        copying (see ``BaseScraper.load_arrow``).
+
+        Args:
+            scraper_name: Scraper whose base is loaded
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            columns: Columns to load (all by default)
+            as_frame: Return a DataFrame backed by the Arrow buffers
+                (``pd.ArrowDtype`` columns) instead of a ``pyarrow.Table``
+
+        Returns:
+            Rows in date order
+
+        Raises:
+            KeyError: If the scraper is unknown
+            ImportError: If pyarrow is not installed
+        """
+        if scraper_name not in self.scrapers:
+            raise KeyError(f"Unknown scraper: {scraper_name}")
+
+        table = self.scrapers[scraper_name].load_arrow(start_date, end_date, columns)
+        if as_frame:
+            import pandas as pd
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return table
+
+    def changes(self, scraper_name: str, since: int = 0) -> Iterator["ChangeBatch"]:
+        """Read the rows written to a dataset after a sequence number.
+
+        Consumers store the sequence of the last batch they processed and
+        pass it on their next call, so each run reads only new rows.
+
+        Args:
+            scraper_name: Scraper whose changes are read
+            since: Last sequence number already processed (0 for all)
+
+        Returns:
+            Batches in sequence order
+
+        Raises:
+            KeyError: If the scraper is unknown
+            ChangesExpiredError: If batches after ``since`` were pruned
+        """
+        if scraper_name not in self.scrapers:
+            raise KeyError(f"Unknown scraper: {scraper_name}")
+        return self.scrapers[scraper_name].change_feed.changes(since)
+
+    def history(self, scraper_names: Optional[List[str]] = None,
+                limit: Optional[int] = None) -> Dict[str, List["RunTrend"]]:
+        """Compare the latest recorded runs with their rolling baseline.
+
+        Args:
+            scraper_names: Scrapers to show (defaults to every recorded one)
+            limit: Runs per scraper (defaults to RUN_HISTORY_SETTINGS)
+
+        Returns:
+            Latest runs of each scraper with a recorded history
+        """
+        from ..utils.run_history import RunHistory
+
+        with RunHistory(RUN_HISTORY_SETTINGS["path"]) as history:
+            return {
+                name: history.trends(
+                    name,
+                    limit or RUN_HISTORY_SETTINGS["show_runs"],
+                    RUN_HISTORY_SETTINGS["baseline_runs"],
+                    RUN_HISTORY_SETTINGS["threshold"],
+                )
+                for name in scraper_names or history.datasets()
+            }
+
+    def get_run_metrics(self, scraper_names: List[str]) -> Dict[str, Dict]:
+        """Get the per-stage metrics of the last run of each scraper.
+
+        Args:
+            scraper_names: Scrapers that ran
+
+        Returns:
+            Run summaries by scraper (see RunMetrics.summary)
+        """
+        return {
+            name: self.scrapers[name].metrics.summary()
+            for name in scraper_names
+            if name in self.scrapers
+        }
 
     def get_available_scrapers(self) -> List[str]:
         """Get list of available scrapers.
@@ -128,20 +361,70 @@ class ANBIMAScraper:
         """
         return list(self.scrapers.keys())
 
+    def get_dataset_status(self, scraper_names: Optional[List[str]] = None,
+                           today: Optional[date] = None
+                           ) -> Dict[str, Optional["DatasetStatus"]]:
+        """Get the freshness and size of each dataset from its metadata.
+
+        Bases are not read, except once for a dataset without metadata
+        yet; the last run of each scraper comes from the run history.
+
+        Args:
+            scraper_names: Scrapers to check (defaults to all)
+            today: Date freshness is measured against (defaults to today)
+
+        Returns:
+            Status by scraper, None for scrapers whose status failed
+        """
+        from ..utils.run_history import RunHistory
+
+        history = None
+        if Path(RUN_HISTORY_SETTINGS["path"]).exists():
+            history = RunHistory(RUN_HISTORY_SETTINGS["path"])
+
+        status: Dict[str, Optional["DatasetStatus"]] = {}
+        try:
+            for name in scraper_names or self.get_available_scrapers():
+                try:
+                    runs = history.runs(name, limit=1) if history else []
+                    status[name] = self.scrapers[name].get_status(
+                        today, runs[-1] if runs else None
+                    )
+                except Exception as e:
+                    logger.error(f"Error getting status for {name}: {e}")
+                    status[name] = None
+        finally:
+            if history is not None:
+                history.close()
+
+        return status
+
     def get_scraper_status(self) -> Dict[str, Optional[date]]:
         """Get status of all scrapers (last available date).
 
         Returns:
             Dictionary with scraper names and their last available dates
         """
-        status = {}
-        
-        for name, scraper in self.scrapers.items():
-            try:
-                last_date = scraper.get_last_available_date()
-                status[name] = last_date
-            except Exception as e:
-                logger.error(f"Error getting status for {name}: {e}")
-                status[name] = None
-        
-        return status 
\ No newline at end of file
+        return {
+            name: status.last_date if status else None
+            for name, status in self.get_dataset_status().items()
+        }
+
+
+def load(dataset: str, start_date: Optional[date] = None,
+         end_date: Optional[date] = None,
+         columns: Optional[Sequence[str]] = None,
+         as_frame: bool = False) -> Union["pyarrow.Table", "pandas.DataFrame"]:
+    """Load the stored rows of a dataset (see ``ANBIMAScraper.load``).
+
+    Args:
+        dataset: Scraper whose base is loaded
+        start_date: First date (inclusive), unbounded if None
+        end_date: Last date (inclusive), unbounded if None
+        columns: Columns to load (all by default)
+        as_frame: Return an Arrow-backed DataFrame instead of a table
+
+    Returns:
+        Rows in date order
+    """
+    return ANBIMAScraper().load(dataset, start_date, end_date, columns, as_frame)
@@ -0,0 +1,221 @@
+"""Resumable historical backfill of ANBIMA datasets."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import List, NamedTuple, Optional
+
+from ..config.settings import BACKFILL_SETTINGS
+from ..utils.backfill_state import BackfillState
+from ..utils.request_planner import DateRange, RangeRequestPlanner
+from .scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillReport(NamedTuple):
+    """Outcome of a backfill run."""
+
+    dataset: str
+    total_dates: int
+    already_completed: int
+    completed: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def success(self) -> bool:
+        """Whether every pending date was completed."""
+        return self.failed == 0
+
+    @property
+    def dates_per_second(self) -> float:
+        """Throughput of the run, in dates per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed / self.elapsed_seconds
+
+
+class BackfillRunner:
+    """Scrape a dataset's history in parallel, resumable chunks.
+
+    Pending business days (those not yet recorded in the state database)
+    are split into chunks of consecutive days. Chunks run concurrently on
+    one scraper instance, sharing its HTTP session. Bases without a
+    columnar store are rewritten whenever rows land before their last
+    date, so their chunks run one at a time in date order and each one
+    appends after the previous. The dates of a chunk that reached the
+    base are checkpointed at once, so a killed backfill resumes where it
+    stopped. Dates left without rows (failed downloads, unpublished days)
+    stay pending and are retried by the next run. Throughput and ETA are
+    logged after every chunk.
+
+    The runner changes the scraper's ``skip_stored_dates`` and closes its
+    session, so it should get an instance of its own (see
+    ``ScraperRegistry.create``).
+    """
+
+    def __init__(
+        self,
+        scraper: BaseScraper,
+        state: BackfillState,
+        chunk_business_days: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
+        """Initialize the runner.
+
+        Args:
+            scraper: Scraper of the dataset to backfill
+            state: Checkpoint database
+            chunk_business_days: Business days per scrape call
+            max_workers: Chunks running at the same time (always 1
+                without a columnar store)
+        """
+        if not scraper.supports_backfill:
+            raise ValueError(f"Scraper {scraper.name} does not support backfill")
+
+        self.scraper = scraper
+        self.state = state
+        if scraper.store is None:
+            self.max_workers = 1
+        else:
+            self.max_workers = max_workers or BACKFILL_SETTINGS["max_workers"]
+        self.planner = RangeRequestPlanner(
+            scraper.calendar,
+            chunk_business_days or BACKFILL_SETTINGS["chunk_business_days"]
+        )
+
+        self._progress_lock = threading.Lock()
+        self._done = 0
+        self._started = 0.0
+
+    def pending_chunks(self, start_date: date,
+                       end_date: date) -> List[DateRange]:
+        """Plan the chunks still missing between two dates.
+
+        Args:
+            start_date: First date of the history
+            end_date: Last date of the history
+
+        Returns:
+            Chunks of consecutive pending business days
+        """
+        dates = self.scraper.calendar.get_business_days_range(start_date, end_date)
+        completed = self.state.completed_dates(self.scraper.name, start_date, end_date)
+        return self.planner.plan(dt for dt in dates if dt not in completed)
+
+    def run(self, start_date: date,
+            end_date: Optional[date] = None) -> BackfillReport:
+        """Backfill the dataset between two dates.
+
+        Args:
+            start_date: First date of the history
+            end_date: Last date (defaults to the previous business day)
+
+        Returns:
+            Backfill report
+        """
+        calendar = self.scraper.calendar
+        if end_date is None:
+            end_date = calendar.get_previous_business_day(date.today())
+
+        name = self.scraper.name
+        total = len(calendar.get_business_days_range(start_date, end_date))
+        chunks = self.pending_chunks(start_date, end_date)
+        pending = sum(len(chunk.dates) for chunk in chunks)
+
+        logger.info(
+            f"Backfilling {name} from {start_date} to {end_date}: "
+            f"{pending}/{total} dates pending in {len(chunks)} chunks"
+        )
+
+        self._done = 0
+        self._started = time.monotonic()
+        failed = 0
+
+        # Older dates must not be dropped for being before the last stored one
+        self.scraper.skip_stored_dates = False
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._run_chunk, chunk, pending)
+                    for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    failed += future.result()
+        finally:
+            self.scraper.skip_stored_dates = True
+            self.scraper.close()
+
+        report = BackfillReport(
+            dataset=name,
+            total_dates=total,
+            already_completed=total - pending,
+            completed=pending - failed,
+            failed=failed,
+            elapsed_seconds=time.monotonic() - self._started,
+        )
+        logger.info(
+            f"Backfill of {name} finished: {report.completed} dates completed, "
+            f"{report.failed} failed, {report.dates_per_second:.2f} dates/s"
+        )
+        return report
+
+    def _run_chunk(self, chunk: DateRange, pending: int) -> int:
+        """Scrape one chunk and checkpoint the dates that were stored.
+
+        Scrapers succeed when part of a range could not be downloaded, so
+        completion is read from the base rather than from the result.
+
+        Args:
+            chunk: Consecutive business days to scrape
+            pending: Dates pending in the whole run, for the ETA
+
+        Returns:
+            Dates of the chunk left without rows
+        """
+        try:
+            self.scraper.scrape(chunk.start, chunk.end)
+        except Exception as e:
+            logger.error(
+                f"Error backfilling {self.scraper.name} from {chunk.start} "
+                f"to {chunk.end}: {e}"
+            )
+
+        try:
+            stored = self.scraper.stored_dates(chunk.dates)
+        except Exception as e:
+            logger.error(f"Error reading stored dates of {self.scraper.name}: {e}")
+            stored = []
+
+        missing = len(chunk.dates) - len(stored)
+        if missing:
+            logger.error(
+                f"Chunk {chunk.start} to {chunk.end} of {self.scraper.name}: "
+                f"{missing} of {len(chunk.dates)} dates not stored"
+            )
+        if stored:
+            self.state.mark_completed(self.scraper.name, stored)
+            self._report_progress(len(stored), pending)
+        return missing
+
+    def _report_progress(self, completed: int, pending: int) -> None:
+        """Log throughput and estimated time to completion.
+
+        Args:
+            completed: Dates completed by the chunk that just finished
+            pending: Dates pending in the whole run
+        """
+        with self._progress_lock:
+            self._done += completed
+            done = self._done
+
+        elapsed = time.monotonic() - self._started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = timedelta(seconds=round((pending - done) / rate)) if rate else None
+        logger.info(
+            f"Backfill {self.scraper.name}: {done}/{pending} dates "
+            f"({rate:.2f} dates/s, ETA {eta if eta is not None else 'n/a'})"
+        )
@@ -0,0 +1,231 @@
+"""Long-running scraper daemon with publication-aware polling."""
+
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from ..config.settings import DAEMON_SETTINGS
+from ..utils.concurrency import run_concurrently
+from .anbima_scraper import ANBIMAScraper
+
+logger = logging.getLogger(__name__)
+
+
+class PublicationWindow(NamedTuple):
+    """Time of day in which ANBIMA usually publishes a dataset."""
+
+    start: time
+    end: time
+
+    @classmethod
+    def parse(cls, window: Sequence[str]) -> "PublicationWindow":
+        """Build a window from ("HH:MM", "HH:MM") strings."""
+        start, end = (datetime.strptime(value, "%H:%M").time() for value in window)
+        return cls(start, end)
+
+
+class DatasetState:
+    """Warm state of one dataset between polls."""
+
+    def __init__(self, name: str, window: PublicationWindow):
+        """Initialize the state.
+
+        Args:
+            name: Dataset (scraper) name
+            window: Publication window of the dataset
+        """
+        self.name = name
+        self.window = window
+        self.last_date: Optional[date] = None
+        self.late_polls = 0
+        self.next_poll = datetime.min
+
+
+class ScraperDaemon:
+    """Keep scrapers warm and poll each dataset around its publication.
+
+    Scrapers, the calendar and the last stored date of every dataset stay
+    in memory between polls. Each poll is a regular scraper run, so its
+    metrics, run history and change batches are recorded as for ``run``.
+    A dataset that is up to date sleeps until shortly before the next
+    publication window; from then on its data is due and it is polled
+    every few seconds until the window closes, and with exponential
+    backoff afterwards if no new data arrived.
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[ANBIMAScraper] = None,
+        datasets: Optional[List[str]] = None,
+        clock: Optional[Callable[[], datetime]] = None
+    ):
+        """Initialize the daemon.
+
+        Args:
+            scraper: Scraper coordinator (defaults to all registered scrapers)
+            datasets: Datasets to keep updated (defaults to all)
+            clock: Function returning the current local time
+        """
+        self.scraper = scraper or ANBIMAScraper()
+        self.clock = clock or self._local_now
+        self._stop = threading.Event()
+
+        windows = DAEMON_SETTINGS["publication_windows"]
+        names = datasets or list(self.scraper.scrapers)
+        self.states: Dict[str, DatasetState] = {}
+        for name in names:
+            if name not in self.scraper.scrapers:
+                raise ValueError(f"Unknown scraper: {name}")
+            window = windows.get(name, DAEMON_SETTINGS["default_window"])
+            self.states[name] = DatasetState(name, PublicationWindow.parse(window))
+
+    @staticmethod
+    def _local_now() -> datetime:
+        """Current time in the ANBIMA timezone, as a naive datetime."""
+        try:
+            from zoneinfo import ZoneInfo
+
+            tz = ZoneInfo(DAEMON_SETTINGS["timezone"])
+            return datetime.now(tz).replace(tzinfo=None)
+        except Exception:
+            return datetime.now()
+
+    def warm_up(self) -> None:
+        """Build every scraper and load the last stored dates."""
+        for state in self.states.values():
+            scraper = self.scraper.scrapers[state.name]
+            state.last_date = scraper.get_last_available_date()
+            logger.info(f"{state.name}: last stored date {state.last_date}")
+
+    def expected_date(self, state: DatasetState, now: datetime) -> date:
+        """Latest reference date whose publication window has opened.
+
+        A window counts as open from DAEMON_SETTINGS["window_lead"] seconds
+        before its start, so early publications are picked up.
+
+        Args:
+            state: Dataset state
+            now: Current local time
+
+        Returns:
+            Reference date that should be available
+        """
+        calendar = self.scraper.scrapers[state.name].calendar
+        today = now.date()
+        opens = datetime.combine(today, state.window.start) - timedelta(
+            seconds=DAEMON_SETTINGS["window_lead"]
+        )
+        if calendar.is_business_day(today) and now >= opens:
+            return today
+        return calendar.get_previous_business_day(today)
+
+    def schedule(self, state: DatasetState, now: datetime) -> datetime:
+        """Compute when a dataset should be polled next.
+
+        Args:
+            state: Dataset state, after its last poll
+            now: Current local time
+
+        Returns:
+            Time of the next poll
+        """
+        expected = self.expected_date(state, now)
+
+        if state.last_date is not None and state.last_date >= expected:
+            calendar = self.scraper.scrapers[state.name].calendar
+            next_date = calendar.get_next_business_day(state.last_date)
+            opens = datetime.combine(next_date, state.window.start)
+            return max(
+                opens - timedelta(seconds=DAEMON_SETTINGS["window_lead"]), now
+            )
+
+        closes = datetime.combine(expected, state.window.end)
+        if now <= closes:
+            return now + timedelta(seconds=DAEMON_SETTINGS["window_interval"])
+
+        backoff = min(
+            DAEMON_SETTINGS["late_interval"] * 2 ** state.late_polls,
+            DAEMON_SETTINGS["max_backoff"]
+        )
+        return now + timedelta(seconds=backoff)
+
+    def poll(self, state: DatasetState, now: datetime) -> bool:
+        """Fetch the missing dates of a dataset, up to the expected one.
+
+        Args:
+            state: Dataset state
+            now: Current local time
+
+        Returns:
+            True if new data was stored, False otherwise
+        """
+        scraper = self.scraper.scrapers[state.name]
+        expected = self.expected_date(state, now)
+        dates = [
+            dt for dt in scraper.calendar.get_date_range_for_download(state.last_date)
+            if dt <= expected
+        ]
+        if not dates:
+            return False
+
+        try:
+            if not scraper.run(end_date=expected):
+                logger.warning(f"{state.name}: poll run failed")
+            last_date = scraper.get_last_available_date()
+        except Exception as e:
+            logger.error(f"Error polling {state.name}: {e}")
+            return False
+
+        if last_date is not None and (
+            state.last_date is None or last_date > state.last_date
+        ):
+            logger.info(f"{state.name}: new data up to {last_date}")
+            state.last_date = last_date
+            state.late_polls = 0
+            return True
+
+        if now > datetime.combine(expected, state.window.end):
+            state.late_polls += 1
+        return False
+
+    def run_once(self) -> datetime:
+        """Poll every due dataset and reschedule them.
+
+        Returns:
+            Time of the next due poll
+        """
+        now = self.clock()
+        due = [state for state in self.states.values() if state.next_poll <= now]
+
+        if due:
+            run_concurrently(lambda state: self.poll(state, now), due)
+            now = self.clock()
+            for state in due:
+                state.next_poll = self.schedule(state, now)
+                logger.debug(f"{state.name}: next poll at {state.next_poll}")
+
+        return min(state.next_poll for state in self.states.values())
+
+    def run_forever(self) -> None:
+        """Poll until ``stop`` is called."""
+        logger.info(f"Daemon started for {', '.join(self.states)}")
+        self.warm_up()
+        try:
+            while not self._stop.is_set():
+                wake = self.run_once()
+                delay = (wake - self.clock()).total_seconds()
+                self._stop.wait(max(delay, 0))
+        finally:
+            self.close()
+            logger.info("Daemon stopped")
+
+    def stop(self) -> None:
+        """Ask ``run_forever`` to return."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Close the HTTP sessions of the built scrapers."""
+        for name in self.states:
+            if self.scraper.scrapers.is_loaded(name):
+                self.scraper.scrapers[name].close()
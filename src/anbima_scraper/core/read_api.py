@@ -0,0 +1,466 @@
+"""Local HTTP API answering range queries over the stored datasets.
+
+Each dataset is held in memory as one DataFrame sorted by date, so a
+``/{dataset}?from=&to=&indice=`` query is a binary search plus a filter
+instead of a read of the base. Responses carry an ETag derived from the
+source stamp of the base (see ``BaseScraper.source_stamp``): clients
+revalidating with ``If-None-Match`` get a 304 until the next write.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import date
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Tuple, Union,
+)
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import CHANGE_FEED_SETTINGS, DATA_SETTINGS, SERVE_SETTINGS
+from ..utils.change_feed import ChangesExpiredError
+from ..utils.export import import_pyarrow
+
+if TYPE_CHECKING:
+    from .anbima_scraper import ANBIMAScraper
+    from .scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+# (status, body, content type)
+Response = Tuple[int, bytes, str]
+
+# Response formats by the name accepted in the format parameter
+FORMATS = {
+    "json": "application/json; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+class DatasetIndex:
+    """Rows of one dataset held in memory, sorted by date.
+
+    The index remembers the source stamp and the change feed sequence it
+    reflects. When a write changes the stamp, only the batches recorded
+    since that sequence are merged in, replacing rows with the same key as
+    the stores do. The base is read in full on first use, when the feed is
+    disabled, when the batches needed are gone, or when the stamp moved
+    without any new batch (a rewrite such as ``save_data``, or a write
+    whose batch could not be recorded).
+    """
+
+    def __init__(self, scraper: "BaseScraper"):
+        """Initialize the index (rows are loaded on first refresh).
+
+        Args:
+            scraper: Scraper owning the dataset
+        """
+        self.scraper = scraper
+        self.rows = pd.DataFrame()
+        self.stamp: Optional[str] = None
+        self.sequence = 0
+        self._lock = threading.Lock()
+
+    def refresh(self) -> str:
+        """Bring the rows up to date with the base.
+
+        Returns:
+            Source stamp the rows reflect
+        """
+        with self._lock:
+            # Read before the feed, so a write landing meanwhile is seen
+            # again on the next refresh rather than missed
+            stamp = self.scraper.source_stamp()
+            if stamp == self.stamp:
+                return stamp
+
+            if self.stamp is None or not CHANGE_FEED_SETTINGS["enabled"]:
+                self._reload()
+            else:
+                try:
+                    if not self._apply_changes():
+                        logger.info(
+                            f"Reloading {self.scraper.name}: base changed "
+                            f"without change batches"
+                        )
+                        self._reload()
+                except ChangesExpiredError as e:
+                    logger.info(f"Reloading {self.scraper.name}: {e}")
+                    self._reload()
+
+            self.stamp = stamp
+            return stamp
+
+    def _reload(self) -> None:
+        """Read every stored row."""
+        # Batches written during the read are merged again by key later
+        sequence = self.scraper.change_feed.last_sequence()
+        self.rows = self._merge(list(self.scraper.iter_chunks()))
+        self.sequence = sequence
+        logger.info(f"Loaded {len(self.rows)} rows of {self.scraper.name}")
+
+    def _apply_changes(self) -> bool:
+        """Merge the batches written since the last refresh.
+
+        Returns:
+            True if any batch was merged
+        """
+        batches = list(self.scraper.change_feed.changes(self.sequence))
+        if not batches:
+            return False
+        self.rows = self._merge([self.rows] + [batch.rows for batch in batches])
+        self.sequence = batches[-1].sequence
+        logger.debug(
+            f"Applied {len(batches)} change batches to {self.scraper.name}"
+        )
+        return True
+
+    def _merge(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Combine frames into the sorted rows, later rows winning by key."""
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        # CSV bases only type the date column; batches carry every date
+        # typed, so align them before comparing keys
+        date_columns = {
+            col for df in frames for col in df.columns
+            if pd.api.types.is_datetime64_any_dtype(df[col])
+        }
+        for position, df in enumerate(frames):
+            untyped = [
+                col for col in date_columns
+                if col in df.columns
+                and not pd.api.types.is_datetime64_any_dtype(df[col])
+            ]
+            if untyped:
+                df = df.copy()
+                for col in untyped:
+                    df[col] = pd.to_datetime(df[col], errors='coerce')
+                frames[position] = df
+
+        rows = pd.concat(frames, ignore_index=True)
+        if len(frames) > 1:
+            key = self.scraper.key_columns
+            if key and not set(key).issubset(rows.columns):
+                key = None
+            rows = rows.drop_duplicates(subset=key, keep='last')
+
+        date_column = self.scraper.date_column
+        if date_column in rows.columns:
+            rows = rows.sort_values(date_column, kind='mergesort')
+        series_column = self.scraper.series_column
+        if series_column in rows.columns:
+            rows[series_column] = rows[series_column].astype('category')
+        return rows.reset_index(drop=True)
+
+    def query(self, start_date: Optional[date] = None,
+              end_date: Optional[date] = None,
+              series: Optional[Sequence[str]] = None
+              ) -> Tuple[pd.DataFrame, Optional[str]]:
+        """Select rows by date range and series.
+
+        Args:
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            series: Values of the series column to keep (all if empty)
+
+        Returns:
+            Rows in date order, and the source stamp they reflect
+
+        Raises:
+            ValueError: If series are given for a dataset without series
+        """
+        with self._lock:
+            rows, stamp = self.rows, self.stamp
+
+        date_column = self.scraper.date_column
+        if ((start_date is not None or end_date is not None)
+                and date_column in rows.columns):
+            dates = rows[date_column].to_numpy()
+            first = 0
+            last = len(dates)
+            if start_date is not None:
+                first = int(np.searchsorted(
+                    dates, np.datetime64(start_date, 'D').astype(dates.dtype)
+                ))
+            if end_date is not None:
+                last = int(np.searchsorted(
+                    dates, np.datetime64(end_date, 'D').astype(dates.dtype),
+                    side='right'
+                ))
+            rows = rows.iloc[first:max(first, last)]
+
+        if series:
+            series_column = self.scraper.series_column
+            if series_column is None:
+                raise ValueError(f"{self.scraper.name} has no indice to filter by")
+            if series_column in rows.columns:
+                rows = rows[rows[series_column].isin(series)]
+
+        return rows, stamp
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a YYYY-MM-DD query parameter.
+
+    Raises:
+        ValueError: If the value is not a date
+    """
+    if not value:
+        return None
+    return date.fromisoformat(value)
+
+
+def _negotiate(accept: Optional[str]) -> str:
+    """Pick the response format from an Accept header (JSON by default)."""
+    media_types = {
+        content_type.split(';')[0]: name for name, content_type in FORMATS.items()
+    }
+    for media in (accept or "").split(','):
+        name = media_types.get(media.split(';')[0].strip())
+        if name is not None:
+            return name
+    return "json"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names the current ETag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in [tag[2:] if tag.startswith('W/') else tag
+                                   for tag in tags]
+
+
+def _encode(rows: pd.DataFrame, response_format: str) -> bytes:
+    """Serialize rows in a response format."""
+    body: bytes
+    if response_format == "csv":
+        body = rows.to_csv(
+            index=False,
+            sep=DATA_SETTINGS["csv_separator"],
+            date_format=DATA_SETTINGS["date_format"],
+        ).encode('utf-8')
+        return body
+
+    if response_format == "arrow":
+        pa = import_pyarrow()
+        table = pa.Table.from_pandas(rows, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        body = sink.getvalue().to_pybytes()
+        return body
+
+    body = rows.to_json(
+        orient='records', date_format='iso', date_unit='s', force_ascii=False
+    ).encode('utf-8')
+    return body
+
+
+def _error(status: int, message: str) -> Response:
+    """JSON error response."""
+    body = json.dumps({"error": message}, ensure_ascii=False).encode('utf-8')
+    return status, body, FORMATS["json"]
+
+
+class ReadAPIServer:
+    """Threaded HTTP server answering range queries from DatasetIndexes.
+
+    ``GET /`` lists the datasets served and ``GET /{dataset}`` returns its
+    rows, optionally restricted by ``from`` and ``to`` (YYYY-MM-DD) and by
+    ``indice`` (values of the dataset's series column, repeated or comma
+    separated). The format is chosen by the ``format`` parameter (json,
+    csv or arrow) or by the Accept header.
+    """
+
+    def __init__(
+        self,
+        scraper: "ANBIMAScraper",
+        datasets: Optional[Sequence[str]] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        max_age: Optional[int] = None,
+    ):
+        """Initialize the server (call ``start`` to serve).
+
+        Args:
+            scraper: ANBIMA scraper owning the datasets
+            datasets: Datasets to serve (all if None)
+            host: Interface to bind (defaults to SERVE_SETTINGS)
+            port: Port to bind, 0 picks a free one (defaults to SERVE_SETTINGS)
+            max_age: Cache-Control max-age in seconds (defaults to SERVE_SETTINGS)
+
+        Raises:
+            ValueError: If a dataset is unknown
+        """
+        names = datasets or list(scraper.scrapers)
+        self.indexes: Dict[str, DatasetIndex] = {}
+        for name in names:
+            if name not in scraper.scrapers:
+                raise ValueError(f"Unknown scraper: {name}")
+            self.indexes[name] = DatasetIndex(scraper.scrapers[name])
+        self.max_age = SERVE_SETTINGS["max_age"] if max_age is None else max_age
+        self._thread: Optional[threading.Thread] = None
+
+        self.httpd = _HTTPServer(
+            (host or SERVE_SETTINGS["host"],
+             SERVE_SETTINGS["port"] if port is None else port),
+            _Handler,
+        )
+        self.httpd.read_api = self
+
+    @property
+    def base_url(self) -> str:
+        """URL the API is served at."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "ReadAPIServer":
+        """Serve requests in a background thread.
+
+        Returns:
+            The server itself
+        """
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="anbima-read-api", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Read API serving at {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> "ReadAPIServer":
+        """Context manager entry, starting the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Context manager exit."""
+        self.stop()
+
+    def respond(
+        self, path: str, query: str,
+        headers: Union[Mapping[str, str], Message]
+    ) -> Tuple[Response, Dict[str, str]]:
+        """Build the response to a request.
+
+        Args:
+            path: Request path
+            query: Raw query string
+            headers: Request headers
+
+        Returns:
+            Response and extra headers
+        """
+        name = path.strip('/')
+        if not name:
+            body = json.dumps({"datasets": sorted(self.indexes)}).encode('utf-8')
+            return (200, body, FORMATS["json"]), {}
+
+        index = self.indexes.get(name)
+        if index is None:
+            return _error(404, f"Unknown dataset: {name}"), {}
+
+        params = parse_qs(query)
+        try:
+            start_date = _parse_date(params.get("from", [None])[0])
+            end_date = _parse_date(params.get("to", [None])[0])
+        except ValueError:
+            return _error(400, "from/to must be dates in YYYY-MM-DD format"), {}
+        series = sorted({
+            value for values in params.get("indice", [])
+            for value in values.split(',') if value
+        })
+        response_format = params.get("format", [None])[0] or _negotiate(
+            headers.get("Accept")
+        )
+        if response_format not in FORMATS:
+            return _error(400, f"Unknown format: {response_format}"), {}
+
+        if series and index.scraper.series_column is None:
+            return _error(400, f"{name} has no indice to filter by"), {}
+
+        try:
+            stamp: Optional[str] = index.refresh()
+            cache_headers = self._cache_headers(stamp, response_format, query)
+            if _etag_matches(headers.get("If-None-Match"), cache_headers["ETag"]):
+                return (304, b"", FORMATS[response_format]), cache_headers
+
+            rows, stamp = index.query(start_date, end_date, series)
+            body = _encode(rows, response_format)
+        except ImportError as e:
+            return _error(406, str(e)), {}
+        except Exception as e:
+            logger.error(f"Error answering {path}?{query}: {e}")
+            return _error(500, "Internal error"), {}
+
+        # A write may have been merged between refresh and query
+        cache_headers = self._cache_headers(stamp, response_format, query)
+        return (200, body, FORMATS[response_format]), cache_headers
+
+    def _cache_headers(self, stamp: Optional[str], response_format: str,
+                       query: str) -> Dict[str, str]:
+        """Caching headers of a query response.
+
+        The ETag is strong: the same base, format and query always give
+        the same bytes.
+        """
+        digest = hashlib.sha1(
+            f"{stamp}|{response_format}|{query}".encode('utf-8')
+        ).hexdigest()
+        return {
+            "ETag": f'"{digest}"',
+            "Cache-Control": f"max-age={self.max_age}",
+            "Vary": "Accept",
+        }
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """HTTP server holding the ReadAPIServer its handlers delegate to."""
+
+    daemon_threads = True
+    read_api: ReadAPIServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating to the owning ReadAPIServer."""
+
+    protocol_version = "HTTP/1.1"
+    server: _HTTPServer
+
+    def do_GET(self) -> None:
+        """Serve a GET request."""
+        read_api = self.server.read_api
+        url = urlsplit(self.path)
+
+        (status, body, content_type), headers = read_api.respond(
+            url.path, url.query, self.headers
+        )
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Log requests at debug level instead of printing them."""
+        logger.debug(f"{self.address_string()} - {format % args}")
@@ -0,0 +1,160 @@
+"""Lazy registry of ANBIMA scrapers."""
+
+import importlib
+import logging
+import sys
+import threading
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    from .scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+# Entry-point group third-party packages use to add scrapers
+ENTRY_POINT_GROUP = "anbima_scraper.scrapers"
+
+# Built-in scrapers as "module:attribute" paths, imported on first use
+BUILTIN_SCRAPERS: Dict[str, str] = {
+    "indicators": "anbima_scraper.scrapers.indicators:IndicatorsScraper",
+    "idka": "anbima_scraper.scrapers.idka:IDKAScraper",
+    "ima_carteiras": "anbima_scraper.scrapers.ima:IMACarteirasScraper",
+    "ima_quadro_resumo": "anbima_scraper.scrapers.ima:IMAQuadroResumoScraper",
+    "curva_juros_fechamento": (
+        "anbima_scraper.scrapers.curves:CurvaJurosFechamentoScraper"
+    ),
+    "debentures": "anbima_scraper.scrapers.debentures:DebenturesScraper",
+    "titulos_publicos": (
+        "anbima_scraper.scrapers.titulos_publicos:TitulosPublicosScraper"
+    ),
+}
+
+Factory = Union[str, Callable[[], "BaseScraper"]]
+
+
+def _resolve(factory: Any) -> Callable[[], "BaseScraper"]:
+    """Turn a registered factory into a callable building the scraper.
+
+    Args:
+        factory: "module:attribute" path, entry point or callable
+
+    Returns:
+        Callable returning a scraper
+    """
+    builder: Callable[[], "BaseScraper"]
+    if isinstance(factory, str):
+        module_name, _, attribute = factory.partition(":")
+        builder = getattr(importlib.import_module(module_name), attribute)
+    elif not callable(factory):
+        # importlib.metadata entry point
+        builder = factory.load()
+    else:
+        builder = factory
+    return builder
+
+
+def _entry_points() -> Dict[str, Any]:
+    """Find scraper entry points installed by other packages."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8 without the backport
+        return {}
+
+    try:
+        if sys.version_info >= (3, 10):
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        else:
+            found = entry_points().get(ENTRY_POINT_GROUP, [])
+    except Exception as e:
+        logger.warning(f"Error reading scraper entry points: {e}")
+        return {}
+
+    return {ep.name: ep for ep in found}
+
+
+class ScraperRegistry(Mapping):
+    """Mapping of scraper names to scrapers built on first access.
+
+    Factories are "module:attribute" paths or callables; nothing is
+    imported or instantiated until a scraper is looked up, so listing
+    names is free. Scrapers published under the ``anbima_scraper.scrapers``
+    entry-point group are discovered too, built-ins taking precedence.
+    """
+
+    def __init__(self, factories: Optional[Dict[str, Factory]] = None,
+                 discover: bool = True):
+        """Initialize the registry.
+
+        Args:
+            factories: Factories by scraper name (defaults to built-ins)
+            discover: Also register scrapers from entry points
+        """
+        self._factories: Dict[str, Factory] = {}
+        self._instances: Dict[str, "BaseScraper"] = {}
+        self._lock = threading.Lock()
+
+        self._factories.update(
+            BUILTIN_SCRAPERS if factories is None else factories
+        )
+
+        if discover:
+            for name, entry_point in _entry_points().items():
+                self._factories.setdefault(name, entry_point)
+
+    def register(self, name: str, factory: Factory) -> None:
+        """Register (or replace) a scraper factory.
+
+        Args:
+            name: Scraper name
+            factory: "module:attribute" path or callable returning a scraper
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def create(self, name: str) -> "BaseScraper":
+        """Build a new scraper, separate from the one shared by lookups.
+
+        Callers changing a scraper's mode or closing its session (such as
+        backfills) use their own instance, so concurrent runs through the
+        registry are not affected.
+
+        Args:
+            name: Scraper name
+
+        Returns:
+            New scraper instance
+        """
+        return _resolve(self._factories[name])()
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a scraper has already been built."""
+        return name in self._instances
+
+    def __getitem__(self, name: str) -> "BaseScraper":
+        """Get a scraper, building it on first access."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+
+            instance = _resolve(self._factories[name])()
+            self._instances[name] = instance
+            logger.debug(f"Built scraper {name}")
+            return instance
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over scraper names without building them."""
+        return iter(list(self._factories))
+
+    def __len__(self) -> int:
+        """Number of registered scrapers."""
+        return len(self._factories)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a scraper name is registered."""
+        return name in self._factories
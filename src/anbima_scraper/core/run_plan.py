@@ -0,0 +1,108 @@
+"""Dry-run planning of scraper runs, without network access."""
+
+import logging
+from typing import Iterable, List, NamedTuple, Optional
+
+from ..config.settings import PLAN_SETTINGS, REQUEST_SETTINGS, RUN_STATS_FILE
+from ..utils.run_stats import RunStats
+from .scraper import BaseScraper, PlannedRequest
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetPlan(NamedTuple):
+    """Requests a run of one dataset would make and their estimated cost."""
+
+    dataset: str
+    requests: List[PlannedRequest]
+    estimated_bytes: float
+    estimated_seconds: float
+    # Whether the estimate comes from recorded runs or from defaults
+    from_history: bool
+
+    @property
+    def request_count(self) -> int:
+        """Number of planned requests."""
+        return len(self.requests)
+
+
+class RunPlanner:
+    """Compute the requests of a run from local state only.
+
+    Each scraper lists the (dataset, date, URL) requests its run would
+    make through ``plan_requests``, after the same stored-date filtering
+    the run applies. Bytes and time are estimated from the averages kept
+    in the run statistics file, or from PLAN_SETTINGS for datasets never
+    run; scrapers issuing requests concurrently divide the time by the
+    REQUEST_SETTINGS worker count.
+    """
+
+    def __init__(self, stats: Optional[RunStats] = None):
+        """Initialize the planner.
+
+        Args:
+            stats: Run statistics (defaults to RUN_STATS_FILE)
+        """
+        self.stats = stats if stats is not None else RunStats(RUN_STATS_FILE)
+
+    def plan(self, scraper: BaseScraper,
+             force_update: bool = False) -> DatasetPlan:
+        """Plan the run of one scraper.
+
+        Args:
+            scraper: Scraper to plan
+            force_update: Plan a forced run
+
+        Returns:
+            Dataset plan
+        """
+        dates = scraper.get_run_dates(force_update)
+        requests: List[PlannedRequest] = []
+        if dates:
+            # Mirror BaseScraper.run, which refreshes stored dates when forced
+            scraper.skip_stored_dates = not force_update
+            try:
+                requests = scraper.plan_requests(dates)
+            finally:
+                scraper.skip_stored_dates = True
+
+        cost = self.stats.cost(scraper.name)
+        if cost is not None:
+            bytes_per_request = cost.bytes_per_request
+            seconds_per_request = cost.seconds_per_request
+        else:
+            bytes_per_request = PLAN_SETTINGS["default_bytes_per_request"]
+            seconds_per_request = PLAN_SETTINGS["default_seconds_per_request"]
+
+        seconds = len(requests) * seconds_per_request
+        if scraper.concurrent_requests:
+            seconds /= REQUEST_SETTINGS["max_workers"]
+
+        return DatasetPlan(
+            dataset=scraper.name,
+            requests=requests,
+            estimated_bytes=len(requests) * bytes_per_request,
+            estimated_seconds=seconds,
+            from_history=cost is not None,
+        )
+
+    def plan_all(self, scrapers: Iterable[BaseScraper],
+                 force_update: bool = False) -> List[DatasetPlan]:
+        """Plan the runs of several scrapers.
+
+        Scrapers that cannot plan their requests are logged and left out.
+
+        Args:
+            scrapers: Scrapers to plan
+            force_update: Plan forced runs
+
+        Returns:
+            Dataset plans
+        """
+        plans = []
+        for scraper in scrapers:
+            try:
+                plans.append(self.plan(scraper, force_update))
+            except NotImplementedError as e:
+                logger.warning(str(e))
+        return plans
@@ -0,0 +1,192 @@
+"""Concurrent, dependency-aware execution of scraper runs."""
+
+import logging
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from ..config.settings import SCHEDULER_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+class Job(NamedTuple):
+    """A unit of work for the scheduler."""
+
+    func: Callable[[], bool]
+    host: str = ""
+    depends_on: Sequence[str] = ()
+    timeout: Optional[float] = None
+
+
+class Scheduler:
+    """Run jobs concurrently under global and per-host limits.
+
+    A job starts once every dependency it declares has succeeded; if a
+    dependency fails (or times out) the job is reported as failed without
+    running. Dependencies outside the submitted jobs are considered met.
+    Jobs exceeding their timeout are reported as failed and no longer
+    hold a slot; Python threads cannot be killed, so the abandoned call
+    finishes in the background.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 max_per_host: Optional[int] = None):
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Jobs running at the same time
+            max_per_host: Jobs running at the same time against one host
+        """
+        self.max_workers = max_workers or SCHEDULER_SETTINGS["max_workers"]
+        self.max_per_host = max_per_host or SCHEDULER_SETTINGS["max_per_host"]
+
+    def run(self, jobs: Dict[str, Job]) -> Dict[str, bool]:
+        """Run every job and collect their results.
+
+        Args:
+            jobs: Jobs by name
+
+        Returns:
+            Dictionary with job results, in submission order
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        self._check_cycles(jobs)
+
+        results: Dict[str, bool] = {}
+        waiting: List[str] = list(jobs)
+        running: Dict[Future, str] = {}
+        started: Dict[str, float] = {}
+        hosts: Counter = Counter()
+
+        # Timed-out calls keep their thread, so the pool is never the limit
+        executor = ThreadPoolExecutor(max_workers=max(len(jobs), 1))
+        try:
+            while waiting or running:
+                waiting = self._skip_failed_dependents(jobs, waiting, results)
+
+                for name in list(waiting):
+                    if len(running) >= self.max_workers:
+                        break
+                    job = jobs[name]
+                    if not self._dependencies_met(job, jobs, results):
+                        continue
+                    if job.host and hosts[job.host] >= self.max_per_host:
+                        continue
+
+                    waiting.remove(name)
+                    hosts[job.host] += 1
+                    started[name] = time.monotonic()
+                    running[executor.submit(job.func)] = name
+                    logger.info(f"Started {name}")
+
+                if not running:
+                    if waiting:
+                        # Only reachable if limits are misconfigured
+                        for name in waiting:
+                            logger.error(f"Could not schedule {name}")
+                            results[name] = False
+                        waiting = []
+                    break
+
+                done, _ = wait(
+                    running, timeout=self._next_timeout(jobs, running, started),
+                    return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    name = running.pop(future)
+                    hosts[jobs[name].host] -= 1
+                    results[name] = self._result(name, future)
+
+                now = time.monotonic()
+                for future, name in list(running.items()):
+                    timeout = jobs[name].timeout
+                    if timeout is not None and now - started[name] >= timeout:
+                        logger.error(f"{name} timed out after {timeout}s")
+                        running.pop(future)
+                        hosts[jobs[name].host] -= 1
+                        results[name] = False
+        finally:
+            executor.shutdown(wait=False)
+
+        return {name: results.get(name, False) for name in jobs}
+
+    @staticmethod
+    def _result(name: str, future: Future) -> bool:
+        """Get the result of a finished job, treating errors as failure."""
+        try:
+            success = bool(future.result())
+        except Exception as e:
+            logger.error(f"Error running {name}: {e}")
+            return False
+
+        if success:
+            logger.info(f"{name} completed successfully")
+        else:
+            logger.error(f"{name} failed")
+        return success
+
+    @staticmethod
+    def _dependencies_met(job: Job, jobs: Dict[str, Job],
+                          results: Dict[str, bool]) -> bool:
+        """Check whether every submitted dependency has succeeded."""
+        return all(
+            results.get(dep, False) for dep in job.depends_on if dep in jobs
+        )
+
+    @staticmethod
+    def _skip_failed_dependents(jobs: Dict[str, Job], waiting: List[str],
+                                results: Dict[str, bool]) -> List[str]:
+        """Fail waiting jobs whose dependencies have failed.
+
+        Returns:
+            Jobs still waiting
+        """
+        still_waiting = []
+        for name in waiting:
+            failed = [
+                dep for dep in jobs[name].depends_on
+                if dep in jobs and results.get(dep) is False
+            ]
+            if failed:
+                logger.error(f"Skipping {name}: dependency {failed[0]} failed")
+                results[name] = False
+            else:
+                still_waiting.append(name)
+        return still_waiting
+
+    @staticmethod
+    def _next_timeout(jobs: Dict[str, Job], running: Dict[Future, str],
+                      started: Dict[str, float]) -> Optional[float]:
+        """Seconds until the earliest running job times out."""
+        now = time.monotonic()
+        deadlines: List[float] = []
+        for name in running.values():
+            timeout = jobs[name].timeout
+            if timeout is not None:
+                deadlines.append(started[name] + timeout - now)
+        return max(min(deadlines), 0) if deadlines else None
+
+    @staticmethod
+    def _check_cycles(jobs: Dict[str, Job]) -> None:
+        """Raise ValueError if the submitted dependencies form a cycle."""
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle involving {name}")
+            visiting.add(name)
+            for dep in jobs[name].depends_on:
+                if dep in jobs:
+                    visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in jobs:
+            visit(name)
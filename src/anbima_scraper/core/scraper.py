@@ -1,24 +1,107 @@
 """Base scraper class for ANBIMA data."""
 
 import logging
+import threading
+import tracemalloc
 from abc import ABC, abstractmethod
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+    Sequence,
+)
+from urllib.parse import urlencode, urlsplit
 
 import pandas as pd
 
-from ..config.settings import FILE_PATHS
-from ..utils.calendar import ANBIMACalendar, format_date_for_anbima
+from ..config.settings import (
+    ANBIMA_DOWNLOAD_URLS,
+    ANBIMA_URLS,
+    CHANGE_FEED_SETTINGS,
+    DATA_SETTINGS,
+    EXPORT_SETTINGS,
+    FILE_PATHS,
+    REQUEST_SETTINGS,
+    RUN_HISTORY_SETTINGS,
+    RUN_STATS_FILE,
+)
+from ..utils.calendar import ANBIMACalendar, format_date_for_anbima, get_calendar
+from ..utils.change_feed import ChangeFeed
+from ..utils.columnar_store import ColumnarStore
 from ..utils.data_processor import DataProcessor
+from ..utils.dataset_metadata import DatasetMetadata, DatasetStatus
 from ..utils.http_client import ANBIMAHTTPClient
+from ..utils.metrics import RunMetrics
+from ..utils.profiling import MemoryTracer, profile_run
+from ..utils.run_history import RunHistory, RunRecord
+from ..utils.run_stats import RunStats
+
+if TYPE_CHECKING:
+    import pyarrow
 
 logger = logging.getLogger(__name__)
 
+# Process-wide locks serializing writes to the same base, shared by every
+# scraper instance writing it (e.g. a backfill next to a daemon poll)
+_write_locks: Dict[Path, threading.Lock] = {}
+_write_locks_lock = threading.Lock()
+
+
+def write_lock(path: Path) -> threading.Lock:
+    """Get the lock serializing writes to a base.
+
+    Args:
+        path: Output path of the base
+
+    Returns:
+        Lock shared by every writer of the same path
+    """
+    key = Path(path).absolute()
+    with _write_locks_lock:
+        lock = _write_locks.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _write_locks[key] = lock
+        return lock
+
+
+class PlannedRequest(NamedTuple):
+    """A request a run would make, as computed without network access."""
+
+    dataset: str
+    start_date: Optional[date]
+    end_date: Optional[date]
+    url: str
+
+    @classmethod
+    def build(cls, dataset: str, start_date: Optional[date],
+              end_date: Optional[date], url: str,
+              params: Optional[Dict] = None) -> "PlannedRequest":
+        """Build a planned request, encoding the query parameters."""
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        return cls(dataset, start_date, end_date, url)
+
 
 class BaseScraper(ABC):
     """Base class for all ANBIMA scrapers."""
 
+    # Date column of the output base and columns identifying one record
+    date_column: str = 'dt_referencia'
+    key_columns: Optional[List[str]] = None
+
+    # Column naming the series of a row (filtered by the read API's indice)
+    series_column: Optional[str] = None
+
+    # Whether past dates can be requested (see core.backfill)
+    supports_backfill: bool = True
+
+    # Scrapers whose output must be updated before this one runs
+    depends_on: Sequence[str] = ()
+
+    # Whether scrape() issues its requests concurrently
+    concurrent_requests: bool = False
+
     def __init__(self, name: str):
         """Initialize the scraper.
 
@@ -26,14 +109,99 @@ class BaseScraper(ABC):
             name: Scraper name
         """
         self.name = name
-        self.calendar = ANBIMACalendar()
         self.data_processor = DataProcessor()
-        self.http_client = ANBIMAHTTPClient()
+
+        # HTTP session created on first request (see http_client)
+        self._http_client: Optional[ANBIMAHTTPClient] = None
+        self._client_lock = threading.Lock()
         
         # Get output file path
-        self.output_file = FILE_PATHS.get(name)
-        if not self.output_file:
+        output_file = FILE_PATHS.get(name)
+        if not output_file:
             raise ValueError(f"No output file configured for scraper: {name}")
+        self.output_file: Path = output_file
+
+        # Columnar store used instead of the CSV base, set by subclasses
+        self.store: Optional[ColumnarStore] = None
+
+        # Drop dates up to the last stored one; backfills turn this off
+        self.skip_stored_dates = True
+
+        # HTTP, parse and write timings, reset by every run()
+        self.metrics = RunMetrics(name)
+
+    @property
+    def _write_lock(self) -> threading.Lock:
+        """Lock serializing writes to the base, across instances too."""
+        return write_lock(self.output_file)
+
+    @property
+    def calendar(self) -> ANBIMACalendar:
+        """Shared ANBIMA calendar, built on first use."""
+        return get_calendar()
+
+    @property
+    def http_client(self) -> ANBIMAHTTPClient:
+        """HTTP client, created on first use."""
+        if self._http_client is None:
+            with self._client_lock:
+                if self._http_client is None:
+                    self._http_client = ANBIMAHTTPClient(metrics=self.metrics)
+        return self._http_client
+
+    @http_client.setter
+    def http_client(self, client: ANBIMAHTTPClient) -> None:
+        """Replace the HTTP client, reporting to this scraper's metrics."""
+        if client.metrics is None:
+            client.metrics = self.metrics
+        self._http_client = client
+
+    @property
+    def uses_anbima(self) -> bool:
+        """Whether requests go to ANBIMA rather than another server.
+
+        Runs against another server (see REQUEST_SETTINGS["base_url"]) are
+        not recorded in run statistics nor in the run history, so they do
+        not skew plan estimates and baselines for ANBIMA.
+        """
+        client = self._http_client
+        if client is not None:
+            return not client.base_url
+        return not REQUEST_SETTINGS["base_url"]
+
+    def close(self) -> None:
+        """Record request statistics and close the HTTP client, if created."""
+        with self._client_lock:
+            if self._http_client is not None:
+                if self.uses_anbima:
+                    self._record_run_stats(self._http_client.stats)
+                self._http_client.close()
+                self._http_client = None
+
+    def _record_run_stats(self, stats: Dict[str, float]) -> None:
+        """Add the requests of the HTTP client to the run statistics."""
+        try:
+            RunStats(RUN_STATS_FILE).record(
+                self.name, int(stats["requests"]), int(stats["bytes"]),
+                stats["seconds"]
+            )
+        except Exception as e:
+            logger.warning(f"Error recording run statistics: {e}")
+
+    def _record_run_history(self, dates: List[date]) -> None:
+        """Append the finished run to the run history ledger."""
+        try:
+            run = RunRecord.from_summary(self.metrics.summary(), dates[0], dates[-1])
+            with RunHistory(RUN_HISTORY_SETTINGS["path"]) as history:
+                history.record(run)
+        except Exception as e:
+            logger.warning(f"Error recording run history: {e}")
+
+    @property
+    def host(self) -> str:
+        """Host the scraper downloads from, used for concurrency limits."""
+        url = ANBIMA_DOWNLOAD_URLS.get(self.name) or ANBIMA_URLS.get(self.name, "")
+        return urlsplit(url).netloc.lower()
 
     @abstractmethod
     def scrape(self, start_date: Optional[date] = None, 
@@ -55,6 +223,8 @@ class BaseScraper(ABC):
         Returns:
             Last available date or None if no data exists
         """
+        if self.store is not None:
+            return self.store.get_last_date()
         return self.data_processor.get_last_date_from_csv(self.output_file)
 
     def get_download_dates(self, days_back: int = 6) -> List[date]:
@@ -69,6 +239,24 @@ class BaseScraper(ABC):
         last_date = self.get_last_available_date()
         return self.calendar.get_date_range_for_download(last_date, days_back)
 
+    def filter_stored_dates(self, dates: List[date]) -> List[date]:
+        """Drop dates up to the last stored one, unless backfilling.
+
+        Args:
+            dates: Candidate dates
+
+        Returns:
+            Dates still to fetch
+        """
+        if not self.skip_stored_dates:
+            return dates
+        last_date = self.get_last_available_date()
+        if last_date is None:
+            return dates
+        remaining = [dt for dt in dates if dt > last_date]
+        self.metrics.add("http", cache_hits=len(dates) - len(remaining))
+        return remaining
+
     def should_download_date(self, dt: date, file_path: Path) -> bool:
         """Check if date should be downloaded.
 
@@ -85,6 +273,7 @@ class BaseScraper(ABC):
         
         if file_path.exists():
             logger.info(f"File already exists: {file_path}")
+            self.metrics.add("http", cache_hits=1)
             return False
         
         return True
@@ -102,17 +291,22 @@ class BaseScraper(ABC):
             logger.warning("No data to save")
             return False
 
-        # Clean data
-        df = self.data_processor.clean_dataframe(df)
-        
-        # Remove duplicates
-        df = self.data_processor.remove_duplicates(df)
-        
-        # Sort by date
-        df = self.data_processor.sort_by_date(df)
+        with self.metrics.trace("clean"):
+            # Clean data
+            df = self.data_processor.clean_dataframe(df)
+            
+            # Remove duplicates
+            df = self.data_processor.remove_duplicates(df)
+            
+            # Sort by date
+            df = self.data_processor.sort_by_date(df)
         
         # Save to file
-        return self.data_processor.save_csv_safe(df, self.output_file)
+        with self._write_lock, self.metrics.stage("write", rows=len(df)):
+            success = self.data_processor.save_csv_safe(df, self.output_file)
+            if success:
+                self.rebuild_metadata()
+            return success
 
     def append_data(self, df: pd.DataFrame) -> bool:
         """Append data to existing file.
@@ -127,41 +321,386 @@ class BaseScraper(ABC):
             logger.warning("No data to append")
             return False
 
-        # Clean data
-        df = self.data_processor.clean_dataframe(df)
-        
-        # Remove duplicates
-        df = self.data_processor.remove_duplicates(df)
-        
-        # Append to file
-        return self.data_processor.save_csv_safe(
-            df, self.output_file, mode='a'
+        with self.metrics.trace("clean"):
+            # Clean data
+            df = self.data_processor.clean_dataframe(df)
+            
+            # Remove duplicates
+            df = self.data_processor.remove_duplicates(
+                df, subset=self.key_columns
+            )
+
+        with self._write_lock, self.metrics.stage("write", rows=len(df)):
+            if self.store is not None:
+                success = self.store.append(df)
+            elif self.date_column not in df.columns:
+                success = self.data_processor.save_csv_safe(
+                    df, self.output_file, mode='a',
+                    header=not self.output_file.exists()
+                )
+            else:
+                # Append to file, keeping the base sorted by date
+                success = self.data_processor.append_csv_sorted(
+                    df, self.output_file, self.date_column, self.key_columns
+                )
+
+            # The batch is recorded before the metadata is replaced, so a
+            # reader seeing the new source stamp finds it in the feed
+            if success:
+                self.record_changes(df)
+            if success and self.date_column in df.columns:
+                dates = pd.to_datetime(df[self.date_column]).dt.date
+                self.update_metadata(dates.value_counts().to_dict())
+            return success
+
+    @property
+    def change_feed(self) -> ChangeFeed:
+        """Delta batches of the rows written to the dataset."""
+        return ChangeFeed(
+            Path(CHANGE_FEED_SETTINGS["directory"]) / self.name,
+            CHANGE_FEED_SETTINGS["format"],
+        )
+
+    def record_changes(self, df: pd.DataFrame) -> Optional[int]:
+        """Add the rows of a successful write to the change feed.
+
+        Batches beyond the configured retention are pruned afterwards. The
+        write is already stored, so a failure to record its rows does not
+        fail it; the sequence number is published without a batch instead
+        (see ``ChangeFeed.mark_lost``), so consumers reading across it get
+        ChangesExpiredError and resynchronize rather than miss the rows.
+
+        Args:
+            df: Rows written
+
+        Returns:
+            Sequence number of the batch, None if not recorded
+        """
+        if not CHANGE_FEED_SETTINGS["enabled"]:
+            return None
+        feed = self.change_feed
+        try:
+            sequence = feed.append(df)
+        except Exception as e:
+            logger.error(f"Error recording changes of {self.name}: {e}")
+            try:
+                feed.mark_lost()
+            except Exception as e:
+                logger.error(f"Error marking lost changes of {self.name}: {e}")
+            return None
+
+        try:
+            feed.prune(
+                CHANGE_FEED_SETTINGS["retention_days"],
+                CHANGE_FEED_SETTINGS["retention_batches"],
+            )
+        except Exception as e:
+            logger.warning(f"Error pruning changes of {self.name}: {e}")
+        return sequence
+
+    @property
+    def metadata(self) -> DatasetMetadata:
+        """Row counts per date of the output base, stored beside it."""
+        if self.store is not None:
+            return DatasetMetadata(Path(self.store.directory) / "metadata.json")
+        return DatasetMetadata(
+            self.output_file.with_name(self.output_file.stem + ".meta.json")
+        )
+
+    def count_stored_rows(
+        self,
+        dates: Optional[Iterable[date]] = None
+    ) -> Dict[date, int]:
+        """Count stored rows per reference date by reading the base.
+
+        This is the slow path behind the metadata, used to build it for
+        existing bases and to recount dates a write merged into.
+
+        Args:
+            dates: Dates to count (all stored dates if None)
+
+        Returns:
+            Rows by reference date
+        """
+        if self.store is not None:
+            return self.store.count_rows(dates)
+        if not self.output_file.exists():
+            return {}
+
+        df = self.data_processor.read_csv_safe(
+            self.output_file, usecols=[self.date_column]
+        )
+        if df is None or df.empty:
+            return {}
+        counts = pd.to_datetime(df[self.date_column]).dt.date.value_counts()
+        if dates is not None:
+            counts = counts[counts.index.isin(list(dates))]
+        stored: Dict[date, int] = counts.to_dict()
+        return stored
+
+    def stored_dates(self, dates: Iterable[date]) -> List[date]:
+        """Keep the dates that have rows in the base.
+
+        Without a columnar store the dataset metadata is read instead of
+        the base, which every write keeps up to date; the base is only
+        read when there is no metadata yet. Either is read under the
+        write lock, so rows being appended by a concurrent write are
+        never seen half written.
+
+        Args:
+            dates: Dates to check
+
+        Returns:
+            Dates with stored rows, in the given order
+        """
+        dates = list(dates)
+        with self._write_lock:
+            counts = self.metadata.load() if self.store is None else None
+            if counts is None:
+                counts = self.count_stored_rows(dates)
+        return [dt for dt in dates if counts.get(dt)]
+
+    def update_metadata(self, counts: Dict[date, int]) -> None:
+        """Record the dates a write touched in the dataset metadata.
+
+        Dates that were already stored may have been merged with the new
+        rows, so they are recounted from the base. Without metadata yet,
+        it is built from the whole base once.
+
+        Args:
+            counts: Rows written per reference date
+        """
+        try:
+            metadata = self.metadata
+            stored = metadata.load()
+            if stored is None:
+                self.rebuild_metadata()
+                return
+            merged = [dt for dt in counts if dt in stored]
+            if merged:
+                counts = {**counts, **self.count_stored_rows(merged)}
+            metadata.update(counts)
+        except Exception as e:
+            logger.warning(f"Error updating metadata of {self.name}: {e}")
+
+    def rebuild_metadata(self) -> Dict[date, int]:
+        """Recount every stored date and rewrite the metadata.
+
+        Returns:
+            Rows by reference date
+        """
+        counts = self.count_stored_rows()
+        self.metadata.replace(counts)
+        return counts
+
+    def iter_chunks(self, start_date: Optional[date] = None,
+                    end_date: Optional[date] = None,
+                    chunk_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Read the stored rows in date order, a bounded chunk at a time.
+
+        Columnar stores are read partition by partition and CSV bases
+        ``chunk_rows`` lines at a time, so consumers such as exports never
+        hold a multi-year base in memory.
+
+        Args:
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            chunk_rows: Rows per chunk (defaults to EXPORT_SETTINGS)
+
+        Yields:
+            Chunks of stored rows, dates typed as datetime64
+        """
+        chunk_rows = chunk_rows or EXPORT_SETTINGS["chunk_rows"]
+
+        if self.store is not None:
+            pending: List[pd.DataFrame] = []
+            pending_rows = 0
+            for dt in self.store.dates():
+                if start_date is not None and dt < start_date:
+                    continue
+                if end_date is not None and dt > end_date:
+                    break
+                df = self.store.read_partition(dt)
+                if df is None:
+                    continue
+                pending.append(df)
+                pending_rows += len(df)
+                if pending_rows >= chunk_rows:
+                    yield pd.concat(pending, ignore_index=True)
+                    pending, pending_rows = [], 0
+            if pending:
+                yield pd.concat(pending, ignore_index=True)
+            return
+
+        if not self.output_file.exists():
+            return
+
+        with pd.read_csv(
+            self.output_file,
+            sep=DATA_SETTINGS["csv_separator"],
+            encoding=DATA_SETTINGS["encoding"],
+            chunksize=chunk_rows,
+        ) as reader:
+            for chunk in reader:
+                if self.date_column not in chunk.columns:
+                    yield chunk
+                    continue
+                dates = pd.to_datetime(chunk[self.date_column])
+                chunk[self.date_column] = dates
+                mask = pd.Series(True, index=chunk.index)
+                if start_date is not None:
+                    mask &= dates >= pd.Timestamp(start_date)
+                if end_date is not None:
+                    mask &= dates <= pd.Timestamp(end_date)
+                if mask.any():
+                    yield chunk[mask]
+                # The base is kept sorted by date (see append_csv_sorted)
+                elif end_date is not None and dates.min() > pd.Timestamp(end_date):
+                    return
+
+    def source_stamp(self) -> str:
+        """Get a stamp of the stored base that changes with every write.
+
+        The metadata file is replaced by each write (see
+        ``update_metadata``), so its identity, modification time and size
+        tell copies of the base such as Arrow snapshots whether they are
+        stale. Without metadata yet, it is built from the base first.
+
+        Returns:
+            Stamp of the base
+        """
+        if not self.metadata.path.exists():
+            self.rebuild_metadata()
+        source = self.metadata.path.stat()
+        return f"{source.st_ino}-{source.st_mtime_ns}-{source.st_size}"
+
+    def load_arrow(self, start_date: Optional[date] = None,
+                   end_date: Optional[date] = None,
+                   columns: Optional[Sequence[str]] = None) -> "pyarrow.Table":
+        """Load stored rows as an Arrow table, memory-mapped without copies.
+
+        Rows are served from an Arrow IPC snapshot of the base under
+        EXPORT_SETTINGS["arrow_directory"]. The snapshot is stamped with
+        ``source_stamp`` and is rebuilt from the base only when that stamp
+        has changed.
+
+        Args:
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            columns: Columns to load (all by default)
+
+        Returns:
+            Rows in date order
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        from ..utils.arrow_snapshot import ArrowSnapshot
+
+        snapshot = ArrowSnapshot(
+            Path(EXPORT_SETTINGS["arrow_directory"]) / f"{self.name}.arrow",
+            self.date_column,
+        )
+        stamp = self.source_stamp()
+        if snapshot.stamp() != stamp:
+            logger.info(f"Building Arrow snapshot of {self.name}")
+            snapshot.build(self.iter_chunks(), self.name, stamp)
+
+        return snapshot.read(start_date, end_date, columns)
+
+    def get_status(self, today: Optional[date] = None,
+                   last_run: Optional[RunRecord] = None) -> DatasetStatus:
+        """Get the freshness and size of the dataset from its metadata.
+
+        The base is only read when no metadata exists yet, in which case
+        the metadata is built for the next calls.
+
+        Args:
+            today: Date freshness is measured against (defaults to today)
+            last_run: Last recorded run of the dataset
+
+        Returns:
+            Dataset status
+        """
+        counts = self.metadata.load()
+        if counts is None:
+            logger.info(f"Building metadata of {self.name} from its base")
+            counts = self.count_stored_rows()
+            if counts:
+                self.metadata.replace(counts)
+        return DatasetStatus.build(
+            self.name, counts, self.calendar, today or date.today(), last_run
         )
 
-    def run(self, force_update: bool = False) -> bool:
+    def get_run_dates(self, force_update: bool = False) -> List[date]:
+        """Get the dates a run would scrape.
+
+        Args:
+            force_update: Force update even if data exists
+
+        Returns:
+            List of dates
+        """
+        if force_update:
+            # Force update: scrape last 6 business days
+            return self.calendar.get_last_n_business_days(6)
+        # Normal update: get dates that need downloading
+        return self.get_download_dates()
+
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the requests scraping ``dates`` would make, offline.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            Planned requests
+
+        Raises:
+            NotImplementedError: If the scraper cannot plan its requests
+        """
+        raise NotImplementedError(f"{self.name} does not support planning")
+
+    def run(self, force_update: bool = False,
+            end_date: Optional[date] = None) -> bool:
         """Run the scraper.
 
+        The run is profiled when PROFILE_SETTINGS["profile_dir"] is set and
+        its stages are memory-traced while tracemalloc is tracing.
+
         Args:
             force_update: Force update even if data exists
+            end_date: Last date to scrape (today if None)
 
         Returns:
             True if successful, False otherwise
         """
+        with profile_run(self.name):
+            return self._run(force_update, end_date)
+
+    def _run(self, force_update: bool, end_date: Optional[date]) -> bool:
+        """Run the scraper, recording its metrics (see ``run``)."""
         logger.info(f"Starting {self.name} scraper")
+        self.metrics.reset()
+        self.metrics.memory = (
+            MemoryTracer(self.name) if tracemalloc.is_tracing() else None
+        )
+        success = False
+        dates: List[date] = []
         
         try:
-            if force_update:
-                # Force update: scrape last 6 business days
-                dates = self.calendar.get_last_n_business_days(6)
-            else:
-                # Normal update: get dates that need downloading
-                dates = self.get_download_dates()
+            dates = self.get_run_dates(force_update)
+            if end_date is not None:
+                dates = [dt for dt in dates if dt <= end_date]
             
             if not dates:
                 logger.info("No new data to download")
-                return True
+                success = True
+                return success
             
             logger.info(f"Downloading data for {len(dates)} dates")
+            # Forced runs refresh dates that are already stored
+            self.skip_stored_dates = not force_update
             success = self.scrape(dates[0], dates[-1])
             
             if success:
@@ -175,7 +714,13 @@ class BaseScraper(ABC):
             logger.error(f"Error running {self.name} scraper: {e}")
             return False
         finally:
-            self.http_client.close()
+            self.skip_stored_dates = True
+            record_history = bool(dates) and self.uses_anbima
+            self.close()
+            self.metrics.finish(success)
+            logger.info(self.metrics.describe())
+            if record_history:
+                self._record_run_history(dates)
 
     def __enter__(self):
         """Context manager entry."""
@@ -183,4 +728,4 @@ class BaseScraper(ABC):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.http_client.close() 
\ No newline at end of file
+        self.close() 
\ No newline at end of file
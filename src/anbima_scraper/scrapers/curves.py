@@ -2,9 +2,25 @@
 
 import logging
 from datetime import date
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ..core.scraper import BaseScraper
+import numpy as np
+import pandas as pd
+
+from ..config.settings import ANBIMA_DOWNLOAD_URLS, EXPORT_SETTINGS
+from ..core.scraper import BaseScraper, PlannedRequest
+from ..utils.calendar import format_date_for_anbima
+from ..utils.dataset_metadata import DatasetMetadata
+from ..utils.curve_store import (
+    CURVE_SERIES,
+    SVENSSON_CURVES,
+    SVENSSON_PARAMETERS,
+    ClosingCurves,
+    CurveStore,
+    merge_curves,
+)
+from ..utils.metrics import measure_stage
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +36,7 @@ class CurvesScraper(BaseScraper):
         """
         super().__init__(name)
 
-    def scrape(self, start_date: Optional[date] = None, 
+    def scrape(self, start_date: Optional[date] = None,
                end_date: Optional[date] = None) -> bool:
         """Scrape curves data.
 
@@ -36,8 +52,331 @@ class CurvesScraper(BaseScraper):
 
 
 class CurvaJurosFechamentoScraper(CurvesScraper):
-    """Scraper for Curva de Juros Fechamento."""
+    """Scraper for Curva de Juros Fechamento.
+
+    Curves are kept in a ``CurveStore`` (dates x vertices arrays) rather
+    than in a CSV base, so a full history loads with a memory-mapped read.
+    The store is ``curve_store``: ``store`` stays None, as it holds the
+    row-oriented ``ColumnarStore`` of other scrapers.
+    """
+
+    # Key of the rows of iter_chunks and of the change batches
+    key_columns = ['dt_referencia', 'vertice_du']
+
+    # Column headers of the vertex table mapped to stored series
+    SERIES_MAPPING = {
+        'ETTJ IPCA': 'ettj_ipca',
+        'ETTJ PREF': 'ettj_pref',
+        'Inflação Implícita': 'inflacao_implicita',
+    }
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the Curva de Juros Fechamento scraper."""
-        super().__init__("curva_juros_fechamento") 
\ No newline at end of file
+        super().__init__("curva_juros_fechamento")
+        self.curve_store = CurveStore(self.output_file)
+
+    def get_last_available_date(self) -> Optional[date]:
+        """Get last available date from the curve store.
+
+        Returns:
+            Last available date or None if no data exists
+        """
+        return self.curve_store.get_last_date()
+
+    @property
+    def metadata(self) -> DatasetMetadata:
+        """Curves per date, stored beside the arrays."""
+        return DatasetMetadata(Path(self.curve_store.directory) / "metadata.json")
+
+    def count_stored_rows(
+        self,
+        dates: Optional[Iterable[date]] = None
+    ) -> Dict[date, int]:
+        """Count stored curves per reference date (one per date).
+
+        Args:
+            dates: Dates to count (all stored dates if None)
+
+        Returns:
+            1 for each stored date
+        """
+        return self.curve_store.count_rows(dates)
+
+    def load_curves(self, mmap: bool = True) -> ClosingCurves:
+        """Load every stored curve.
+
+        Args:
+            mmap: Memory-map the arrays instead of reading them into memory
+
+        Returns:
+            Stored curves
+        """
+        return self.curve_store.load(mmap=mmap)
+
+    def iter_chunks(self, start_date: Optional[date] = None,
+                    end_date: Optional[date] = None,
+                    chunk_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Read stored curves as one row per date and vertex, in chunks.
+
+        Args:
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            chunk_rows: Rows per chunk (defaults to EXPORT_SETTINGS)
+
+        Yields:
+            Chunks with the date, the vertex and one column per series
+        """
+        curves = self.curve_store.load(mmap=True)
+        first = 0
+        if start_date is not None:
+            first = int(np.searchsorted(curves.dates, np.datetime64(start_date, 'D')))
+        last = len(curves.dates)
+        if end_date is not None:
+            last = int(np.searchsorted(
+                curves.dates, np.datetime64(end_date, 'D'), side='right'
+            ))
+
+        n_vertices = max(1, len(curves.vertices))
+        step = max(1, (chunk_rows or EXPORT_SETTINGS["chunk_rows"]) // n_vertices)
+        for begin in range(first, last, step):
+            yield self._curve_rows(curves, begin, min(begin + step, last))
+
+    def _curve_rows(self, curves: ClosingCurves, begin: int = 0,
+                    end: Optional[int] = None) -> pd.DataFrame:
+        """Flatten the curves of a range of dates to one row per vertex."""
+        end = len(curves.dates) if end is None else end
+        data = {
+            self.date_column: np.repeat(
+                curves.dates[begin:end], len(curves.vertices)
+            ).astype('datetime64[ns]'),
+            'vertice_du': np.tile(curves.vertices, end - begin),
+        }
+        for position, series in enumerate(CURVE_SERIES):
+            data[series] = curves.rates[begin:end, position, :].reshape(-1)
+        return pd.DataFrame(data)
+
+    def scrape(self, start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> bool:
+        """Scrape closing curves for the given date range.
+
+        Args:
+            start_date: Start date for scraping
+            end_date: End date for scraping
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.info(f"Scraping closing curves from {start_date} to {end_date}")
+
+            if start_date is None or end_date is None:
+                dates = self.get_download_dates()
+            else:
+                dates = self.calendar.get_business_days_range(start_date, end_date)
+
+            if not dates:
+                logger.info("No dates to download")
+                return True
+
+            parsed: List[ClosingCurves] = []
+            for dt in dates:
+                content = self._download_curve(dt)
+                if content is None:
+                    continue
+
+                curves = self._process_curve_data(content, dt)
+                if curves is not None:
+                    parsed.append(curves)
+                else:
+                    logger.warning(f"No valid curve data for {dt}")
+
+            if not parsed:
+                logger.info("No new curves downloaded")
+                return True
+
+            combined = parsed[0]
+            for curves in parsed[1:]:
+                combined = merge_curves(combined, curves)
+
+            with self._write_lock, self.metrics.stage(
+                "write", rows=len(combined.dates)
+            ):
+                success = self.curve_store.append(combined)
+                if success:
+                    self.record_changes(self._curve_rows(combined))
+                    self.update_metadata(
+                        dict.fromkeys(combined.dates.astype(object), 1)
+                    )
+
+            if success:
+                logger.info(f"Successfully stored {len(combined.dates)} curves")
+            else:
+                logger.error("Failed to store curves")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error scraping closing curves: {e}")
+            return False
+
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the requests scraping ``dates`` would make.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            One planned request per business day
+        """
+        url = ANBIMA_DOWNLOAD_URLS["curva_juros_fechamento"]
+        return [
+            PlannedRequest.build(self.name, dt, dt, url, self._build_params(dt))
+            for dt in dates if self.calendar.is_business_day(dt)
+        ]
+
+    def _build_params(self, dt: date) -> dict:
+        """Build query parameters for the curves of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Query parameters
+        """
+        return {
+            'escolha': '2',
+            'Dt_Ref': format_date_for_anbima(dt),
+            'Dt_Ref_Ver': '20000101',
+            'saida': 'csv',
+            'Idioma': 'PT',
+        }
+
+    def _download_curve(self, dt: date) -> Optional[bytes]:
+        """Download the CZ-down.asp output for a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw response content or None if failed
+        """
+        try:
+            url = ANBIMA_DOWNLOAD_URLS["curva_juros_fechamento"]
+            response = self.http_client.get(url, params=self._build_params(dt))
+            logger.info(f"Downloaded closing curves for {dt}")
+            return response.content
+
+        except Exception as e:
+            logger.error(f"Error downloading closing curves for {dt}: {e}")
+            return None
+
+    @measure_stage("parse", rows=lambda curves: len(curves.dates))
+    def _process_curve_data(self, content: bytes,
+                            reference_date: date) -> Optional[ClosingCurves]:
+        """Parse the CZ-down.asp output for one date.
+
+        The file holds a block of Svensson parameters (one row per curve,
+        ``Beta 1`` to ``Lambda 2``) followed by the vertex table
+        (``Vertices;ETTJ IPCA;ETTJ PREF;Inflação Implícita``).
+
+        Args:
+            content: Raw CSV content (latin1)
+            reference_date: Date the curves refer to
+
+        Returns:
+            Curves for the date or None if the content is invalid
+        """
+        try:
+            text = content.decode('latin1')
+            if 'Não há dados disponíveis' in text or '<html' in text.lower():
+                logger.warning(f"No curve data available for {reference_date}")
+                return None
+
+            lines = [line.split(';') for line in text.splitlines()]
+
+            parameters = self._parse_parameters(lines)
+            vertices, rates = self._parse_vertices(lines)
+
+            if len(vertices) == 0:
+                logger.warning(f"No vertex table found for {reference_date}")
+                return None
+
+            return ClosingCurves(
+                dates=np.array([reference_date], dtype='datetime64[D]'),
+                vertices=vertices,
+                rates=rates[np.newaxis, :, :],
+                parameters=parameters[np.newaxis, :, :],
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing curve data for {reference_date}: {e}")
+            return None
+
+    def _parse_parameters(self, lines: List[List[str]]) -> np.ndarray:
+        """Extract Svensson parameters from the split lines.
+
+        Args:
+            lines: File lines split on ';'
+
+        Returns:
+            Array of shape (n_curves, n_params), NaN where missing
+        """
+        parameters = np.full((len(SVENSSON_CURVES), len(SVENSSON_PARAMETERS)), np.nan)
+        n_params = len(SVENSSON_PARAMETERS)
+
+        for fields in lines:
+            name = fields[0].strip().lower()
+            if name not in SVENSSON_CURVES or len(fields) < n_params + 1:
+                continue
+
+            row = SVENSSON_CURVES.index(name)
+            if not np.isnan(parameters[row]).all():
+                # Only the first block holds the closing parameters
+                continue
+
+            values = pd.Series(fields[1:n_params + 1])
+            parameters[row] = self.data_processor.parse_decimal_comma(values)
+
+        return parameters
+
+    def _parse_vertices(
+        self, lines: List[List[str]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Extract the vertex table from the split lines.
+
+        Args:
+            lines: File lines split on ';'
+
+        Returns:
+            Tuple of vertices (n_vertices,) and rates (n_series, n_vertices)
+        """
+        start = None
+        for i, fields in enumerate(lines):
+            if fields[0].strip().lower().startswith(('vertice', 'vértice')):
+                start = i
+                break
+
+        if start is None:
+            return np.array([], dtype=np.int64), np.empty((len(CURVE_SERIES), 0))
+
+        header = [field.strip() for field in lines[start]]
+        rows = []
+        for fields in lines[start + 1:]:
+            if not fields[0].strip().replace('.', '').isdigit():
+                break
+            rows.append(fields[:len(header)])
+
+        table = pd.DataFrame(rows, columns=header, dtype=str)
+        vertices = (
+            self.data_processor.parse_decimal_comma(table[header[0]])
+            .to_numpy(dtype=np.int64)
+        )
+
+        rates = np.full((len(CURVE_SERIES), len(vertices)), np.nan)
+        for column, series in self.SERIES_MAPPING.items():
+            if column in table.columns:
+                rates[CURVE_SERIES.index(series)] = (
+                    self.data_processor.parse_decimal_comma(table[column])
+                )
+
+        return vertices, rates
@@ -1,31 +1,232 @@
 """Debentures scraper for ANBIMA data."""
 
+import csv
+import io
 import logging
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
-from ..core.scraper import BaseScraper
+import pandas as pd
+
+from ..config.settings import ANBIMA_DOWNLOAD_URLS
+from ..core.scraper import BaseScraper, PlannedRequest
+from ..utils.columnar_store import ColumnarStore
+from ..utils.metrics import measure_stage
 
 logger = logging.getLogger(__name__)
 
 
 class DebenturesScraper(BaseScraper):
-    """Scraper for Debentures data."""
+    """Scraper for Debentures data.
+
+    Parses the daily ``db{yymmdd}.txt`` secondary-market files into a
+    columnar store keyed by (dt_referencia, codigo).
+    """
+
+    key_columns = ['dt_referencia', 'codigo']
+    series_column = 'codigo'
+
+    # Fixed field layout of the '@' separated db{yymmdd}.txt rows
+    COLUMNS = [
+        'codigo',
+        'nome',
+        'dt_vencimento',
+        'indice_correcao',
+        'taxa_compra',
+        'taxa_venda',
+        'taxa_indicativa',
+        'desvio_padrao',
+        'intervalo_indicativo_min',
+        'intervalo_indicativo_max',
+        'pu',
+        'pu_par_perc',
+        'duration_du',
+        'reune_perc',
+        'referencia_ntnb',
+    ]
+
+    TEXT_COLUMNS = ['codigo', 'nome', 'indice_correcao', 'referencia_ntnb']
+
+    # Data rows start with an upper-case alphanumeric code (e.g. AALM12@)
+    DATA_LINE_PATTERN = rb'[A-Z0-9]+@'
 
     def __init__(self):
         """Initialize the debentures scraper."""
         super().__init__("debentures")
+        self.store = ColumnarStore(
+            self.output_file, self.date_column, self.key_columns
+        )
 
-    def scrape(self, start_date: Optional[date] = None, 
+    def scrape(self, start_date: Optional[date] = None,
                end_date: Optional[date] = None) -> bool:
-        """Scrape debentures data.
+        """Scrape debentures data for the given date range.
 
         Args:
-            start_date: Start date (not implemented yet)
-            end_date: End date (not implemented yet)
+            start_date: Start date for scraping
+            end_date: End date for scraping
 
         Returns:
             True if successful, False otherwise
         """
-        logger.warning(f"{self.name} scraper not implemented yet")
-        return False 
\ No newline at end of file
+        try:
+            logger.info(f"Scraping debentures data from {start_date} to {end_date}")
+
+            if start_date is None or end_date is None:
+                dates = self.get_download_dates()
+            else:
+                dates = self.calendar.get_business_days_range(start_date, end_date)
+
+            if not dates:
+                logger.info("No dates to download")
+                return True
+
+            all_data = []
+            for dt in dates:
+                content = self._download_debentures_file(dt)
+                if content is None:
+                    continue
+
+                df = self._process_debentures_file(content, dt)
+                if df is not None and not df.empty:
+                    all_data.append(df)
+                else:
+                    logger.warning(f"No valid debentures data for {dt}")
+
+            if not all_data:
+                logger.info("No new data downloaded")
+                return True
+
+            combined_df = pd.concat(all_data, ignore_index=True)
+            success = self.append_data(combined_df)
+
+            if success:
+                logger.info(f"Successfully processed {len(combined_df)} new records")
+            else:
+                logger.error("Failed to save processed data")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error scraping debentures data: {e}")
+            return False
+
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the daily file requests scraping ``dates`` would make.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            One planned request per business day
+        """
+        return [
+            PlannedRequest.build(self.name, dt, dt, self._get_download_url(dt))
+            for dt in dates if self.calendar.is_business_day(dt)
+        ]
+
+    def _get_download_url(self, dt: date) -> str:
+        """Get the URL of the daily file for a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            File URL
+        """
+        return f"{ANBIMA_DOWNLOAD_URLS['debentures']}{dt:%y%m%d}.txt"
+
+    def _download_debentures_file(self, dt: date) -> Optional[bytes]:
+        """Download the daily file for a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw file content or None if failed
+        """
+        try:
+            response = self.http_client.get(self._get_download_url(dt))
+            logger.info(f"Downloaded debentures data for {dt}")
+            return response.content
+
+        except Exception as e:
+            logger.error(f"Error downloading debentures file for {dt}: {e}")
+            return None
+
+    @measure_stage("parse")
+    def _process_debentures_file(self, content: bytes,
+                                 reference_date: date) -> Optional[pd.DataFrame]:
+        """Parse a db{yymmdd}.txt file into typed columns.
+
+        Title, header and group lines are dropped from the raw bytes by a
+        single regex pass and the rest is handed to the pandas C parser,
+        which types the decimal-comma numbers itself, so no Python object
+        is built per line.
+
+        Args:
+            content: Raw file content (latin1)
+            reference_date: Date the file refers to
+
+        Returns:
+            Processed DataFrame or None if failed
+        """
+        try:
+            if b'@' not in content:
+                logger.warning(f"Invalid debentures file for {reference_date}")
+                return None
+
+            data = self.data_processor.filter_lines(content, self.DATA_LINE_PATTERN)
+            if not data.strip():
+                logger.warning(f"No data rows in debentures file for {reference_date}")
+                return pd.DataFrame(columns=['dt_referencia'] + self.COLUMNS)
+
+            df = pd.read_csv(
+                io.BytesIO(data),
+                sep='@',
+                header=None,
+                names=self.COLUMNS,
+                dtype={col: str for col in self.TEXT_COLUMNS + ['dt_vencimento']},
+                decimal=',',
+                thousands='.',
+                na_values=['--'],
+                encoding='latin1',
+                quoting=csv.QUOTE_NONE,
+                on_bad_lines='skip',
+                engine='c',
+            )
+
+            numeric_columns = [
+                col for col in self.COLUMNS
+                if col not in self.TEXT_COLUMNS and col != 'dt_vencimento'
+            ]
+            for col in numeric_columns:
+                if not pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = self.data_processor.parse_decimal_comma(df[col])
+
+            # Only security rows carry a price or an indicative rate
+            is_data = (
+                df['codigo'].notna()
+                & df['nome'].notna()
+                & (df['pu'].notna() | df['taxa_indicativa'].notna())
+            )
+            df = df[is_data].copy()
+
+            if df.empty:
+                return df
+
+            for col in self.TEXT_COLUMNS:
+                df[col] = df[col].str.strip()
+
+            df['dt_vencimento'] = pd.to_datetime(
+                df['dt_vencimento'].str.strip(), format='%d/%m/%Y', errors='coerce'
+            )
+            df.insert(0, 'dt_referencia', pd.Timestamp(reference_date))
+
+            logger.info(f"Processed {len(df)} debentures for {reference_date}")
+            return df.reset_index(drop=True)
+
+        except Exception as e:
+            logger.error(
+                f"Error processing debentures file for {reference_date}: {e}"
+            )
+            return None
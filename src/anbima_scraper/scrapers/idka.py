@@ -9,8 +9,9 @@ from typing import List, Optional
 import pandas as pd
 
 from ..config.settings import ANBIMA_URLS, RAW_DATA_DIR
-from ..core.scraper import BaseScraper
+from ..core.scraper import BaseScraper, PlannedRequest
 from ..utils.calendar import format_date_for_anbima, parse_anbima_date
+from ..utils.metrics import measure_stage
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +19,13 @@ logger = logging.getLogger(__name__)
 class IDKAScraper(BaseScraper):
     """Scraper for IDKA (Índice de Duração Constante ANBIMA) data."""
 
+    series_column = 'no_indice'
+
     def __init__(self):
         """Initialize the IDKA scraper."""
         super().__init__("idka")
+        # Created by the first download (see ANBIMAHTTPClient.download_file)
         self.download_dir = RAW_DATA_DIR / "idka"
-        self.download_dir.mkdir(parents=True, exist_ok=True)
 
     def scrape(self, start_date: Optional[date] = None, 
                end_date: Optional[date] = None) -> bool:
@@ -93,6 +96,42 @@ class IDKAScraper(BaseScraper):
         filename = f"{dt.strftime('%Y%m%d')}_idka.csv"
         return self.download_dir / filename
 
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the requests scraping ``dates`` would make.
+
+        Dates whose raw file is already in the download directory are
+        not requested again.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            One planned request per business day without a cached file
+        """
+        url = ANBIMA_URLS["idka"]
+        return [
+            PlannedRequest.build(self.name, dt, dt, url, self._build_params(dt))
+            for dt in dates
+            if self.calendar.is_business_day(dt)
+            and not self._get_download_file_path(dt).exists()
+        ]
+
+    def _build_params(self, dt: date) -> dict:
+        """Build query parameters for the IDKA file of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Query parameters
+        """
+        return {
+            'DataIni': format_date_for_anbima(dt),
+            'Idioma': 'PT',
+            'escolha': '2',
+            'saida': 'csv'
+        }
+
     def _download_idka_file(self, dt: date, file_path: Path) -> bool:
         """Download IDKA file for a specific date.
 
@@ -105,12 +144,7 @@ class IDKAScraper(BaseScraper):
         """
         try:
             url = ANBIMA_URLS["idka"]
-            params = {
-                'DataIni': format_date_for_anbima(dt),
-                'Idioma': 'PT',
-                'escolha': '2',
-                'saida': 'csv'
-            }
+            params = self._build_params(dt)
             
             success = self.http_client.download_file(url, file_path, params)
             
@@ -157,7 +191,7 @@ class IDKAScraper(BaseScraper):
             # Get last available date from existing data
             last_date = self.get_last_available_date()
             
-            if last_date is not None:
+            if self.skip_stored_dates and last_date is not None:
                 # Filter data newer than last available date
                 combined_df['dt_referencia'] = pd.to_datetime(combined_df['dt_referencia'])
                 combined_df = combined_df[combined_df['dt_referencia'].dt.date > last_date]
@@ -180,6 +214,7 @@ class IDKAScraper(BaseScraper):
             logger.error(f"Error processing downloaded files: {e}")
             return False
 
+    @measure_stage("parse")
     def _process_idka_file(self, file_path: Path) -> Optional[pd.DataFrame]:
         """Process a single IDKA file.
 
@@ -1,10 +1,19 @@
 """IMA scrapers for ANBIMA data."""
 
+import io
 import logging
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from ..core.scraper import BaseScraper
+import pandas as pd
+
+from ..config.settings import ANBIMA_DOWNLOAD_URLS, RANGE_REQUEST_SETTINGS
+from ..core.scraper import BaseScraper, PlannedRequest
+from ..utils.calendar import format_date_for_anbima
+from ..utils.columnar_store import ColumnarStore
+from ..utils.concurrency import run_concurrently
+from ..utils.metrics import measure_stage
+from ..utils.request_planner import RangeRequestPlanner
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +21,8 @@ logger = logging.getLogger(__name__)
 class IMAScraper(BaseScraper):
     """Base scraper for IMA data."""
 
+    series_column = 'no_indice'
+
     def __init__(self, name: str):
         """Initialize the IMA scraper.
 
@@ -19,8 +30,19 @@ class IMAScraper(BaseScraper):
             name: Scraper name
         """
         super().__init__(name)
+        self._request_planner: Optional[RangeRequestPlanner] = None
+
+    @property
+    def request_planner(self) -> RangeRequestPlanner:
+        """Range request planner, built with the calendar on first use."""
+        if self._request_planner is None:
+            settings = RANGE_REQUEST_SETTINGS.get(self.name, {})
+            self._request_planner = RangeRequestPlanner(
+                self.calendar, settings.get("max_business_days", 1)
+            )
+        return self._request_planner
 
-    def scrape(self, start_date: Optional[date] = None, 
+    def scrape(self, start_date: Optional[date] = None,
                end_date: Optional[date] = None) -> bool:
         """Scrape IMA data.
 
@@ -36,16 +58,529 @@ class IMAScraper(BaseScraper):
 
 
 class IMACarteirasScraper(IMAScraper):
-    """Scraper for IMA Carteiras."""
+    """Scraper for IMA Carteiras (theoretical portfolio compositions).
+
+    Every (carteira, date) pair is an independent download, so the whole
+    job matrix is fanned out over a thread pool sharing one pooled HTTP
+    session; the HTTP client bounds how many requests hit the host at
+    once. Compositions are stored with dictionary-encoded security codes.
+
+    The composition download is a snapshot for ``Dt_Ref`` (DataIni and
+    DataFim must repeat it), so dates cannot be coalesced into ranges and
+    the scraper has no ``RANGE_REQUEST_SETTINGS`` entry.
+    """
+
+    key_columns = ['dt_referencia', 'no_indice', 'codigo_selic', 'dt_vencimento']
+
+    concurrent_requests = True
+
+    CARTEIRAS = [
+        'irf-m',
+        'irf-m 1',
+        'irf-m 1+',
+        'ima-b',
+        'ima-b 5',
+        'ima-b 5+',
+        'ima-c',
+        'ima-s',
+        'ima-geral',
+        'ima-geral ex-c',
+    ]
+
+    COLUMN_MAPPING = {
+        'Data de Referência': 'dt_referencia',
+        'Título': 'titulo',
+        'Data de Vencimento': 'dt_vencimento',
+        'Código SELIC': 'codigo_selic',
+        'Código ISIN': 'codigo_isin',
+        'Taxa Indicativa (% a.a.)': 'taxa_indicativa',
+        'PU (R$)': 'pu',
+        'PU de Juros (R$)': 'pu_juros',
+        'Quantidade (1.000 títulos)': 'qt_1000_titulos',
+        'Quantidade Teórica (1.000 títulos)': 'qt_teorica_1000_titulos',
+        'Carteira a Mercado (R$ mil)': 'carteira_mercado_reais_mil',
+        'Peso (%)': 'peso_perc',
+        'Prazo (d.u.)': 'prazo_du',
+        'Duration (d.u.)': 'duration_du',
+        'Quantidade em Mercado (1.000 títulos)': 'qt_mercado_1000_titulos',
+        'PMR': 'pmr',
+        'Convexidade': 'convexidade',
+    }
+
+    TEXT_COLUMNS = ['titulo', 'codigo_selic', 'codigo_isin']
+    DATE_COLUMNS = ['dt_referencia', 'dt_vencimento']
+
+    # Repeated on every row of every snapshot, stored as codes + dictionary
+    CATEGORICAL_COLUMNS = ['no_indice', 'titulo', 'codigo_selic', 'codigo_isin']
 
     def __init__(self):
         """Initialize the IMA Carteiras scraper."""
         super().__init__("ima_carteiras")
+        self.store = ColumnarStore(
+            self.output_file,
+            self.date_column,
+            self.key_columns,
+            categorical_columns=self.CATEGORICAL_COLUMNS
+        )
+
+    def scrape(self, start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> bool:
+        """Scrape IMA Carteiras data for the given date range.
+
+        Only business days are scheduled, and a failed or empty carteira
+        does not stop the others of the same date.
+
+        Args:
+            start_date: Start date for scraping
+            end_date: End date for scraping
+
+        Returns:
+            True if successful, False otherwise (including when every
+            download failed)
+        """
+        try:
+            logger.info(
+                f"Scraping IMA Carteiras data from {start_date} to {end_date}"
+            )
+
+            if start_date is None or end_date is None:
+                dates = self.get_download_dates()
+            else:
+                dates = self.calendar.get_business_days_range(start_date, end_date)
+
+            dates = self.filter_stored_dates(dates)
+
+            if not dates:
+                logger.info("No dates to download")
+                return True
+
+            jobs = [(carteira, dt) for dt in dates for carteira in self.CARTEIRAS]
+            logger.info(
+                f"Fetching {len(jobs)} carteiras for {len(dates)} dates"
+            )
+            results = run_concurrently(self._fetch_carteira, jobs)
+
+            downloaded = [
+                df for df in (results.get(job) for job in jobs) if df is not None
+            ]
+            if not downloaded:
+                logger.error(f"All {len(jobs)} carteira downloads failed")
+                return False
+            if len(downloaded) < len(jobs):
+                logger.warning(
+                    f"{len(jobs) - len(downloaded)} of {len(jobs)} "
+                    f"carteira downloads failed"
+                )
+
+            all_data = [df for df in downloaded if not df.empty]
+            if not all_data:
+                logger.info("No new data downloaded")
+                return True
+
+            combined_df = pd.concat(all_data, ignore_index=True)
+            success = self.append_data(combined_df)
+
+            if success:
+                logger.info(f"Successfully processed {len(combined_df)} new records")
+            else:
+                logger.error("Failed to save processed data")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error scraping IMA Carteiras data: {e}")
+            return False
+
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the (carteira, date) requests scraping ``dates`` would make.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            One planned request per carteira and business day
+        """
+        url = ANBIMA_DOWNLOAD_URLS["ima_carteiras"]
+        dates = [dt for dt in dates if self.calendar.is_business_day(dt)]
+        return [
+            PlannedRequest.build(
+                self.name, dt, dt, url, self._build_params(carteira, dt)
+            )
+            for dt in self.filter_stored_dates(dates)
+            for carteira in self.CARTEIRAS
+        ]
+
+    def _fetch_carteira(self, job: Tuple[str, date]) -> Optional[pd.DataFrame]:
+        """Download and parse the composition of one carteira on one date.
+
+        Args:
+            job: (carteira, reference date) pair
+
+        Returns:
+            Parsed rows (empty when ANBIMA has no data) or None if failed
+        """
+        carteira, dt = job
+        content = self._download_carteira(carteira, dt)
+        if content is None:
+            return None
+
+        if 'Não há dados disponíveis'.encode('latin1') in content[:512]:
+            logger.info(f"No {carteira} data available for {dt}")
+            return pd.DataFrame()
+
+        return self._process_carteira(content, carteira)
+
+    def _build_params(self, carteira: str, dt: date) -> dict:
+        """Build query parameters for a carteira request.
+
+        Args:
+            carteira: Carteira name (e.g. 'ima-b 5+')
+            dt: Reference date
+
+        Returns:
+            Query parameters
+        """
+        dt_ref = format_date_for_anbima(dt)
+        return {
+            'Titulo_1': carteira,
+            'Indice': carteira,
+            'Consulta_1': 'Ambos',
+            'Dt_Ref': dt_ref,
+            'DataIni': dt_ref,
+            'DataFim': dt_ref,
+            'Consulta': 'Ambos',
+            'saida': 'csv',
+            'Idioma': 'PT',
+        }
+
+    def _download_carteira(self, carteira: str, dt: date) -> Optional[bytes]:
+        """Download the composition CSV of a carteira.
+
+        Args:
+            carteira: Carteira name
+            dt: Reference date
+
+        Returns:
+            Raw response content or None if failed
+        """
+        try:
+            url = ANBIMA_DOWNLOAD_URLS["ima_carteiras"]
+            response = self.http_client.get(
+                url, params=self._build_params(carteira, dt)
+            )
+            logger.info(f"Downloaded {carteira} carteira for {dt}")
+            return response.content
+
+        except Exception as e:
+            logger.error(f"Error downloading {carteira} carteira for {dt}: {e}")
+            return None
+
+    @measure_stage("parse")
+    def _process_carteira(self, content: bytes,
+                          carteira: str) -> Optional[pd.DataFrame]:
+        """Parse a carteira CSV into a typed DataFrame.
+
+        Args:
+            content: Raw CSV content (latin1)
+            carteira: Carteira the file refers to
+
+        Returns:
+            Processed DataFrame or None if failed
+        """
+        try:
+            first_line = content.split(b'\n', 1)[0].decode('latin1')
+            if 'CARTEIRA' not in first_line.upper():
+                logger.warning(f"Invalid {carteira} carteira format")
+                return None
+
+            df = pd.read_csv(
+                io.BytesIO(content),
+                sep=';',
+                skiprows=1,
+                encoding='latin1',
+                header=0,
+                dtype=str,
+            )
+            df.columns = df.columns.str.strip()
+
+            existing_columns = {
+                k: v for k, v in self.COLUMN_MAPPING.items() if k in df.columns
+            }
+            df = df.rename(columns=existing_columns)
+
+            expected_columns = list(self.COLUMN_MAPPING.values())
+            for col in expected_columns:
+                if col not in df.columns:
+                    df[col] = None
+            df = df[expected_columns]
+
+            for col in self.DATE_COLUMNS:
+                df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
+            # Footer and error lines have no valid reference date
+            df = df[df['dt_referencia'].notna()].copy()
+
+            for col in expected_columns:
+                if col not in self.TEXT_COLUMNS and col not in self.DATE_COLUMNS:
+                    df[col] = self.data_processor.parse_decimal_comma(df[col])
+
+            for col in self.TEXT_COLUMNS:
+                df[col] = df[col].str.strip()
+
+            df.insert(1, 'no_indice', carteira.upper())
+
+            logger.info(f"Processed {len(df)} {carteira} carteira records")
+            return df
+
+        except Exception as e:
+            logger.error(f"Error processing {carteira} carteira data: {e}")
+            return None
 
 
 class IMAQuadroResumoScraper(IMAScraper):
     """Scraper for IMA Quadro Resumo."""
 
+    key_columns = ['dt_referencia', 'no_indice']
+
+    COLUMN_MAPPING = {
+        'Data de Referência': 'dt_referencia',
+        'Índice': 'no_indice',
+        'Número Índice': 'nu_indice',
+        'Variação Diária (%)': 'var_diaria_perc',
+        'Variação Mensal (%)': 'var_mensal_perc',
+        'Variação Anual (%)': 'var_anual_perc',
+        'Variação Últimos 12 Meses (%)': 'var_ult_12_meses_perc',
+        'Variação Últimos 24 Meses (%)': 'var_ult_24_meses_perc',
+        'Peso (%)': 'peso_perc',
+        'Duration (d.u.)': 'duration_du',
+        'Carteira a Mercado (R$ mil)': 'carteira_mercado_reais_mil',
+        'Número de Operações *': 'nu_operacoes',
+        'Quant. Negociada (1.000 títulos) *': 'qt_negociada_1000_tit',
+        'Valor Negociado (R$ mil) *': 'vr_negociado_reais_mil',
+        'PMR': 'pmr',
+        'Convexidade': 'convexidade',
+        'Yield': 'yield',
+        'Redemption Yield': 'redemption_yield',
+    }
+
+    TEXT_COLUMNS = ['dt_referencia', 'no_indice']
+
     def __init__(self):
         """Initialize the IMA Quadro Resumo scraper."""
-        super().__init__("ima_quadro_resumo") 
\ No newline at end of file
+        super().__init__("ima_quadro_resumo")
+
+    def scrape(self, start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> bool:
+        """Scrape IMA Quadro Resumo data for the given date range.
+
+        Missing business days are coalesced by the request planner into
+        DataIni/DataFim ranges, so a range of dates costs one download
+        instead of one per date.
+
+        Args:
+            start_date: Start date for scraping
+            end_date: End date for scraping
+
+        Returns:
+            True if successful, False otherwise (including when every
+            request failed)
+        """
+        try:
+            logger.info(
+                f"Scraping IMA Quadro Resumo data from {start_date} to {end_date}"
+            )
+
+            if start_date is None or end_date is None:
+                dates = self.get_download_dates()
+            else:
+                dates = self.calendar.get_business_days_range(start_date, end_date)
+
+            dates = self.filter_stored_dates(dates)
+
+            if not dates:
+                logger.info("No dates to download")
+                return True
+
+            ranges = self.request_planner.plan(dates)
+            logger.info(
+                f"Fetching {len(dates)} dates with {len(ranges)} range requests"
+            )
+            fetched: List[Tuple[date, date]] = []
+
+            def fetch(start: date, end: date) -> Optional[pd.DataFrame]:
+                df = self._fetch_range(start, end)
+                if df is not None:
+                    fetched.append((start, end))
+                return df
+
+            partitions = self.request_planner.execute(ranges, fetch)
+
+            if not fetched:
+                logger.error(f"All requests for {len(dates)} dates failed")
+                return False
+
+            if not partitions:
+                logger.info("No new data downloaded")
+                return True
+
+            all_data = [partitions[dt] for dt in sorted(partitions)]
+            combined_df = pd.concat(all_data, ignore_index=True)
+
+            success = self.append_data(combined_df)
+
+            if success:
+                logger.info(f"Successfully processed {len(combined_df)} new records")
+            else:
+                logger.error("Failed to save processed data")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error scraping IMA Quadro Resumo data: {e}")
+            return False
+
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the range requests scraping ``dates`` would make.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            One planned request per DataIni/DataFim range
+        """
+        url = ANBIMA_DOWNLOAD_URLS["ima_quadro_resumo"]
+        return [
+            PlannedRequest.build(
+                self.name, r.start, r.end, url, self._build_params(r.start, r.end)
+            )
+            for r in self.request_planner.plan(self.filter_stored_dates(dates))
+        ]
+
+    def _fetch_range(self, start_date: date,
+                     end_date: date) -> Optional[pd.DataFrame]:
+        """Download and parse one DataIni/DataFim range.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+
+        Returns:
+            Parsed rows (empty when ANBIMA has no data for the range) or
+            None if the request failed
+        """
+        content = self._download_range(start_date, end_date)
+        if content is None:
+            return None
+
+        if 'Não há dados disponíveis'.encode('latin1') in content[:512]:
+            logger.info(f"No data available from {start_date} to {end_date}")
+            return pd.DataFrame()
+
+        return self._process_quadro_resumo(content)
+
+    def _build_params(self, start_date: date, end_date: date) -> dict:
+        """Build query parameters for a DataIni/DataFim request.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+
+        Returns:
+            Query parameters
+        """
+        return {
+            'Titulo_1': 'quadro-resumo',
+            'Consulta_1': 'Ambos',
+            'Dt_Ref': format_date_for_anbima(end_date),
+            'DataIni': format_date_for_anbima(start_date),
+            'DataFim': format_date_for_anbima(end_date),
+            'Indice': 'quadro-resumo',
+            'Consulta': 'Ambos',
+            'saida': 'csv',
+            'Idioma': 'PT',
+        }
+
+    def _download_range(self, start_date: date,
+                        end_date: date) -> Optional[bytes]:
+        """Download the Quadro Resumo CSV for a date range.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+
+        Returns:
+            Raw response content or None if failed
+        """
+        try:
+            url = ANBIMA_DOWNLOAD_URLS["ima_quadro_resumo"]
+            params = self._build_params(start_date, end_date)
+            response = self.http_client.get(url, params=params)
+            logger.info(
+                f"Downloaded IMA Quadro Resumo data from {start_date} to {end_date}"
+            )
+            return response.content
+
+        except Exception as e:
+            logger.error(
+                f"Error downloading IMA Quadro Resumo from {start_date} "
+                f"to {end_date}: {e}"
+            )
+            return None
+
+    @measure_stage("parse")
+    def _process_quadro_resumo(self, content: bytes) -> Optional[pd.DataFrame]:
+        """Parse a Quadro Resumo CSV into a typed DataFrame.
+
+        The whole payload is parsed by pandas in one call; numbers in
+        ANBIMA's decimal-comma format and dates are converted column by
+        column, never row by row.
+
+        Args:
+            content: Raw CSV content (latin1)
+
+        Returns:
+            Processed DataFrame or None if failed
+        """
+        try:
+            first_line = content.split(b'\n', 1)[0].decode('latin1')
+            if 'QUADRO-RESUMO' not in first_line.upper():
+                logger.warning("Invalid Quadro Resumo format")
+                return None
+
+            df = pd.read_csv(
+                io.BytesIO(content),
+                sep=';',
+                skiprows=1,
+                encoding='latin1',
+                header=0,
+                dtype=str,
+            )
+
+            existing_columns = {
+                k: v for k, v in self.COLUMN_MAPPING.items() if k in df.columns
+            }
+            df = df.rename(columns=existing_columns)
+
+            expected_columns = list(self.COLUMN_MAPPING.values())
+            for col in expected_columns:
+                if col not in df.columns:
+                    df[col] = None
+            df = df[expected_columns]
+
+            df['dt_referencia'] = pd.to_datetime(
+                df['dt_referencia'], format='%d/%m/%Y', errors='coerce'
+            )
+            # Footer and error lines have no valid reference date
+            df = df[df['dt_referencia'].notna()].copy()
+
+            for col in expected_columns:
+                if col not in self.TEXT_COLUMNS:
+                    df[col] = self.data_processor.parse_decimal_comma(df[col])
+
+            df['no_indice'] = df['no_indice'].str.strip()
+
+            logger.info(f"Processed {len(df)} Quadro Resumo records")
+            return df
+
+        except Exception as e:
+            logger.error(f"Error processing Quadro Resumo data: {e}")
+            return None
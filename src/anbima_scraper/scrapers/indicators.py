@@ -1,13 +1,14 @@
 """Indicators scraper for ANBIMA data."""
 
 import logging
-from datetime import datetime
-from typing import Dict, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 
 import pandas as pd
 
 from ..config.settings import ANBIMA_URLS, INDICATOR_MAPPINGS
-from ..core.scraper import BaseScraper
+from ..core.scraper import BaseScraper, PlannedRequest
+from ..utils.metrics import measure_stage
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,13 @@ logger = logging.getLogger(__name__)
 class IndicatorsScraper(BaseScraper):
     """Scraper for ANBIMA indicators."""
 
+    date_column = 'data_referencia'
+    key_columns = ['data_referencia', 'indice']
+    series_column = 'indice'
+
+    # The indicators page only shows the latest values
+    supports_backfill = False
+
     def __init__(self):
         """Initialize the indicators scraper."""
         super().__init__("indicators")
@@ -64,6 +72,19 @@ class IndicatorsScraper(BaseScraper):
             logger.error(f"Error scraping indicators: {e}")
             return False
 
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the requests a run would make.
+
+        The indicators page is fetched once per run, whatever the dates.
+
+        Args:
+            dates: Dates a run would scrape (not used for indicators)
+
+        Returns:
+            A single planned request for the indicators page
+        """
+        return [PlannedRequest.build(self.name, None, None, ANBIMA_URLS["indicators"])]
+
     def _fetch_indicators_data(self) -> Optional[pd.DataFrame]:
         """Fetch indicators data from ANBIMA website.
 
@@ -95,6 +116,7 @@ class IndicatorsScraper(BaseScraper):
             logger.error(f"Error fetching indicators data: {e}")
             return None
 
+    @measure_stage("parse")
     def _process_indicators_data(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """Process raw indicators data.
 
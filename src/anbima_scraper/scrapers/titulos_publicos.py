@@ -0,0 +1,220 @@
+"""Títulos públicos secondary market scraper for ANBIMA data."""
+
+import csv
+import io
+import logging
+from datetime import date
+from typing import List, Optional
+
+import pandas as pd
+
+from ..config.settings import ANBIMA_DOWNLOAD_URLS
+from ..core.scraper import BaseScraper, PlannedRequest
+from ..utils.columnar_store import ColumnarStore
+from ..utils.concurrency import run_concurrently
+from ..utils.metrics import measure_stage
+
+logger = logging.getLogger(__name__)
+
+
+class TitulosPublicosScraper(BaseScraper):
+    """Scraper for the títulos públicos secondary market (ms{yymmdd}.txt).
+
+    Daily files are downloaded concurrently and parsed together: every row
+    carries its reference date, so the files of a whole range are joined
+    and handed to a single vectorized parse.
+    """
+
+    key_columns = ['dt_referencia', 'titulo', 'dt_vencimento']
+    series_column = 'titulo'
+
+    concurrent_requests = True
+
+    # Fixed field layout of the '@' separated ms{yymmdd}.txt rows
+    COLUMNS = [
+        'titulo',
+        'dt_referencia',
+        'codigo_selic',
+        'dt_emissao',
+        'dt_vencimento',
+        'taxa_compra',
+        'taxa_venda',
+        'taxa_indicativa',
+        'pu',
+        'desvio_padrao',
+        'intervalo_min_d0',
+        'intervalo_max_d0',
+        'intervalo_min_d1',
+        'intervalo_max_d1',
+        'criterio',
+    ]
+
+    TEXT_COLUMNS = ['titulo', 'codigo_selic', 'criterio']
+    DATE_COLUMNS = ['dt_referencia', 'dt_emissao', 'dt_vencimento']
+
+    # Data rows start with the título followed by the yyyymmdd reference date
+    DATA_LINE_PATTERN = rb'[^@\r\n]+@\d{8}@'
+
+    def __init__(self) -> None:
+        """Initialize the títulos públicos scraper."""
+        super().__init__("titulos_publicos")
+        self.store = ColumnarStore(
+            self.output_file, self.date_column, self.key_columns
+        )
+
+    def scrape(self, start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> bool:
+        """Scrape títulos públicos data for the given date range.
+
+        Args:
+            start_date: Start date for scraping
+            end_date: End date for scraping
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.info(
+                f"Scraping títulos públicos data from {start_date} to {end_date}"
+            )
+
+            if start_date is None or end_date is None:
+                dates = self.get_download_dates()
+            else:
+                dates = self.calendar.get_business_days_range(start_date, end_date)
+
+            if not dates:
+                logger.info("No dates to download")
+                return True
+
+            downloads = run_concurrently(self._download_titulos_file, dates)
+            contents = [downloads[dt] for dt in dates if downloads.get(dt)]
+
+            if not contents:
+                logger.info("No new files downloaded")
+                return True
+
+            df = self._process_titulos_files(contents)
+            if df is None or df.empty:
+                logger.warning("No valid data found in any downloaded files")
+                return True
+
+            success = self.append_data(df)
+
+            if success:
+                logger.info(f"Successfully processed {len(df)} new records")
+            else:
+                logger.error("Failed to save processed data")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error scraping títulos públicos data: {e}")
+            return False
+
+    def plan_requests(self, dates: List[date]) -> List[PlannedRequest]:
+        """List the daily file requests scraping ``dates`` would make.
+
+        Args:
+            dates: Dates a run would scrape
+
+        Returns:
+            One planned request per business day
+        """
+        return [
+            PlannedRequest.build(self.name, dt, dt, self._get_download_url(dt))
+            for dt in dates if self.calendar.is_business_day(dt)
+        ]
+
+    def _get_download_url(self, dt: date) -> str:
+        """Get the URL of the daily file for a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            File URL
+        """
+        return f"{ANBIMA_DOWNLOAD_URLS['titulos_publicos']}{dt:%y%m%d}.txt"
+
+    def _download_titulos_file(self, dt: date) -> Optional[bytes]:
+        """Download the daily file for a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw file content or None if failed
+        """
+        try:
+            response = self.http_client.get(self._get_download_url(dt))
+            logger.info(f"Downloaded títulos públicos data for {dt}")
+            return response.content
+
+        except Exception as e:
+            logger.error(f"Error downloading títulos públicos file for {dt}: {e}")
+            return None
+
+    @measure_stage("parse")
+    def _process_titulos_files(self, contents: List[bytes]) -> Optional[pd.DataFrame]:
+        """Parse one or more ms{yymmdd}.txt files into typed columns.
+
+        Args:
+            contents: Raw file contents (latin1)
+
+        Returns:
+            Processed DataFrame or None if failed
+        """
+        try:
+            valid = [content for content in contents if b'@' in content]
+            if not valid:
+                logger.warning("No valid títulos públicos files to process")
+                return None
+
+            data = self.data_processor.filter_lines(
+                b'\n'.join(valid), self.DATA_LINE_PATTERN
+            )
+            if not data.strip():
+                logger.warning("No data rows in títulos públicos files")
+                return pd.DataFrame(columns=self.COLUMNS)
+
+            df = pd.read_csv(
+                io.BytesIO(data),
+                sep='@',
+                header=None,
+                names=self.COLUMNS,
+                dtype={col: str for col in self.TEXT_COLUMNS + self.DATE_COLUMNS},
+                decimal=',',
+                thousands='.',
+                na_values=['--'],
+                encoding='latin1',
+                quoting=csv.QUOTE_NONE,
+                on_bad_lines='skip',
+                engine='c',
+            )
+
+            for col in self.DATE_COLUMNS:
+                df[col] = pd.to_datetime(df[col], format='%Y%m%d', errors='coerce')
+
+            df = df[df['dt_referencia'].notna() & df['titulo'].notna()].copy()
+
+            numeric_columns = [
+                col for col in self.COLUMNS
+                if col not in self.TEXT_COLUMNS and col not in self.DATE_COLUMNS
+            ]
+            for col in numeric_columns:
+                if not pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = self.data_processor.parse_decimal_comma(df[col])
+
+            for col in self.TEXT_COLUMNS:
+                df[col] = df[col].str.strip()
+
+            columns = [c for c in self.COLUMNS if c != 'dt_referencia']
+            df = df[['dt_referencia'] + columns]
+
+            logger.info(f"Processed {len(df)} títulos públicos records")
+            return df.reset_index(drop=True)
+
+        except Exception as e:
+            logger.error(f"Error processing títulos públicos files: {e}")
+            return None
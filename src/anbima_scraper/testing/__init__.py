@@ -0,0 +1 @@
+"""Synthetic data and helpers for load testing ANBIMA scrapers."""
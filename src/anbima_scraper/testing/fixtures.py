@@ -0,0 +1,634 @@
+"""Synthetic ANBIMA raw files for load and scale testing.
+
+Every payload is a pure function of the seed and the reference date, so
+any date of a 100-year history can be produced on its own (by a test, a
+benchmark or a stand-in server) and regenerating it gives the same bytes.
+Files follow the layouts the scrapers parse: latin1 text, ANBIMA's
+headers and footers, and numbers with a decimal comma and dot thousands
+separator.
+"""
+
+import argparse
+import hashlib
+import logging
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..utils.calendar import ANBIMACalendar, get_calendar
+
+logger = logging.getLogger(__name__)
+
+DATASETS = (
+    "idka", "ima_quadro_resumo", "indicators", "debentures", "titulos_publicos",
+    "curva_juros_fechamento",
+)
+
+# Page served for dates ANBIMA has not published
+MISSING_DAY_TEXT = "Não há dados disponíveis para a data informada."
+
+# Business day offsets of index levels are counted from here
+_EPOCH = date(1900, 1, 1)
+
+_DECIMAL_COMMA = str.maketrans(",.", ".,")
+
+IDKA_HEADER = (
+    "Indexador;Índices;Nº Índice;Retorno (% Dia);Retorno (% Mês);"
+    "Retorno (% Ano);Retorno (% 12 Meses);Volatilidade (% a.a.) *;"
+    "Taxa de Juros (% a.a.) [Compra (D-1)];Taxa de Juros (% a.a.) [Venda (D-0)]"
+)
+
+QUADRO_RESUMO_HEADER = (
+    "Índice;Data de Referência;Número Índice;Variação Diária (%);"
+    "Variação Mensal (%);Variação Anual (%);Variação Últimos 12 Meses (%);"
+    "Variação Últimos 24 Meses (%);Peso (%);Duration (d.u.);"
+    "Carteira a Mercado (R$ mil);Número de Operações *;"
+    "Quant. Negociada (1.000 títulos) *;Valor Negociado (R$ mil) *;PMR;"
+    "Convexidade;Yield;Redemption Yield"
+)
+
+DEBENTURES_HEADER = (
+    "Código@Nome@Repac./  Venc.@Índice/ Correção@Taxa de Compra@Taxa de Venda@"
+    "Taxa Indicativa@Desvio Padrão@Intervalo Indicativo Minimo@"
+    "Intervalo Indicativo Máximo@PU@% PU Par@Duration@% Reune@Referência NTN-B"
+)
+
+TITULOS_HEADER = (
+    "Titulo@Data Referencia@Codigo SELIC@Data Base/Emissao@Data Vencimento@"
+    "Tx. Compra@Tx. Venda@Tx. Indicativas@PU@Desvio padrao@"
+    "Interv. Ind. Inf. (D0)@Interv. Ind. Sup. (D0)@Interv. Ind. Inf. (D+1)@"
+    "Interv. Ind. Sup. (D+1)@Criterio"
+)
+
+IDKA_INDICES = [
+    ("PRE", "IDkA PRE 3M"), ("PRE", "IDkA PRE 1A"), ("PRE", "IDkA PRE 2A"),
+    ("PRE", "IDkA PRE 3A"), ("PRE", "IDkA PRE 5A"), ("IPCA", "IDkA IPCA 2A"),
+    ("IPCA", "IDkA IPCA 3A"), ("IPCA", "IDkA IPCA 5A"), ("IPCA", "IDkA IPCA 10A"),
+    ("IPCA", "IDkA IPCA 15A"), ("IPCA", "IDkA IPCA 20A"), ("IPCA", "IDkA IPCA 30A"),
+]
+
+IMA_INDICES = [
+    "IRF-M 1", "IRF-M 1+", "IRF-M", "IMA-B 5", "IMA-B 5+", "IMA-B",
+    "IMA-S", "IMA-GERAL ex-C", "IMA-GERAL",
+]
+
+CARTEIRA_HEADER = (
+    "Data de Referência;Título;Data de Vencimento;Código SELIC;Código ISIN;"
+    "Taxa Indicativa (% a.a.);PU (R$);PU de Juros (R$);"
+    "Quantidade (1.000 títulos);Quantidade Teórica (1.000 títulos);"
+    "Carteira a Mercado (R$ mil);Peso (%);Prazo (d.u.);Duration (d.u.);"
+    "Quantidade em Mercado (1.000 títulos);PMR;Convexidade"
+)
+
+# Vertices (business days) of the CZ-down.asp table
+CURVE_VERTICES = [21, 42, 63, 126, 252, 378, 504, 630, 756, 1008, 1260,
+                  1512, 1764, 2016, 2520, 3024, 3528, 4032, 5040, 6048, 7560]
+
+# (título, código SELIC, day and months of maturity)
+TITULOS = [
+    ("LTN", "100000", 1, (1, 7)),
+    ("NTN-F", "950199", 1, (1,)),
+    ("NTN-B", "760199", 15, (5, 8)),
+    ("LFT", "210100", 1, (3, 9)),
+]
+
+# (group line, índice/correção template)
+DEBENTURE_GROUPS = [
+    ("DI SPREAD", "DI + {rate}%"),
+    ("DI PERCENTUAL", "{rate}% do DI"),
+    ("IPCA SPREAD", "IPCA + {rate}%"),
+    ("IGP-M", "IGP-M + {rate}%"),
+]
+
+
+def format_decimal_comma(value: float, decimals: int) -> str:
+    """Format a number as ANBIMA does (``1.234,56``).
+
+    Args:
+        value: Number to format
+        decimals: Decimal places
+
+    Returns:
+        Formatted number
+    """
+    return f"{value:,.{decimals}f}".translate(_DECIMAL_COMMA)
+
+
+def _index_names(base: Sequence, count: Optional[int],
+                 make_extra: Callable[[int], Any]) -> list:
+    """Extend a list of real index names with synthetic ones up to ``count``."""
+    if count is None:
+        return list(base)
+    names = list(base[:count])
+    names.extend(make_extra(i) for i in range(len(names), count))
+    return names
+
+
+def _debenture_code(i: int) -> str:
+    """Unique upper-case code in ANBIMA's AAAA11 style."""
+    letters = ""
+    for _ in range(4):
+        i, rest = divmod(i, 26)
+        letters = chr(ord("A") + rest) + letters
+    return f"{letters}{11 + i % 89}"
+
+
+class SyntheticANBIMA:
+    """Generate realistic raw ANBIMA files for any dates.
+
+    Index levels follow a deterministic drift over business days with
+    per-date noise, so consecutive files look like a real series and any
+    date can be generated without the previous ones.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        idka_indices: Optional[int] = None,
+        ima_indices: Optional[int] = None,
+        debentures: int = 400,
+        titulos: int = 60,
+        calendar: Optional[ANBIMACalendar] = None,
+    ):
+        """Initialize the generator.
+
+        Args:
+            seed: Seed of every random draw
+            idka_indices: IDKA indices per file (default: the 12 real ones)
+            ima_indices: IMA indices per quadro resumo date (default: the 9
+                real ones)
+            debentures: Securities per db file
+            titulos: Bonds per ms file
+            calendar: Business day calendar
+        """
+        self.seed = seed
+        self.calendar = calendar or get_calendar()
+        self.idka_indices = _index_names(
+            IDKA_INDICES, idka_indices,
+            lambda i: ("PRE", f"IDkA PRE {i + 1}A") if i % 2 else
+            ("IPCA", f"IDkA IPCA {i + 1}A")
+        )
+        self.ima_indices = _index_names(
+            IMA_INDICES, ima_indices, lambda i: f"IMA-SINT {i + 1}"
+        )
+        self.n_debentures = debentures
+        self.n_titulos = titulos
+
+    def business_days(self, start_date: date, end_date: date) -> List[date]:
+        """Get the business days files exist for.
+
+        Args:
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            Business days, beyond the holidays file range if needed
+        """
+        days: List[date] = self.calendar.business_days_array(
+            start_date, end_date
+        ).tolist()
+        return days
+
+    def _rng(self, dt: date, dataset: str) -> np.random.Generator:
+        """Random generator for one (date, dataset), independent of the others."""
+        salt = int.from_bytes(hashlib.md5(dataset.encode()).digest()[:4], "little")
+        return np.random.default_rng([self.seed, dt.toordinal(), salt])
+
+    def _levels(self, dt: date, count: int, rng: np.random.Generator,
+                base: float = 1000.0) -> np.ndarray:
+        """Index numbers of ``count`` indices on a date."""
+        elapsed = int(self.calendar.count_business_days(_EPOCH, dt))
+        drift = 0.0002 + 0.00005 * np.arange(count)
+        bases = base * (1 + 0.25 * np.arange(count))
+        return bases * np.exp(drift * elapsed / 10) * (1 + rng.normal(0, 0.002, count))
+
+    def idka_csv(self, dt: date) -> bytes:
+        """Build the IDKA CSV of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw file content (latin1)
+        """
+        rng = self._rng(dt, "idka")
+        n = len(self.idka_indices)
+        levels = self._levels(dt, n, rng)
+        returns = rng.normal(0.03, 0.2, (n, 4)) * [1, 4, 20, 40]
+        vols = rng.uniform(0.5, 20, n)
+        rates = rng.uniform(3, 14, (n, 2))
+
+        lines = [
+            f"IDkA - Índices de Duração Constante ANBIMA - "
+            f"Data de Referência: {dt:%d/%m/%Y}",
+            "",
+            IDKA_HEADER,
+        ]
+        for i, (indexador, indice) in enumerate(self.idka_indices):
+            fields = [indexador, indice, format_decimal_comma(levels[i], 6)]
+            fields.extend(format_decimal_comma(v, 4) for v in returns[i])
+            fields.append(format_decimal_comma(vols[i], 4))
+            fields.extend(format_decimal_comma(v, 4) for v in rates[i])
+            lines.append(";".join(fields))
+        lines.extend([
+            "* Volatilidade anualizada dos últimos 21 dias úteis.",
+            "Fonte: ANBIMA",
+            "Informações sujeitas a alteração.",
+        ])
+        return "\r\n".join(lines).encode("latin1")
+
+    def _quadro_resumo_rows(self, dt: date) -> List[str]:
+        """Quadro resumo lines of one date."""
+        rng = self._rng(dt, "ima_quadro_resumo")
+        n = len(self.ima_indices)
+        levels = self._levels(dt, n, rng, base=2000.0)
+        variations = rng.normal(0.04, 0.2, (n, 5)) * [1, 4, 20, 40, 80]
+        weights = rng.dirichlet(np.ones(n)) * 100
+        durations = rng.integers(1, 3000, n)
+        portfolio = rng.uniform(1e7, 2e9, n)
+        operations = rng.integers(0, 2000, n)
+        traded = rng.uniform(0, 50_000, (n, 2))
+        risk = rng.uniform(0, 30, (n, 3))
+
+        date_str = f"{dt:%d/%m/%Y}"
+        rows = []
+        for i, indice in enumerate(self.ima_indices):
+            fields = [indice, date_str, format_decimal_comma(levels[i], 6)]
+            fields.extend(format_decimal_comma(v, 4) for v in variations[i])
+            fields.append(format_decimal_comma(weights[i], 2))
+            fields.append(str(durations[i]))
+            fields.append(format_decimal_comma(portfolio[i], 0))
+            fields.append(str(operations[i]))
+            fields.extend(format_decimal_comma(v, 2) for v in traded[i])
+            fields.append(str(durations[i] * 3 // 2))
+            fields.extend(format_decimal_comma(v, 4) for v in risk[i])
+            rows.append(";".join(fields))
+        return rows
+
+    def quadro_resumo_csv(self, dates: Iterable[date]) -> bytes:
+        """Build the quadro resumo CSV of a range request.
+
+        Args:
+            dates: Reference dates in the range
+
+        Returns:
+            Raw file content (latin1)
+        """
+        lines = ["QUADRO-RESUMO - IMA", QUADRO_RESUMO_HEADER]
+        for dt in dates:
+            lines.extend(self._quadro_resumo_rows(dt))
+        lines.extend(["", "* Valores referentes ao mercado secundário."])
+        return "\r\n".join(lines).encode("latin1")
+
+    def indicators_html(self, dt: date) -> bytes:
+        """Build the indicators page of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw HTML content (latin1)
+        """
+        rng = self._rng(dt, "indicators")
+        date_str = f"{dt:%d/%m/%Y}"
+        month = f"{dt:%m/%Y}"
+        selic, di = rng.uniform(2, 14, 2)
+        rows = [
+            ("Estimativa SELIC1", date_str, format_decimal_comma(selic, 2)),
+            ("Taxa SELIC do BC2", date_str, format_decimal_comma(selic, 2)),
+            ("DI-CETIP3", date_str, format_decimal_comma(di, 2)),
+            (f"IGP-M ({month})", "Número Índice",
+             format_decimal_comma(rng.uniform(500, 1200), 3)),
+            (f"IGP-M ({month})", "Var % no mês",
+             format_decimal_comma(rng.normal(0.4, 0.5), 2)),
+            (f"IGP-M1 ({month})", "Projeção",
+             format_decimal_comma(rng.normal(0.4, 0.5), 2)),
+            (f"IPCA ({month})", "Número Índice",
+             format_decimal_comma(rng.uniform(3000, 7000), 2)),
+            (f"IPCA ({month})", "Var % no mês",
+             format_decimal_comma(rng.normal(0.4, 0.3), 2)),
+            (f"IPCA1 ({month})", "Projeção",
+             format_decimal_comma(rng.normal(0.4, 0.3), 2)),
+            ("Dolar Comercial Compra", date_str,
+             format_decimal_comma(rng.uniform(1.5, 6), 4)),
+            ("Dolar Comercial Venda", date_str,
+             format_decimal_comma(rng.uniform(1.5, 6), 4)),
+            ("Euro Compra", date_str, format_decimal_comma(rng.uniform(2, 7), 4)),
+            ("Euro Venda", date_str, format_decimal_comma(rng.uniform(2, 7), 4)),
+            ("TR2", date_str, format_decimal_comma(rng.uniform(0, 0.3), 4)),
+            ("TBF2", date_str, format_decimal_comma(rng.uniform(0.2, 1.2), 4)),
+            ("FDS4", date_str, format_decimal_comma(rng.uniform(0, 0.3), 4)),
+        ]
+
+        cells = "\n".join(
+            f"<tr><td>{name}</td><td>{description}</td><td>{value}</td></tr>"
+            for name, description, value in rows
+        )
+        html = f"""<html>
+<head><meta charset="iso-8859-1"><title>ANBIMA - Indicadores</title></head>
+<body>
+<table><tr><td>ANBIMA</td></tr></table>
+<table><tr><td>Indicadores</td></tr></table>
+<table>
+<tr><td colspan="3">Data e Hora da Última Atualização: {date_str} - 18:30</td></tr>
+{cells}
+</table>
+</body>
+</html>"""
+        return html.encode("latin1")
+
+    def debentures_txt(self, dt: date) -> bytes:
+        """Build the db{yymmdd}.txt file of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw file content (latin1)
+        """
+        rng = self._rng(dt, "debentures")
+        n = self.n_debentures
+        rates = rng.uniform(0.5, 9, n)
+        spreads = rng.uniform(0.01, 0.3, n)
+        pus = rng.uniform(50, 12_000, n)
+        pu_par = rng.uniform(80, 110, n)
+        durations = rng.integers(20, 3000, n)
+        has_quotes = rng.random(n) < 0.3
+
+        lines = [
+            "ANBIMA - Associação Brasileira das Entidades dos Mercados "
+            "Financeiro e de Capitais",
+            "Mercado Secundário de Debêntures",
+            f"{dt:%d/%m/%Y}",
+            DEBENTURES_HEADER,
+        ]
+        groups = np.array_split(np.arange(n), len(DEBENTURE_GROUPS))
+        for (group, template), members in zip(DEBENTURE_GROUPS, groups):
+            lines.append(group)
+            for i in members:
+                rate = format_decimal_comma(rates[i], 4)
+                maturity = date(dt.year + 1 + i % 15, 1 + i % 12, 15)
+                quote = rate if has_quotes[i] else "--"
+                lines.append("@".join([
+                    _debenture_code(i),
+                    f"SINTETICA {i} S.A.",
+                    f"{maturity:%d/%m/%Y}",
+                    template.format(rate=rate),
+                    quote,
+                    quote,
+                    rate,
+                    format_decimal_comma(spreads[i], 4),
+                    format_decimal_comma(rates[i] - spreads[i], 4),
+                    format_decimal_comma(rates[i] + spreads[i], 4),
+                    format_decimal_comma(pus[i], 6),
+                    format_decimal_comma(pu_par[i], 2),
+                    format_decimal_comma(durations[i], 0),
+                    "--",
+                    "B25" if group == "IPCA SPREAD" else "--",
+                ]))
+        return "\r\n".join(lines).encode("latin1")
+
+    def titulos_publicos_txt(self, dt: date) -> bytes:
+        """Build the ms{yymmdd}.txt file of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw file content (latin1)
+        """
+        rng = self._rng(dt, "titulos_publicos")
+        n = self.n_titulos
+        rates = rng.uniform(3, 15, n)
+        pus = rng.uniform(300, 15_000, n)
+        deviations = rng.uniform(0, 0.1, n)
+
+        lines = [
+            "ANBIMA - Associação Brasileira das Entidades dos Mercados "
+            "Financeiro e de Capitais",
+            "",
+            TITULOS_HEADER,
+        ]
+        reference = f"{dt:%Y%m%d}"
+        for i in range(n):
+            titulo, codigo, day, months = TITULOS[i % len(TITULOS)]
+            k = i // len(TITULOS)
+            maturity = date(
+                dt.year + 1 + k // len(months), months[k % len(months)], day
+            )
+            rate = format_decimal_comma(rates[i], 4)
+            low = format_decimal_comma(rates[i] - 0.1, 4)
+            high = format_decimal_comma(rates[i] + 0.1, 4)
+            lines.append("@".join([
+                titulo, reference, codigo, f"{dt.year - 5}0101", f"{maturity:%Y%m%d}",
+                rate, rate, rate, format_decimal_comma(pus[i], 6),
+                format_decimal_comma(deviations[i], 4), low, high, low, high,
+                "Calculado",
+            ]))
+        return "\r\n".join(lines).encode("latin1")
+
+    def curves_csv(self, dt: date) -> bytes:
+        """Build the CZ-down.asp output of a date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Raw file content (latin1)
+        """
+        rng = self._rng(dt, "curva_juros_fechamento")
+        parameters = rng.normal(0, 0.05, (2, 6)) + [0.1, 0, 0, 0, 2, 0.5]
+        vertices = np.array(CURVE_VERTICES)
+        pref = 10 + rng.normal(0, 0.2) + np.log1p(vertices / 252)
+        ipca = 5 + rng.normal(0, 0.2) + 0.5 * np.log1p(vertices / 252)
+        implicit = ((1 + pref / 100) / (1 + ipca / 100) - 1) * 100
+
+        lines = [";Beta 1;Beta 2;Beta 3;Beta 4;Lambda 1;Lambda 2"]
+        for name, values in zip(("PREFIXADOS", "IPCA"), parameters):
+            lines.append(";".join(
+                [name] + [format_decimal_comma(v, 4) for v in values]
+            ))
+        lines.extend(["", "ETTJ Inflação Implicita (IPCA)",
+                      "Vertices;ETTJ IPCA;ETTJ PREF;Inflação Implícita"])
+        for i, vertex in enumerate(vertices):
+            lines.append(";".join([
+                format_decimal_comma(vertex, 0), format_decimal_comma(ipca[i], 4),
+                format_decimal_comma(pref[i], 4), format_decimal_comma(implicit[i], 4),
+            ]))
+        lines.extend(["", "PREFIXADOS (CIRCULAR 3.361);1;2;3;4;5;6"])
+        return "\r\n".join(lines).encode("latin1")
+
+    def carteira_csv(self, carteira: str, dt: date) -> bytes:
+        """Build the theoretical portfolio CSV of a carteira on a date.
+
+        Args:
+            carteira: Carteira name (e.g. 'ima-b 5+')
+            dt: Reference date
+
+        Returns:
+            Raw file content (latin1)
+        """
+        rng = self._rng(dt, f"ima_carteiras/{carteira}")
+        n = max(self.n_titulos // 4, 1)
+        weights = rng.dirichlet(np.ones(n)) * 100
+        rates = rng.uniform(3, 15, n)
+        pus = rng.uniform(300, 15_000, n)
+        quantities = rng.uniform(100, 50_000, n)
+
+        date_str = f"{dt:%d/%m/%Y}"
+        lines = [
+            f"CARTEIRA TEÓRICA DO {carteira.upper()} - {date_str}", CARTEIRA_HEADER
+        ]
+        for i in range(n):
+            titulo, codigo, day, months = TITULOS[i % len(TITULOS)]
+            k = i // len(TITULOS)
+            maturity = date(
+                dt.year + 1 + k // len(months), months[k % len(months)], day
+            )
+            term = int(self.calendar.count_business_days(dt, maturity))
+            lines.append(";".join([
+                date_str, titulo, f"{maturity:%d/%m/%Y}", codigo,
+                f"BRSTN{codigo[:2]}{i:05d}", format_decimal_comma(rates[i], 4),
+                format_decimal_comma(pus[i], 6), "0,000000",
+                format_decimal_comma(quantities[i], 1),
+                format_decimal_comma(quantities[i], 1),
+                format_decimal_comma(quantities[i] * pus[i], 2),
+                format_decimal_comma(weights[i], 2),
+                format_decimal_comma(term, 0),
+                format_decimal_comma(term * 0.9, 0),
+                format_decimal_comma(quantities[i], 1), "", "",
+            ]))
+        return "\r\n".join(lines).encode("latin1")
+
+    def missing_day_page(self) -> bytes:
+        """Build the page ANBIMA serves for dates without data.
+
+        Returns:
+            Raw HTML content (latin1)
+        """
+        return f"<html><body><p>{MISSING_DAY_TEXT}</p></body></html>".encode("latin1")
+
+    def file_name(self, dataset: str, dt: date) -> str:
+        """Get the name ANBIMA (or the scraper's download cache) uses.
+
+        Args:
+            dataset: Dataset name
+            dt: Reference date
+
+        Returns:
+            File name
+        """
+        names = {
+            "idka": f"{dt:%Y%m%d}_idka.csv",
+            "ima_quadro_resumo": f"{dt:%Y%m%d}_quadro_resumo.csv",
+            "indicators": f"{dt:%Y%m%d}_indicadores.html",
+            "debentures": f"db{dt:%y%m%d}.txt",
+            "titulos_publicos": f"ms{dt:%y%m%d}.txt",
+            "curva_juros_fechamento": f"{dt:%Y%m%d}_curvas.csv",
+        }
+        return names[dataset]
+
+    def content(self, dataset: str, dt: date) -> bytes:
+        """Build the raw file of any dataset for one date.
+
+        Args:
+            dataset: Dataset name
+            dt: Reference date
+
+        Returns:
+            Raw file content
+        """
+        if dataset == "idka":
+            return self.idka_csv(dt)
+        if dataset == "ima_quadro_resumo":
+            return self.quadro_resumo_csv([dt])
+        if dataset == "indicators":
+            return self.indicators_html(dt)
+        if dataset == "debentures":
+            return self.debentures_txt(dt)
+        if dataset == "titulos_publicos":
+            return self.titulos_publicos_txt(dt)
+        if dataset == "curva_juros_fechamento":
+            return self.curves_csv(dt)
+        raise ValueError(f"Unknown dataset: {dataset}")
+
+    def write_history(
+        self,
+        directory: Union[str, Path],
+        start_date: date,
+        end_date: date,
+        datasets: Sequence[str] = DATASETS,
+    ) -> Dict[str, Tuple[int, int]]:
+        """Write one raw file per dataset and business day.
+
+        Files go to ``directory/<dataset>/`` under their ANBIMA names;
+        existing files are overwritten.
+
+        Args:
+            directory: Output directory
+            start_date: First date
+            end_date: Last date
+            datasets: Datasets to generate
+
+        Returns:
+            Files written and bytes by dataset
+        """
+        directory = Path(directory)
+        dates = self.business_days(start_date, end_date)
+        written = {}
+
+        for dataset in datasets:
+            dataset_dir = directory / dataset
+            dataset_dir.mkdir(parents=True, exist_ok=True)
+            size = 0
+            for dt in dates:
+                content = self.content(dataset, dt)
+                (dataset_dir / self.file_name(dataset, dt)).write_bytes(content)
+                size += len(content)
+            written[dataset] = (len(dates), size)
+            logger.info(f"Wrote {len(dates)} {dataset} files ({size} bytes)")
+
+        return written
+
+
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD command line date."""
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Write a synthetic history to disk."""
+    parser = argparse.ArgumentParser(
+        prog="python -m anbima_scraper.testing.fixtures",
+        description="Gera arquivos sintéticos da ANBIMA para testes de carga",
+    )
+    parser.add_argument("directory", type=Path, help="Diretório de saída")
+    parser.add_argument("--from", dest="start_date", type=_parse_date,
+                        default=date(2000, 1, 1), help="Data inicial (AAAA-MM-DD)")
+    parser.add_argument("--to", dest="end_date", type=_parse_date,
+                        default=date(2009, 12, 31), help="Data final (AAAA-MM-DD)")
+    parser.add_argument("--datasets", nargs="+", choices=DATASETS,
+                        default=list(DATASETS), help="Datasets a gerar")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--debentures", type=int, default=400,
+                        help="Debêntures por arquivo")
+    parser.add_argument("--titulos", type=int, default=60,
+                        help="Títulos por arquivo")
+    args = parser.parse_args(argv)
+
+    generator = SyntheticANBIMA(
+        seed=args.seed, debentures=args.debentures, titulos=args.titulos
+    )
+    written = generator.write_history(
+        args.directory, args.start_date, args.end_date, args.datasets
+    )
+    for dataset, (files, size) in written.items():
+        print(f"{dataset:<20} {files:>8} arquivos {size / 1e6:>10.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,390 @@
+"""Local stand-in for the ANBIMA website, serving synthetic files.
+
+Paths mirror those of ``ANBIMA_URLS`` and ``ANBIMA_DOWNLOAD_URLS``, so a
+scraper whose HTTP client has a base URL override (see
+``REQUEST_SETTINGS["base_url"]``) runs unchanged against it. Latency,
+bandwidth, rate limiting, server errors and unpublished days can be
+injected to exercise retries and throughput without touching
+anbima.com.br.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..config.settings import ANBIMA_DOWNLOAD_URLS, ANBIMA_URLS
+from .fixtures import SyntheticANBIMA
+
+logger = logging.getLogger(__name__)
+
+# (status, body, content type)
+Response = Tuple[int, bytes, str]
+
+SERVER_ERRORS = (500, 502, 503, 504)
+
+_CSV = "text/csv; charset=iso-8859-1"
+_TEXT = "text/plain; charset=iso-8859-1"
+_HTML = "text/html; charset=iso-8859-1"
+
+
+def _path(url: str) -> str:
+    """Path part of a configured ANBIMA URL."""
+    return urlsplit(url).path
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a dd/mm/yyyy query parameter."""
+    try:
+        return datetime.strptime(value or "", "%d/%m/%Y").date()
+    except ValueError:
+        return None
+
+
+class StandInServer:
+    """Threaded HTTP server answering ANBIMA endpoints from fixtures.
+
+    Faults are drawn per request from a seeded generator: with
+    ``rate_limit_rate`` a 429 with ``Retry-After`` is returned, with
+    ``error_rate`` a random 5xx. Dates that are not business days, lie
+    after ``today`` or are drawn with ``missing_day_rate`` are answered
+    like ANBIMA does for unpublished days: a "Não há dados disponíveis"
+    page for the .asp endpoints and a 404 for the daily .txt files.
+    """
+
+    def __init__(
+        self,
+        generator: Optional[SyntheticANBIMA] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: Optional[float] = None,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        missing_day_rate: float = 0.0,
+        retry_after: int = 0,
+        today: Optional[date] = None,
+        seed: int = 0,
+    ):
+        """Initialize the server (call ``start`` to serve).
+
+        Args:
+            generator: Fixture generator (defaults to a seeded one)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            latency: Seconds before each response starts
+            jitter: Extra random latency, up to this many seconds
+            bandwidth: Bytes per second sent per response (None: unlimited)
+            rate_limit_rate: Share of requests answered with 429
+            error_rate: Share of requests answered with a 5xx
+            missing_day_rate: Share of business days reported unpublished
+            retry_after: Retry-After seconds of 429 responses
+            today: Last date with published data (defaults to today)
+            seed: Seed of the fault draws
+        """
+        self.generator = generator or SyntheticANBIMA(seed=seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.missing_day_rate = missing_day_rate
+        self.retry_after = retry_after
+        self.today = today
+        self.seed = seed
+
+        # Status codes served, for assertions and reports
+        self.status_counts: Counter = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self._routes = {
+            _path(ANBIMA_URLS["indicators"]): self._indicators,
+            _path(ANBIMA_URLS["idka"]): self._idka,
+            _path(ANBIMA_DOWNLOAD_URLS["ima_quadro_resumo"]): self._quadro_resumo,
+            _path(ANBIMA_DOWNLOAD_URLS["curva_juros_fechamento"]): self._curves,
+            _path(ANBIMA_DOWNLOAD_URLS["ima_carteiras"]): self._carteira,
+        }
+        self._daily_files = {
+            _path(ANBIMA_DOWNLOAD_URLS["debentures"]): self.generator.debentures_txt,
+            _path(ANBIMA_DOWNLOAD_URLS["titulos_publicos"]):
+                self.generator.titulos_publicos_txt,
+        }
+        self._pages = {
+            _path(url) for name, url in ANBIMA_URLS.items()
+            if _path(url) not in self._routes
+        }
+
+        self.httpd = _HTTPServer((host, port), _Handler)
+        self.httpd.stand_in = self
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as ``REQUEST_SETTINGS["base_url"]``."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "StandInServer":
+        """Serve requests in a background thread.
+
+        Returns:
+            The server itself
+        """
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="anbima-stand-in", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"ANBIMA stand-in serving at {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        """Context manager entry, starting the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Context manager exit."""
+        self.stop()
+
+    def respond(self, path: str, query: str) -> Tuple[Response, Dict[str, str]]:
+        """Build the response to a request, faults included.
+
+        Args:
+            path: Request path
+            query: Raw query string
+
+        Returns:
+            Response and extra headers
+        """
+        with self._lock:
+            draw = self._random.random()
+            error_status = self._random.choice(SERVER_ERRORS)
+
+        if draw < self.rate_limit_rate:
+            return (429, b"Too Many Requests", _TEXT), {
+                "Retry-After": str(self.retry_after)
+            }
+        if draw < self.rate_limit_rate + self.error_rate:
+            return (error_status, b"Server Error", _TEXT), {}
+
+        params = {k: v[0] for k, v in parse_qs(query).items()}
+        return self.route(path, params), {}
+
+    def route(self, path: str, params: Dict[str, str]) -> Response:
+        """Answer a request without faults.
+
+        Args:
+            path: Request path
+            params: Query parameters
+
+        Returns:
+            Response
+        """
+        handler = self._routes.get(path)
+        if handler is not None:
+            return handler(params)
+
+        for prefix, build in self._daily_files.items():
+            if path.startswith(prefix) and path.endswith(".txt"):
+                try:
+                    dt = datetime.strptime(path[len(prefix):-4], "%y%m%d").date()
+                except ValueError:
+                    break
+                if not self.is_published(dt):
+                    return 404, b"Not Found", _TEXT
+                return 200, build(dt), _TEXT
+
+        if path in self._pages:
+            return 200, b"<html><body>ANBIMA</body></html>", _HTML
+
+        return 404, b"Not Found", _TEXT
+
+    def is_published(self, dt: date) -> bool:
+        """Whether data for a date is available.
+
+        Missing days are drawn per date, so every request for the same
+        date gets the same answer.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            True if the date has data
+        """
+        if dt > (self.today or date.today()):
+            return False
+        if not self.generator.calendar.business_days_array(dt, dt).size:
+            return False
+        if self.missing_day_rate <= 0:
+            return True
+        draw = random.Random(f"{self.seed}/{dt.isoformat()}").random()
+        return draw >= self.missing_day_rate
+
+    def _missing(self) -> Response:
+        """ANBIMA's page for unpublished dates."""
+        return 200, self.generator.missing_day_page(), _HTML
+
+    def _last_published(self) -> date:
+        """Latest date with data."""
+        dt = self.today or date.today()
+        for _ in range(30):
+            if self.is_published(dt):
+                break
+            dt = date.fromordinal(dt.toordinal() - 1)
+        return dt
+
+    def _indicators(self, params: Dict[str, str]) -> Response:
+        """Indicators page, for the latest published date."""
+        return 200, self.generator.indicators_html(self._last_published()), _HTML
+
+    def _idka(self, params: Dict[str, str]) -> Response:
+        """IDkA-down.asp, for DataIni."""
+        dt = _parse_date(params.get("DataIni"))
+        if dt is None or not self.is_published(dt):
+            return self._missing()
+        return 200, self.generator.idka_csv(dt), _CSV
+
+    def _quadro_resumo(self, params: Dict[str, str]) -> Response:
+        """IMA-geral-down.asp, for every published date of DataIni..DataFim."""
+        start = _parse_date(params.get("DataIni"))
+        if start is None:
+            return self._missing()
+        end = _parse_date(params.get("DataFim")) or start
+        dates = [
+            dt for dt in self.generator.business_days(start, end)
+            if self.is_published(dt)
+        ]
+        if not dates:
+            return self._missing()
+        return 200, self.generator.quadro_resumo_csv(dates), _CSV
+
+    def _curves(self, params: Dict[str, str]) -> Response:
+        """CZ-down.asp, for Dt_Ref."""
+        dt = _parse_date(params.get("Dt_Ref"))
+        if dt is None or not self.is_published(dt):
+            return self._missing()
+        return 200, self.generator.curves_csv(dt), _CSV
+
+    def _carteira(self, params: Dict[str, str]) -> Response:
+        """ima-carteira-down.asp, for Indice and Dt_Ref."""
+        dt = _parse_date(params.get("Dt_Ref"))
+        carteira = params.get("Indice")
+        if dt is None or not carteira or not self.is_published(dt):
+            return self._missing()
+        return 200, self.generator.carteira_csv(carteira, dt), _CSV
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """HTTP server holding the StandInServer its handlers delegate to."""
+
+    daemon_threads = True
+    stand_in: StandInServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating to the owning StandInServer."""
+
+    protocol_version = "HTTP/1.1"
+    server: _HTTPServer
+
+    def do_GET(self) -> None:
+        """Serve a GET request."""
+        stand_in = self.server.stand_in
+        url = urlsplit(self.path)
+
+        delay = stand_in.latency
+        if stand_in.jitter:
+            delay += random.uniform(0, stand_in.jitter)
+        if delay:
+            time.sleep(delay)
+
+        (status, body, content_type), headers = stand_in.respond(url.path, url.query)
+        with stand_in._lock:
+            stand_in.status_counts[status] += 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if not stand_in.bandwidth:
+            self.wfile.write(body)
+            return
+
+        chunk_size = 16 * 1024
+        for offset in range(0, len(body), chunk_size):
+            chunk = body[offset:offset + chunk_size]
+            time.sleep(len(chunk) / stand_in.bandwidth)
+            self.wfile.write(chunk)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Log requests at debug level instead of printing them."""
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the stand-in server until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m anbima_scraper.testing.server",
+        description="Servidor local que simula a ANBIMA com dados sintéticos",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Latência por resposta (s)")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Latência aleatória adicional máxima (s)")
+    parser.add_argument("--bandwidth", type=float,
+                        help="Banda por resposta (bytes/s)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fração de respostas 429")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fração de respostas 5xx")
+    parser.add_argument("--missing-day-rate", type=float, default=0.0,
+                        help="Fração de dias úteis sem dados")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        bandwidth=args.bandwidth,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        missing_day_rate=args.missing_day_rate,
+        seed=args.seed,
+    )
+    print(f"Servindo em {server.base_url} "
+          f"(use ANBIMA_BASE_URL={server.base_url} ou --base-url)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
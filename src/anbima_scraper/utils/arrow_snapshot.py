@@ -0,0 +1,109 @@
+"""Memory-mapped Arrow IPC snapshots of stored datasets."""
+
+import logging
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .export import import_pyarrow, write_feather
+
+if TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+
+class ArrowSnapshot:
+    """Arrow IPC copy of a dataset, read memory-mapped and without copies.
+
+    The snapshot records a stamp of the base it was built from (see
+    ``BaseScraper.load_arrow``), so readers rebuild it only when the base
+    has changed. Rows are in date order, which lets date ranges be sliced
+    out of the mapped file instead of filtered into new buffers.
+    """
+
+    STAMP_KEY = "anbima_source_stamp"
+
+    def __init__(self, path: Union[str, Path], date_column: str):
+        """Initialize the snapshot.
+
+        Args:
+            path: Arrow IPC (Feather v2) file
+            date_column: Column holding the reference date
+        """
+        self.path = Path(path)
+        self.date_column = date_column
+
+    def _open(self) -> "pyarrow.ipc.RecordBatchFileReader":
+        """Open the snapshot memory-mapped."""
+        pa = import_pyarrow()
+        return pa.ipc.open_file(pa.memory_map(str(self.path), 'r'))
+
+    def stamp(self) -> Optional[str]:
+        """Get the stamp of the base the snapshot was built from.
+
+        Returns:
+            Stamp, or None if the snapshot is missing or unreadable
+        """
+        if not self.path.exists():
+            return None
+        try:
+            metadata = self._open().schema.metadata or {}
+        except Exception as e:
+            logger.warning(f"Error reading Arrow snapshot {self.path}: {e}")
+            return None
+        stamp = metadata.get(self.STAMP_KEY.encode())
+        return stamp.decode() if stamp is not None else None
+
+    def build(self, chunks: Iterable[pd.DataFrame], dataset: str,
+              stamp: str) -> int:
+        """Rewrite the snapshot from the rows of the base.
+
+        Args:
+            chunks: Stored rows in date order
+            dataset: Dataset name
+            stamp: Stamp of the base being copied
+
+        Returns:
+            Rows written
+        """
+        return write_feather(chunks, self.path, dataset, {self.STAMP_KEY: stamp})
+
+    def read(self, start_date: Optional[date] = None,
+             end_date: Optional[date] = None,
+             columns: Optional[Sequence[str]] = None) -> "pyarrow.Table":
+        """Read rows between two dates without copying them.
+
+        Args:
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            columns: Columns to load (all by default)
+
+        Returns:
+            Table whose buffers point into the mapped file
+        """
+        table = self._open().read_all()
+
+        if ((start_date is not None or end_date is not None)
+                and self.date_column in table.column_names):
+            # Only the date column is materialized, to find the slice bounds
+            dates = table.column(self.date_column).to_numpy()
+            first = 0
+            last = len(dates)
+            if start_date is not None:
+                first = int(np.searchsorted(
+                    dates, np.datetime64(start_date, 'D').astype(dates.dtype)
+                ))
+            if end_date is not None:
+                last = int(np.searchsorted(
+                    dates, np.datetime64(end_date, 'D').astype(dates.dtype),
+                    side='right'
+                ))
+            table = table.slice(first, max(0, last - first))
+
+        if columns is not None:
+            table = table.select([col for col in columns if col in table.column_names])
+        return table
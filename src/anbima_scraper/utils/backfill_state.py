@@ -0,0 +1,109 @@
+"""Checkpoint state of historical backfills."""
+
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillState:
+    """Record completed (dataset, date) units in a small SQLite database.
+
+    Units are committed as soon as their chunk finishes, so a killed
+    backfill resumes from the first date that was not stored.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS completed_units (
+            dataset TEXT NOT NULL,
+            dt_referencia TEXT NOT NULL,
+            completed_at TEXT NOT NULL,
+            PRIMARY KEY (dataset, dt_referencia)
+        )
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (and create if needed) the state database.
+
+        Args:
+            path: SQLite database file, or ':memory:'
+        """
+        self.path = path
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(self.SCHEMA)
+
+    def completed_dates(
+        self,
+        dataset: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Set[date]:
+        """Get the dates already completed for a dataset.
+
+        Args:
+            dataset: Dataset (scraper) name
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+
+        Returns:
+            Set of completed dates
+        """
+        query = "SELECT dt_referencia FROM completed_units WHERE dataset = ?"
+        params = [dataset]
+        if start_date is not None:
+            query += " AND dt_referencia >= ?"
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            query += " AND dt_referencia <= ?"
+            params.append(end_date.isoformat())
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return {date.fromisoformat(row[0]) for row in rows}
+
+    def mark_completed(self, dataset: str, dates: Iterable[date]) -> None:
+        """Record dates as completed for a dataset.
+
+        Args:
+            dataset: Dataset (scraper) name
+            dates: Completed dates
+        """
+        completed_at = datetime.now().isoformat(timespec='seconds')
+        rows = [(dataset, dt.isoformat(), completed_at) for dt in dates]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO completed_units VALUES (?, ?, ?)", rows
+            )
+
+    def reset(self, dataset: str) -> None:
+        """Forget every completed unit of a dataset.
+
+        Args:
+            dataset: Dataset (scraper) name
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM completed_units WHERE dataset = ?", (dataset,)
+            )
+        logger.info(f"Backfill state reset for {dataset}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "BackfillState":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Context manager exit."""
+        self.close()
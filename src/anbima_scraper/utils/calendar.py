@@ -1,16 +1,22 @@
 """Calendar utilities for business days calculation."""
 
 import logging
+from functools import lru_cache
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 
+import numpy as np
 from bizdays import Calendar, load_holidays
 
 from ..config.settings import BUSINESS_DAYS_SETTINGS
 
 logger = logging.getLogger(__name__)
 
+WEEKDAY_NAMES = [
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+]
+
 
 class ANBIMACalendar:
     """Calendar utility for ANBIMA business days."""
@@ -18,6 +24,7 @@ class ANBIMACalendar:
     def __init__(self):
         """Initialize the ANBIMA calendar."""
         self.calendar = self._create_calendar()
+        self._holidays_array: Optional[np.ndarray] = None
 
     def _create_calendar(self) -> Calendar:
         """Create ANBIMA business calendar."""
@@ -57,7 +64,67 @@ class ANBIMACalendar:
         Returns:
             List of business days
         """
-        return self.calendar.bizdays(start_date, end_date)
+        return list(self.calendar.seq(start_date, end_date))
+
+    def count_business_days(
+        self,
+        start_dates: Union[date, Sequence[date], np.ndarray],
+        end_dates: Union[date, Sequence[date], np.ndarray]
+    ) -> np.ndarray:
+        """Count business days between dates (DU convention), vectorized.
+
+        Counts business days from ``start_dates`` (inclusive) to
+        ``end_dates`` (exclusive), broadcasting like numpy, so thousands
+        of cash flows are counted in a single call.
+
+        Args:
+            start_dates: Start date(s)
+            end_dates: End date(s)
+
+        Returns:
+            Array of business day counts
+        """
+        return np.busday_count(
+            np.asarray(start_dates, dtype='datetime64[D]'),
+            np.asarray(end_dates, dtype='datetime64[D]'),
+            **self._busday_arguments()
+        )
+
+    def business_days_array(self, start_date: date, end_date: date) -> np.ndarray:
+        """Get business days in range as a ``datetime64[D]`` array.
+
+        Unlike ``get_business_days_range`` this is not limited to the
+        range of the holidays file: dates beyond it only skip weekends.
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            Array of business days
+        """
+        days = np.arange(
+            np.datetime64(start_date, 'D'),
+            np.datetime64(end_date, 'D') + 1,
+            dtype='datetime64[D]'
+        )
+        business_days: np.ndarray = days[
+            np.is_busday(days, **self._busday_arguments())
+        ]
+        return business_days
+
+    def _busday_arguments(self) -> dict:
+        """Weekmask and holidays for numpy's business day functions."""
+        if self._holidays_array is None:
+            self._holidays_array = np.array(
+                list(self.calendar.holidays), dtype='datetime64[D]'
+            )
+
+        weekmask = [
+            0 if name in BUSINESS_DAYS_SETTINGS["weekdays"] else 1
+            for name in WEEKDAY_NAMES
+        ]
+        return {"weekmask": weekmask, "holidays": self._holidays_array}
 
     def get_next_business_day(self, dt: date) -> date:
         """Get next business day.
@@ -127,6 +194,19 @@ class ANBIMACalendar:
         return self.get_business_days_range(start_date, today)
 
 
+@lru_cache(maxsize=1)
+def get_calendar() -> ANBIMACalendar:
+    """Get the process-wide ANBIMA calendar.
+
+    The holidays file is read once and the calendar is shared by every
+    scraper, since it is never modified after creation.
+
+    Returns:
+        Shared calendar
+    """
+    return ANBIMACalendar()
+
+
 def format_date_for_anbima(dt: date) -> str:
     """Format date for ANBIMA API.
 
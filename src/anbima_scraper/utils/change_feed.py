@@ -0,0 +1,289 @@
+"""Change-data feed of the rows written to each dataset."""
+
+import json
+import logging
+import os
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .export import import_pyarrow
+
+logger = logging.getLogger(__name__)
+
+# Batch file formats by suffix
+FORMATS = ("jsonl", "parquet")
+
+
+class ChangesExpiredError(LookupError):
+    """Changes after a sequence number are no longer complete.
+
+    Their batches were pruned by retention, or could not be written (see
+    ``ChangeFeed.mark_lost``). Consumers catching it must resynchronize
+    from the base itself.
+    """
+
+
+class ChangeBatch(NamedTuple):
+    """Rows written to a dataset by one write.
+
+    Attributes:
+        sequence: Position of the batch in the feed, increasing by one
+        created_at: When the rows were written
+        rows: Rows written (new rows, or rows replacing stored ones with
+            the same key)
+    """
+
+    sequence: int
+    created_at: datetime
+    rows: pd.DataFrame
+
+
+class ChangeFeed:
+    """Directory of delta batches, one file per write, in sequence order.
+
+    Each successful write of a dataset appends one batch named after its
+    sequence number (``000000000042.jsonl``), and the last number handed
+    out is kept in ``sequence.json`` so numbers never repeat, even after
+    every batch was pruned. A batch is written before its number is
+    published there, so readers only serve batches up to the published
+    number, and every number up to it must have its batch: a gap means
+    rows were lost and is reported as expired changes. Consumers remember
+    the last sequence they processed and ask for the changes since it.
+    Callers serialize writes to the same dataset (see BaseScraper).
+    """
+
+    SEQUENCE_FILE = "sequence.json"
+
+    def __init__(self, directory: Union[str, Path], batch_format: str = "jsonl"):
+        """Initialize the feed.
+
+        Args:
+            directory: Directory holding the batches of one dataset
+            batch_format: Format of new batches ("jsonl" or "parquet")
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if batch_format not in FORMATS:
+            raise ValueError(f"Unknown change batch format: {batch_format}")
+        self.directory = Path(directory)
+        self.batch_format = batch_format
+
+    def last_sequence(self) -> int:
+        """Get the latest published sequence number (0 if none yet)."""
+        path = self.directory / self.SEQUENCE_FILE
+        if not path.exists():
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            return int(json.load(f)["last_sequence"])
+
+    def _next_sequence(self) -> int:
+        """Number of the next batch.
+
+        A batch left unpublished by a failure after it was written keeps
+        its number, so it is never overwritten.
+        """
+        batches = self._batches()
+        written = int(batches[-1].stem) if batches else 0
+        return max(self.last_sequence(), written) + 1
+
+    def _publish(self, sequence: int) -> None:
+        """Atomically record the latest sequence number."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sequence_path = self.directory / self.SEQUENCE_FILE
+        tmp_path = sequence_path.with_name(sequence_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"last_sequence": sequence}, f)
+        os.replace(tmp_path, sequence_path)
+
+    def _batches(self) -> List[Path]:
+        """List batch files, oldest first."""
+        if not self.directory.exists():
+            return []
+        return sorted(
+            path for path in self.directory.iterdir()
+            if path.suffix.lstrip('.') in FORMATS and path.stem.isdigit()
+        )
+
+    def append(self, rows: pd.DataFrame) -> int:
+        """Add a batch with the rows of one write.
+
+        Args:
+            rows: Rows written
+
+        Returns:
+            Sequence number of the batch
+        """
+        sequence = self._next_sequence()
+        created_at = datetime.now()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        path = self.directory / f"{sequence:012d}.{self.batch_format}"
+        tmp_path = path.with_name(path.name + '.tmp')
+        if self.batch_format == "parquet":
+            _write_parquet(rows, tmp_path, sequence, created_at)
+        else:
+            _write_jsonl(rows, tmp_path, sequence, created_at)
+        os.replace(tmp_path, path)
+
+        # The batch exists before its number is published
+        self._publish(sequence)
+        return sequence
+
+    def mark_lost(self) -> int:
+        """Publish a sequence number without a batch.
+
+        Used when the rows of a stored write could not be recorded:
+        consumers reading across the number get ChangesExpiredError and
+        resynchronize, instead of silently missing those rows.
+
+        Returns:
+            Sequence number left without a batch
+        """
+        sequence = self._next_sequence()
+        self._publish(sequence)
+        logger.warning(f"Sequence {sequence} of {self.directory} has no batch")
+        return sequence
+
+    def changes(self, since: int = 0) -> Iterator[ChangeBatch]:
+        """Read the batches written after a sequence number.
+
+        Args:
+            since: Last sequence number already processed (0 for all)
+
+        Yields:
+            Batches in sequence order
+
+        Raises:
+            ChangesExpiredError: If batches after ``since`` were pruned or
+                never written
+        """
+        # Read first: batches numbered above it are still being published
+        last = self.last_sequence()
+        batches = [
+            path for path in self._batches() if since < int(path.stem) <= last
+        ]
+        numbers = [int(path.stem) for path in batches]
+        if numbers != list(range(since + 1, last + 1)):
+            missing = next(
+                seq for position, seq in enumerate(range(since + 1, last + 1))
+                if position >= len(numbers) or numbers[position] != seq
+            )
+            raise ChangesExpiredError(
+                f"Changes after {since} in {self.directory} are incomplete: "
+                f"batch {missing} was pruned or never written"
+            )
+
+        for path in batches:
+            if path.suffix == ".parquet":
+                yield _read_parquet(path)
+            else:
+                yield _read_jsonl(path)
+
+    def prune(self, max_age_days: Optional[float] = None,
+              max_batches: Optional[int] = None) -> int:
+        """Delete old batches. The sequence number is kept.
+
+        Args:
+            max_age_days: Delete batches written longer ago (None keeps all)
+            max_batches: Keep at most this many latest batches (None keeps all)
+
+        Returns:
+            Batches deleted
+        """
+        batches = self._batches()
+        expired = set()
+        if max_batches is not None:
+            expired.update(batches[:max(0, len(batches) - max_batches)])
+        if max_age_days is not None:
+            oldest = time.time() - max_age_days * 86400
+            expired.update(p for p in batches if p.stat().st_mtime < oldest)
+
+        for path in expired:
+            path.unlink(missing_ok=True)
+        if expired:
+            logger.debug(f"Pruned {len(expired)} change batches from {self.directory}")
+        return len(expired)
+
+
+def _date_columns(rows: pd.DataFrame) -> List[str]:
+    """Columns holding dates, restored as datetime64 when read back."""
+    return [
+        col for col in rows.columns
+        if pd.api.types.is_datetime64_any_dtype(rows[col])
+    ]
+
+
+def _json_value(value: object) -> object:
+    """Convert a cell to a JSON value (dates as ISO strings, NaN as null)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _write_jsonl(rows: pd.DataFrame, path: Path, sequence: int,
+                 created_at: datetime) -> None:
+    """Write a batch as a header line followed by one JSON object per row."""
+    header = {
+        "sequence": sequence,
+        "created_at": created_at.isoformat(),
+        "rows": len(rows),
+        "date_columns": _date_columns(rows),
+    }
+    columns = [str(col) for col in rows.columns]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header) + "\n")
+        for values in rows.astype(object).itertuples(index=False, name=None):
+            record = dict(zip(columns, map(_json_value, values)))
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _read_jsonl(path: Path) -> ChangeBatch:
+    """Read a batch written by ``_write_jsonl``."""
+    with open(path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        rows = pd.DataFrame([json.loads(line) for line in f])
+    for col in header["date_columns"]:
+        if col in rows.columns:
+            rows[col] = pd.to_datetime(rows[col])
+    return ChangeBatch(
+        header["sequence"], datetime.fromisoformat(header["created_at"]), rows
+    )
+
+
+def _write_parquet(rows: pd.DataFrame, path: Path, sequence: int,
+                   created_at: datetime) -> None:
+    """Write a batch as Parquet, with its sequence in the schema metadata."""
+    pa = import_pyarrow()
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(rows, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        b"sequence": str(sequence).encode(),
+        b"created_at": created_at.isoformat().encode(),
+    })
+    pq.write_table(table, path)
+
+
+def _read_parquet(path: Path) -> ChangeBatch:
+    """Read a batch written by ``_write_parquet``."""
+    import_pyarrow()
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    metadata = table.schema.metadata
+    return ChangeBatch(
+        int(metadata[b"sequence"]),
+        datetime.fromisoformat(metadata[b"created_at"].decode()),
+        table.to_pandas(),
+    )
@@ -0,0 +1,291 @@
+"""Date-partitioned columnar storage for ANBIMA datasets."""
+
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .data_processor import DataProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnarStore:
+    """Store a dataset as one columnar file per reference date.
+
+    Each partition is an uncompressed ``.npz`` archive holding one typed
+    array per column under ``{directory}/{yyyy}/{yyyymmdd}.npz``. Strings
+    are stored as fixed-width unicode arrays and categorical columns as
+    integer codes plus their dictionary, so no partition needs pickling.
+    Columns listed in ``categorical_columns`` are dictionary-encoded on
+    write, which keeps repetitive codes and names compact. Rows inside a
+    partition are unique on ``key_columns``.
+    """
+
+    SUFFIX = '.npz'
+    CATEGORIES_SUFFIX = '__categories'
+    COLUMNS_KEY = '__columns__'
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        date_column: str = 'dt_referencia',
+        key_columns: Optional[List[str]] = None,
+        categorical_columns: Optional[List[str]] = None
+    ):
+        """Initialize the store.
+
+        Args:
+            directory: Root directory of the partitions
+            date_column: Column holding the reference date
+            key_columns: Columns identifying a record within a date
+            categorical_columns: Text columns to store dictionary-encoded
+        """
+        self.directory = Path(directory)
+        self.date_column = date_column
+        self.key_columns = key_columns
+        self.categorical_columns = categorical_columns or []
+
+    def partition_path(self, dt: date) -> Path:
+        """Get the file holding a reference date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Partition file path
+        """
+        return self.directory / f"{dt:%Y}" / f"{dt:%Y%m%d}{self.SUFFIX}"
+
+    def dates(self) -> List[date]:
+        """List stored reference dates from the partition file names.
+
+        Returns:
+            Sorted list of dates
+        """
+        if not self.directory.exists():
+            return []
+
+        dates = []
+        for path in self.directory.glob(f"*/*{self.SUFFIX}"):
+            try:
+                dates.append(datetime.strptime(path.stem, '%Y%m%d').date())
+            except ValueError:
+                continue
+        return sorted(dates)
+
+    def count_rows(
+        self,
+        dates: Optional[Iterable[date]] = None
+    ) -> Dict[date, int]:
+        """Count the rows of date partitions.
+
+        Args:
+            dates: Dates to count (every stored date if None)
+
+        Returns:
+            Rows by reference date, for dates with a partition
+        """
+        counts = {}
+        for dt in self.dates() if dates is None else dates:
+            path = self.partition_path(dt)
+            if not path.exists():
+                continue
+            with np.load(path, allow_pickle=False) as archive:
+                first_column = str(archive[self.COLUMNS_KEY][0])
+                counts[dt] = len(archive[first_column])
+        return counts
+
+    def get_last_date(self) -> Optional[date]:
+        """Get the last stored reference date.
+
+        Only the newest year directory is listed.
+
+        Returns:
+            Last date or None if the store is empty
+        """
+        if not self.directory.exists():
+            return None
+
+        years = sorted(
+            (p for p in self.directory.iterdir() if p.is_dir() and p.name.isdigit()),
+            reverse=True
+        )
+        for year in years:
+            stems = sorted(p.stem for p in year.glob(f"*{self.SUFFIX}"))
+            if stems:
+                return datetime.strptime(stems[-1], '%Y%m%d').date()
+        return None
+
+    def append(self, df: pd.DataFrame) -> bool:
+        """Merge rows into their date partitions.
+
+        Rows for a date already stored replace the stored rows with the
+        same key; other stored rows are kept.
+
+        Args:
+            df: Rows to store, with a date column
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if df.empty:
+            return True
+
+        try:
+            reference_dates = pd.to_datetime(df[self.date_column]).dt.date
+            for dt, partition in df.groupby(reference_dates, sort=True):
+                existing = self.read_partition(dt)
+                if existing is not None:
+                    partition = pd.concat([existing, partition], ignore_index=True)
+                partition = partition.drop_duplicates(
+                    subset=self.key_columns, keep='last'
+                )
+                self.write_partition(dt, partition)
+
+            logger.info(f"Stored {len(df)} rows in {self.directory}")
+            return True
+        except Exception as e:
+            logger.error(f"Error storing rows in {self.directory}: {e}")
+            return False
+
+    def write_partition(self, dt: date, df: pd.DataFrame) -> None:
+        """Atomically replace the partition of a date.
+
+        Args:
+            dt: Reference date
+            df: Every row of the date
+        """
+        path = self.partition_path(dt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        categorical = [col for col in self.categorical_columns if col in df.columns]
+        if categorical:
+            df = df.astype({col: 'category' for col in categorical})
+
+        # Any: numpy types savez's keywords as allow_pickle too
+        arrays: Dict[str, Any] = encode_columns(df)
+        tmp_path = path.with_name(path.stem + '.tmp' + self.SUFFIX)
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+            DataProcessor.sync_file(f, f.tell())
+        os.replace(tmp_path, path)
+
+    def read_partition(
+        self,
+        dt: date,
+        columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Read the rows of one date.
+
+        Args:
+            dt: Reference date
+            columns: Columns to load (all by default)
+
+        Returns:
+            DataFrame or None if the date is not stored
+        """
+        path = self.partition_path(dt)
+        if not path.exists():
+            return None
+
+        with np.load(path, allow_pickle=False) as archive:
+            return decode_columns(archive, columns)
+
+    def read(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """Read every row between two dates.
+
+        Args:
+            start_date: First date (inclusive), unbounded if None
+            end_date: Last date (inclusive), unbounded if None
+            columns: Columns to load (all by default)
+
+        Returns:
+            Concatenated rows sorted by date
+        """
+        frames = []
+        for dt in self.dates():
+            if start_date is not None and dt < start_date:
+                continue
+            if end_date is not None and dt > end_date:
+                continue
+            df = self.read_partition(dt, columns)
+            if df is not None:
+                frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        return pd.concat(frames, ignore_index=True)
+
+
+def encode_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Convert DataFrame columns to arrays that need no pickling.
+
+    Args:
+        df: DataFrame to encode
+
+    Returns:
+        Mapping of array names to arrays
+    """
+    arrays: Dict[str, np.ndarray] = {
+        ColumnarStore.COLUMNS_KEY: np.array(list(df.columns), dtype=str)
+    }
+
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            arrays[col] = series.cat.codes.to_numpy()
+            arrays[col + ColumnarStore.CATEGORIES_SUFFIX] = (
+                np.asarray(series.cat.categories, dtype=str)
+            )
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            arrays[col] = series.to_numpy(dtype='datetime64[ns]')
+        elif (pd.api.types.is_numeric_dtype(series)
+              or pd.api.types.is_bool_dtype(series)):
+            arrays[col] = series.to_numpy()
+        else:
+            values = series.to_numpy(dtype=object)
+            if len(values) and all(isinstance(v, (date, datetime)) for v in values):
+                arrays[col] = pd.to_datetime(series).to_numpy(dtype='datetime64[ns]')
+            else:
+                arrays[col] = series.fillna('').astype(str).to_numpy(dtype=str)
+
+    return arrays
+
+
+def decode_columns(
+    archive: Dict[str, np.ndarray],
+    columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """Rebuild a DataFrame from arrays written by ``encode_columns``.
+
+    Args:
+        archive: Mapping of array names to arrays (e.g. an ``NpzFile``)
+        columns: Columns to load (all by default)
+
+    Returns:
+        Decoded DataFrame
+    """
+    stored = list(archive[ColumnarStore.COLUMNS_KEY])
+    selected = [col for col in stored if columns is None or col in columns]
+
+    data = {}
+    for col in selected:
+        categories_key = col + ColumnarStore.CATEGORIES_SUFFIX
+        if categories_key in archive:
+            data[col] = pd.Categorical.from_codes(
+                archive[col], categories=archive[categories_key]
+            )
+        else:
+            data[col] = archive[col]
+
+    return pd.DataFrame(data, columns=selected)
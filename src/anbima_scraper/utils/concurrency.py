@@ -0,0 +1,61 @@
+"""Concurrency helpers for ANBIMA downloads."""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, Iterable, Optional, TypeVar
+
+from ..config.settings import REQUEST_SETTINGS
+from .profiling import diagnostics_enabled
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar('K', bound=Hashable)
+R = TypeVar('R')
+
+
+def run_concurrently(
+    func: Callable[[K], Optional[R]],
+    items: Iterable[K],
+    max_workers: Optional[int] = None
+) -> Dict[K, Optional[R]]:
+    """Call ``func`` for every item on a bounded thread pool.
+
+    Downloads are I/O bound, so threads sharing one HTTP session overlap
+    their network waits. Exceptions are logged and reported as None.
+    While profiling, items are called in the calling thread so they show
+    up in its profile.
+
+    Args:
+        func: Function applied to each item
+        items: Items to process
+        max_workers: Thread pool size (defaults to REQUEST_SETTINGS)
+
+    Returns:
+        Dictionary mapping each item to its result
+    """
+    items = list(items)
+    max_workers = max_workers or REQUEST_SETTINGS["max_workers"]
+    results: Dict[K, Optional[R]] = {}
+
+    if max_workers <= 1 or len(items) <= 1 or diagnostics_enabled():
+        for item in items:
+            results[item] = _call_safe(func, item)
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: Dict["Future[Optional[R]]", K] = {
+            executor.submit(_call_safe, func, item): item for item in items
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
+
+
+def _call_safe(func: Callable[[K], Optional[R]], item: K) -> Optional[R]:
+    """Call ``func`` turning exceptions into None."""
+    try:
+        return func(item)
+    except Exception as e:
+        logger.error(f"Error processing {item}: {e}")
+        return None
@@ -0,0 +1,361 @@
+"""Dense array storage for ANBIMA closing yield curves."""
+
+import json
+import logging
+import os
+import shutil
+from datetime import date
+from pathlib import Path
+from typing import (
+    Dict, Iterable, Literal, NamedTuple, Optional, Set, Tuple, Union
+)
+
+import numpy as np
+
+from .data_processor import DataProcessor
+
+logger = logging.getLogger(__name__)
+
+# Vertex series published in the CZ-down.asp output, in storage order
+CURVE_SERIES = ('ettj_ipca', 'ettj_pref', 'inflacao_implicita')
+
+# Svensson curves and their parameters, in storage order
+SVENSSON_CURVES = ('prefixados', 'ipca')
+SVENSSON_PARAMETERS = ('beta1', 'beta2', 'beta3', 'beta4', 'lambda1', 'lambda2')
+
+
+class ClosingCurves(NamedTuple):
+    """Closing curves for a set of dates, as dense arrays.
+
+    Attributes:
+        dates: Reference dates, ``datetime64[D]`` of shape (n_dates,)
+        vertices: Vertices in business days, shape (n_vertices,)
+        rates: Vertex rates in % a.a., shape (n_dates, n_series, n_vertices)
+        parameters: Svensson parameters, shape (n_dates, n_curves, n_params)
+    """
+
+    dates: np.ndarray
+    vertices: np.ndarray
+    rates: np.ndarray
+    parameters: np.ndarray
+
+    def series(self, name: str) -> np.ndarray:
+        """Get one vertex series as a (n_dates, n_vertices) array.
+
+        Args:
+            name: Series name (see ``CURVE_SERIES``)
+
+        Returns:
+            Rates of the series for every date and vertex
+        """
+        return self.rates[:, CURVE_SERIES.index(name), :]
+
+    def svensson(self, curve: str) -> np.ndarray:
+        """Get the Svensson parameters of a curve as a (n_dates, 6) array.
+
+        Args:
+            curve: Curve name (see ``SVENSSON_CURVES``)
+
+        Returns:
+            Parameters for every date
+        """
+        return self.parameters[:, SVENSSON_CURVES.index(curve), :]
+
+    def date_index(self, dt: date) -> int:
+        """Get the row of a reference date.
+
+        Args:
+            dt: Reference date
+
+        Returns:
+            Row index
+
+        Raises:
+            KeyError: If the date is not stored
+        """
+        key = np.datetime64(dt, 'D')
+        position = int(np.searchsorted(self.dates, key))
+        if position >= len(self.dates) or self.dates[position] != key:
+            raise KeyError(f"No curve stored for {dt}")
+        return position
+
+    @classmethod
+    def empty(cls) -> "ClosingCurves":
+        """Create an empty set of curves."""
+        return cls(
+            dates=np.array([], dtype='datetime64[D]'),
+            vertices=np.array([], dtype=np.int64),
+            rates=np.empty((0, len(CURVE_SERIES), 0)),
+            parameters=np.empty(
+                (0, len(SVENSSON_CURVES), len(SVENSSON_PARAMETERS))
+            ),
+        )
+
+
+class CurveStore:
+    """Store closing curves as a dates x vertices float array on disk.
+
+    Each array lives in its own ``.npy`` file, so the whole history is
+    opened with memory-mapped reads and no parsing. Every write goes to a
+    new numbered generation directory inside ``directory``; the manifest
+    naming the current generation and its array shapes is then replaced in
+    a single rename, so readers see either the old or the new arrays, never
+    a mix. The generation before the current one is kept for readers still
+    opening it; older ones are removed. Stores written before generations
+    (arrays directly in ``directory``) are read until the next write.
+    """
+
+    FILES = {
+        'dates': 'dates.npy',
+        'vertices': 'vertices.npy',
+        'rates': 'rates.npy',
+        'parameters': 'parameters.npy',
+    }
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, directory: Union[str, Path]):
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the arrays
+        """
+        self.directory = Path(directory)
+
+    def _manifest(self) -> Optional[Dict]:
+        """Read the manifest of the current generation (None if unwritten)."""
+        path = self.directory / self.MANIFEST_FILE
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest: Dict = json.load(f)
+        return manifest
+
+    def _current(self, manifest: Optional[Dict]) -> Path:
+        """Directory holding the arrays of the generation a manifest names.
+
+        Args:
+            manifest: Manifest read once by the caller (None before
+                generations), so the arrays and the shapes checked against
+                them come from the same generation
+
+        Returns:
+            Generation directory
+        """
+        if manifest is None:
+            return self.directory
+        return self.directory / str(manifest['generation'])
+
+    def _has_arrays(self, directory: Path) -> bool:
+        """Check if every array file is in a directory."""
+        return all(
+            (directory / filename).exists() for filename in self.FILES.values()
+        )
+
+    def _generations(self) -> Dict[int, Path]:
+        """Generation directories on disk, by number."""
+        if not self.directory.exists():
+            return {}
+        return {
+            int(path.name): path for path in self.directory.iterdir()
+            if path.is_dir() and path.name.isdigit()
+        }
+
+    def exists(self) -> bool:
+        """Check if the store has been written."""
+        return self._has_arrays(self._current(self._manifest()))
+
+    def load(self, mmap: bool = True) -> ClosingCurves:
+        """Load all stored curves.
+
+        Args:
+            mmap: Memory-map the arrays instead of reading them into memory
+
+        Returns:
+            Stored curves (empty if nothing was stored yet)
+
+        Raises:
+            ValueError: If the stored arrays do not fit together
+        """
+        manifest = self._manifest()
+        current = self._current(manifest)
+        if not self._has_arrays(current):
+            return ClosingCurves.empty()
+
+        mmap_mode: Optional[Literal['r']] = 'r' if mmap else None
+        arrays = {
+            field: np.load(current / filename, mmap_mode=mmap_mode)
+            for field, filename in self.FILES.items()
+        }
+        curves = ClosingCurves(**arrays)
+        self._validate(curves, manifest)
+        return curves
+
+    def _validate(self, curves: ClosingCurves,
+                  manifest: Optional[Dict]) -> None:
+        """Check the arrays against each other and the manifest.
+
+        Args:
+            curves: Loaded arrays
+            manifest: Manifest they were loaded from (None before generations)
+
+        Raises:
+            ValueError: If a shape does not match
+        """
+        n_dates, n_vertices = len(curves.dates), len(curves.vertices)
+        expected: Dict[str, Tuple[int, ...]] = {
+            'rates': (n_dates, len(CURVE_SERIES), n_vertices),
+            'parameters': (
+                n_dates, len(SVENSSON_CURVES), len(SVENSSON_PARAMETERS)
+            ),
+        }
+        if manifest is not None:
+            expected['dates'] = (manifest['dates'],)
+            expected['vertices'] = (manifest['vertices'],)
+
+        for field, shape in expected.items():
+            actual = getattr(curves, field).shape
+            if actual != shape:
+                raise ValueError(
+                    f"Curve store {self.directory} is inconsistent: "
+                    f"{field} has shape {actual}, expected {shape}"
+                )
+
+    def count_rows(
+        self,
+        dates: Optional[Iterable[date]] = None
+    ) -> Dict[date, int]:
+        """Count stored curves per date (one set of curves per date).
+
+        Args:
+            dates: Dates to count (every stored date if None)
+
+        Returns:
+            1 for each stored date
+        """
+        path = self._current(self._manifest()) / self.FILES['dates']
+        if not path.exists():
+            return {}
+        stored = set(np.load(path, mmap_mode='r').astype(object))
+        if dates is not None:
+            stored &= set(dates)
+        return dict.fromkeys(stored, 1)
+
+    def get_last_date(self) -> Optional[date]:
+        """Get the last stored reference date.
+
+        Returns:
+            Last date or None if the store is empty
+        """
+        path = self._current(self._manifest()) / self.FILES['dates']
+        if not path.exists():
+            return None
+
+        dates = np.load(path, mmap_mode='r')
+        if len(dates) == 0:
+            return None
+        last_date: date = dates[-1].astype(object)
+        return last_date
+
+    def append(self, curves: ClosingCurves) -> bool:
+        """Merge new curves into the store.
+
+        Dates already stored are replaced. Vertices are the union of the
+        stored and new vertices, missing cells are NaN. The whole history
+        is read and written again as a new generation, so each call costs
+        O(dates x vertices): a few MB for decades of daily curves, which
+        the once-a-day scrape affords. Batch many dates into one call
+        rather than appending them one at a time.
+
+        Args:
+            curves: Curves to store
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if len(curves.dates) == 0:
+            return True
+
+        try:
+            merged = merge_curves(self.load(mmap=False), curves)
+            self._write(merged)
+            logger.info(
+                f"Stored {len(curves.dates)} curves in {self.directory} "
+                f"({len(merged.dates)} dates x {len(merged.vertices)} vertices)"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error storing curves in {self.directory}: {e}")
+            return False
+
+    def _write(self, curves: ClosingCurves) -> None:
+        """Write the arrays as a new generation and make it current."""
+        generations = self._generations()
+        # Past any generation left unpublished by a failed write
+        number = max(generations, default=0) + 1
+        generation = self.directory / f"{number:012d}"
+        generation.mkdir(parents=True)
+
+        for field, filename in self.FILES.items():
+            with open(generation / filename, 'wb') as f:
+                np.save(f, np.ascontiguousarray(getattr(curves, field)))
+                DataProcessor.sync_file(f, f.tell())
+
+        manifest_path = self.directory / self.MANIFEST_FILE
+        previous = self._current(self._manifest())
+        tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generation': generation.name,
+                'dates': len(curves.dates),
+                'vertices': len(curves.vertices),
+            }, f)
+            DataProcessor.sync_file(f, f.tell())
+        os.replace(tmp_path, manifest_path)
+
+        self._remove_stale(keep={generation, previous})
+
+    def _remove_stale(self, keep: Set[Path]) -> None:
+        """Remove generations and pre-generation arrays no longer read.
+
+        Args:
+            keep: Directories still read (current and previous generation)
+        """
+        for path in self._generations().values():
+            if path not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+        if self.directory not in keep:
+            for filename in self.FILES.values():
+                (self.directory / filename).unlink(missing_ok=True)
+
+
+def merge_curves(old: ClosingCurves, new: ClosingCurves) -> ClosingCurves:
+    """Merge two sets of curves, ``new`` taking precedence on shared dates.
+
+    Args:
+        old: Existing curves
+        new: Curves to add
+
+    Returns:
+        Merged curves sorted by date and vertex
+    """
+    dates = np.union1d(old.dates, new.dates).astype('datetime64[D]')
+    vertices = np.union1d(old.vertices, new.vertices).astype(np.int64)
+
+    rates = np.full((len(dates), len(CURVE_SERIES), len(vertices)), np.nan)
+    parameters = np.full(
+        (len(dates), len(SVENSSON_CURVES), len(SVENSSON_PARAMETERS)), np.nan
+    )
+    series_index = np.arange(len(CURVE_SERIES))[None, :, None]
+
+    for curves in (old, new):
+        if len(curves.dates) == 0:
+            continue
+        rows = np.searchsorted(dates, curves.dates)
+        columns = np.searchsorted(vertices, curves.vertices)
+        rates[rows] = np.nan
+        rates[rows[:, None, None], series_index, columns[None, None, :]] = (
+            curves.rates
+        )
+        parameters[rows] = curves.parameters
+
+    return ClosingCurves(dates, vertices, rates, parameters)
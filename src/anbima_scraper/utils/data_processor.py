@@ -2,13 +2,17 @@
 
 import csv
 import logging
+import os
+import re
+import time
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import IO, Any, Dict, List, Optional, Union
 
 import pandas as pd
 
 from ..config.settings import DATA_SETTINGS
+from . import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -73,20 +77,175 @@ class DataProcessor:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            df.to_csv(
-                file_path,
-                mode=mode,
-                encoding=DATA_SETTINGS["encoding"],
-                sep=DATA_SETTINGS["csv_separator"],
-                index=False,
-                **kwargs
-            )
+            with open(file_path, mode, encoding=DATA_SETTINGS["encoding"],
+                      newline='') as f:
+                start = f.tell()
+                df.to_csv(
+                    f,
+                    sep=DATA_SETTINGS["csv_separator"],
+                    index=False,
+                    **kwargs
+                )
+                DataProcessor.sync_file(f, f.tell() - start)
             logger.info(f"Successfully saved CSV: {file_path}")
             return True
         except Exception as e:
             logger.error(f"Error saving CSV {file_path}: {e}")
             return False
 
+    @staticmethod
+    def sync_file(f: IO[Any], size: int) -> None:
+        """Flush a file being written and report the write to run metrics.
+
+        The file is also fsynced when DATA_SETTINGS["fsync"] is set.
+
+        Args:
+            f: Open file object
+            size: Bytes written to it
+        """
+        f.flush()
+        fsync_seconds = 0.0
+        if DATA_SETTINGS["fsync"]:
+            started = time.perf_counter()
+            os.fsync(f.fileno())
+            fsync_seconds = time.perf_counter() - started
+        metrics.record("write", bytes=size, fsync_seconds=fsync_seconds)
+
+    @staticmethod
+    def append_csv_sorted(
+        df: pd.DataFrame,
+        file_path: Union[str, Path],
+        date_column: str = 'dt_referencia',
+        subset: Optional[List[str]] = None
+    ) -> bool:
+        """Append rows to a CSV base keeping it sorted by date.
+
+        Rows dated after the last date already stored are appended in a
+        single write, without touching the existing content. The base is
+        only re-read, merged and rewritten when the new rows overlap it.
+
+        Args:
+            df: DataFrame to append
+            file_path: Output file path
+            date_column: Name of date column
+            subset: Columns identifying a record when deduplicating a merge
+
+        Returns:
+            True if successful, False otherwise
+        """
+        file_path = Path(file_path)
+
+        if df.empty:
+            return True
+
+        try:
+            df = df.copy()
+            df[date_column] = pd.to_datetime(df[date_column])
+            df = df.sort_values(date_column, kind='mergesort')
+
+            header = DataProcessor.read_csv_header(file_path)
+            if header is None:
+                return DataProcessor.save_csv_safe(df, file_path)
+
+            last_date = DataProcessor.get_last_date_from_tail(
+                file_path, date_column
+            )
+            same_layout = list(df.columns) == header
+
+            if (same_layout and last_date is not None
+                    and df[date_column].min().date() > last_date):
+                return DataProcessor.save_csv_safe(
+                    df, file_path, mode='a', header=False
+                )
+
+            logger.info(f"New rows overlap {file_path}, merging base")
+            existing = DataProcessor.read_csv_safe(file_path)
+            if existing is None:
+                return False
+            existing[date_column] = pd.to_datetime(existing[date_column])
+
+            merged = pd.concat([existing, df], ignore_index=True)
+            merged = merged.drop_duplicates(
+                subset=subset or None, keep='last'
+            )
+            merged = merged.sort_values(date_column, kind='mergesort')
+            return DataProcessor.save_csv_safe(merged, file_path)
+        except Exception as e:
+            logger.error(f"Error appending to CSV {file_path}: {e}")
+            return False
+
+    @staticmethod
+    def read_csv_header(file_path: Union[str, Path]) -> Optional[List[str]]:
+        """Read the column names of a CSV file without parsing its rows.
+
+        Args:
+            file_path: Path to CSV file
+
+        Returns:
+            List of column names, or None if the file is missing or empty
+        """
+        file_path = Path(file_path)
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return None
+
+        with open(file_path, 'r', encoding=DATA_SETTINGS["encoding"]) as f:
+            first_line = f.readline().rstrip('\r\n')
+
+        if not first_line:
+            return None
+        return [
+            column.strip('"')
+            for column in first_line.split(DATA_SETTINGS["csv_separator"])
+        ]
+
+    @staticmethod
+    def get_last_date_from_tail(
+        file_path: Union[str, Path],
+        date_column: str = 'dt_referencia',
+        block_size: int = 65536
+    ) -> Optional[date]:
+        """Get the date on the last row of a date-sorted CSV file.
+
+        Only the header and the final block of the file are read, so the
+        cost does not grow with the size of the base.
+
+        Args:
+            file_path: Path to CSV file
+            date_column: Name of date column
+            block_size: Number of bytes to read from the end of the file
+
+        Returns:
+            Last date if found, None otherwise
+        """
+        header = DataProcessor.read_csv_header(file_path)
+        if header is None or date_column not in header:
+            return None
+
+        position = header.index(date_column)
+        file_path = Path(file_path)
+
+        with open(file_path, 'rb') as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - block_size))
+            tail = f.read().decode(DATA_SETTINGS["encoding"], errors='ignore')
+
+        lines = [line for line in tail.splitlines() if line.strip()]
+        if len(lines) < 2 and size <= block_size:
+            # Only the header is present
+            return None
+
+        fields = lines[-1].split(DATA_SETTINGS["csv_separator"])
+        if position >= len(fields):
+            return None
+
+        try:
+            last_date: date = pd.to_datetime(fields[position].strip('"')).date()
+            return last_date
+        except (ValueError, TypeError):
+            logger.debug(f"Could not parse last date in {file_path}")
+            return None
+
     @staticmethod
     def get_last_date_from_csv(file_path: Union[str, Path]) -> Optional[date]:
         """Get last date from CSV file.
@@ -144,10 +303,16 @@ class DataProcessor:
             'Nenhum arquivo encontrado'
         ]
         
-        for pattern in error_patterns:
-            mask = df.astype(str).apply(
-                lambda x: x.str.contains(pattern, case=False, na=False)
-            ).any(axis=1)
+        # Numeric and datetime columns cannot hold error messages, so only
+        # text columns are scanned, with all patterns in a single pass
+        text_columns = df.select_dtypes(include=['object', 'string']).columns
+        if len(text_columns) > 0:
+            regex = '|'.join(re.escape(pattern) for pattern in error_patterns)
+            mask = pd.Series(False, index=df.index)
+            for col in text_columns:
+                mask |= df[col].astype(str).str.contains(
+                    regex, case=False, na=False
+                )
             df = df[~mask]
         
         removed_rows = initial_rows - len(df)
@@ -156,6 +321,42 @@ class DataProcessor:
         
         return df
 
+    @staticmethod
+    def parse_decimal_comma(series: pd.Series) -> pd.Series:
+        """Convert ANBIMA formatted numbers ("1.234,56") to floats.
+
+        Args:
+            series: Series of strings in decimal-comma format
+
+        Returns:
+            Float series, with NaN where the value is not a number
+        """
+        cleaned = (
+            series.astype(str)
+            .str.strip()
+            .str.replace('.', '', regex=False)
+            .str.replace(',', '.', regex=False)
+        )
+        return pd.to_numeric(cleaned, errors='coerce')
+
+    @staticmethod
+    def filter_lines(content: bytes, pattern: bytes) -> bytes:
+        """Keep only the lines of a raw payload that start with ``pattern``.
+
+        Titles, headers and footers of ANBIMA text files are removed by the
+        regex engine over the whole buffer, so the remaining data parses
+        straight into numeric columns.
+
+        Args:
+            content: Raw file content
+            pattern: Regular expression (bytes) matched at line start
+
+        Returns:
+            Content with the other lines removed
+        """
+        regex = re.compile(rb'^(?!' + pattern + rb').*(?:\n|\Z)', re.MULTILINE)
+        return regex.sub(b'', content)
+
     @staticmethod
     def sort_by_date(
         df: pd.DataFrame,
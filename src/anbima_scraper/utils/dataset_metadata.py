@@ -0,0 +1,156 @@
+"""Per-dataset metadata maintained on write, read by the status command."""
+
+import json
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Mapping, NamedTuple, Optional, Union
+
+from .calendar import ANBIMACalendar
+from .run_history import RunRecord
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetStatus(NamedTuple):
+    """Freshness and size of a dataset, as shown by the status command.
+
+    Attributes:
+        dataset: Dataset (scraper) name
+        first_date: First stored reference date
+        last_date: Last stored reference date
+        rows: Stored rows
+        dates: Stored reference dates
+        gaps: Business days between the first and last dates not stored
+        lag_business_days: Business days after the last stored date up to
+            the previous business day, i.e. publications not yet stored
+        last_run_at: Start of the last recorded run
+        last_run_seconds: Duration of the last recorded run
+        last_run_success: Whether the last recorded run succeeded
+    """
+
+    dataset: str
+    first_date: Optional[date]
+    last_date: Optional[date]
+    rows: int
+    dates: int
+    gaps: int
+    lag_business_days: Optional[int]
+    last_run_at: Optional[datetime]
+    last_run_seconds: Optional[float]
+    last_run_success: Optional[bool]
+
+    @classmethod
+    def build(cls, dataset: str, counts: Mapping[date, int],
+              calendar: ANBIMACalendar, today: date,
+              last_run: Optional[RunRecord] = None) -> "DatasetStatus":
+        """Derive the status of a dataset from its row counts per date.
+
+        Args:
+            dataset: Dataset (scraper) name
+            counts: Stored rows per reference date
+            calendar: ANBIMA calendar
+            today: Date freshness is measured against
+            last_run: Last recorded run of the dataset
+        """
+        first_date: Optional[date] = None
+        last_date: Optional[date] = None
+        gaps = 0
+        lag = None
+        if counts:
+            first_date, last_date = min(counts), max(counts)
+            # Business days in [first, last], minus those stored
+            span = int(calendar.count_business_days(
+                first_date, calendar.get_next_business_day(last_date)
+            ))
+            gaps = max(0, span - len(counts))
+            # Business days in (last, previous business day of today]
+            lag = max(0, int(calendar.count_business_days(
+                calendar.get_next_business_day(last_date), today
+            )))
+
+        return cls(
+            dataset=dataset,
+            first_date=first_date,
+            last_date=last_date,
+            rows=sum(counts.values()),
+            dates=len(counts),
+            gaps=gaps,
+            lag_business_days=lag,
+            last_run_at=last_run.started_at if last_run else None,
+            last_run_seconds=last_run.duration_seconds if last_run else None,
+            last_run_success=last_run.success if last_run else None,
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert to JSON-serializable values."""
+        return {
+            field: value.isoformat() if isinstance(value, (date, datetime)) else value
+            for field, value in self._asdict().items()
+        }
+
+
+class DatasetMetadata:
+    """Row counts per reference date of a dataset, kept next to its base.
+
+    Writes update the counts of the dates they touch, so the status of a
+    dataset is read from one small JSON file instead of the base itself.
+    Callers serialize writes to the same dataset (see BaseScraper).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the metadata file.
+
+        Args:
+            path: JSON file holding the counts
+        """
+        self.path = Path(path)
+
+    def load(self) -> Optional[Dict[date, int]]:
+        """Read the row counts per reference date.
+
+        Returns:
+            Counts by date, or None if the file is missing or unreadable
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                content = json.load(f)
+            return {
+                date.fromisoformat(dt): rows
+                for dt, rows in content["rows_by_date"].items()
+            }
+        except Exception as e:
+            logger.warning(f"Error reading dataset metadata {self.path}: {e}")
+            return None
+
+    def update(self, counts: Mapping[date, int]) -> None:
+        """Set the row counts of some dates, keeping the others.
+
+        Args:
+            counts: Rows now stored for each written date
+        """
+        stored = self.load() or {}
+        stored.update(counts)
+        self.replace(stored)
+
+    def replace(self, counts: Mapping[date, int]) -> None:
+        """Atomically replace every row count.
+
+        Args:
+            counts: Rows stored for every date of the dataset
+        """
+        content = {
+            "updated_at": datetime.now().isoformat(timespec='seconds'),
+            "rows_by_date": {
+                dt.isoformat(): int(rows)
+                for dt, rows in sorted(counts.items()) if rows
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(content, f)
+        os.replace(tmp_path, self.path)
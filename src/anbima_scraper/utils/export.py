@@ -0,0 +1,242 @@
+"""Exports of stored datasets to analysis formats."""
+
+import logging
+import os
+from datetime import date
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+from xlsxwriter.format import Format
+from xlsxwriter.worksheet import Worksheet
+
+from ..config.settings import EXPORT_SETTINGS
+
+if TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+# Rows of an Excel worksheet, header included
+MAX_SHEET_ROWS = 1_048_576
+
+# Values of one column and the worksheet method writing them (None for
+# columns of mixed types)
+ColumnCells = Tuple[List, Optional[Callable]]
+
+
+def write_xlsx(chunks: Iterable[pd.DataFrame], path: Union[str, Path],
+               sheet_name: str = "dados") -> int:
+    """Write DataFrame chunks to an Excel file in constant memory.
+
+    The workbook is written in xlsxwriter's ``constant_memory`` mode, which
+    flushes every row to disk as soon as the next one starts, so memory is
+    bounded by one chunk however large the base. Dates become Excel dates
+    and numbers Excel numbers; missing values are left blank. Rows beyond
+    Excel's limit continue on new worksheets (``dados_2``, ...) under a
+    repeated header. Columns are those of the first chunk.
+
+    Args:
+        chunks: Rows to write, in order
+        path: Output ``.xlsx`` file, replaced atomically
+        sheet_name: Name of the first worksheet
+
+    Returns:
+        Rows written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.stem + '.tmp' + path.suffix)
+
+    workbook = xlsxwriter.Workbook(str(tmp_path), {'constant_memory': True})
+    date_format = workbook.add_format(
+        {'num_format': EXPORT_SETTINGS["xlsx_date_format"]}
+    )
+    header_format = workbook.add_format({'bold': True})
+
+    columns: Optional[List[str]] = None
+    sheets = 0
+    sheet: Optional[Worksheet] = None
+    row = MAX_SHEET_ROWS
+    written = 0
+    try:
+        for chunk in chunks:
+            if columns is None:
+                columns = [str(col) for col in chunk.columns]
+            chunk = chunk.set_axis(
+                [str(col) for col in chunk.columns], axis=1
+            ).reindex(columns=columns)
+            cells = [
+                (*_column_cells(chunk[col]),
+                 date_format if pd.api.types.is_datetime64_any_dtype(chunk[col])
+                 else None)
+                for col in columns
+            ]
+
+            for position in range(len(chunk)):
+                if row >= MAX_SHEET_ROWS:
+                    sheets += 1
+                    sheet = workbook.add_worksheet(
+                        sheet_name if sheets == 1 else f"{sheet_name}_{sheets}"
+                    )
+                    sheet.write_row(0, 0, columns, header_format)
+                    row = 1
+                for col, (values, write, cell_format) in enumerate(cells):
+                    value = values[position]
+                    if value is None:
+                        continue
+                    if write is not None:
+                        write(sheet, row, col, value, cell_format)
+                    else:
+                        _write_value(sheet, row, col, value, date_format)
+                row += 1
+            written += len(chunk)
+
+        if sheet is None:
+            sheet = workbook.add_worksheet(sheet_name)
+            if columns:
+                sheet.write_row(0, 0, columns, header_format)
+        workbook.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Exported {written} rows to {path}")
+    return written
+
+
+def _column_cells(series: pd.Series) -> ColumnCells:
+    """Convert a column to Python values and the method writing them.
+
+    Missing values become None. Typed columns (dates, numbers, booleans)
+    write every value with one worksheet method; other columns are
+    dispatched value by value.
+    """
+    missing = series.isna().to_numpy()
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = pd.DatetimeIndex(series).to_pydatetime()
+        write = Worksheet.write_datetime
+    elif pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype=object)
+        write = Worksheet.write_boolean
+    elif pd.api.types.is_numeric_dtype(series):
+        numbers = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = numbers.astype(object)
+        # Excel has no NaN or infinity
+        missing = ~np.isfinite(numbers)
+        write = Worksheet.write_number
+    else:
+        values = series.to_numpy(dtype=object)
+        write = None
+
+    values[missing] = None
+    return values.tolist(), write
+
+
+def _write_value(sheet: Worksheet, row: int, col: int, value: object,
+                 date_format: Format) -> None:
+    """Write a value of an untyped column as its Excel type."""
+    if isinstance(value, date):
+        sheet.write_datetime(row, col, value, date_format)
+    elif isinstance(value, (bool, np.bool_)):
+        sheet.write_boolean(row, col, bool(value))
+    elif isinstance(value, (int, float, np.number)):
+        sheet.write_number(row, col, float(value))
+    elif value != '':
+        sheet.write_string(row, col, str(value))
+
+
+def import_pyarrow() -> "pyarrow":
+    """Import pyarrow, an optional dependency of the Arrow formats.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow/Feather files: "
+            "pip install 'anbima_scraper[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def write_feather(chunks: Iterable[pd.DataFrame], path: Union[str, Path],
+                  dataset: str = "",
+                  metadata: Optional[Mapping[str, str]] = None) -> int:
+    """Write DataFrame chunks to an uncompressed Feather (Arrow IPC) file.
+
+    Each chunk becomes one record batch, so memory is bounded by one
+    chunk. The file is left uncompressed so readers can memory-map it
+    without copying. Categorical columns are written as plain strings,
+    since the IPC file format allows one dictionary per column and
+    partitions carry their own. Columns and types are those of the first
+    chunk.
+
+    Args:
+        chunks: Rows to write, in order
+        path: Output file, replaced atomically
+        dataset: Dataset name, stored in the schema metadata
+        metadata: Extra schema metadata
+
+    Returns:
+        Rows written
+    """
+    pa = import_pyarrow()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process, as concurrent loads may rebuild the same snapshot
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    schema_metadata = {"anbima_dataset": dataset, **(metadata or {})}
+
+    written = 0
+    writer = None
+    try:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            for chunk in chunks:
+                chunk = chunk.astype({
+                    col: object for col in chunk.columns
+                    if isinstance(chunk[col].dtype, pd.CategoricalDtype)
+                })
+                if writer is None:
+                    schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                    schema = schema.with_metadata(
+                        {**(schema.metadata or {}), **schema_metadata}
+                    )
+                    writer = pa.ipc.new_file(sink, schema)
+                batch = pa.RecordBatch.from_pandas(
+                    chunk.reindex(columns=schema.names),
+                    schema=schema,
+                    preserve_index=False,
+                )
+                writer.write_batch(batch)
+                written += len(chunk)
+
+            if writer is None:
+                writer = pa.ipc.new_file(
+                    sink, pa.schema([]).with_metadata(schema_metadata)
+                )
+            writer.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Exported {written} rows to {path}")
+    return written
+
+
+# Writers by export format: (chunks, path, dataset name) -> rows written
+EXPORT_WRITERS: Dict[str, Callable[[Iterable[pd.DataFrame], Path, str], int]] = {
+    "xlsx": write_xlsx,
+    "feather": write_feather,
+}
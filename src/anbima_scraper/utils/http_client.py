@@ -2,33 +2,142 @@
 
 import logging
 import random
+import threading
+import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, ContextManager, Dict, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 
 from ..config.settings import REQUEST_SETTINGS, USER_AGENTS_FILE
+from .metrics import RunMetrics
 
 logger = logging.getLogger(__name__)
 
+# Process-wide limits on simultaneous requests to the same host, shared by
+# every client so concurrent scrapers do not add up against one server
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+# Connections opened by the current thread's request and the time spent
+# opening them, read back by ANBIMAHTTPClient.get
+_connect_timing = threading.local()
+
+
+def host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """Get the semaphore bounding concurrent requests to a URL's host.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Semaphore shared by every request to the same host
+    """
+    host = urlsplit(url).netloc.lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(
+                REQUEST_SETTINGS["max_connections_per_host"]
+            )
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def rewrite_base_url(url: str, base_url: Optional[str]) -> str:
+    """Point a URL at another server, keeping its path and query.
+
+    Args:
+        url: ANBIMA URL
+        base_url: Scheme and host to use instead (e.g. http://127.0.0.1:8080)
+
+    Returns:
+        Rewritten URL, or ``url`` itself without a base URL
+    """
+    if not base_url:
+        return url
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    return urlunsplit((
+        base.scheme, base.netloc, base.path.rstrip('/') + parts.path,
+        parts.query, parts.fragment
+    ))
+
+
+class _TimedConnectMixin(HTTPConnection):
+    """Add the time spent opening a connection to the thread's totals."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.count = getattr(_connect_timing, 'count', 0) + 1
+            _connect_timing.seconds = (
+                getattr(_connect_timing, 'seconds', 0.0)
+                + time.perf_counter() - started
+            )
+
+
+class _TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTP adapter timing new connections, TCP and TLS handshakes included."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
 
 class ANBIMAHTTPClient:
     """HTTP client with retry logic and user agent rotation for ANBIMA requests."""
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3,
+                 base_url: Optional[str] = None,
+                 metrics: Optional[RunMetrics] = None):
         """Initialize the HTTP client.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
+            base_url: Server replacing ANBIMA's (defaults to
+                REQUEST_SETTINGS["base_url"])
+            metrics: Run metrics receiving per-request timings
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.base_url = base_url or REQUEST_SETTINGS["base_url"]
+        self.metrics = metrics
         self.session = self._create_session()
         self.user_agents = self._load_user_agents()
 
+        # Totals of successful requests, used for run statistics
+        self.stats = {"requests": 0, "bytes": 0, "seconds": 0.0}
+        self._stats_lock = threading.Lock()
+
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry strategy."""
         session = requests.Session()
@@ -36,11 +145,14 @@ class ANBIMAHTTPClient:
         retry_strategy = Retry(
             total=self.max_retries,
             status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET", "OPTIONS"],
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
             backoff_factor=REQUEST_SETTINGS["retry_delay"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = TimedHTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=REQUEST_SETTINGS["pool_maxsize"]
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -86,24 +198,76 @@ class ANBIMAHTTPClient:
             requests.RequestException: If request fails after retries
         """
         headers = self._get_headers()
+        url = rewrite_base_url(url, self.base_url)
         
         logger.debug(f"Making GET request to: {url}")
         
+        _connect_timing.count = 0
+        _connect_timing.seconds = 0.0
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=self.timeout,
-                stream=stream
-            )
+            started = time.monotonic()
+            with host_semaphore(url), self._trace_download():
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream
+                )
             response.raise_for_status()
+            self._record(response, time.monotonic() - started, stream)
             logger.debug(f"Request successful: {response.status_code}")
             return response
         except requests.RequestException as e:
+            if self.metrics is not None:
+                self.metrics.add(
+                    "http", errors=1,
+                    connections=_connect_timing.count,
+                    connect_seconds=_connect_timing.seconds,
+                )
             logger.error(f"Request failed: {e}")
             raise
 
+    def _trace_download(self) -> ContextManager[None]:
+        """Trace the memory of a download, if the run traces memory."""
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.trace("download")
+
+    def _record(self, response: requests.Response, seconds: float,
+                stream: bool) -> None:
+        """Add a successful request to the statistics.
+
+        The body of a streamed response is counted once it has been read
+        (see ``_record_body``).
+        """
+        size = 0 if stream else len(response.content)
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += size
+            self.stats["seconds"] += seconds
+
+        if self.metrics is not None:
+            retries = getattr(response.raw, 'retries', None)
+            self.metrics.add(
+                "http",
+                requests=1,
+                bytes=size,
+                seconds=seconds,
+                ttfb_seconds=response.elapsed.total_seconds(),
+                retries=len(retries.history) if retries is not None else 0,
+                connections=_connect_timing.count,
+                connect_seconds=_connect_timing.seconds,
+            )
+
+    def _record_body(self, size: int, seconds: float) -> None:
+        """Add the body of a streamed response to the statistics."""
+        with self._stats_lock:
+            self.stats["bytes"] += size
+            self.stats["seconds"] += seconds
+        if self.metrics is not None:
+            self.metrics.add("http", bytes=size, seconds=seconds)
+
     def download_file(
         self, 
         url: str, 
@@ -125,12 +289,14 @@ class ANBIMAHTTPClient:
         
         try:
             response = self.get(url, params=params, stream=True)
+            started = time.monotonic()
             
             total_size = int(response.headers.get('content-length', 0))
             
-            with open(file_path, 'wb') as f:
+            with open(file_path, 'wb') as f, self._trace_download():
                 if total_size == 0:
                     f.write(response.content)
+                    downloaded = len(response.content)
                 else:
                     downloaded = 0
                     for chunk in response.iter_content(chunk_size=8192):
@@ -141,6 +307,7 @@ class ANBIMAHTTPClient:
                                 f"Downloaded: {downloaded}/{total_size} bytes"
                             )
             
+            self._record_body(downloaded, time.monotonic() - started)
             logger.info(f"File downloaded successfully: {file_path}")
             return True
             
@@ -0,0 +1,300 @@
+"""Per-stage timing and throughput metrics of scraper runs."""
+
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterator, Mapping,
+    Optional, Union,
+)
+
+if TYPE_CHECKING:
+    from .profiling import MemoryTracer
+
+logger = logging.getLogger(__name__)
+
+# Counters kept for each stage of a run
+STAGE_FIELDS = {
+    "http": (
+        "requests", "errors", "retries", "connections", "cache_hits",
+        "bytes", "seconds", "connect_seconds", "ttfb_seconds",
+    ),
+    "parse": ("calls", "rows", "seconds"),
+    "write": ("calls", "rows", "bytes", "seconds", "fsync_seconds"),
+}
+
+# Help text of the exported Prometheus metrics
+METRIC_HELP = {
+    "http_requests": "Successful HTTP requests",
+    "http_errors": "HTTP requests failed after retries",
+    "http_retries": "Retries of successful HTTP requests",
+    "http_connections": "New connections opened",
+    "http_cache_hits": "Requests avoided because the data was already stored",
+    "http_bytes": "Response bytes downloaded",
+    "http_seconds": "Time spent in HTTP requests",
+    "http_connect_seconds": "Time spent opening connections (TCP and TLS)",
+    "http_ttfb_seconds": "Time until response headers, summed over requests",
+    "parse_calls": "Files or pages parsed",
+    "parse_rows": "Rows produced by the parsers",
+    "parse_seconds": "Time spent parsing",
+    "write_calls": "Writes to the output base",
+    "write_rows": "Rows written to the output base",
+    "write_bytes": "Bytes written to disk",
+    "write_seconds": "Time spent writing, including fsync",
+    "write_fsync_seconds": "Time spent in fsync",
+}
+
+# Metrics of the run whose write stage is in progress in this context, so
+# storage code deep below a scraper can report bytes without a reference
+_active: ContextVar[Optional["RunMetrics"]] = ContextVar(
+    "anbima_run_metrics", default=None
+)
+
+# Returned by RunMetrics.trace when memory is not traced
+_NOT_TRACED = nullcontext()
+
+
+class RunMetrics:
+    """Accumulate HTTP, parse and write counters of one scraper run.
+
+    Counters are added to from several threads when a scraper downloads
+    concurrently, so every update holds a lock.
+    """
+
+    def __init__(self, dataset: str):
+        """Initialize empty counters.
+
+        Args:
+            dataset: Dataset (scraper) name
+        """
+        self.dataset = dataset
+        self._lock = threading.Lock()
+        # Per-stage memory tracing, set by runs with tracemalloc active
+        self.memory: Optional["MemoryTracer"] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter and restart the run clock."""
+        with self._lock:
+            self._values: Dict[str, Dict[str, float]] = {
+                stage: dict.fromkeys(fields, 0)
+                for stage, fields in STAGE_FIELDS.items()
+            }
+            self.started_at = datetime.now()
+            self._started = time.perf_counter()
+            self.duration_seconds: Optional[float] = None
+            self.success: Optional[bool] = None
+
+    def add(self, stage: str, **values: float) -> None:
+        """Add values to the counters of a stage.
+
+        Args:
+            stage: Stage name (see STAGE_FIELDS)
+            **values: Amounts to add, by counter
+        """
+        with self._lock:
+            counters = self._values[stage]
+            for field, value in values.items():
+                counters[field] += value
+
+    def trace(self, stage: str) -> ContextManager[None]:
+        """Trace the memory of a block as one call of a stage, if enabled.
+
+        Args:
+            stage: Stage name (download, parse, clean, write)
+
+        Returns:
+            Context manager, doing nothing unless ``memory`` is set
+        """
+        if self.memory is None:
+            return _NOT_TRACED
+        return self.memory.stage(stage)
+
+    @contextmanager
+    def stage(self, stage: str, **values: float) -> Iterator[None]:
+        """Time a block as one call of a stage.
+
+        While the block runs, ``record`` adds to this run, which is how
+        storage code reports written bytes and fsync time.
+
+        Args:
+            stage: Stage name (see STAGE_FIELDS)
+            **values: Amounts to add once the block ends (e.g. rows)
+        """
+        token = _active.set(self)
+        started = time.perf_counter()
+        try:
+            with self.trace(stage):
+                yield
+        finally:
+            _active.reset(token)
+            self.add(
+                stage, calls=1, seconds=time.perf_counter() - started, **values
+            )
+
+    def finish(self, success: bool) -> None:
+        """Mark the run as finished.
+
+        Args:
+            success: Whether the run succeeded
+        """
+        with self._lock:
+            self.duration_seconds = time.perf_counter() - self._started
+            self.success = success
+
+    def summary(self) -> Dict:
+        """Get the counters of the run with derived throughputs.
+
+        Returns:
+            JSON-serializable summary
+        """
+        with self._lock:
+            values = {stage: dict(counters) for stage, counters in self._values.items()}
+            duration = self.duration_seconds
+            if duration is None:
+                duration = time.perf_counter() - self._started
+            summary = {
+                "dataset": self.dataset,
+                "started_at": self.started_at.isoformat(timespec='seconds'),
+                "duration_seconds": round(duration, 6),
+                "success": self.success,
+            }
+
+        http, parse, write = values["http"], values["parse"], values["write"]
+        http["bytes_per_second"] = _rate(http["bytes"], http["seconds"])
+        parse["rows_per_second"] = _rate(parse["rows"], parse["seconds"])
+        write["bytes_per_second"] = _rate(write["bytes"], write["seconds"])
+
+        for stage in values.values():
+            for field, value in stage.items():
+                if isinstance(value, float):
+                    stage[field] = round(value, 6)
+        summary.update(values)
+        if self.memory is not None:
+            summary["memory"] = self.memory.summary()
+        return summary
+
+    def describe(self) -> str:
+        """Describe the run in one log line."""
+        summary = self.summary()
+        http, parse, write = summary["http"], summary["parse"], summary["write"]
+        return (
+            f"{self.dataset}: http {http['requests']} requests, "
+            f"{http['bytes'] / 1e6:.2f} MB in {http['seconds']:.2f}s "
+            f"(connect {http['connect_seconds']:.2f}s, "
+            f"ttfb {http['ttfb_seconds']:.2f}s, {http['retries']} retries, "
+            f"{http['errors']} errors); parse {parse['rows']} rows in "
+            f"{parse['seconds']:.2f}s ({parse['rows_per_second']:.0f} rows/s); "
+            f"write {write['bytes'] / 1e6:.2f} MB in {write['seconds']:.2f}s "
+            f"(fsync {write['fsync_seconds']:.2f}s)"
+        )
+
+
+def _rate(amount: float, seconds: float) -> float:
+    """Amount per second, 0 when no time was measured."""
+    return amount / seconds if seconds > 0 else 0.0
+
+
+def record(stage: str, **values: float) -> None:
+    """Add values to the run whose stage is in progress, if any.
+
+    Args:
+        stage: Stage name (see STAGE_FIELDS)
+        **values: Amounts to add, by counter
+    """
+    metrics = _active.get()
+    if metrics is not None:
+        metrics.add(stage, **values)
+
+
+def measure_stage(stage: str,
+                  rows: Callable[[Any], int] = len) -> Callable:
+    """Decorate a scraper method to time it as one call of a stage.
+
+    The decorated method's instance must have a ``metrics`` attribute
+    holding a ``RunMetrics``; results of None count as zero rows.
+
+    Args:
+        stage: Stage name (see STAGE_FIELDS)
+        rows: Counts the rows of the method's result
+
+    Returns:
+        Decorator
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            with self.metrics.trace(stage):
+                result = method(self, *args, **kwargs)
+            self.metrics.add(
+                stage,
+                calls=1,
+                rows=rows(result) if result is not None else 0,
+                seconds=time.perf_counter() - started,
+            )
+            return result
+        return wrapper
+    return decorator
+
+
+def format_prometheus(summaries: Mapping[str, Dict]) -> str:
+    """Render run summaries in the Prometheus text exposition format.
+
+    Args:
+        summaries: Run summaries by dataset (see RunMetrics.summary)
+
+    Returns:
+        Text for a node_exporter textfile collector
+    """
+    lines = []
+
+    def family(name: str, help_text: str, samples: Dict[str, float]) -> None:
+        lines.append(f"# HELP anbima_scraper_{name} {help_text}")
+        lines.append(f"# TYPE anbima_scraper_{name} gauge")
+        for dataset, value in samples.items():
+            lines.append(f'anbima_scraper_{name}{{dataset="{dataset}"}} {value}')
+
+    family("run_duration_seconds", "Duration of the last run", {
+        dataset: summary["duration_seconds"] for dataset, summary in summaries.items()
+    })
+    family("run_success", "Whether the last run succeeded", {
+        dataset: int(bool(summary["success"]))
+        for dataset, summary in summaries.items()
+    })
+    family("run_started_timestamp_seconds", "Start of the last run", {
+        dataset: datetime.fromisoformat(summary["started_at"]).timestamp()
+        for dataset, summary in summaries.items()
+    })
+
+    for stage, fields in STAGE_FIELDS.items():
+        for field in fields:
+            name = f"{stage}_{field}"
+            family(name, METRIC_HELP[name], {
+                dataset: summary[stage][field]
+                for dataset, summary in summaries.items()
+            })
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(summaries: Mapping[str, Dict],
+                              path: Union[str, Path]) -> None:
+    """Atomically write run summaries as a Prometheus textfile.
+
+    Args:
+        summaries: Run summaries by dataset (see RunMetrics.summary)
+        path: Output ``.prom`` file, usually in the collector's directory
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(format_prometheus(summaries))
+    os.replace(tmp_path, path)
@@ -0,0 +1,171 @@
+"""Opt-in CPU profiling and memory tracing of scraper runs."""
+
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from ..config.settings import PROFILE_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# Snapshots and counters of concurrent stage calls are not stage allocations
+_TRACER_FILES = frozenset({tracemalloc.__file__, __file__})
+
+
+def diagnostics_enabled() -> bool:
+    """Whether runs are being profiled or memory traced.
+
+    Both measure one scraper at a time only if nothing else runs meanwhile,
+    so schedulers run scrapers one by one and ``run_concurrently`` calls
+    items in the calling thread while this is true.
+    """
+    return bool(PROFILE_SETTINGS["profile_dir"]) or tracemalloc.is_tracing()
+
+
+@contextmanager
+def profile_run(name: str) -> Iterator[None]:
+    """Profile a scraper run with cProfile if PROFILE_SETTINGS asks for it.
+
+    The profile covers the calling thread, where ``run()`` executes;
+    downloads run there too while profiling (see ``diagnostics_enabled``).
+    A ``.pstats`` file (for ``pstats``/snakeviz) and a text report sorted
+    by cumulative time are written to PROFILE_SETTINGS["profile_dir"].
+
+    Args:
+        name: Scraper name, used in the output file names
+    """
+    profile_dir = PROFILE_SETTINGS["profile_dir"]
+    if not profile_dir:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Python 3.12+ allows a single active profiler per process
+        logger.warning(f"Not profiling {name}: {e}")
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _write_profile(profiler, Path(profile_dir), name)
+
+
+def _write_profile(profiler: cProfile.Profile, profile_dir: Path,
+                   name: str) -> None:
+    """Dump a profile and its text report."""
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{name}_{datetime.now():%Y%m%d-%H%M%S}"
+    stats_path = profile_dir / f"{stem}.pstats"
+    profiler.dump_stats(stats_path)
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(PROFILE_SETTINGS["top_functions"])
+    (profile_dir / f"{stem}.txt").write_text(report.getvalue(), encoding='utf-8')
+
+    logger.info(f"Profile of {name} written to {stats_path}")
+
+
+class MemoryTracer:
+    """Peak memory and top allocation sites of each stage of a run.
+
+    Stages are measured with tracemalloc, which must already be tracing
+    (see ``start_memory_tracing``). Each call snapshots the traced blocks
+    twice, so tracing should start after imports and scraper construction
+    to keep snapshots small. The peak of a stage is the highest
+    traced memory above the level at which one of its calls started; its
+    allocation sites are the source lines whose allocations grew the most
+    across its calls. tracemalloc is process-wide, which is why scrapers
+    run one at a time while tracing (see ``diagnostics_enabled``).
+    """
+
+    def __init__(self, dataset: str):
+        """Initialize empty per-stage results.
+
+        Args:
+            dataset: Dataset (scraper) name
+        """
+        self.dataset = dataset
+        self.peaks: Dict[str, int] = {}
+        self.sites: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Trace the allocations of one call of a stage.
+
+        Args:
+            stage: Stage name (download, parse, clean, write)
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        before = tracemalloc.take_snapshot()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1] - start
+            growth = tracemalloc.take_snapshot().compare_to(before, 'lineno')
+            with self._lock:
+                self.peaks[stage] = max(self.peaks.get(stage, 0), peak)
+                sites = self.sites.setdefault(stage, Counter())
+                for stat in growth:
+                    if (stat.size_diff > 0
+                            and stat.traceback[0].filename not in _TRACER_FILES):
+                        sites[str(stat.traceback)] += stat.size_diff
+
+    def summary(self) -> Dict[str, Dict]:
+        """Get the peak and top allocation sites of every traced stage.
+
+        Returns:
+            JSON-serializable results by stage
+        """
+        top = PROFILE_SETTINGS["top_allocations"]
+        with self._lock:
+            return {
+                stage: {
+                    "peak_bytes": peak,
+                    "top_sites": [
+                        {"site": site, "bytes": size}
+                        for site, size in self.sites[stage].most_common(top)
+                    ],
+                }
+                for stage, peak in self.peaks.items()
+            }
+
+
+def start_memory_tracing() -> None:
+    """Start tracemalloc with PROFILE_SETTINGS["trace_frames"] frames."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(PROFILE_SETTINGS["trace_frames"])
+
+
+def stop_memory_tracing() -> Optional[int]:
+    """Stop tracemalloc.
+
+    Returns:
+        Process-wide peak of traced memory in bytes, None if not tracing
+    """
+    if not tracemalloc.is_tracing():
+        return None
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
@@ -0,0 +1,159 @@
+"""Request planning for endpoints that accept DataIni/DataFim ranges."""
+
+import logging
+from datetime import date
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import pandas as pd
+
+from .calendar import ANBIMACalendar
+
+logger = logging.getLogger(__name__)
+
+
+class DateRange(NamedTuple):
+    """Consecutive business days fetched by a single request."""
+
+    start: date
+    end: date
+    dates: List[date]
+
+
+class RangeRequestPlanner:
+    """Coalesce missing business days into as few range requests as possible.
+
+    Consecutive business days are grouped into ranges of at most
+    ``max_business_days`` days. Each response is split back into one
+    partition per reference date, and a range that fails is retried one
+    date at a time so a single bad day does not lose the whole range.
+    """
+
+    def __init__(self, calendar: ANBIMACalendar, max_business_days: int = 1):
+        """Initialize the planner.
+
+        Args:
+            calendar: Business day calendar
+            max_business_days: Largest number of business days per request
+        """
+        if max_business_days < 1:
+            raise ValueError("max_business_days must be at least 1")
+        self.calendar = calendar
+        self.max_business_days = max_business_days
+
+    def plan(self, missing_dates: Iterable[date]) -> List[DateRange]:
+        """Coalesce missing dates into range requests.
+
+        Args:
+            missing_dates: Dates to fetch (non-business days are ignored)
+
+        Returns:
+            List of date ranges, in chronological order
+        """
+        dates = sorted(
+            {dt for dt in missing_dates if self.calendar.is_business_day(dt)}
+        )
+
+        ranges: List[DateRange] = []
+        current: List[date] = []
+
+        for dt in dates:
+            contiguous = (
+                current
+                and self.calendar.get_next_business_day(current[-1]) == dt
+            )
+            if current and (not contiguous
+                            or len(current) >= self.max_business_days):
+                ranges.append(DateRange(current[0], current[-1], current))
+                current = []
+            current.append(dt)
+
+        if current:
+            ranges.append(DateRange(current[0], current[-1], current))
+
+        logger.debug(
+            f"Planned {len(ranges)} requests for {len(dates)} business days"
+        )
+        return ranges
+
+    def execute(
+        self,
+        ranges: List[DateRange],
+        fetch: Callable[[date, date], Optional[pd.DataFrame]],
+        date_column: str = 'dt_referencia'
+    ) -> Dict[date, pd.DataFrame]:
+        """Fetch planned ranges and split the results per reference date.
+
+        Args:
+            ranges: Ranges returned by ``plan``
+            fetch: Callable downloading and parsing one range; returns None
+                (or raises) on failure
+            date_column: Date column used to partition the responses
+
+        Returns:
+            Dictionary mapping each date with data to its rows
+        """
+        partitions: Dict[date, pd.DataFrame] = {}
+
+        for date_range in ranges:
+            df = self._fetch_safe(fetch, date_range.start, date_range.end)
+
+            if df is None and len(date_range.dates) > 1:
+                logger.warning(
+                    f"Range {date_range.start} to {date_range.end} failed, "
+                    f"falling back to {len(date_range.dates)} daily requests"
+                )
+                for dt in date_range.dates:
+                    daily = self._fetch_safe(fetch, dt, dt)
+                    if daily is not None:
+                        partitions.update(
+                            self.split_by_date(daily, [dt], date_column)
+                        )
+                continue
+
+            if df is not None:
+                partitions.update(
+                    self.split_by_date(df, date_range.dates, date_column)
+                )
+
+        return partitions
+
+    @staticmethod
+    def split_by_date(
+        df: pd.DataFrame,
+        dates: List[date],
+        date_column: str = 'dt_referencia'
+    ) -> Dict[date, pd.DataFrame]:
+        """Split a range response into one partition per requested date.
+
+        Args:
+            df: Parsed response
+            dates: Dates requested in the range
+            date_column: Date column of the response
+
+        Returns:
+            Dictionary mapping each requested date with data to its rows
+        """
+        if df.empty or date_column not in df.columns:
+            return {}
+
+        reference_dates = pd.to_datetime(df[date_column]).dt.date
+        requested = set(dates)
+
+        return {
+            dt: group
+            for dt, group in df.groupby(reference_dates, sort=True)
+            if dt in requested
+        }
+
+    @staticmethod
+    def _fetch_safe(
+        fetch: Callable[[date, date], Optional[pd.DataFrame]],
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """Call ``fetch`` turning exceptions into None."""
+        try:
+            return fetch(start_date, end_date)
+        except Exception as e:
+            logger.error(f"Error fetching {start_date} to {end_date}: {e}")
+            return None
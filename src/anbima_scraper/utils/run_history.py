@@ -0,0 +1,254 @@
+"""Ledger of past scraper runs, for performance regression tracking."""
+
+import logging
+import sqlite3
+import statistics
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class RunRecord(NamedTuple):
+    """Outcome and cost of one scraper run."""
+
+    dataset: str
+    started_at: datetime
+    duration_seconds: float
+    success: bool
+    start_date: Optional[date]
+    end_date: Optional[date]
+    requests: int
+    bytes: int
+    rows: int
+    cache_hits: int
+    errors: int
+
+    @classmethod
+    def from_summary(cls, summary: Dict, start_date: Optional[date] = None,
+                     end_date: Optional[date] = None) -> "RunRecord":
+        """Build a record from a run summary (see RunMetrics.summary).
+
+        Args:
+            summary: Run summary
+            start_date: First reference date of the run
+            end_date: Last reference date of the run
+        """
+        http = summary["http"]
+        return cls(
+            dataset=summary["dataset"],
+            started_at=datetime.fromisoformat(summary["started_at"]),
+            duration_seconds=summary["duration_seconds"],
+            success=bool(summary["success"]),
+            start_date=start_date,
+            end_date=end_date,
+            requests=http["requests"],
+            bytes=http["bytes"],
+            rows=summary["write"]["rows"],
+            cache_hits=http["cache_hits"],
+            errors=http["errors"],
+        )
+
+    @property
+    def bytes_per_row(self) -> Optional[float]:
+        """Downloaded bytes per row ingested, None without rows."""
+        return self.bytes / self.rows if self.rows else None
+
+
+class RunTrend(NamedTuple):
+    """A run compared with the rolling baseline of the runs before it.
+
+    Attributes:
+        run: The run
+        baseline_duration: Median duration of the baseline runs
+        baseline_bytes_per_row: Median bytes per row of the baseline runs
+        flags: Measures deviating from the baseline ("duration",
+            "bytes_per_row")
+    """
+
+    run: RunRecord
+    baseline_duration: Optional[float]
+    baseline_bytes_per_row: Optional[float]
+    flags: Tuple[str, ...]
+
+
+class RunHistory:
+    """Append-only SQLite ledger with one row per scraper run."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dataset TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            duration_seconds REAL NOT NULL,
+            success INTEGER NOT NULL,
+            start_date TEXT,
+            end_date TEXT,
+            requests INTEGER NOT NULL,
+            bytes INTEGER NOT NULL,
+            rows INTEGER NOT NULL,
+            cache_hits INTEGER NOT NULL,
+            errors INTEGER NOT NULL
+        )
+    """
+    INDEX = """
+        CREATE INDEX IF NOT EXISTS runs_dataset_started
+        ON runs (dataset, started_at)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (and create if needed) the ledger.
+
+        Args:
+            path: SQLite database file, or ':memory:'
+        """
+        self.path = path
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(self.SCHEMA)
+            self._connection.execute(self.INDEX)
+
+    def record(self, run: RunRecord) -> None:
+        """Append a run to the ledger.
+
+        Args:
+            run: Run to record
+        """
+        row = (
+            run.dataset,
+            run.started_at.isoformat(timespec='seconds'),
+            run.duration_seconds,
+            int(run.success),
+            run.start_date.isoformat() if run.start_date else None,
+            run.end_date.isoformat() if run.end_date else None,
+            run.requests,
+            run.bytes,
+            run.rows,
+            run.cache_hits,
+            run.errors,
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO runs (dataset, started_at, duration_seconds, "
+                "success, start_date, end_date, requests, bytes, rows, "
+                "cache_hits, errors) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+
+    def datasets(self) -> List[str]:
+        """Get the datasets with recorded runs.
+
+        Returns:
+            Dataset names, sorted
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT dataset FROM runs ORDER BY dataset"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def runs(self, dataset: str, limit: Optional[int] = None) -> List[RunRecord]:
+        """Get the latest runs of a dataset, oldest first.
+
+        Args:
+            dataset: Dataset (scraper) name
+            limit: Number of latest runs (all if None)
+
+        Returns:
+            Runs in chronological order
+        """
+        query = (
+            "SELECT dataset, started_at, duration_seconds, success, "
+            "start_date, end_date, requests, bytes, rows, cache_hits, errors "
+            "FROM runs WHERE dataset = ? ORDER BY started_at DESC, id DESC"
+        )
+        params: list = [dataset]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+
+        return [
+            RunRecord(
+                dataset=row[0],
+                started_at=datetime.fromisoformat(row[1]),
+                duration_seconds=row[2],
+                success=bool(row[3]),
+                start_date=date.fromisoformat(row[4]) if row[4] else None,
+                end_date=date.fromisoformat(row[5]) if row[5] else None,
+                requests=row[6],
+                bytes=row[7],
+                rows=row[8],
+                cache_hits=row[9],
+                errors=row[10],
+            )
+            for row in reversed(rows)
+        ]
+
+    def trends(self, dataset: str, limit: int, window: int,
+               threshold: float) -> List[RunTrend]:
+        """Compare the latest runs of a dataset with their rolling baseline.
+
+        The baseline of a run is the median of the ``window`` successful
+        runs before it. A run is flagged when its duration exceeds
+        ``threshold`` times the baseline, or when its bytes per row drift
+        from the baseline by more than ``threshold`` in either direction
+        (a change in ANBIMA's file layout or in our parsing).
+
+        Args:
+            dataset: Dataset (scraper) name
+            limit: Number of latest runs to compare
+            window: Successful runs in the baseline
+            threshold: Accepted ratio to the baseline (e.g. 1.5)
+
+        Returns:
+            Latest runs with their baseline, oldest first
+        """
+        runs = self.runs(dataset, limit + window)
+        trends = []
+        for position in range(max(0, len(runs) - limit), len(runs)):
+            run = runs[position]
+            baseline = [r for r in runs[:position] if r.success][-window:]
+            trends.append(_compare_to_baseline(run, baseline, threshold))
+        return trends
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "RunHistory":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def _compare_to_baseline(run: RunRecord, baseline: List[RunRecord],
+                         threshold: float) -> RunTrend:
+    """Compare a run with the medians of its baseline runs."""
+    if not baseline:
+        return RunTrend(run, None, None, ())
+
+    flags = []
+    baseline_duration = statistics.median(r.duration_seconds for r in baseline)
+    if baseline_duration > 0 and run.duration_seconds > threshold * baseline_duration:
+        flags.append("duration")
+
+    ratios = [r.bytes_per_row for r in baseline if r.bytes_per_row is not None]
+    baseline_bytes_per_row = statistics.median(ratios) if ratios else None
+    if baseline_bytes_per_row and run.bytes_per_row is not None:
+        ratio = run.bytes_per_row / baseline_bytes_per_row
+        if ratio > threshold or ratio < 1 / threshold:
+            flags.append("bytes_per_row")
+
+    return RunTrend(run, baseline_duration, baseline_bytes_per_row, tuple(flags))
@@ -0,0 +1,97 @@
+"""Per-dataset request statistics accumulated across runs."""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+
+
+class RequestCost(NamedTuple):
+    """Average cost of one request to a dataset's endpoint."""
+
+    bytes_per_request: float
+    seconds_per_request: float
+    sample_requests: int
+
+
+class RunStats:
+    """Accumulate request counts, bytes and time per dataset in a JSON file.
+
+    Totals are only ever added to, so averages converge over runs and are
+    used to estimate the cost of planned runs without network access.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the statistics file.
+
+        Args:
+            path: JSON file holding the totals
+        """
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Dict[str, float]]:
+        """Read the totals of every dataset.
+
+        Returns:
+            Totals by dataset (empty if the file does not exist)
+        """
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                totals: Dict[str, Dict[str, float]] = json.load(f)
+            return totals
+        except Exception as e:
+            logger.warning(f"Error reading run statistics {self.path}: {e}")
+            return {}
+
+    def record(self, dataset: str, requests: int, size: int,
+               seconds: float) -> None:
+        """Add the requests of a run to the totals of a dataset.
+
+        Args:
+            dataset: Dataset (scraper) name
+            requests: Number of successful requests
+            size: Bytes downloaded
+            seconds: Time spent in requests
+        """
+        if requests <= 0:
+            return
+
+        with _lock:
+            totals = self.load()
+            current = totals.setdefault(
+                dataset, {"requests": 0, "bytes": 0, "seconds": 0.0}
+            )
+            current["requests"] += requests
+            current["bytes"] += size
+            current["seconds"] += seconds
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(totals, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def cost(self, dataset: str) -> Optional[RequestCost]:
+        """Get the average request cost of a dataset.
+
+        Args:
+            dataset: Dataset (scraper) name
+
+        Returns:
+            Average cost or None without history
+        """
+        totals = self.load().get(dataset)
+        if not totals or not totals.get("requests"):
+            return None
+        requests = int(totals["requests"])
+        return RequestCost(
+            totals["bytes"] / requests, totals["seconds"] / requests, requests
+        )
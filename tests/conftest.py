@@ -0,0 +1,13 @@
+"""Shared test configuration."""
+
+import pytest
+
+from anbima_scraper.config.settings import CHANGE_FEED_SETTINGS
+
+
+@pytest.fixture(autouse=True)
+def change_feed_directory(tmp_path, monkeypatch):
+    """Keep the change batches of test writes out of the data directory."""
+    directory = tmp_path / "changes"
+    monkeypatch.setitem(CHANGE_FEED_SETTINGS, "directory", directory)
+    return directory
@@ -0,0 +1,97 @@
+"""Tests for Arrow snapshots, the load API and Feather exports."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from anbima_scraper.config.settings import EXPORT_SETTINGS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+
+pa = pytest.importorskip("pyarrow")
+feather = pytest.importorskip("pyarrow.feather")
+
+
+def partition(day, codes, rate=10.0):
+    """Build the debentures rows of one day of May 2017."""
+    return pd.DataFrame({
+        "dt_referencia": [pd.Timestamp(2017, 5, day)] * len(codes),
+        "codigo": codes,
+        "taxa": [rate + position for position in range(len(codes))],
+    })
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """ANBIMA scraper with a small debentures base under tmp_path."""
+    monkeypatch.setitem(EXPORT_SETTINGS, "arrow_directory", tmp_path / "arrow")
+    scraper = ANBIMAScraper()
+    debentures = scraper.scrapers["debentures"]
+    debentures.store.directory = tmp_path / "debentures"
+    # Each partition then carries its own dictionary of codes
+    debentures.store.categorical_columns = ["codigo"]
+    for day, codes in ((15, ["AALM11", "BRFS13"]), (16, ["CCRO12"]),
+                       (17, ["AALM11", "DASA15"])):
+        assert debentures.append_data(partition(day, codes))
+    return scraper
+
+
+class TestLoad:
+    """Test class for ANBIMAScraper.load."""
+
+    def test_date_range_and_columns(self, scraper):
+        """Test ranges are sliced and columns projected from the snapshot."""
+        table = scraper.load("debentures", date(2017, 5, 16), date(2017, 5, 17),
+                             columns=["codigo", "taxa"])
+
+        assert table.column_names == ["codigo", "taxa"]
+        assert table.column("codigo").to_pylist() == ["CCRO12", "AALM11", "DASA15"]
+
+    def test_buffers_are_memory_mapped(self, scraper):
+        """Test loading allocates no Arrow memory for the rows."""
+        scraper.load("debentures")
+        allocated = pa.total_allocated_bytes()
+
+        table = scraper.load("debentures", date(2017, 5, 17))
+
+        assert table.num_rows == 2
+        assert pa.total_allocated_bytes() == allocated
+
+    def test_snapshot_follows_writes(self, scraper, tmp_path):
+        """Test the snapshot is reused until the base changes."""
+        scraper.load("debentures")
+        path = tmp_path / "arrow" / "debentures.arrow"
+        built = path.stat().st_mtime_ns
+
+        assert scraper.load("debentures").num_rows == 5
+        assert path.stat().st_mtime_ns == built
+
+        assert scraper.scrapers["debentures"].append_data(partition(18, ["EEEL11"]))
+        table = scraper.load("debentures", date(2017, 5, 18))
+        assert table.column("codigo").to_pylist() == ["EEEL11"]
+
+    def test_as_frame_is_arrow_backed(self, scraper):
+        """Test DataFrames keep the Arrow types."""
+        df = scraper.load("debentures", columns=["taxa"], as_frame=True)
+
+        assert isinstance(df["taxa"].dtype, pd.ArrowDtype)
+        assert len(df) == 5
+
+    def test_unknown_dataset(self, scraper):
+        """Test unknown datasets raise instead of returning nothing."""
+        with pytest.raises(KeyError):
+            scraper.load("inexistente")
+
+
+def test_feather_export(scraper, tmp_path):
+    """Test Feather exports turn per-partition categories into strings."""
+    path = tmp_path / "debentures.feather"
+
+    assert scraper.export("debentures", path, export_format="feather") == 5
+
+    table = feather.read_table(path)
+    assert table.schema.field("codigo").type == pa.string()
+    assert table.column("codigo").to_pylist() == [
+        "AALM11", "BRFS13", "CCRO12", "AALM11", "DASA15",
+    ]
+    assert table.schema.metadata[b"anbima_dataset"] == b"debentures"
@@ -0,0 +1,163 @@
+"""Tests for resumable historical backfills."""
+
+import pytest
+from datetime import date
+from unittest.mock import Mock
+
+import pandas as pd
+
+from anbima_scraper.config.settings import (
+    BACKFILL_SETTINGS,
+    FILE_PATHS,
+    REQUEST_SETTINGS,
+)
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.core.backfill import BackfillRunner
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.scrapers.indicators import IndicatorsScraper
+from anbima_scraper.testing.server import StandInServer
+from anbima_scraper.utils.backfill_state import BackfillState
+
+
+def store_range(scraper):
+    """Build a scrape stand-in storing one debenture per business day."""
+    def scrape(start, end):
+        dates = scraper.calendar.get_business_days_range(start, end)
+        return scraper.append_data(pd.DataFrame({
+            'dt_referencia': [pd.Timestamp(dt) for dt in dates],
+            'codigo': ["AALM11"] * len(dates),
+        }))
+    return scrape
+
+
+class TestBackfillState:
+    """Test class for BackfillState."""
+
+    def test_completed_dates_persist(self, tmp_path):
+        """Test completed units survive reopening the database."""
+        path = tmp_path / "state.sqlite3"
+        with BackfillState(path) as state:
+            state.mark_completed("debentures", [date(2017, 5, 15), date(2017, 5, 16)])
+            state.mark_completed("idka", [date(2017, 5, 15)])
+
+        with BackfillState(path) as state:
+            assert state.completed_dates("debentures") == {
+                date(2017, 5, 15), date(2017, 5, 16)
+            }
+            assert state.completed_dates(
+                "debentures", start_date=date(2017, 5, 16)
+            ) == {date(2017, 5, 16)}
+
+            state.reset("debentures")
+            assert state.completed_dates("debentures") == set()
+            assert state.completed_dates("idka") == {date(2017, 5, 15)}
+
+
+class TestBackfillRunner:
+    """Test class for BackfillRunner."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create a scraper whose scrape calls are recorded."""
+        scraper = DebenturesScraper()
+        scraper.store.directory = tmp_path / "debentures"
+        return scraper
+
+    def test_resumes_failed_chunks_only(self, scraper):
+        """Test a second run only scrapes what the first did not store."""
+        state = BackfillState(":memory:")
+        store = store_range(scraper)
+        # The chunk starting on 9 May reports success without storing rows
+        scraper.scrape = Mock(
+            side_effect=lambda start, end: (
+                start == date(2017, 5, 9) or store(start, end)
+            )
+        )
+        runner = BackfillRunner(scraper, state, chunk_business_days=5, max_workers=2)
+
+        report = runner.run(date(2017, 5, 1), date(2017, 5, 19))
+
+        # 1 May is a holiday: 14 business days in 3 chunks, one failing
+        assert report.total_dates == 14
+        assert report.completed == 9
+        assert report.failed == 5
+        assert not report.success
+        assert scraper.skip_stored_dates
+
+        scraper.scrape = Mock(side_effect=store)
+        report = runner.run(date(2017, 5, 1), date(2017, 5, 19))
+
+        scraper.scrape.assert_called_once_with(date(2017, 5, 9), date(2017, 5, 15))
+        assert report.already_completed == 9
+        assert report.completed == 5
+        assert report.success
+
+    def test_csv_chunks_append_in_order(self, tmp_path):
+        """Test chunks of a CSV base never rewrite or re-read the base."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+        scraper.append_data(pd.DataFrame({
+            'dt_referencia': [pd.Timestamp(2017, 4, 28)], 'no_indice': ["IRF-M"],
+        }))
+
+        def scrape(start, end):
+            dates = scraper.calendar.get_business_days_range(start, end)
+            return scraper.append_data(pd.DataFrame({
+                'dt_referencia': [pd.Timestamp(dt) for dt in dates],
+                'no_indice': ["IRF-M"] * len(dates),
+            }))
+
+        scraper.scrape = Mock(side_effect=scrape)
+        scraper.data_processor.read_csv_safe = Mock(
+            side_effect=AssertionError("base re-read")
+        )
+        runner = BackfillRunner(
+            scraper, BackfillState(":memory:"), chunk_business_days=5, max_workers=4
+        )
+
+        report = runner.run(date(2017, 5, 1), date(2017, 5, 19))
+
+        assert runner.max_workers == 1
+        assert report.completed == 14
+        assert [c.args[0] for c in scraper.scrape.call_args_list] == [
+            date(2017, 5, 2), date(2017, 5, 9), date(2017, 5, 16)
+        ]
+        base = pd.read_csv(scraper.output_file, sep=';')
+        assert len(base) == 15
+        assert list(base['dt_referencia']) == sorted(base['dt_referencia'])
+
+    def test_rejects_scrapers_without_history(self):
+        """Test scrapers of current-only pages cannot be backfilled."""
+        with pytest.raises(ValueError):
+            BackfillRunner(IndicatorsScraper(), BackfillState(":memory:"))
+
+
+def test_outage_leaves_dates_pending(tmp_path, monkeypatch):
+    """Test dates a failing server never served are retried on resume."""
+    monkeypatch.setitem(FILE_PATHS, "debentures", tmp_path / "debentures")
+    monkeypatch.setitem(BACKFILL_SETTINGS, "state_file", tmp_path / "state.sqlite3")
+    monkeypatch.setitem(REQUEST_SETTINGS, "retry_delay", 0)
+    scraper = ANBIMAScraper()
+    shared = scraper.scrapers["debentures"]
+
+    with StandInServer(today=date(2017, 5, 19), error_rate=1.0) as server:
+        monkeypatch.setitem(REQUEST_SETTINGS, "base_url", server.base_url)
+        client = shared.http_client
+        report = scraper.backfill("debentures", date(2017, 5, 15), date(2017, 5, 19))
+
+    assert report.completed == 0
+    assert report.failed == 5
+    assert shared.store.dates() == []
+    # The backfill ran on its own instance
+    assert shared.http_client is client
+    assert shared.skip_stored_dates
+
+    with StandInServer(today=date(2017, 5, 19)) as server:
+        monkeypatch.setitem(REQUEST_SETTINGS, "base_url", server.base_url)
+        report = scraper.backfill("debentures", date(2017, 5, 15), date(2017, 5, 19))
+        assert server.status_counts[200] == 5
+
+    assert report.already_completed == 0
+    assert report.completed == 5
+    assert len(shared.store.dates()) == 5
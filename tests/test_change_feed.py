@@ -0,0 +1,174 @@
+"""Tests for the change-data feed."""
+
+import json
+import os
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from anbima_scraper.cli import _show_changes
+from anbima_scraper.config.settings import CHANGE_FEED_SETTINGS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.utils.change_feed import ChangeFeed, ChangesExpiredError
+
+
+def quadro_resumo(rows):
+    """Build cleaned quadro resumo rows of (index name, reference date)."""
+    return pd.DataFrame({
+        'dt_referencia': [pd.Timestamp(dt) for _, dt in rows],
+        'no_indice': [name for name, _ in rows],
+        'nu_indice': [1000.5] * len(rows),
+    })
+
+
+class TestChangeFeed:
+    """Test class for ChangeFeed."""
+
+    @pytest.mark.parametrize("batch_format", ["jsonl", "parquet"])
+    def test_round_trip(self, tmp_path, batch_format):
+        """Test batches come back typed, in order, after a sequence."""
+        if batch_format == "parquet":
+            pytest.importorskip("pyarrow")
+        feed = ChangeFeed(tmp_path / "idka", batch_format)
+        assert feed.last_sequence() == 0
+
+        assert feed.append(quadro_resumo([("IRF-M", "2017-05-16")])) == 1
+        assert feed.append(quadro_resumo([("IMA-B", "2017-05-17")])) == 2
+
+        batch, = feed.changes(since=1)
+        assert batch.sequence == 2
+        assert batch.rows.loc[0, 'no_indice'] == "IMA-B"
+        assert batch.rows.loc[0, 'dt_referencia'] == pd.Timestamp(2017, 5, 17)
+        assert batch.rows.loc[0, 'nu_indice'] == 1000.5
+        assert [b.sequence for b in feed.changes()] == [1, 2]
+        assert list(feed.changes(since=2)) == []
+
+    def test_retention(self, tmp_path):
+        """Test pruning keeps sequence numbers and reports expired reads."""
+        feed = ChangeFeed(tmp_path / "idka")
+        for day in (15, 16, 17):
+            feed.append(quadro_resumo([("IRF-M", f"2017-05-{day}")]))
+        first = tmp_path / "idka" / "000000000001.jsonl"
+        old = time.time() - 10 * 86400
+        os.utime(first, (old, old))
+
+        assert feed.prune(max_age_days=5) == 1
+        assert feed.prune(max_batches=1) == 1
+
+        assert [b.sequence for b in feed.changes(since=2)] == [3]
+        with pytest.raises(ChangesExpiredError):
+            list(feed.changes(since=1))
+
+        # Numbers are never reused after every batch is gone
+        feed.prune(max_batches=0)
+        assert feed.append(quadro_resumo([("IRF-M", "2017-05-18")])) == 4
+
+    def test_unpublished_batch_is_not_overwritten(self, tmp_path, monkeypatch):
+        """Test a crash before publishing a batch does not reuse its number."""
+        feed = ChangeFeed(tmp_path / "idka")
+        feed.append(quadro_resumo([("IRF-M", "2017-05-16")]))
+
+        def crash(sequence):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(feed, "_publish", crash)
+            with pytest.raises(OSError):
+                feed.append(quadro_resumo([("IMA-B", "2017-05-17")]))
+
+        # Not served before it is published
+        assert [b.sequence for b in feed.changes()] == [1]
+        assert feed.append(quadro_resumo([("IRF-M", "2017-05-18")])) == 3
+        batch, = feed.changes(since=2)
+        assert batch.rows.loc[0, 'dt_referencia'] == pd.Timestamp(2017, 5, 18)
+        assert [b.sequence for b in feed.changes(since=1)] == [2, 3]
+
+    def test_lost_sequence_expires_reads(self, tmp_path):
+        """Test reads across a sequence without a batch are expired."""
+        feed = ChangeFeed(tmp_path / "idka")
+        feed.append(quadro_resumo([("IRF-M", "2017-05-16")]))
+
+        assert feed.mark_lost() == 2
+        assert feed.append(quadro_resumo([("IRF-M", "2017-05-17")])) == 3
+
+        with pytest.raises(ChangesExpiredError):
+            list(feed.changes(since=1))
+        assert [b.sequence for b in feed.changes(since=2)] == [3]
+
+
+class TestScraperChanges:
+    """Test class for changes recorded by scraper writes."""
+
+    def test_append_data_records_batches(self, tmp_path):
+        """Test each write adds one batch with the rows it wrote."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+
+        assert scraper.append_data(quadro_resumo([
+            ("IRF-M", "2017-05-16"), ("IMA-B", "2017-05-16"),
+        ]))
+        assert scraper.append_data(quadro_resumo([("IRF-M", "2017-05-17")]))
+
+        batches = list(scraper.change_feed.changes())
+        assert [len(batch.rows) for batch in batches] == [2, 1]
+        assert batches[1].rows.loc[0, 'dt_referencia'] == pd.Timestamp(2017, 5, 17)
+
+    def test_retention_applies_on_write(self, tmp_path, monkeypatch):
+        """Test writes prune batches beyond the configured retention."""
+        monkeypatch.setitem(CHANGE_FEED_SETTINGS, "retention_batches", 1)
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+
+        for day in (15, 16):
+            assert scraper.append_data(quadro_resumo([("IRF-M", f"2017-05-{day}")]))
+
+        assert [b.sequence for b in scraper.change_feed.changes(since=1)] == [2]
+
+    def test_failed_record_expires_reads(self, tmp_path, monkeypatch):
+        """Test rows stored without a batch are not silently skipped."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+        assert scraper.append_data(quadro_resumo([("IRF-M", "2017-05-16")]))
+
+        def fail(feed, df):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ChangeFeed, "append", fail)
+            assert scraper.append_data(quadro_resumo([("IRF-M", "2017-05-17")]))
+
+        feed = scraper.change_feed
+        assert feed.last_sequence() == 2
+        with pytest.raises(ChangesExpiredError):
+            list(feed.changes(since=1))
+
+    def test_disabled_feed(self, tmp_path, monkeypatch, change_feed_directory):
+        """Test no batch is written when the feed is disabled."""
+        monkeypatch.setitem(CHANGE_FEED_SETTINGS, "enabled", False)
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+
+        assert scraper.append_data(quadro_resumo([("IRF-M", "2017-05-16")]))
+
+        assert not change_feed_directory.exists()
+
+
+def test_changes_command(tmp_path, capsys):
+    """Test the changes command prints rows after a sequence as JSONL."""
+    scraper = ANBIMAScraper()
+    ima = scraper.scrapers["ima_quadro_resumo"]
+    ima.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+    for day in (16, 17):
+        assert ima.append_data(quadro_resumo([("IRF-M", f"2017-05-{day}")]))
+
+    assert _show_changes(scraper, "ima_quadro_resumo", 1, False) == 0
+
+    row, = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert row["_sequence"] == 2
+    assert row["dt_referencia"].startswith(date(2017, 5, 17).isoformat())
+
+    assert _show_changes(scraper, "ima_quadro_resumo", 0, True) == 0
+    assert capsys.readouterr().out.strip() == "2"
@@ -0,0 +1,101 @@
+"""Tests for yield-curve interpolation."""
+
+import pytest
+from datetime import date
+
+import numpy as np
+
+from anbima_scraper.analytics.curves import (
+    CurveInterpolator,
+    discount_factors,
+    flat_forward_252,
+    svensson,
+)
+from anbima_scraper.utils.curve_store import ClosingCurves
+
+VERTICES = np.array([252, 504, 756])
+RATES = np.array([
+    [10.0, 11.0, 11.5],
+    [9.0, np.nan, 10.0],
+])
+
+
+class TestFlatForward:
+    """Test class for flat-forward interpolation."""
+
+    def test_matches_vertices(self):
+        """Test rates on vertices are returned unchanged."""
+        result = flat_forward_252(VERTICES, RATES[:1], VERTICES)
+        np.testing.assert_allclose(result, RATES[:1])
+
+    def test_forward_is_flat_between_vertices(self):
+        """Test discount factors are log-linear between vertices."""
+        result = flat_forward_252(VERTICES, RATES[:1], np.array([378]))
+        df = discount_factors(result, 378)
+        expected = np.sqrt(
+            discount_factors(10.0, 252) * discount_factors(11.0, 504)
+        )
+        np.testing.assert_allclose(df, [[expected]])
+
+    def test_scalar_maturity(self):
+        """Test a single maturity may be given as a scalar."""
+        result = flat_forward_252(VERTICES, RATES, 504)
+        np.testing.assert_allclose(result[:1], [[11.0]])
+        assert result.shape == (2, 1)
+
+    def test_flat_before_first_vertex_and_missing_vertex(self):
+        """Test short maturities and NaN vertices are handled per date."""
+        result = flat_forward_252(VERTICES, RATES, np.array([0, 21, 504]))
+        np.testing.assert_allclose(result[:, :2], [[10.0, 10.0], [9.0, 9.0]])
+        assert 9.0 < result[1, 2] < 10.0
+
+
+class TestSvensson:
+    """Test class for Svensson evaluation."""
+
+    def test_long_end_tends_to_beta1(self):
+        """Test the curve tends to beta1 + beta2 at 0 and to beta1 at the long end."""
+        params = np.array([[0.11, -0.02, 0.04, -0.03, 1.8, 0.6]])
+        result = svensson(params, np.array([0, 252 * 500]))
+        assert result[0, 1] == pytest.approx(11.0, abs=0.01)
+        assert result[0, 0] == pytest.approx(9.0, abs=0.01)
+
+
+class TestCurveInterpolator:
+    """Test class for CurveInterpolator."""
+
+    @pytest.fixture
+    def interpolator(self):
+        """Create an interpolator over two stored dates."""
+        rates = np.stack([RATES, RATES, RATES], axis=1)
+        parameters = np.tile([0.11, -0.02, 0.04, -0.03, 1.8, 0.6], (2, 2, 1))
+        curves = ClosingCurves(
+            dates=np.array(['2017-05-16', '2017-05-17'], dtype='datetime64[D]'),
+            vertices=VERTICES,
+            rates=rates,
+            parameters=parameters,
+        )
+        return CurveInterpolator(curves)
+
+    def test_rates_for_dates(self, interpolator):
+        """Test cash flow dates are converted to business days."""
+        result = interpolator.rates_for_dates(
+            [date(2017, 5, 16)], [date(2018, 5, 17)]
+        )
+        du = interpolator.calendar.count_business_days(
+            date(2017, 5, 16), date(2018, 5, 17)
+        )
+        expected = flat_forward_252(VERTICES, RATES[:1], np.array([du]))
+        np.testing.assert_allclose(result, expected)
+
+    def test_svensson_method(self, interpolator):
+        """Test Svensson rates use the stored parameters."""
+        result = interpolator.rates(
+            [date(2017, 5, 17)], np.array([252]), method='svensson'
+        )
+        assert result.shape == (1, 1)
+
+    def test_unknown_date(self, interpolator):
+        """Test dates without a stored curve are rejected."""
+        with pytest.raises(KeyError):
+            interpolator.rates([date(2017, 5, 18)], np.array([252]))
@@ -0,0 +1,161 @@
+"""Tests for curves scrapers."""
+
+import pytest
+from datetime import date
+
+import numpy as np
+
+from anbima_scraper.scrapers.curves import CurvaJurosFechamentoScraper
+from anbima_scraper.utils.curve_store import CURVE_SERIES, CurveStore, merge_curves
+
+
+def make_curve_file(shift=0.0):
+    """Build a raw CZ-down.asp payload as served by ANBIMA."""
+    lines = [
+        ";Beta 1;Beta 2;Beta 3;Beta 4;Lambda 1;Lambda 2",
+        "PREFIXADOS;0,1132;-0,0184;0,0417;-0,0296;1,8571;0,6431",
+        "IPCA;0,0601;-0,0021;0,0382;-0,0134;2,4413;0,4512",
+        "",
+        "ETTJ Inflação Implicita (IPCA)",
+        "Vertices;ETTJ IPCA;ETTJ PREF;Inflação Implícita",
+    ]
+    for vertex, ipca, pref in [("252", 5.5, 10.1), ("504", 5.3, 10.4),
+                               ("1.008", 5.2, 10.9)]:
+        ipca_str = f"{ipca + shift:.4f}".replace(".", ",")
+        pref_str = f"{pref + shift:.4f}".replace(".", ",")
+        lines.append(f"{vertex};{ipca_str};{pref_str};4,5")
+    lines += ["", "PREFIXADOS (CIRCULAR 3.361);1;2;3;4;5;6"]
+    return "\n".join(lines).encode("latin1")
+
+
+class TestCurvaJurosFechamentoScraper:
+    """Test class for CurvaJurosFechamentoScraper."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create scraper instance writing to a temporary store."""
+        scraper = CurvaJurosFechamentoScraper()
+        scraper.curve_store.directory = tmp_path / "curva_juros_fechamento"
+        return scraper
+
+    def test_process_curve_data(self, scraper):
+        """Test parameters and vertex table are parsed."""
+        curves = scraper._process_curve_data(make_curve_file(), date(2017, 5, 16))
+
+        assert list(curves.vertices) == [252, 504, 1008]
+        assert curves.rates.shape == (1, 3, 3)
+        assert curves.series('ettj_pref')[0, 0] == pytest.approx(10.1)
+        assert curves.series('inflacao_implicita')[0, 2] == pytest.approx(4.5)
+        assert curves.svensson('prefixados')[0, 0] == pytest.approx(0.1132)
+        assert curves.svensson('ipca')[0, 5] == pytest.approx(0.4512)
+
+    def test_process_curve_data_no_data(self, scraper):
+        """Test missing-day pages are rejected."""
+        content = "Não há dados disponíveis".encode("latin1")
+        assert scraper._process_curve_data(content, date(2017, 5, 16)) is None
+
+    def test_store_round_trip(self, scraper):
+        """Test curves are appended and reloaded memory-mapped."""
+        first = scraper._process_curve_data(make_curve_file(), date(2017, 5, 17))
+        second = scraper._process_curve_data(make_curve_file(1.0), date(2017, 5, 16))
+
+        assert scraper.curve_store.append(first)
+        assert scraper.curve_store.append(second)
+
+        curves = scraper.load_curves()
+        assert isinstance(curves.rates, np.memmap)
+        assert list(curves.dates.astype(object)) == [
+            date(2017, 5, 16), date(2017, 5, 17)
+        ]
+        row = curves.date_index(date(2017, 5, 16))
+        assert curves.series('ettj_ipca')[row, 0] == pytest.approx(6.5)
+        assert scraper.get_last_available_date() == date(2017, 5, 17)
+
+
+class TestCurveStore:
+    """Test class for CurveStore."""
+
+    @pytest.fixture
+    def curves(self):
+        """Curves of two dates parsed from the raw payload."""
+        scraper = CurvaJurosFechamentoScraper()
+        return [
+            scraper._process_curve_data(make_curve_file(day - 16), date(2017, 5, day))
+            for day in (16, 17)
+        ]
+
+    def test_failed_write_keeps_current_generation(self, tmp_path, curves,
+                                                   monkeypatch):
+        """Test a write failing midway leaves the stored curves readable."""
+        store = CurveStore(tmp_path / "curvas")
+        assert store.append(curves[0])
+
+        save = np.save
+
+        def fail_on_rates(f, array):
+            if array.ndim == 3 and array.shape[1] == len(CURVE_SERIES):
+                raise OSError("disk full")
+            save(f, array)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(np, "save", fail_on_rates)
+            assert not store.append(curves[1])
+
+        stored = store.load()
+        assert list(stored.dates.astype(object)) == [date(2017, 5, 16)]
+        assert stored.rates.shape == (1, 3, 3)
+
+        assert store.append(curves[1])
+        assert store.get_last_date() == date(2017, 5, 17)
+
+    def test_old_generations_removed(self, tmp_path, curves):
+        """Test only the current and previous generations are kept."""
+        store = CurveStore(tmp_path / "curvas")
+        for _ in range(3):
+            for day_curves in curves:
+                assert store.append(day_curves)
+
+        generations = sorted(
+            path.name for path in store.directory.iterdir() if path.is_dir()
+        )
+        assert generations == [f"{n:012d}" for n in (5, 6)]
+        assert len(store.load().dates) == 2
+
+    def test_inconsistent_arrays_rejected(self, tmp_path, curves):
+        """Test arrays of mismatched lengths are not loaded or merged."""
+        store = CurveStore(tmp_path / "curvas")
+        assert store.append(merge_curves(*curves))
+        generation = store._current(store._manifest())
+        np.save(generation / "dates.npy",
+                np.array(["2017-05-16"], dtype="datetime64[D]"))
+
+        with pytest.raises(ValueError):
+            store.load()
+        assert not store.append(curves[0])
+
+    def test_reads_arrays_written_before_generations(self, tmp_path, curves):
+        """Test stores of flat .npy files are read and then migrated."""
+        store = CurveStore(tmp_path / "curvas")
+        store.directory.mkdir()
+        for field, filename in CurveStore.FILES.items():
+            np.save(store.directory / filename, getattr(curves[0], field))
+
+        assert store.get_last_date() == date(2017, 5, 16)
+        assert store.append(curves[1])
+        assert store.append(curves[1])
+
+        assert len(store.load().dates) == 2
+        assert not (store.directory / "dates.npy").exists()
+
+    def test_load_reads_the_manifest_once(self, tmp_path, curves, monkeypatch):
+        """Test a swap during load cannot pair two generations."""
+        store = CurveStore(tmp_path / "curvas")
+        assert store.append(curves[0])
+        assert store.append(merge_curves(*curves))
+
+        # Later reads see the previous, single-date generation
+        manifests = [store._manifest(), store._manifest()]
+        manifests[1] = dict(manifests[0], generation=f"{1:012d}", dates=1)
+        monkeypatch.setattr(store, "_manifest", lambda: manifests.pop(0))
+
+        assert len(store.load().dates) == 2
@@ -0,0 +1,113 @@
+"""Tests for the publication-aware daemon."""
+
+import pytest
+from datetime import date, datetime, timedelta
+
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.core.daemon import ScraperDaemon
+from anbima_scraper.core.registry import ScraperRegistry
+from anbima_scraper.utils.calendar import get_calendar
+
+
+class FakeScraper:
+    """Scraper storing every date it is asked for, once published."""
+
+    def __init__(self, last_date, published_until):
+        self.calendar = get_calendar()
+        self.last_date = last_date
+        self.published_until = published_until
+        self.calls = []
+
+    def get_last_available_date(self):
+        return self.last_date
+
+    def run(self, force_update=False, end_date=None):
+        dates = [
+            dt for dt in self.calendar.get_date_range_for_download(self.last_date)
+            if dt <= end_date
+        ]
+        self.calls.append((dates[0], dates[-1]))
+        self.last_date = min(dates[-1], self.published_until)
+        return True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake():
+    """Scraper with data up to Monday 2017-05-15."""
+    return FakeScraper(date(2017, 5, 15), published_until=date(2017, 5, 15))
+
+
+@pytest.fixture
+def daemon(fake):
+    """Daemon over the fake scraper (default 18:00-21:00 window)."""
+    registry = ScraperRegistry({"fake": lambda: fake}, discover=False)
+    daemon = ScraperDaemon(ANBIMAScraper(registry))
+    daemon.warm_up()
+    return daemon
+
+
+class TestScraperDaemon:
+    """Test class for ScraperDaemon."""
+
+    def test_up_to_date_sleeps_until_window(self, daemon):
+        """Test an up-to-date dataset wakes shortly before the next window."""
+        state = daemon.states["fake"]
+        next_poll = daemon.schedule(state, datetime(2017, 5, 16, 10, 0))
+        assert next_poll == datetime(2017, 5, 16, 17, 55)
+
+    def test_lead_polls_wake_in_the_future(self, daemon, fake):
+        """Test polls before the window expect today's data and do not spin."""
+        state = daemon.states["fake"]
+        now = datetime(2017, 5, 16, 17, 56)
+
+        assert daemon.schedule(state, now) == now + timedelta(seconds=30)
+        assert not daemon.poll(state, now)
+        assert fake.calls == [(date(2017, 5, 16), date(2017, 5, 16))]
+
+        daemon.clock = lambda: now
+        assert daemon.run_once() > now
+
+    def test_polls_often_inside_window(self, daemon):
+        """Test a due dataset is polled every few seconds in its window."""
+        state = daemon.states["fake"]
+        now = datetime(2017, 5, 16, 18, 10)
+        assert daemon.schedule(state, now) == now + timedelta(seconds=30)
+
+    def test_backs_off_after_window(self, daemon):
+        """Test polls back off exponentially once the window has closed."""
+        state = daemon.states["fake"]
+        state.late_polls = 2
+        now = datetime(2017, 5, 16, 21, 30)
+        assert daemon.schedule(state, now) == now + timedelta(seconds=1200)
+
+    def test_poll_fetches_only_published_dates(self, daemon, fake):
+        """Test polls request up to the expected date and track new data."""
+        state = daemon.states["fake"]
+
+        assert not daemon.poll(state, datetime(2017, 5, 16, 21, 30))
+        assert fake.calls == [(date(2017, 5, 16), date(2017, 5, 16))]
+        assert state.late_polls == 1
+
+        fake.published_until = date(2017, 5, 16)
+        assert daemon.poll(state, datetime(2017, 5, 16, 21, 45))
+        assert state.last_date == date(2017, 5, 16)
+        assert state.late_polls == 0
+
+    def test_run_once_reschedules_due_datasets(self, daemon, fake):
+        """Test run_once polls due datasets and returns the next wake time."""
+        fake.published_until = date(2017, 5, 16)
+        daemon.clock = lambda: datetime(2017, 5, 16, 18, 5)
+
+        wake = daemon.run_once()
+
+        assert fake.calls == [(date(2017, 5, 16), date(2017, 5, 16))]
+        assert wake == datetime(2017, 5, 17, 17, 55)
+
+    def test_unknown_dataset(self):
+        """Test unknown datasets are rejected."""
+        registry = ScraperRegistry({}, discover=False)
+        with pytest.raises(ValueError):
+            ScraperDaemon(ANBIMAScraper(registry), ["unknown"])
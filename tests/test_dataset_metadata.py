@@ -0,0 +1,161 @@
+"""Tests for per-dataset metadata and the status built from it."""
+
+import json
+from datetime import date, datetime
+
+import pandas as pd
+
+from anbima_scraper.cli import _show_status
+from anbima_scraper.config.settings import RUN_HISTORY_SETTINGS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.testing.fixtures import SyntheticANBIMA
+from anbima_scraper.testing.server import StandInServer
+from anbima_scraper.utils.calendar import get_calendar
+from anbima_scraper.utils.dataset_metadata import DatasetMetadata, DatasetStatus
+from anbima_scraper.utils.http_client import ANBIMAHTTPClient
+from anbima_scraper.utils.run_history import RunHistory, RunRecord
+
+
+def quadro_resumo(rows):
+    """Build cleaned quadro resumo rows of (index name, reference date)."""
+    return pd.DataFrame({
+        'dt_referencia': [pd.Timestamp(dt) for _, dt in rows],
+        'no_indice': [name for name, _ in rows],
+        'nu_indice': [1000.0] * len(rows),
+    })
+
+
+class TestDatasetMetadata:
+    """Test class for DatasetMetadata."""
+
+    def test_update_keeps_other_dates(self, tmp_path):
+        """Test updates overwrite the dates they carry and keep the rest."""
+        metadata = DatasetMetadata(tmp_path / "base.meta.json")
+        assert metadata.load() is None
+
+        metadata.replace({date(2017, 5, 15): 3, date(2017, 5, 16): 2})
+        metadata.update({date(2017, 5, 16): 4, date(2017, 5, 17): 1})
+
+        assert metadata.load() == {
+            date(2017, 5, 15): 3, date(2017, 5, 16): 4, date(2017, 5, 17): 1,
+        }
+
+    def test_unreadable_file_loads_as_missing(self, tmp_path):
+        """Test a corrupt file is treated as missing, to be rebuilt."""
+        path = tmp_path / "base.meta.json"
+        path.write_text("{", encoding="utf-8")
+        assert DatasetMetadata(path).load() is None
+
+
+class TestDatasetStatus:
+    """Test class for DatasetStatus."""
+
+    def test_gaps_and_lag(self):
+        """Test missing business days are counted inside and after the range."""
+        counts = {
+            date(2017, 5, 15): 10,  # Monday
+            date(2017, 5, 17): 10,
+            date(2017, 5, 18): 5,
+        }
+        run = RunRecord("idka", datetime(2017, 5, 23, 19), 12.5, True,
+                        None, None, 1, 100, 5, 0, 0)
+
+        status = DatasetStatus.build(
+            "idka", counts, get_calendar(), date(2017, 5, 24), run
+        )
+
+        assert (status.first_date, status.last_date) == (
+            date(2017, 5, 15), date(2017, 5, 18)
+        )
+        assert (status.rows, status.dates) == (25, 3)
+        assert status.gaps == 1
+        # 19, 22 and 23 are published but not stored
+        assert status.lag_business_days == 3
+        assert status.last_run_seconds == 12.5
+        assert status.to_dict()["last_run_at"] == "2017-05-23T19:00:00"
+
+    def test_empty_dataset(self):
+        """Test a dataset without rows has no dates and no lag."""
+        status = DatasetStatus.build("idka", {}, get_calendar(), date(2017, 5, 24))
+        assert status.last_date is None
+        assert status.lag_business_days is None
+        assert status.rows == 0
+
+
+class TestScraperMetadata:
+    """Test class for metadata maintained by scraper writes."""
+
+    def test_csv_append_recounts_merged_dates(self, tmp_path):
+        """Test appends to a CSV base keep the metadata equal to the base."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+
+        assert scraper.append_data(quadro_resumo([
+            ("IRF-M", "2017-05-16"), ("IRF-M", "2017-05-17"),
+        ]))
+        assert scraper.metadata.path == tmp_path / "ima_quadro_resumo_base.meta.json"
+        # Merging into a stored date counts its old rows too
+        assert scraper.append_data(quadro_resumo([
+            ("IRF-M 1", "2017-05-16"), ("IRF-M", "2017-05-18"),
+        ]))
+
+        expected = {date(2017, 5, 16): 2, date(2017, 5, 17): 1, date(2017, 5, 18): 1}
+        assert scraper.metadata.load() == expected
+        assert scraper.count_stored_rows() == expected
+
+    def test_status_builds_missing_metadata(self, tmp_path):
+        """Test bases written before the metadata are counted once."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+        assert scraper.append_data(quadro_resumo([("IRF-M", "2017-05-16")]))
+        scraper.metadata.path.unlink()
+
+        status = scraper.get_status(today=date(2017, 5, 18))
+
+        assert status.rows == 1
+        assert status.lag_business_days == 1
+        assert scraper.metadata.load() == {date(2017, 5, 16): 1}
+
+    def test_columnar_store_metadata(self, tmp_path):
+        """Test scrapes into a columnar store count rows per partition."""
+        generator = SyntheticANBIMA(debentures=20)
+        with StandInServer(generator, today=date(2017, 5, 19)) as server:
+            scraper = DebenturesScraper()
+            scraper.store.directory = tmp_path / "debentures"
+            scraper.http_client = ANBIMAHTTPClient(base_url=server.base_url)
+
+            assert scraper.scrape(date(2017, 5, 15), date(2017, 5, 16))
+
+        assert scraper.metadata.path == tmp_path / "debentures" / "metadata.json"
+        assert scraper.metadata.load() == {
+            date(2017, 5, 15): 20, date(2017, 5, 16): 20,
+        }
+        assert scraper.store.count_rows([date(2017, 5, 16), date(2017, 5, 17)]) == {
+            date(2017, 5, 16): 20,
+        }
+
+
+def test_status_json(tmp_path, monkeypatch, capsys):
+    """Test status --json reports metadata and the last recorded run."""
+    path = tmp_path / "history.sqlite3"
+    monkeypatch.setitem(RUN_HISTORY_SETTINGS, "path", path)
+    with RunHistory(path) as history:
+        history.record(RunRecord("ima_quadro_resumo", datetime(2017, 5, 17, 19),
+                                 3.5, True, None, None, 1, 100, 1, 0, 0))
+
+    scraper = ANBIMAScraper()
+    ima = scraper.scrapers["ima_quadro_resumo"]
+    ima.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+    assert ima.append_data(quadro_resumo([("IRF-M", "2017-05-16")]))
+    monkeypatch.setattr(scraper, "get_available_scrapers",
+                        lambda: ["ima_quadro_resumo"])
+
+    assert _show_status(scraper, as_json=True) == 0
+
+    status = json.loads(capsys.readouterr().out)["ima_quadro_resumo"]
+    assert status["last_date"] == "2017-05-16"
+    assert status["rows"] == 1
+    assert status["last_run_seconds"] == 3.5
+    assert status["last_run_success"] is True
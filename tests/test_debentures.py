@@ -0,0 +1,66 @@
+"""Tests for debentures scraper."""
+
+import pytest
+from datetime import date
+
+import pandas as pd
+
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+
+
+def make_db_file():
+    """Build a raw db{yymmdd}.txt payload as served by ANBIMA."""
+    lines = [
+        "ANBIMA - Associação Brasileira das Entidades dos Mercados Financeiro "
+        "e de Capitais",
+        "Mercado Secundário de Debêntures",
+        "16/05/2017",
+        "Código@Nome@Repac./  Venc.@Índice/ Correção@Taxa de Compra@Taxa de Venda@"
+        "Taxa Indicativa@Desvio Padrão@Intervalo Indicativo Minimo@"
+        "Intervalo Indicativo Máximo@PU@% PU Par@Duration@% Reune@Referência NTN-B",
+        "DI SPREAD",
+        "AALM12@ALMEIDA JUNIOR SHOPPING@15/06/2020@DI + 1,6000%@1,7500@1,4500@"
+        "1,6100@0,0450@1,2000@2,0000@1.012,345678@100,12@512@--@--",
+        "IPCA SPREAD",
+        "ABCB11@BANCO ABC@01/12/2025@IPCA + 6,2000%@--@--@"
+        "6,1500@0,1000@5,8000@6,5000@1.234,567890@98,50@1.503@12,50@B25",
+    ]
+    return "\r\n".join(lines).encode("latin1")
+
+
+class TestDebenturesScraper:
+    """Test class for DebenturesScraper."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create scraper instance writing to a temporary store."""
+        scraper = DebenturesScraper()
+        scraper.store.directory = tmp_path / "debentures"
+        return scraper
+
+    def test_process_debentures_file(self, scraper):
+        """Test only security rows are kept, with typed columns."""
+        df = scraper._process_debentures_file(make_db_file(), date(2017, 5, 16))
+
+        assert list(df['codigo']) == ["AALM12", "ABCB11"]
+        assert df.loc[0, 'pu'] == pytest.approx(1012.345678)
+        assert df.loc[1, 'duration_du'] == 1503
+        assert pd.isna(df.loc[1, 'taxa_compra'])
+        assert df.loc[1, 'dt_vencimento'] == pd.Timestamp(2025, 12, 1)
+        assert (df['dt_referencia'] == pd.Timestamp(2017, 5, 16)).all()
+
+    def test_process_invalid_file(self, scraper):
+        """Test HTML error pages are rejected."""
+        content = b"<html>Nenhum arquivo encontrado</html>"
+        assert scraper._process_debentures_file(content, date(2017, 5, 16)) is None
+
+    def test_append_to_store(self, scraper):
+        """Test rows are stored per date and keyed by codigo."""
+        df = scraper._process_debentures_file(make_db_file(), date(2017, 5, 16))
+        assert scraper.append_data(df)
+        assert scraper.append_data(df)
+
+        stored = scraper.store.read()
+        assert len(stored) == 2
+        assert stored.loc[0, 'pu'] == pytest.approx(1012.345678)
+        assert scraper.get_last_available_date() == date(2017, 5, 16)
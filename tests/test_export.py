@@ -0,0 +1,180 @@
+"""Tests for chunked reads of stored bases and their exports."""
+
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from anbima_scraper.cli import EXPORT_FORMATS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.scrapers.curves import CurvaJurosFechamentoScraper
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.utils import export
+from anbima_scraper.utils.curve_store import ClosingCurves
+from anbima_scraper.utils.export import write_xlsx
+
+NAMESPACE = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def read_sheet(path, number=1):
+    """Read the cells of a worksheet as {reference: (type, text)}."""
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read(f"xl/worksheets/sheet{number}.xml"))
+    cells = {}
+    for cell in root.iter(f"{NAMESPACE}c"):
+        if cell.get("t") == "inlineStr":
+            text = cell.find(f"{NAMESPACE}is/{NAMESPACE}t").text
+        else:
+            text = cell.find(f"{NAMESPACE}v").text
+        cells[cell.get("r")] = (cell.get("t"), text)
+    return cells
+
+
+def read_styles(path, number=1):
+    """Read the style index of each cell of a worksheet."""
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read(f"xl/worksheets/sheet{number}.xml"))
+    return {cell.get("r"): cell.get("s") for cell in root.iter(f"{NAMESPACE}c")}
+
+
+def sheet_count(path):
+    """Count the worksheets of a workbook."""
+    with zipfile.ZipFile(path) as archive:
+        return sum(
+            name.startswith("xl/worksheets/sheet") for name in archive.namelist()
+        )
+
+
+class TestWriteXlsx:
+    """Test class for write_xlsx."""
+
+    def test_typed_cells(self, tmp_path):
+        """Test dates, numbers and text become typed cells across chunks."""
+        path = tmp_path / "base.xlsx"
+        chunks = [
+            pd.DataFrame({
+                "dt_referencia": pd.to_datetime(["2017-05-16"]),
+                "taxa": [10.25],
+                "codigo": pd.Categorical(["AALM11"]),
+                "ativo": [True],
+            }),
+            pd.DataFrame({
+                "dt_referencia": pd.to_datetime(["2017-05-17"]),
+                "taxa": [np.nan],
+                "codigo": ["BRFS13"],
+                "ativo": [False],
+            }),
+        ]
+
+        assert write_xlsx(chunks, path, "debentures") == 2
+
+        cells = read_sheet(path)
+        styles = read_styles(path)
+        # Only date cells carry the date number format
+        assert styles["A2"] is not None and styles["B2"] is None
+        assert cells["A1"] == ("inlineStr", "dt_referencia")
+        # Excel serial date 42871 is 2017-05-16
+        assert cells["A2"] == (None, "42871")
+        assert cells["B2"] == (None, "10.25")
+        assert cells["C2"] == ("inlineStr", "AALM11")
+        assert cells["D2"] == ("b", "1")
+        assert cells["C3"] == ("inlineStr", "BRFS13")
+        assert "B3" not in cells
+        assert not (tmp_path / "base.tmp.xlsx").exists()
+
+    def test_rows_continue_on_new_sheets(self, tmp_path, monkeypatch):
+        """Test rows beyond the sheet limit go to new sheets with a header."""
+        monkeypatch.setattr(export, "MAX_SHEET_ROWS", 3)
+        path = tmp_path / "base.xlsx"
+        chunks = [pd.DataFrame({"valor": range(5)})]
+
+        assert write_xlsx(chunks, path) == 5
+
+        assert sheet_count(path) == 3
+        assert read_sheet(path, 3) == {
+            "A1": ("inlineStr", "valor"), "A2": (None, "4"),
+        }
+
+
+class TestIterChunks:
+    """Test class for BaseScraper.iter_chunks."""
+
+    def test_columnar_store_chunks(self, tmp_path):
+        """Test partitions are grouped up to the chunk size, in date order."""
+        scraper = DebenturesScraper()
+        scraper.store.directory = tmp_path / "debentures"
+        for day in (15, 16, 17):
+            scraper.store.append(pd.DataFrame({
+                "dt_referencia": [pd.Timestamp(2017, 5, day)] * 2,
+                "codigo": ["AALM11", "BRFS13"],
+                "taxa": [10.0 + day, 11.0],
+            }))
+
+        chunks = list(scraper.iter_chunks(date(2017, 5, 16), chunk_rows=3))
+
+        assert [len(chunk) for chunk in chunks] == [4]
+        chunks = list(scraper.iter_chunks(chunk_rows=1))
+        assert [chunk["dt_referencia"].iloc[0].day for chunk in chunks] == [15, 16, 17]
+
+    def test_csv_chunks(self, tmp_path):
+        """Test CSV bases are read in chunks with typed, filtered dates."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+        scraper.append_data(pd.DataFrame({
+            "dt_referencia": pd.to_datetime(
+                ["2017-05-15", "2017-05-16", "2017-05-17", "2017-05-18"]
+            ),
+            "no_indice": ["IRF-M"] * 4,
+            "nu_indice": [1.0, 2.0, 3.0, 4.0],
+        }))
+
+        chunks = list(scraper.iter_chunks(
+            date(2017, 5, 16), date(2017, 5, 17), chunk_rows=1
+        ))
+
+        assert [chunk["nu_indice"].iloc[0] for chunk in chunks] == [2.0, 3.0]
+        assert pd.api.types.is_datetime64_any_dtype(chunks[0]["dt_referencia"])
+
+    def test_curve_chunks(self, tmp_path):
+        """Test curves are flattened to one row per date and vertex."""
+        scraper = CurvaJurosFechamentoScraper()
+        scraper.curve_store.directory = tmp_path / "curva_juros_fechamento"
+        rates = np.arange(2 * 3 * 2, dtype=float).reshape(2, 3, 2)
+        scraper.curve_store.append(ClosingCurves(
+            dates=np.array(["2017-05-16", "2017-05-17"], dtype="datetime64[D]"),
+            vertices=np.array([252, 504]),
+            rates=rates,
+            parameters=np.zeros((2, 2, 6)),
+        ))
+
+        chunk, = scraper.iter_chunks(end_date=date(2017, 5, 16))
+
+        assert list(chunk["vertice_du"]) == [252, 504]
+        assert list(chunk["ettj_pref"]) == [2.0, 3.0]
+        assert chunk["dt_referencia"].iloc[0] == pd.Timestamp(2017, 5, 16)
+
+
+def test_export_command_writes_base(tmp_path):
+    """Test ANBIMAScraper.export streams a base into a workbook."""
+    scraper = ANBIMAScraper()
+    debentures = scraper.scrapers["debentures"]
+    debentures.store.directory = tmp_path / "debentures"
+    debentures.store.append(pd.DataFrame({
+        "dt_referencia": [pd.Timestamp(2017, 5, 16)],
+        "codigo": ["AALM11"],
+        "taxa": [10.5],
+    }))
+    path = tmp_path / "exports" / "debentures.xlsx"
+
+    assert scraper.export("debentures", path) == 1
+    assert scraper.export("debentures", path, export_format="ods") is None
+
+    assert read_sheet(path)["C2"] == (None, "10.5")
+
+
+def test_cli_formats_match_writers():
+    """Test the formats offered by the CLI are the registered writers."""
+    assert EXPORT_FORMATS == tuple(sorted(export.EXPORT_WRITERS))
@@ -0,0 +1,108 @@
+"""Tests for the synthetic ANBIMA fixture generator."""
+
+import io
+import pytest
+from datetime import date
+
+import pandas as pd
+
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.scrapers.idka import IDKAScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.scrapers.indicators import IndicatorsScraper
+from anbima_scraper.scrapers.titulos_publicos import TitulosPublicosScraper
+from anbima_scraper.testing.fixtures import SyntheticANBIMA, format_decimal_comma
+
+DT = date(2017, 5, 16)
+
+
+class TestSyntheticANBIMA:
+    """Test class for SyntheticANBIMA."""
+
+    @pytest.fixture
+    def generator(self):
+        """Create a small, seeded generator."""
+        return SyntheticANBIMA(seed=7, debentures=40, titulos=12)
+
+    def test_format_decimal_comma(self):
+        """Test numbers use ANBIMA's separators."""
+        assert format_decimal_comma(1234567.891, 2) == "1.234.567,89"
+
+    def test_deterministic_per_date(self, generator):
+        """Test a date's file does not depend on what was generated before."""
+        first = generator.debentures_txt(DT)
+        generator.debentures_txt(date(2017, 5, 17))
+
+        assert SyntheticANBIMA(seed=7, debentures=40).debentures_txt(DT) == first
+        assert SyntheticANBIMA(seed=8, debentures=40).debentures_txt(DT) != first
+
+    def test_idka_parses(self, generator, tmp_path):
+        """Test the IDKA file is read by the scraper's parser."""
+        path = tmp_path / generator.file_name("idka", DT)
+        path.write_bytes(generator.idka_csv(DT))
+
+        df = IDKAScraper()._process_idka_file(path)
+
+        assert len(df) == 12
+        assert (df['dt_referencia'] == DT).all()
+        assert df['no_indice'].iloc[0] == "IDkA PRE 3M"
+
+    def test_quadro_resumo_parses(self, tmp_path):
+        """Test every index of every date in a range is parsed."""
+        generator = SyntheticANBIMA(ima_indices=20)
+        content = generator.quadro_resumo_csv([DT, date(2017, 5, 17)])
+
+        df = IMAQuadroResumoScraper()._process_quadro_resumo(content)
+
+        assert len(df) == 40
+        assert df['nu_indice'].notna().all()
+        assert "IMA-SINT 20" in set(df['no_indice'])
+
+    def test_debentures_parse(self, generator):
+        """Test every security row survives the line filter."""
+        df = DebenturesScraper()._process_debentures_file(
+            generator.debentures_txt(DT), DT
+        )
+
+        assert len(df) == 40
+        assert df['codigo'].is_unique
+        assert df['pu'].notna().all()
+
+    def test_titulos_publicos_parse(self, generator):
+        """Test the ms file holds future maturities of the four títulos."""
+        df = TitulosPublicosScraper()._process_titulos_files(
+            [generator.titulos_publicos_txt(DT)]
+        )
+
+        assert len(df) == 12
+        assert set(df['titulo']) == {"LTN", "NTN-F", "NTN-B", "LFT"}
+        assert (df['dt_vencimento'] > pd.Timestamp(DT)).all()
+
+    def test_indicators_parse(self, generator):
+        """Test the indicators page maps every row to a known indicator."""
+        pytest.importorskip("lxml")
+        tables = pd.read_html(
+            io.BytesIO(generator.indicators_html(DT)), thousands='.', decimal=','
+        )
+
+        df = IndicatorsScraper()._process_indicators_data(tables[2])
+
+        assert len(df) == 16
+        assert not df['indice'].str.contains(r'\(').any()
+
+    def test_write_history(self, generator, tmp_path):
+        """Test one file is written per dataset and business day."""
+        written = generator.write_history(
+            tmp_path, date(2017, 5, 1), date(2017, 5, 7),
+            datasets=["debentures", "titulos_publicos"]
+        )
+
+        assert written["debentures"][0] == 4
+        assert (tmp_path / "debentures" / "db170502.txt").exists()
+        assert (tmp_path / "titulos_publicos" / "ms170505.txt").exists()
+
+    def test_business_days_beyond_calendar(self, generator):
+        """Test histories past the holidays file still skip weekends."""
+        days = generator.business_days(date(2090, 1, 2), date(2090, 1, 8))
+
+        assert days == [date(2090, 1, d) for d in range(2, 7)]
@@ -0,0 +1,175 @@
+"""Tests for IMA scrapers."""
+
+import pytest
+from unittest.mock import Mock
+from datetime import date
+
+import pandas as pd
+
+from anbima_scraper.scrapers.ima import IMACarteirasScraper, IMAQuadroResumoScraper
+
+
+HEADER = (
+    "Índice;Data de Referência;Número Índice;Variação Diária (%);"
+    "Variação Mensal (%);Variação Anual (%);Variação Últimos 12 Meses (%);"
+    "Variação Últimos 24 Meses (%);Peso (%);Duration (d.u.);"
+    "Carteira a Mercado (R$ mil);Número de Operações *;"
+    "Quant. Negociada (1.000 títulos) *;Valor Negociado (R$ mil) *;PMR;"
+    "Convexidade;Yield;Redemption Yield"
+)
+
+
+def make_quadro_resumo(rows):
+    """Build a raw Quadro Resumo payload as served by ANBIMA."""
+    lines = ["QUADRO-RESUMO - IMA", HEADER]
+    for indice, dt in rows:
+        lines.append(
+            f"{indice};{dt};10.225,542168;0,2171;1,4072;7,9779;18,5521;"
+            f"37,0963;36,40;602;1.149.412.049;210;8.569,05;8.027.595,65;"
+            f"922;10,2886;9,3098;9,4603"
+        )
+    return "\n".join(lines).encode("latin1")
+
+
+class TestIMAQuadroResumoScraper:
+    """Test class for IMAQuadroResumoScraper."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create scraper instance writing to a temporary base."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+        return scraper
+
+    def test_process_quadro_resumo_types(self, scraper):
+        """Test numbers and dates are typed column-wise."""
+        content = make_quadro_resumo([("IRF-M", "16/05/2017")])
+
+        df = scraper._process_quadro_resumo(content)
+
+        assert len(df) == 1
+        assert df.loc[0, 'no_indice'] == "IRF-M"
+        assert df.loc[0, 'nu_indice'] == pytest.approx(10225.542168)
+        assert df.loc[0, 'carteira_mercado_reais_mil'] == 1149412049
+        assert df.loc[0, 'duration_du'] == 602
+        assert df['dt_referencia'].iloc[0] == pd.Timestamp(2017, 5, 16)
+
+    def test_process_quadro_resumo_invalid(self, scraper):
+        """Test error pages are rejected."""
+        content = "Não há dados disponíveis".encode("latin1")
+        assert scraper._process_quadro_resumo(content) is None
+
+    def test_build_params_range(self, scraper):
+        """Test a single request covers the whole range."""
+        params = scraper._build_params(date(2017, 5, 1), date(2017, 5, 16))
+        assert params['DataIni'] == "01/05/2017"
+        assert params['DataFim'] == "16/05/2017"
+
+    def test_scrape_appends_sorted(self, scraper):
+        """Test one range request is made and rows land sorted in the base."""
+        content = make_quadro_resumo([
+            ("IRF-M", "17/05/2017"),
+            ("IRF-M", "16/05/2017"),
+        ])
+        scraper._download_range = Mock(return_value=content)
+
+        assert scraper.scrape(date(2017, 5, 16), date(2017, 5, 17))
+        scraper._download_range.assert_called_once_with(
+            date(2017, 5, 16), date(2017, 5, 17)
+        )
+
+        base = pd.read_csv(scraper.output_file, sep=';')
+        assert list(base['dt_referencia']) == ["2017-05-16", "2017-05-17"]
+
+        # A second run with older data is merged without duplicating rows
+        scraper._download_range = Mock(return_value=make_quadro_resumo([
+            ("IRF-M 1", "16/05/2017"),
+        ]))
+        scraper.get_last_available_date = Mock(return_value=None)
+        assert scraper.scrape(date(2017, 5, 16), date(2017, 5, 16))
+
+        base = pd.read_csv(scraper.output_file, sep=';')
+        assert len(base) == 3
+        assert list(base['dt_referencia']) == sorted(base['dt_referencia'])
+
+    def test_scrape_fails_when_every_request_fails(self, scraper):
+        """Test an outage fails the run while a day without data does not."""
+        scraper._download_range = Mock(return_value=None)
+        assert not scraper.scrape(date(2017, 5, 16), date(2017, 5, 17))
+        assert not scraper.output_file.exists()
+
+        scraper._download_range = Mock(
+            return_value="Não há dados disponíveis".encode("latin1")
+        )
+        assert scraper.scrape(date(2017, 5, 16), date(2017, 5, 17))
+
+
+CARTEIRA_HEADER = (
+    "Data de Referência;Título;Data de Vencimento;Código SELIC;Código ISIN;"
+    "Taxa Indicativa (% a.a.);PU (R$);PU de Juros (R$);"
+    "Quantidade (1.000 títulos);Quantidade Teórica (1.000 títulos);"
+    "Carteira a Mercado (R$ mil);Peso (%);Prazo (d.u.);Duration (d.u.);"
+    "Quantidade em Mercado (1.000 títulos);PMR;Convexidade"
+)
+
+
+def make_carteira(carteira, dt):
+    """Build a raw carteira composition payload as served by ANBIMA."""
+    lines = [
+        f"CARTEIRA TEÓRICA DO {carteira.upper()} - {dt}",
+        CARTEIRA_HEADER,
+        f"{dt};NTN-B;15/08/2024;760199;BRSTNCNTB096;5,7000;3.001,123456;"
+        "0,000000;1.234,5;1.234,5;3.704.937,25;12,50;1.850;1.620;1.234,5;;",
+        f"{dt};NTN-B;15/05/2035;760199;BRSTNCNTB4U6;5,9000;3.112,654321;"
+        "0,000000;2.345,6;2.345,6;7.300.000,00;24,75;4.400;2.900;2.345,6;;",
+    ]
+    return "\n".join(lines).encode("latin1")
+
+
+class TestIMACarteirasScraper:
+    """Test class for IMACarteirasScraper."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create scraper instance writing to a temporary store."""
+        scraper = IMACarteirasScraper()
+        scraper.store.directory = tmp_path / "ima_carteiras"
+        return scraper
+
+    def test_process_carteira_types(self, scraper):
+        """Test rows are typed and tagged with their carteira."""
+        df = scraper._process_carteira(make_carteira("ima-b", "16/05/2017"), "ima-b")
+
+        assert len(df) == 2
+        assert (df['no_indice'] == "IMA-B").all()
+        assert df.loc[0, 'pu'] == pytest.approx(3001.123456)
+        assert df.loc[1, 'carteira_mercado_reais_mil'] == 7300000
+        assert df.loc[1, 'dt_vencimento'] == pd.Timestamp(2035, 5, 15)
+
+    def test_scrape_fans_out_job_matrix(self, scraper):
+        """Test every (carteira, business day) pair is fetched once."""
+        def download(carteira, dt):
+            if carteira == "ima-c":
+                return None
+            return make_carteira(carteira, dt.strftime("%d/%m/%Y"))
+
+        scraper._download_carteira = Mock(side_effect=download)
+
+        # 2017-05-13/14 are a weekend and must not stop the range
+        assert scraper.scrape(date(2017, 5, 12), date(2017, 5, 15))
+
+        calls = {c.args for c in scraper._download_carteira.call_args_list}
+        assert len(calls) == 2 * len(IMACarteirasScraper.CARTEIRAS)
+        assert {dt for _, dt in calls} == {date(2017, 5, 12), date(2017, 5, 15)}
+
+        stored = scraper.store.read_partition(date(2017, 5, 15))
+        assert len(stored) == 2 * (len(IMACarteirasScraper.CARTEIRAS) - 1)
+        assert isinstance(stored['codigo_isin'].dtype, pd.CategoricalDtype)
+        assert set(stored['codigo_isin']) == {"BRSTNCNTB096", "BRSTNCNTB4U6"}
+
+    def test_scrape_fails_when_every_download_fails(self, scraper):
+        """Test an outage fails the run instead of reporting success."""
+        scraper._download_carteira = Mock(return_value=None)
+
+        assert not scraper.scrape(date(2017, 5, 15), date(2017, 5, 15))
+        assert scraper.store.dates() == []
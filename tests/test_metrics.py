@@ -0,0 +1,111 @@
+"""Tests for per-stage run metrics."""
+
+from datetime import date
+
+import pandas as pd
+
+from anbima_scraper.config.settings import DATA_SETTINGS
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.testing.fixtures import SyntheticANBIMA
+from anbima_scraper.testing.server import StandInServer
+from anbima_scraper.utils.data_processor import DataProcessor
+from anbima_scraper.utils.http_client import ANBIMAHTTPClient
+from anbima_scraper.utils.metrics import (
+    RunMetrics,
+    format_prometheus,
+    write_prometheus_textfile,
+)
+
+
+class TestRunMetrics:
+    """Test class for RunMetrics."""
+
+    def test_summary_derives_throughput(self):
+        """Test rows/s and bytes/s are derived from the counters."""
+        metrics = RunMetrics("idka")
+        metrics.add("parse", calls=2, rows=1000, seconds=0.5)
+        metrics.add("http", requests=1, bytes=4000, seconds=2.0)
+        metrics.finish(True)
+
+        summary = metrics.summary()
+
+        assert summary["success"] is True
+        assert summary["parse"]["rows_per_second"] == 2000
+        assert summary["http"]["bytes_per_second"] == 2000
+        assert summary["write"]["bytes_per_second"] == 0
+
+    def test_write_stage_records_bytes_and_fsync(self, tmp_path, monkeypatch):
+        """Test CSV writes inside a write stage report their size."""
+        monkeypatch.setitem(DATA_SETTINGS, "fsync", True)
+        metrics = RunMetrics("indicators")
+        path = tmp_path / "base.csv"
+        df = pd.DataFrame({"dt_referencia": ["2017-05-16"], "valor": [1.5]})
+
+        with metrics.stage("write", rows=len(df)):
+            DataProcessor.save_csv_safe(df, path)
+        # Writes outside a stage are not attributed to the run
+        DataProcessor.save_csv_safe(df, path, mode='a', header=False)
+
+        write = metrics.summary()["write"]
+        assert write["calls"] == 1
+        assert write["rows"] == 1
+        assert write["bytes"] == len("dt_referencia;valor\n2017-05-16;1.5\n")
+        assert write["fsync_seconds"] > 0
+
+    def test_prometheus_textfile(self, tmp_path):
+        """Test summaries render one labelled sample per dataset."""
+        metrics = RunMetrics("debentures")
+        metrics.add("http", requests=3, ttfb_seconds=0.25)
+        metrics.finish(False)
+        path = tmp_path / "anbima.prom"
+
+        write_prometheus_textfile({"debentures": metrics.summary()}, path)
+
+        text = path.read_text()
+        assert text == format_prometheus({"debentures": metrics.summary()})
+        assert "# TYPE anbima_scraper_http_requests gauge" in text
+        assert 'anbima_scraper_http_requests{dataset="debentures"} 3' in text
+        assert 'anbima_scraper_http_ttfb_seconds{dataset="debentures"} 0.25' in text
+        assert 'anbima_scraper_run_success{dataset="debentures"} 0' in text
+
+
+def test_scraper_run_metrics(tmp_path):
+    """Test a scrape against the stand-in server fills every stage."""
+    generator = SyntheticANBIMA(debentures=20)
+    with StandInServer(generator, today=date(2017, 5, 19)) as server:
+        scraper = DebenturesScraper()
+        scraper.store.directory = tmp_path / "debentures"
+        scraper.http_client = ANBIMAHTTPClient(base_url=server.base_url)
+
+        assert scraper.scrape(date(2017, 5, 15), date(2017, 5, 16))
+
+    summary = scraper.metrics.summary()
+    http, parse, write = summary["http"], summary["parse"], summary["write"]
+
+    assert http["requests"] == 2
+    assert http["errors"] == 0
+    assert http["connections"] >= 1
+    assert http["bytes"] == sum(
+        len(generator.debentures_txt(date(2017, 5, day))) for day in (15, 16)
+    )
+    assert 0 < http["ttfb_seconds"] <= http["seconds"]
+    assert parse["calls"] == 2
+    assert parse["rows"] == 40
+    assert write["rows"] == 40
+    assert write["bytes"] == sum(
+        p.stat().st_size for p in (tmp_path / "debentures").rglob("*.npz")
+    )
+
+
+def test_run_resets_metrics(tmp_path):
+    """Test each run starts from zero and records its outcome."""
+    scraper = DebenturesScraper()
+    scraper.store.directory = tmp_path / "debentures"
+    scraper.metrics.add("http", requests=5)
+    scraper.get_run_dates = lambda force_update: []
+
+    assert scraper.run()
+
+    summary = scraper.metrics.summary()
+    assert summary["http"]["requests"] == 0
+    assert summary["success"] is True
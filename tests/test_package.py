@@ -0,0 +1,51 @@
+"""Tests for lazy package loading."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import anbima_scraper
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestLazyPackage:
+    """Test class for PEP 562 lazy attributes."""
+
+    def test_import_loads_no_heavy_dependencies(self):
+        """Test importing the package and settings loads no third-party module."""
+        output = run_python(
+            "import sys, anbima_scraper, anbima_scraper.config.settings; "
+            "print(sorted(m for m in ('pandas', 'numpy', 'requests', 'bizdays') "
+            "if m in sys.modules))"
+        )
+        assert output == "[]"
+
+    def test_cli_import_loads_no_pandas(self):
+        """Test the CLI module defers pandas to the commands that use it."""
+        output = run_python(
+            "import sys, anbima_scraper.cli; "
+            "print(sorted(m for m in ('pandas', 'numpy') if m in sys.modules))"
+        )
+        assert output == "[]"
+
+    def test_public_names_resolve(self):
+        """Test public names load on access and unknown names fail."""
+        from anbima_scraper.scrapers.debentures import DebenturesScraper
+
+        assert anbima_scraper.DebenturesScraper is DebenturesScraper
+        assert "ANBIMAScraper" in dir(anbima_scraper)
+        with pytest.raises(AttributeError):
+            anbima_scraper.Unknown
@@ -0,0 +1,163 @@
+"""Tests for vectorized government bond pricing."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from anbima_scraper.analytics.pricing import (
+    FACE_VALUE,
+    coupon_schedule,
+    price_bonds,
+    verify_published_prices,
+)
+from anbima_scraper.scrapers.titulos_publicos import TitulosPublicosScraper
+from anbima_scraper.utils.calendar import ANBIMACalendar
+
+# Directories of ms{yymmdd}.txt files with the VNA of NTN-B and LFT for
+# their dates in vna.csv (dt_referencia;titulo;vna). The committed one
+# holds PUs worked out independently from the Tesouro Nacional formulas
+# in decimal arithmetic; ANBIMA_PUBLISHED_DIR adds files downloaded from
+# ANBIMA.
+PUBLISHED_DIRS = [Path(__file__).parent / "data" / "titulos_publicos"] + [
+    Path(path) for path in filter(None, [os.environ.get("ANBIMA_PUBLISHED_DIR")])
+]
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    """Shared ANBIMA calendar."""
+    return ANBIMACalendar()
+
+
+def make_bonds(rows):
+    """Build a títulos públicos frame from (titulo, ref, maturity, rate)."""
+    df = pd.DataFrame(
+        rows, columns=['titulo', 'dt_referencia', 'dt_vencimento', 'taxa_indicativa']
+    )
+    df['dt_referencia'] = pd.to_datetime(df['dt_referencia'])
+    df['dt_vencimento'] = pd.to_datetime(df['dt_vencimento'])
+    return df
+
+
+@pytest.fixture(scope="module", params=PUBLISHED_DIRS, ids=lambda path: path.name)
+def published(request):
+    """Rows of the ms files of a directory, with the VNA of their dates."""
+    directory = request.param
+    df = TitulosPublicosScraper()._process_titulos_files(
+        [path.read_bytes() for path in sorted(directory.glob("ms*.txt"))]
+    )
+    assert df is not None and not df.empty
+
+    vna_path = directory / "vna.csv"
+    if vna_path.exists():
+        vna = pd.read_csv(vna_path, sep=";", decimal=",", thousands=".",
+                          parse_dates=['dt_referencia'], dayfirst=True)
+        df = df.merge(vna, on=['dt_referencia', 'titulo'], how='left')
+    return df
+
+
+class TestCouponSchedule:
+    """Test class for coupon date generation."""
+
+    def test_semiannual_dates_after_reference(self):
+        """Test coupons step back six months from maturity."""
+        flows = coupon_schedule(
+            np.array(['2024-03-10'], dtype='datetime64[D]'),
+            np.array(['2025-08-15'], dtype='datetime64[D]'),
+            15
+        )
+        valid = flows[0][~np.isnat(flows[0])]
+        assert list(valid.astype(str)) == ['2025-08-15', '2025-02-15', '2024-08-15']
+
+
+class TestPriceBonds:
+    """Test class for PU, duration and convexity."""
+
+    def test_ltn_matches_closed_formula(self, calendar):
+        """Test LTN PU is the truncated discounted face value."""
+        df = make_bonds([('LTN', '2024-01-02', '2025-01-01', 10.5)])
+        result = price_bonds(df, calendar)
+
+        du = int(calendar.count_business_days(
+            np.array(['2024-01-02'], dtype='datetime64[D]'),
+            np.array(['2025-01-01'], dtype='datetime64[D]')
+        )[0])
+        expected = np.trunc(FACE_VALUE / 1.105 ** (du / 252) * 1e6) / 1e6
+
+        assert result.loc[0, 'pu_calculado'] == pytest.approx(expected, abs=1e-6)
+        assert result.loc[0, 'duration'] == pytest.approx(du / 252)
+        assert result.loc[0, 'duration_modificada'] == pytest.approx(du / 252 / 1.105)
+
+    def test_ntnf_near_par_at_coupon_rate(self, calendar):
+        """Test an NTN-F yielding its coupon rate prices close to par."""
+        df = make_bonds([('NTN-F', '2024-01-02', '2029-01-01', 10.0)])
+        result = price_bonds(df, calendar)
+
+        assert result.loc[0, 'pu_calculado'] == pytest.approx(FACE_VALUE, abs=5.0)
+        assert 0 < result.loc[0, 'duration'] < 5
+        assert result.loc[0, 'convexidade'] > 0
+
+    def test_indexed_bonds_use_vna(self, calendar):
+        """Test NTN-B and LFT PUs scale their quotation by the VNA."""
+        df = make_bonds([
+            ('NTN-B', '2024-01-02', '2030-08-15', 6.0),
+            ('LFT', '2024-01-02', '2029-03-01', 0.0),
+        ])
+        df['vna'] = [4200.0, 14000.0]
+        result = price_bonds(df, calendar)
+
+        # Dirty price: par plus the coupon accrued since 2023-08-15
+        assert 101.0 < result.loc[0, 'cotacao'] < 103.0
+        assert result.loc[0, 'pu_calculado'] == pytest.approx(
+            4200.0 * result.loc[0, 'cotacao'] / 100, abs=1e-5
+        )
+        assert result.loc[1, 'cotacao'] == 100.0
+        assert result.loc[1, 'pu_calculado'] == 14000.0
+
+    def test_unpriced_titles_and_missing_vna(self, calendar):
+        """Test other títulos stay NaN and NTN-B without VNA has no PU."""
+        df = make_bonds([
+            ('NTN-C', '2024-01-02', '2031-01-01', 6.0),
+            ('NTN-B', '2024-01-02', '2035-05-15', 5.5),
+        ])
+        result = price_bonds(df, calendar)
+
+        assert result.loc[0, ['pu_calculado', 'cotacao']].isna().all()
+        assert np.isnan(result.loc[1, 'pu_calculado'])
+        assert result.loc[1, 'cotacao'] > 100
+
+    def test_verify_published_prices(self, calendar):
+        """Test only PUs beyond the tolerance are reported."""
+        df = make_bonds([
+            ('LTN', '2024-01-02', '2025-01-01', 10.5),
+            ('LTN', '2024-01-02', '2026-01-01', 10.5),
+        ])
+        priced = price_bonds(df, calendar)
+        priced['pu'] = priced['pu_calculado'] + [0.0, 0.5]
+
+        mismatches = verify_published_prices(priced)
+
+        assert list(mismatches.index) == [1]
+        assert mismatches.loc[1, 'diferenca_pu'] == pytest.approx(-0.5)
+
+    def test_reproduces_published_prices(self, published, calendar):
+        """Test published PUs are matched up to ANBIMA's truncation."""
+        priced = price_bonds(published, calendar)
+        priced = priced[priced['pu_calculado'].notna() & priced['pu'].notna()]
+        assert {'LTN', 'NTN-F'} <= set(priced['titulo'])
+
+        # PUs are truncated to 6 decimals; NTN-B and LFT truncate the
+        # quotation to 4 decimals of % before applying the VNA
+        step = np.where(
+            priced['titulo'].isin(['NTN-B', 'LFT']),
+            priced.get('vna', np.nan) * 1e-6, 1e-6
+        )
+        difference = (priced['pu_calculado'] - priced['pu']).abs()
+        mismatches = priced.loc[difference > step + 1e-9, [
+            'titulo', 'dt_referencia', 'dt_vencimento', 'pu', 'pu_calculado'
+        ]]
+        assert mismatches.empty, mismatches.to_string()
@@ -0,0 +1,145 @@
+"""Tests for opt-in profiling and memory tracing."""
+
+import pstats
+import threading
+from datetime import date
+
+import pytest
+
+from anbima_scraper.config.settings import PROFILE_SETTINGS, REQUEST_SETTINGS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.core.registry import ScraperRegistry
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.scrapers.titulos_publicos import TitulosPublicosScraper
+from anbima_scraper.testing.fixtures import SyntheticANBIMA
+from anbima_scraper.testing.server import StandInServer
+from anbima_scraper.utils.http_client import ANBIMAHTTPClient
+from anbima_scraper.utils.profiling import (
+    MemoryTracer,
+    profile_run,
+    start_memory_tracing,
+    stop_memory_tracing,
+)
+
+
+@pytest.fixture
+def tracing():
+    """Trace memory allocations during a test."""
+    start_memory_tracing()
+    yield
+    stop_memory_tracing()
+
+
+def test_profile_run_writes_stats(tmp_path, monkeypatch):
+    """Test a profiled block leaves a loadable .pstats and a text report."""
+    monkeypatch.setitem(PROFILE_SETTINGS, "profile_dir", str(tmp_path))
+
+    with profile_run("idka"):
+        sorted(range(10000), key=str)
+
+    stats_file, = tmp_path.glob("idka_*.pstats")
+    assert pstats.Stats(str(stats_file)).total_calls > 0
+    assert "cumulative" in stats_file.with_suffix(".txt").read_text()
+
+
+def test_profile_run_disabled(tmp_path):
+    """Test nothing is written without a profile directory."""
+    assert PROFILE_SETTINGS["profile_dir"] is None
+
+    with profile_run("idka"):
+        pass
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_profiled_runs_are_sequential(tmp_path, monkeypatch):
+    """Test profiled scrapers run one at a time, downloads included."""
+    monkeypatch.setitem(PROFILE_SETTINGS, "profile_dir", str(tmp_path / "profiles"))
+    running = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def build(scraper_class, directory):
+        scraper = scraper_class()
+        scraper.store.directory = tmp_path / directory
+        scraper.get_run_dates = lambda force_update: [
+            date(2017, 5, 15), date(2017, 5, 16)
+        ]
+        run = scraper.run
+
+        def tracked_run(force_update=False):
+            with lock:
+                running.append(scraper.name)
+                overlaps.append(len(running) > 1)
+            try:
+                return run(force_update)
+            finally:
+                with lock:
+                    running.remove(scraper.name)
+        scraper.run = tracked_run
+        return scraper
+
+    with StandInServer(SyntheticANBIMA(debentures=20, titulos=8),
+                       today=date(2017, 5, 19)) as server:
+        monkeypatch.setitem(REQUEST_SETTINGS, "base_url", server.base_url)
+        scrapers = {
+            "debentures": build(DebenturesScraper, "debentures"),
+            "titulos_publicos": build(TitulosPublicosScraper, "titulos_publicos"),
+        }
+        registry = ScraperRegistry(
+            {name: (lambda s=s: s) for name, s in scrapers.items()}, discover=False
+        )
+        results = ANBIMAScraper(registry).run_multiple(list(scrapers))
+
+    assert all(results.values())
+    assert not any(overlaps)
+    stats_file, = (tmp_path / "profiles").glob("titulos_publicos_*.pstats")
+    functions = {name for _, _, name in pstats.Stats(str(stats_file)).stats}
+    assert "_download_titulos_file" in functions
+
+
+class TestMemoryTracer:
+    """Test class for MemoryTracer."""
+
+    def test_stage_peak_and_sites(self, tracing):
+        """Test a stage reports its peak and the line that allocated."""
+        tracer = MemoryTracer("idka")
+
+        with tracer.stage("parse"):
+            kept = bytearray(3_000_000)
+            assert len(bytes(5_000_000)) == 5_000_000
+
+        # Other allocations may be released meanwhile, so stay well below
+        # the 8 MB allocated
+        result = tracer.summary()["parse"]
+        assert result["peak_bytes"] >= 5_000_000
+        assert result["top_sites"][0]["bytes"] >= len(kept)
+        assert "test_profiling.py" in result["top_sites"][0]["site"]
+
+    def test_untraced_stage(self):
+        """Test stages record nothing while tracemalloc is off."""
+        tracer = MemoryTracer("idka")
+
+        with tracer.stage("parse"):
+            bytearray(1000)
+
+        assert tracer.summary() == {}
+
+    def test_run_traces_every_stage(self, tmp_path):
+        """Test a traced run reports download, parse, clean and write."""
+        with StandInServer(SyntheticANBIMA(debentures=20),
+                           today=date(2017, 5, 19)) as server:
+            scraper = DebenturesScraper()
+            scraper.store.directory = tmp_path / "debentures"
+            scraper.http_client = ANBIMAHTTPClient(base_url=server.base_url)
+            scraper.get_run_dates = lambda force_update: [date(2017, 5, 15)]
+
+            start_memory_tracing()
+            try:
+                assert scraper.run()
+            finally:
+                stop_memory_tracing()
+
+        memory = scraper.metrics.summary()["memory"]
+        assert set(memory) == {"download", "parse", "clean", "write"}
+        assert all(stage["peak_bytes"] > 0 for stage in memory.values())
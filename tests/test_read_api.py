@@ -0,0 +1,178 @@
+"""Tests for the local read API."""
+
+import io
+
+import pandas as pd
+import pytest
+import requests
+
+from anbima_scraper.config.settings import CHANGE_FEED_SETTINGS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.core.read_api import DatasetIndex, ReadAPIServer
+
+
+def quadro_resumo(rows, value=1000.5):
+    """Build cleaned quadro resumo rows of (index name, reference date)."""
+    return pd.DataFrame({
+        'dt_referencia': [pd.Timestamp(dt) for _, dt in rows],
+        'no_indice': [name for name, _ in rows],
+        'nu_indice': [value] * len(rows),
+    })
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """ANBIMA scraper with a small quadro resumo base under tmp_path."""
+    scraper = ANBIMAScraper()
+    ima = scraper.scrapers["ima_quadro_resumo"]
+    ima.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+    for day in (15, 16, 17):
+        assert ima.append_data(quadro_resumo([
+            ("IRF-M", f"2017-05-{day}"), ("IMA-B", f"2017-05-{day}"),
+        ]))
+    return scraper
+
+
+@pytest.fixture
+def server(scraper):
+    """Read API over the quadro resumo base, on a free port."""
+    with ReadAPIServer(scraper, ["ima_quadro_resumo"], port=0) as server:
+        yield server
+
+
+class TestDatasetIndex:
+    """Test class for DatasetIndex."""
+
+    def test_writes_are_merged_from_the_feed(self, scraper, monkeypatch):
+        """Test appends reach the index without reading the base again."""
+        ima = scraper.scrapers["ima_quadro_resumo"]
+        index = DatasetIndex(ima)
+        index.refresh()
+        assert len(index.rows) == 6
+
+        monkeypatch.setattr(ima, "iter_chunks", lambda *args: pytest.fail(
+            "base read again"
+        ))
+        assert ima.append_data(quadro_resumo([("IRF-M", "2017-05-18")]))
+        assert ima.append_data(quadro_resumo([("IRF-M", "2017-05-17")], 999.0))
+        index.refresh()
+
+        rows, _ = index.query(pd.Timestamp(2017, 5, 17).date(), series=["IRF-M"])
+        assert rows['nu_indice'].tolist() == [999.0, 1000.5]
+        assert rows['dt_referencia'].is_monotonic_increasing
+        assert len(index.rows) == 7
+        assert index.sequence == ima.change_feed.last_sequence()
+
+    def test_pruned_changes_reload_the_base(self, scraper, monkeypatch):
+        """Test the index reloads when the batches it needs were pruned."""
+        monkeypatch.setitem(CHANGE_FEED_SETTINGS, "retention_batches", 1)
+        ima = scraper.scrapers["ima_quadro_resumo"]
+        index = DatasetIndex(ima)
+        index.refresh()
+
+        for day in (18, 19):
+            assert ima.append_data(quadro_resumo([("IMA-B", f"2017-05-{day}")]))
+        index.refresh()
+
+        assert len(index.rows) == 8
+        assert index.rows['dt_referencia'].max() == pd.Timestamp(2017, 5, 19)
+
+    def test_write_without_batch_reloads(self, scraper, monkeypatch):
+        """Test a base changed without a change batch is read again."""
+        ima = scraper.scrapers["ima_quadro_resumo"]
+        index = DatasetIndex(ima)
+        index.refresh()
+
+        # Stored and stamped, but no batch recorded
+        with monkeypatch.context() as patch:
+            patch.setitem(CHANGE_FEED_SETTINGS, "enabled", False)
+            assert ima.append_data(quadro_resumo([("IRF-M", "2017-05-18")]))
+        index.refresh()
+
+        assert len(index.rows) == 7
+        assert index.rows['dt_referencia'].max() == pd.Timestamp(2017, 5, 18)
+        assert index.stamp == ima.source_stamp()
+
+
+class TestReadAPIServer:
+    """Test class for ReadAPIServer."""
+
+    def test_range_and_indice(self, server):
+        """Test dates are bounded and rows filtered by index name."""
+        response = requests.get(
+            f"{server.base_url}/ima_quadro_resumo",
+            params={"from": "2017-05-16", "to": "2017-05-17", "indice": "IMA-B"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("application/json")
+        assert [row["dt_referencia"] for row in response.json()] == [
+            "2017-05-16T00:00:00", "2017-05-17T00:00:00",
+        ]
+        assert {row["no_indice"] for row in response.json()} == {"IMA-B"}
+
+    def test_csv_format(self, server):
+        """Test the format parameter selects CSV."""
+        response = requests.get(
+            f"{server.base_url}/ima_quadro_resumo",
+            params={"from": "2017-05-17", "format": "csv"},
+        )
+
+        df = pd.read_csv(io.StringIO(response.text), sep=";")
+        assert response.headers["Content-Type"].startswith("text/csv")
+        assert df['dt_referencia'].tolist() == ["2017-05-17", "2017-05-17"]
+
+    def test_arrow_by_accept_header(self, server):
+        """Test Accept negotiates an Arrow IPC stream."""
+        pa = pytest.importorskip("pyarrow")
+
+        response = requests.get(
+            f"{server.base_url}/ima_quadro_resumo",
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 6
+        assert table.column_names == ["dt_referencia", "no_indice", "nu_indice"]
+
+    def test_etag_revalidation(self, server, scraper):
+        """Test a 304 is returned until the next write changes the ETag."""
+        url = f"{server.base_url}/ima_quadro_resumo?indice=IRF-M"
+        first = requests.get(url)
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "max-age=60"
+
+        cached = requests.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        ima = scraper.scrapers["ima_quadro_resumo"]
+        assert ima.append_data(quadro_resumo([("IRF-M", "2017-05-18")]))
+        updated = requests.get(url, headers={"If-None-Match": etag})
+        assert updated.status_code == 200
+        assert updated.headers["ETag"] != etag
+        assert len(updated.json()) == 4
+
+    @pytest.mark.parametrize("path, status", [
+        ("/inexistente", 404),
+        ("/ima_quadro_resumo?from=16/05/2017", 400),
+        ("/ima_quadro_resumo?format=xml", 400),
+    ])
+    def test_errors(self, server, path, status):
+        """Test unknown datasets and invalid parameters are rejected."""
+        response = requests.get(server.base_url + path)
+
+        assert response.status_code == status
+        assert "error" in response.json()
+
+    def test_listing(self, server):
+        """Test the root lists the datasets served."""
+        response = requests.get(server.base_url + "/")
+
+        assert response.json() == {"datasets": ["ima_quadro_resumo"]}
+
+
+def test_unknown_dataset_rejected(scraper):
+    """Test the server refuses to start for unknown scrapers."""
+    with pytest.raises(ValueError):
+        ReadAPIServer(scraper, ["inexistente"], port=0)
@@ -0,0 +1,60 @@
+"""Tests for the lazy scraper registry."""
+
+import pytest
+from unittest.mock import Mock, NonCallableMock
+
+from anbima_scraper.core import registry as registry_module
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.core.registry import BUILTIN_SCRAPERS, ScraperRegistry
+
+
+class TestScraperRegistry:
+    """Test class for ScraperRegistry."""
+
+    def test_lists_without_building(self):
+        """Test names are available before any scraper is built."""
+        registry = ScraperRegistry(discover=False)
+
+        assert list(registry) == list(BUILTIN_SCRAPERS)
+        assert "debentures" in registry
+        assert not any(registry.is_loaded(name) for name in registry)
+
+    def test_builds_once_on_first_access(self):
+        """Test factories run only once, on lookup."""
+        factory = Mock(return_value=object())
+        registry = ScraperRegistry({"custom": factory}, discover=False)
+
+        factory.assert_not_called()
+        assert registry["custom"] is registry["custom"]
+        factory.assert_called_once_with()
+
+    def test_builds_builtin_from_path(self):
+        """Test "module:attribute" factories are imported on demand."""
+        registry = ScraperRegistry(discover=False)
+        assert registry["debentures"].name == "debentures"
+        assert registry.is_loaded("debentures")
+
+    def test_discovers_entry_points(self, monkeypatch):
+        """Test plugins are added after built-ins without overriding them."""
+        plugin = NonCallableMock(spec=["load"])
+        plugin.load.return_value = Mock(return_value="plugin scraper")
+        shadowing = NonCallableMock(spec=["load"])
+        monkeypatch.setattr(
+            registry_module, "_entry_points",
+            lambda: {"plugin": plugin, "idka": shadowing}
+        )
+
+        registry = ScraperRegistry()
+
+        assert list(registry)[-1] == "plugin"
+        plugin.load.assert_not_called()
+        assert registry["plugin"] == "plugin scraper"
+        assert registry["idka"].name == "idka"
+        shadowing.load.assert_not_called()
+
+    def test_unknown_scraper(self):
+        """Test unknown names raise KeyError and fail in ANBIMAScraper."""
+        registry = ScraperRegistry(discover=False)
+        with pytest.raises(KeyError):
+            registry["unknown"]
+        assert ANBIMAScraper(registry).run_scraper("unknown") is False
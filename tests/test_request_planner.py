@@ -0,0 +1,64 @@
+"""Tests for the range request planner."""
+
+import pytest
+from datetime import date
+
+import pandas as pd
+
+from anbima_scraper.utils.calendar import ANBIMACalendar
+from anbima_scraper.utils.request_planner import RangeRequestPlanner
+
+
+class TestRangeRequestPlanner:
+    """Test class for RangeRequestPlanner."""
+
+    @pytest.fixture
+    def calendar(self):
+        """Create calendar instance for testing."""
+        return ANBIMACalendar()
+
+    def test_plan_coalesces_across_weekends(self, calendar):
+        """Test consecutive business days become one range."""
+        planner = RangeRequestPlanner(calendar, max_business_days=20)
+        dates = calendar.get_business_days_range(date(2023, 12, 4), date(2023, 12, 15))
+
+        ranges = planner.plan(dates)
+
+        assert len(ranges) == 1
+        assert ranges[0].start == date(2023, 12, 4)
+        assert ranges[0].end == date(2023, 12, 15)
+        assert len(ranges[0].dates) == 10
+
+    def test_plan_splits_gaps_and_max_size(self, calendar):
+        """Test gaps and the per-endpoint limit split ranges."""
+        planner = RangeRequestPlanner(calendar, max_business_days=3)
+        dates = calendar.get_business_days_range(date(2023, 12, 4), date(2023, 12, 8))
+        dates.remove(date(2023, 12, 6))
+
+        ranges = planner.plan(dates)
+
+        assert [(r.start, r.end) for r in ranges] == [
+            (date(2023, 12, 4), date(2023, 12, 5)),
+            (date(2023, 12, 7), date(2023, 12, 8)),
+        ]
+
+    def test_execute_falls_back_to_daily(self, calendar):
+        """Test a failed range is retried date by date."""
+        planner = RangeRequestPlanner(calendar, max_business_days=5)
+        ranges = planner.plan(
+            calendar.get_business_days_range(date(2023, 12, 4), date(2023, 12, 6))
+        )
+        calls = []
+
+        def fetch(start, end):
+            calls.append((start, end))
+            if start != end:
+                raise ValueError("range not supported")
+            return pd.DataFrame({'dt_referencia': [start], 'valor': [1.0]})
+
+        partitions = planner.execute(ranges, fetch)
+
+        assert len(calls) == 4
+        assert sorted(partitions) == [
+            date(2023, 12, 4), date(2023, 12, 5), date(2023, 12, 6)
+        ]
@@ -0,0 +1,104 @@
+"""Tests for the run history ledger."""
+
+from datetime import date, datetime, timedelta
+
+from anbima_scraper.config.settings import RUN_HISTORY_SETTINGS
+from anbima_scraper.core.anbima_scraper import ANBIMAScraper
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.utils.run_history import RunHistory, RunRecord
+
+START = datetime(2017, 5, 1, 19, 0)
+
+
+def make_run(day: int, duration: float = 10.0, size: int = 1000,
+             rows: int = 10, success: bool = True) -> RunRecord:
+    """Build a run of the debentures dataset."""
+    return RunRecord(
+        dataset="debentures",
+        started_at=START + timedelta(days=day),
+        duration_seconds=duration,
+        success=success,
+        start_date=date(2017, 5, 1) + timedelta(days=day),
+        end_date=date(2017, 5, 1) + timedelta(days=day),
+        requests=1,
+        bytes=size,
+        rows=rows,
+        cache_hits=0,
+        errors=0,
+    )
+
+
+class TestRunHistory:
+    """Test class for RunHistory."""
+
+    def test_runs_persist_in_order(self, tmp_path):
+        """Test runs survive reopening and come back oldest first."""
+        path = tmp_path / "history.sqlite3"
+        with RunHistory(path) as history:
+            history.record(make_run(1))
+            history.record(make_run(0))
+
+        with RunHistory(path) as history:
+            runs = history.runs("debentures")
+            assert [run.started_at.day for run in runs] == [1, 2]
+            assert runs[0] == make_run(0)
+            assert history.runs("debentures", limit=1) == [make_run(1)]
+            assert history.datasets() == ["debentures"]
+
+    def test_trends_flag_deviations(self):
+        """Test slow runs and layout changes are flagged against the median."""
+        history = RunHistory(":memory:")
+        for day in range(5):
+            history.record(make_run(day, duration=10 + day % 2))
+        # A failed run does not enter the baseline of later runs
+        history.record(make_run(5, duration=100, success=False))
+        history.record(make_run(6, duration=30))
+        history.record(make_run(7, size=5000))
+        history.record(make_run(8, duration=12))
+
+        trends = history.trends("debentures", limit=4, window=5, threshold=1.5)
+
+        assert [trend.flags for trend in trends] == [
+            ("duration",), ("duration",), ("bytes_per_row",), (),
+        ]
+        assert trends[1].baseline_duration == 10
+        assert trends[2].baseline_bytes_per_row == 100
+
+    def test_first_run_has_no_baseline(self):
+        """Test a dataset's first run is never flagged."""
+        history = RunHistory(":memory:")
+        history.record(make_run(0))
+
+        trend, = history.trends("debentures", limit=5, window=5, threshold=1.5)
+
+        assert trend.baseline_duration is None
+        assert trend.flags == ()
+
+
+def test_run_is_recorded(tmp_path, monkeypatch):
+    """Test a scraper run with dates appends one row to the ledger."""
+    path = tmp_path / "history.sqlite3"
+    monkeypatch.setitem(RUN_HISTORY_SETTINGS, "path", path)
+    scraper = DebenturesScraper()
+    scraper.store.directory = tmp_path / "debentures"
+    scraper.get_run_dates = lambda force_update: [date(2017, 5, 15), date(2017, 5, 16)]
+    scraper.scrape = lambda start, end: False
+
+    assert not scraper.run()
+
+    history = ANBIMAScraper().history(["debentures"])
+    run, = [trend.run for trend in history["debentures"]]
+    assert not run.success
+    assert (run.start_date, run.end_date) == (date(2017, 5, 15), date(2017, 5, 16))
+
+
+def test_run_without_dates_is_not_recorded(tmp_path, monkeypatch):
+    """Test runs finding nothing to download leave the ledger untouched."""
+    path = tmp_path / "history.sqlite3"
+    monkeypatch.setitem(RUN_HISTORY_SETTINGS, "path", path)
+    scraper = DebenturesScraper()
+    scraper.get_run_dates = lambda force_update: []
+
+    assert scraper.run()
+
+    assert not path.exists()
@@ -0,0 +1,92 @@
+"""Tests for offline run planning."""
+
+import pytest
+from datetime import date
+from unittest.mock import Mock
+
+from anbima_scraper.core.run_plan import RunPlanner
+from anbima_scraper.scrapers.idka import IDKAScraper
+from anbima_scraper.scrapers.ima import IMACarteirasScraper, IMAQuadroResumoScraper
+from anbima_scraper.scrapers.indicators import IndicatorsScraper
+from anbima_scraper.utils.run_stats import RunStats
+
+# Business days of the first week of May 2017 (1 May is a holiday)
+DATES = [date(2017, 5, 2), date(2017, 5, 3), date(2017, 5, 4), date(2017, 5, 5)]
+
+
+class TestPlanRequests:
+    """Test class for the scrapers' plan_requests."""
+
+    def test_quadro_resumo_plans_ranges_after_last_date(self):
+        """Test quadro resumo plans one range over the unstored dates."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.get_last_available_date = Mock(return_value=date(2017, 5, 2))
+
+        requests = scraper.plan_requests(DATES)
+
+        assert len(requests) == 1
+        assert requests[0].start_date == date(2017, 5, 3)
+        assert requests[0].end_date == date(2017, 5, 5)
+        assert "DataIni=03%2F05%2F2017" in requests[0].url
+
+    def test_carteiras_plans_every_carteira_and_date(self):
+        """Test carteiras plans one request per carteira and business day."""
+        scraper = IMACarteirasScraper()
+        scraper.get_last_available_date = Mock(return_value=None)
+
+        requests = scraper.plan_requests([date(2017, 5, 1), date(2017, 5, 2)])
+
+        assert len(requests) == len(scraper.CARTEIRAS)
+        assert {r.start_date for r in requests} == {date(2017, 5, 2)}
+
+    def test_idka_skips_downloaded_files(self, tmp_path):
+        """Test IDKA does not plan dates whose raw file exists."""
+        scraper = IDKAScraper()
+        scraper.download_dir = tmp_path
+        scraper._get_download_file_path(date(2017, 5, 3)).touch()
+
+        requests = scraper.plan_requests(DATES)
+
+        assert [r.start_date for r in requests] == [
+            date(2017, 5, 2), date(2017, 5, 4), date(2017, 5, 5)
+        ]
+
+
+class TestRunPlanner:
+    """Test class for RunPlanner."""
+
+    def test_estimates_from_history(self, tmp_path):
+        """Test costs come from recorded runs when available."""
+        stats = RunStats(tmp_path / "run_stats.json")
+        stats.record("idka", requests=4, size=4000, seconds=8.0)
+        scraper = IDKAScraper()
+        scraper.download_dir = tmp_path
+        scraper.get_run_dates = Mock(return_value=DATES)
+
+        plan = RunPlanner(stats).plan(scraper)
+
+        assert plan.request_count == 4
+        assert plan.estimated_bytes == 4000
+        assert plan.estimated_seconds == pytest.approx(8.0)
+        assert plan.from_history
+
+    def test_forced_plan_includes_stored_dates(self, tmp_path):
+        """Test a forced plan refreshes dates already stored, like run."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.get_last_available_date = Mock(return_value=date(2017, 5, 5))
+        scraper.get_run_dates = Mock(return_value=DATES)
+        planner = RunPlanner(RunStats(tmp_path / "run_stats.json"))
+
+        assert planner.plan(scraper).request_count == 0
+        assert planner.plan(scraper, force_update=True).request_count == 1
+        assert scraper.skip_stored_dates
+
+    def test_indicators_single_request(self, tmp_path):
+        """Test indicators plan one request whatever the dates."""
+        scraper = IndicatorsScraper()
+        scraper.get_run_dates = Mock(return_value=DATES)
+
+        plan = RunPlanner(RunStats(tmp_path / "run_stats.json")).plan(scraper)
+
+        assert plan.request_count == 1
+        assert not plan.from_history
@@ -0,0 +1,98 @@
+"""Tests for the scraper scheduler."""
+
+import pytest
+import threading
+import time
+
+from anbima_scraper.core.scheduler import Job, Scheduler
+
+
+class Tracker:
+    """Record start order and peak concurrency of jobs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.started = []
+
+    def job(self, name, duration=0.05, result=True):
+        """Build a job function sleeping for ``duration`` seconds."""
+        def func():
+            with self.lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+                self.started.append(name)
+            time.sleep(duration)
+            with self.lock:
+                self.running -= 1
+            return result
+        return func
+
+
+class TestScheduler:
+    """Test class for Scheduler."""
+
+    def test_independent_jobs_run_concurrently(self):
+        """Test jobs overlap up to the global limit."""
+        tracker = Tracker()
+        jobs = {name: Job(tracker.job(name)) for name in "abcd"}
+
+        results = Scheduler(max_workers=3, max_per_host=3).run(jobs)
+
+        assert results == {"a": True, "b": True, "c": True, "d": True}
+        assert tracker.peak == 3
+
+    def test_per_host_limit(self):
+        """Test jobs against one host are bounded separately."""
+        tracker = Tracker()
+        jobs = {
+            name: Job(tracker.job(name), host="www.anbima.com.br")
+            for name in "abc"
+        }
+
+        Scheduler(max_workers=3, max_per_host=1).run(jobs)
+
+        assert tracker.peak == 1
+
+    def test_dependencies_order_and_failure(self):
+        """Test dependents wait for inputs and are skipped when they fail."""
+        tracker = Tracker()
+        jobs = {
+            "derived": Job(tracker.job("derived"), depends_on=["input"]),
+            "input": Job(tracker.job("input")),
+            "broken": Job(tracker.job("broken", result=False)),
+            "after_broken": Job(tracker.job("after_broken"), depends_on=["broken"]),
+            "external": Job(tracker.job("external"), depends_on=["not_submitted"]),
+        }
+
+        results = Scheduler(max_workers=4, max_per_host=4).run(jobs)
+
+        assert list(results) == list(jobs)
+        assert results["derived"] and results["external"]
+        assert not results["broken"] and not results["after_broken"]
+        assert tracker.started.index("input") < tracker.started.index("derived")
+        assert "after_broken" not in tracker.started
+
+    def test_timeout_reports_failure(self):
+        """Test a job exceeding its timeout fails without blocking others."""
+        tracker = Tracker()
+        jobs = {
+            "slow": Job(tracker.job("slow", duration=1.0), timeout=0.1),
+            "fast": Job(tracker.job("fast")),
+        }
+
+        started = time.monotonic()
+        results = Scheduler(max_workers=2, max_per_host=2).run(jobs)
+
+        assert results == {"slow": False, "fast": True}
+        assert time.monotonic() - started < 0.9
+
+    def test_dependency_cycle(self):
+        """Test cyclic dependencies are rejected."""
+        jobs = {
+            "a": Job(lambda: True, depends_on=["b"]),
+            "b": Job(lambda: True, depends_on=["a"]),
+        }
+        with pytest.raises(ValueError):
+            Scheduler().run(jobs)
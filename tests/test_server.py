@@ -0,0 +1,114 @@
+"""Tests for the local ANBIMA stand-in server."""
+
+import pytest
+import time
+from datetime import date
+
+import requests
+
+from anbima_scraper.config.settings import REQUEST_SETTINGS
+from anbima_scraper.scrapers.debentures import DebenturesScraper
+from anbima_scraper.scrapers.ima import IMAQuadroResumoScraper
+from anbima_scraper.testing.fixtures import SyntheticANBIMA
+from anbima_scraper.testing.server import StandInServer
+from anbima_scraper.utils.http_client import ANBIMAHTTPClient, rewrite_base_url
+
+TODAY = date(2017, 5, 19)
+
+
+@pytest.fixture
+def server():
+    """Serve a small synthetic history."""
+    generator = SyntheticANBIMA(debentures=20, titulos=8)
+    with StandInServer(generator, today=TODAY) as server:
+        yield server
+
+
+def test_rewrite_base_url():
+    """Test only the scheme and host of a URL are replaced."""
+    url = "https://www.anbima.com.br/informacoes/merc-sec/arqs/ms170516.txt?a=1"
+
+    assert rewrite_base_url(url, "http://127.0.0.1:8080") == (
+        "http://127.0.0.1:8080/informacoes/merc-sec/arqs/ms170516.txt?a=1"
+    )
+    assert rewrite_base_url(url, None) == url
+
+
+class TestStandInServer:
+    """Test class for StandInServer."""
+
+    def test_scraper_runs_against_server(self, server, tmp_path):
+        """Test a scraper with a base URL override downloads from the server."""
+        scraper = DebenturesScraper()
+        scraper.store.directory = tmp_path / "debentures"
+        scraper.http_client = ANBIMAHTTPClient(base_url=server.base_url)
+
+        assert scraper.scrape(date(2017, 5, 15), date(2017, 5, 16))
+
+        assert scraper.get_last_available_date() == date(2017, 5, 16)
+        assert server.status_counts[200] == 2
+
+    def test_quadro_resumo_range(self, server, tmp_path):
+        """Test a range request returns every published date at once."""
+        scraper = IMAQuadroResumoScraper()
+        scraper.output_file = tmp_path / "ima_quadro_resumo_base.csv"
+        scraper.http_client = ANBIMAHTTPClient(base_url=server.base_url)
+
+        df = scraper._fetch_range(date(2017, 5, 15), date(2017, 5, 21))
+
+        # 20 and 21 May are a weekend and after the last published date
+        assert df['dt_referencia'].nunique() == 5
+
+    def test_unpublished_days(self, server):
+        """Test weekends and future dates are reported as unpublished."""
+        base = server.base_url + "/informacoes/merc-sec/arqs/ms"
+
+        assert requests.get(base + "170520.txt").status_code == 404
+        assert requests.get(base + "170522.txt").status_code == 404
+        assert requests.get(base + "170519.txt").status_code == 200
+
+        response = requests.get(
+            server.base_url + "/informacoes/idka/IDkA-down.asp",
+            params={"DataIni": "20/05/2017"}
+        )
+        assert "Não há dados disponíveis" in response.content.decode("latin1")
+
+    def test_missing_days_are_stable(self):
+        """Test a date drawn as missing stays missing across requests."""
+        server = StandInServer(today=TODAY, missing_day_rate=0.5)
+        try:
+            dates = SyntheticANBIMA().business_days(date(2017, 3, 1), TODAY)
+            published = [server.is_published(dt) for dt in dates]
+
+            assert 0 < sum(published) < len(dates)
+            assert published == [server.is_published(dt) for dt in dates]
+        finally:
+            server.stop()
+
+    def test_fault_injection(self, monkeypatch):
+        """Test 429s carry Retry-After and are retried by the client."""
+        monkeypatch.setitem(REQUEST_SETTINGS, "retry_delay", 0)
+        with StandInServer(today=TODAY, rate_limit_rate=1.0, retry_after=0) as server:
+            response = requests.get(server.base_url + "/informacoes/indicadores/")
+            assert response.status_code == 429
+            assert response.headers["Retry-After"] == "0"
+
+            client = ANBIMAHTTPClient(max_retries=2, base_url=server.base_url)
+            with pytest.raises(requests.RequestException):
+                client.get("https://www.anbima.com.br/informacoes/indicadores/")
+            # One plain request, then the client's first try and two retries
+            assert server.status_counts[429] == 4
+
+    def test_bandwidth_limit(self):
+        """Test responses are throttled to the configured bandwidth."""
+        generator = SyntheticANBIMA(debentures=100)
+        size = len(generator.debentures_txt(date(2017, 5, 16)))
+        with StandInServer(generator, today=TODAY, bandwidth=size * 5) as server:
+            started = time.perf_counter()
+            response = requests.get(
+                server.base_url + "/informacoes/merc-sec-debentures/arqs/db170516.txt"
+            )
+            elapsed = time.perf_counter() - started
+
+        assert len(response.content) == size
+        assert elapsed >= 0.2
@@ -0,0 +1,78 @@
+"""Tests for títulos públicos scraper."""
+
+import pytest
+from datetime import date
+
+import pandas as pd
+
+from anbima_scraper.scrapers.titulos_publicos import TitulosPublicosScraper
+
+HEADER = (
+    "Titulo@Data Referencia@Codigo SELIC@Data Base/Emissao@Data Vencimento@"
+    "Tx. Compra@Tx. Venda@Tx. Indicativas@PU@Desvio padrao@"
+    "Interv. Ind. Inf. (D0)@Interv. Ind. Sup. (D0)@Interv. Ind. Inf. (D+1)@"
+    "Interv. Ind. Sup. (D+1)@Criterio"
+)
+
+
+def make_ms_file(dt):
+    """Build a raw ms{yymmdd}.txt payload as served by ANBIMA."""
+    lines = [
+        "ANBIMA - Associação Brasileira das Entidades dos Mercados Financeiro "
+        "e de Capitais",
+        "",
+        HEADER,
+        f"LTN@{dt:%Y%m%d}@100000@20150109@20180101@9,8100@9,7900@9,8000@"
+        f"923,456789@0,0123@9,70@9,90@9,68@9,92@Calculado",
+        f"NTN-B@{dt:%Y%m%d}@760199@20000715@20500815@5,6000@5,5800@5,5900@"
+        f"3.123,456789@--@5,50@5,70@5,49@5,71@Calculado",
+    ]
+    return "\r\n".join(lines).encode("latin1")
+
+
+class TestTitulosPublicosScraper:
+    """Test class for TitulosPublicosScraper."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create scraper instance writing to a temporary store."""
+        scraper = TitulosPublicosScraper()
+        scraper.store.directory = tmp_path / "titulos_publicos"
+        return scraper
+
+    def test_process_titulos_files(self, scraper):
+        """Test several files are parsed in a single pass."""
+        df = scraper._process_titulos_files([
+            make_ms_file(date(2017, 5, 16)),
+            make_ms_file(date(2017, 5, 17)),
+        ])
+
+        assert len(df) == 4
+        assert list(df.columns[:2]) == ['dt_referencia', 'titulo']
+        assert df.loc[1, 'pu'] == pytest.approx(3123.456789)
+        assert pd.isna(df.loc[1, 'desvio_padrao'])
+        assert df.loc[0, 'dt_vencimento'] == pd.Timestamp(2018, 1, 1)
+        assert df.loc[3, 'dt_referencia'] == pd.Timestamp(2017, 5, 17)
+
+    def test_process_invalid_files(self, scraper):
+        """Test HTML error pages are rejected."""
+        assert scraper._process_titulos_files([b"<html>erro</html>"]) is None
+
+    def test_scrape_without_valid_files(self, scraper):
+        """Test unparseable files mean no new data, as in other scrapers."""
+        scraper._download_titulos_file = lambda dt: b"<html>erro</html>"
+
+        assert scraper.scrape(date(2017, 5, 15), date(2017, 5, 16))
+        assert scraper.store.dates() == []
+
+    def test_scrape_partitions_by_date(self, scraper):
+        """Test concurrent downloads land in one partition per date."""
+        scraper._download_titulos_file = make_ms_file
+
+        assert scraper.scrape(date(2017, 5, 15), date(2017, 5, 17))
+
+        assert scraper.store.dates() == [
+            date(2017, 5, 15), date(2017, 5, 16), date(2017, 5, 17)
+        ]
+        partition = scraper.store.read_partition(date(2017, 5, 16))
+        assert list(partition['titulo']) == ["LTN", "NTN-B"]
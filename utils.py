@@ -56,12 +56,11 @@ def get_ultima_data_disponivel_base(path_file_base):
 
 
 def generate_xlsx_base(df, path_saida):
-    # Create a Pandas Excel writer using XlsxWriter as the engine.
-    writer = pd.ExcelWriter(path_saida, engine='xlsxwriter')
-    # Convert the dataframe to an XlsxWriter Excel object.
-    df.to_excel(writer, sheet_name='Sheet1')
-    # Close the Pandas Excel writer and output the Excel file.
-    writer.save()
+    # Create a Pandas Excel writer using XlsxWriter as the engine; the
+    # file is written when the writer closes (ExcelWriter.save was removed
+    # in pandas 2). For large bases use `anbima_scraper export`.
+    with pd.ExcelWriter(path_saida, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name='Sheet1')
 
 
 def xrange(x):